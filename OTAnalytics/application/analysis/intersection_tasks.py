@@ -0,0 +1,112 @@
+import heapq
+from dataclasses import dataclass
+from typing import Iterable
+
+from OTAnalytics.domain.section import Section
+from OTAnalytics.domain.track import TrackId
+from OTAnalytics.domain.track_dataset import TrackSummary
+
+DEFAULT_TASKS_PER_PROCESS: int = 4
+"""Number of intersection tasks created per process to balance the load."""
+
+BoundingBox = tuple[float, float, float, float]
+
+
+@dataclass(frozen=True)
+class IntersectionTask:
+    """Tracks intersected with all sections by a single task.
+
+    Args:
+        track_ids (list[TrackId]): the tracks of the task.
+        detections (int): the number of detections of all tracks.
+        cost (int): the estimated cost of intersecting the tracks.
+    """
+
+    track_ids: list[TrackId]
+    detections: int
+    cost: int
+
+
+def estimate_cost(summary: TrackSummary, section_boxes: list[BoundingBox]) -> int:
+    """Estimate the cost of intersecting a track with sections.
+
+    Every detection of the track is processed once and again for each section near
+    the track. A section is near a track if their bounding boxes overlap.
+
+    Args:
+        summary (TrackSummary): the summary of the track.
+        section_boxes (list[BoundingBox]): the bounding boxes of the sections.
+
+    Returns:
+        int: the estimated cost.
+    """
+    nearby_sections = sum(
+        1
+        for min_x, min_y, max_x, max_y in section_boxes
+        if min_x <= summary.max_x
+        and summary.min_x <= max_x
+        and min_y <= summary.max_y
+        and summary.min_y <= max_y
+    )
+    return summary.length * (1 + nearby_sections)
+
+
+def _bounding_box(section: Section) -> BoundingBox:
+    xs = [coordinate.x for coordinate in section.get_coordinates()]
+    ys = [coordinate.y for coordinate in section.get_coordinates()]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+class IntersectionTaskPlanner:
+    """Partition tracks into intersection tasks of similar estimated cost.
+
+    More tasks than processes are created. Processes finishing early continue with
+    the remaining tasks. Tracks are assigned in descending order of their cost to
+    the task with the lowest total cost so far. Tasks are returned in descending
+    order of their cost to start the most expensive ones first.
+
+    Args:
+        tasks_per_process (int): the number of tasks to create per process.
+    """
+
+    def __init__(self, tasks_per_process: int = DEFAULT_TASKS_PER_PROCESS) -> None:
+        if tasks_per_process < 1:
+            raise ValueError("Number of tasks per process must be greater than zero.")
+        self._tasks_per_process = tasks_per_process
+
+    def plan(
+        self,
+        summaries: Iterable[TrackSummary],
+        sections: Iterable[Section],
+        num_processes: int,
+    ) -> list[IntersectionTask]:
+        """Partition the given tracks into tasks.
+
+        Args:
+            summaries (Iterable[TrackSummary]): the summaries of the tracks.
+            sections (Iterable[Section]): the sections to intersect with.
+            num_processes (int): the number of processes executing the tasks.
+
+        Returns:
+            list[IntersectionTask]: the non-empty tasks.
+        """
+        section_boxes = [_bounding_box(section) for section in sections]
+        costs = sorted(
+            ((estimate_cost(summary, section_boxes), summary) for summary in summaries),
+            key=lambda entry: entry[0],
+            reverse=True,
+        )
+        number_of_tasks = min(len(costs), num_processes * self._tasks_per_process)
+        track_ids: list[list[TrackId]] = [[] for _ in range(number_of_tasks)]
+        detections = [0] * number_of_tasks
+        loads = [(0, task) for task in range(number_of_tasks)]
+        for cost, summary in costs:
+            load, task = heapq.heappop(loads)
+            track_ids[task].append(summary.id)
+            detections[task] += summary.length
+            heapq.heappush(loads, (load + cost, task))
+        tasks = [
+            IntersectionTask(track_ids[task], detections[task], load)
+            for load, task in loads
+        ]
+        return sorted(tasks, key=lambda task: task.cost, reverse=True)
@@ -21,6 +21,37 @@ DEFAULT_COUNTING_INTERVAL_IN_MINUTES: int = 15
 DEFAULT_TRACK_OFFSET: RelativeOffsetCoordinate = RelativeOffsetCoordinate(0.5, 0.5)
 DEFAULT_PROGRESSBAR_STEP_PERCENTAGE: int = 5
 DEFAULT_NUM_PROCESSES = 4
+DEFAULT_TRACK_CACHE_DIR: Path = Path.home() / ".cache" / "OTAnalytics" / "tracks"
+"""Directory of the cache of parsed track files."""
+DEFAULT_TRACK_CACHE_SIZE: int = 10 * 1024**3
+"""Maximum size of the cache of parsed track files in bytes."""
+TRACK_STORE_PANDAS: str = "pandas"
+"""Keep the detections of all tracks in memory."""
+TRACK_STORE_NUMPY: str = "numpy"
+"""Keep the detections of all tracks in memory as NumPy columns sorted by track."""
+TRACK_STORE_MEMORY_MAPPED: str = "memory-mapped"
+"""Keep the detections of all tracks in memory mapped files on disk."""
+TRACK_STORES: list[str] = [
+    TRACK_STORE_PANDAS,
+    TRACK_STORE_NUMPY,
+    TRACK_STORE_MEMORY_MAPPED,
+]
+DEFAULT_TRACK_STORE: str = TRACK_STORE_PANDAS
+GEOMETRY_STORE_PYGEOS: str = "pygeos"
+"""Compute track geometries with pygeos."""
+GEOMETRY_STORE_SHAPELY: str = "shapely"
+"""Compute track geometries in bulk with the array API of Shapely 2."""
+GEOMETRY_STORES: list[str] = [GEOMETRY_STORE_PYGEOS, GEOMETRY_STORE_SHAPELY]
+DEFAULT_GEOMETRY_STORE: str = GEOMETRY_STORE_PYGEOS
+INTERSECTION_PARALLELIZATION_PROCESSES: str = "processes"
+"""Intersect tracks with sections in parallel processes."""
+INTERSECTION_PARALLELIZATION_THREADS: str = "threads"
+"""Intersect tracks with sections in parallel threads sharing the tracks."""
+INTERSECTION_PARALLELIZATIONS: list[str] = [
+    INTERSECTION_PARALLELIZATION_PROCESSES,
+    INTERSECTION_PARALLELIZATION_THREADS,
+]
+DEFAULT_INTERSECTION_PARALLELIZATION: str = INTERSECTION_PARALLELIZATION_PROCESSES
 
 
 # File Types
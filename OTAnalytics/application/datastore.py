@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional, Sequence, Tuple
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
 
 from OTAnalytics.application.project import Project
 from OTAnalytics.application.use_cases.export_events import EventListExporter
@@ -48,11 +48,54 @@ class TrackParseResult:
     video_metadata: VideoMetadata
 
 
+@dataclass(frozen=True)
+class TrackFileMetadata:
+    detection_metadata: DetectionMetadata
+    video_metadata: VideoMetadata
+
+
 class TrackParser(ABC):
     @abstractmethod
     def parse(self, file: Path) -> TrackParseResult:
         raise NotImplementedError
 
+    def parse_metadata(self, file: Path) -> TrackFileMetadata:
+        """Parse only the metadata of a track file.
+
+        Implementations should avoid parsing the tracks of the file.
+
+        Args:
+            file (Path): the track file.
+
+        Returns:
+            TrackFileMetadata: the detection and video metadata of the file.
+        """
+        parse_result = self.parse(file)
+        return TrackFileMetadata(
+            parse_result.detection_metadata, parse_result.video_metadata
+        )
+
+    def parse_all(
+        self, files: Sequence[Path]
+    ) -> Iterator[TrackParseResult | Exception]:
+        """Parse multiple track files.
+
+        The results are yielded in the order of the given files. If a file could not
+        be parsed, the raised exception is yielded instead of its result.
+        Implementations may parse the files in parallel.
+
+        Args:
+            files (Sequence[Path]): the track files to parse.
+
+        Returns:
+            Iterator[TrackParseResult | Exception]: the parse result of each file.
+        """
+        for file in files:
+            try:
+                yield self.parse(file)
+            except Exception as cause:
+                yield cause
+
 
 class EventListParser(ABC):
     @abstractmethod
@@ -5,7 +5,10 @@ from pathlib import Path
 from OTAnalytics.application.config import (
     DEFAULT_COUNTING_INTERVAL_IN_MINUTES,
     DEFAULT_EVENTLIST_FILE_TYPE,
+    DEFAULT_GEOMETRY_STORE,
+    DEFAULT_INTERSECTION_PARALLELIZATION,
     DEFAULT_NUM_PROCESSES,
+    DEFAULT_TRACK_STORE,
 )
 from OTAnalytics.application.config_specification import OtConfigDefaultValueProvider
 from OTAnalytics.application.logger import DEFAULT_LOG_FILE
@@ -37,6 +40,14 @@ class CliArguments:
     log_file: str | None = None
     include_classes: list[str] | None = None
     exclude_classes: list[str] | None = None
+    track_cache: bool = False
+    track_cache_dir: str | None = None
+    clear_track_cache: bool = False
+    stream_track_files: bool = False
+    track_store: str = DEFAULT_TRACK_STORE
+    track_store_dir: str | None = None
+    geometry_store: str = DEFAULT_GEOMETRY_STORE
+    intersection_parallelization: str = DEFAULT_INTERSECTION_PARALLELIZATION
 
 
 class CliValueProvider(OtConfigDefaultValueProvider):
@@ -5,6 +5,7 @@ from OTAnalytics.application.config import (
     DEFAULT_COUNTING_INTERVAL_IN_MINUTES,
     DEFAULT_EVENTLIST_FILE_TYPE,
     DEFAULT_NUM_PROCESSES,
+    DEFAULT_TRACK_CACHE_DIR,
 )
 from OTAnalytics.application.config_specification import OtConfigDefaultValueProvider
 from OTAnalytics.application.logger import DEFAULT_LOG_FILE
@@ -205,5 +206,41 @@ class RunConfiguration(OtConfigDefaultValueProvider):
     def show_svz(self) -> bool:
         return self._cli_args.show_svz
 
+    @property
+    def track_cache(self) -> bool:
+        return self._cli_args.track_cache
+
+    @property
+    def track_cache_dir(self) -> Path:
+        if track_cache_dir := self._cli_args.track_cache_dir:
+            return Path(track_cache_dir)
+        return DEFAULT_TRACK_CACHE_DIR
+
+    @property
+    def clear_track_cache(self) -> bool:
+        return self._cli_args.clear_track_cache
+
+    @property
+    def stream_track_files(self) -> bool:
+        return self._cli_args.stream_track_files
+
+    @property
+    def track_store(self) -> str:
+        return self._cli_args.track_store
+
+    @property
+    def track_store_dir(self) -> Path | None:
+        if track_store_dir := self._cli_args.track_store_dir:
+            return Path(track_store_dir)
+        return None
+
+    @property
+    def geometry_store(self) -> str:
+        return self._cli_args.geometry_store
+
+    @property
+    def intersection_parallelization(self) -> str:
+        return self._cli_args.intersection_parallelization
+
 
 RunConfigurationBuilder = Callable[[CliArguments, OtConfig | None], RunConfiguration]
@@ -1,52 +1,58 @@
-from typing import Callable, Iterable
+from dataclasses import replace
+from typing import Iterable, Sequence, cast
 
 from OTAnalytics.application.analysis.intersect import (
     IntersectionError,
     RunIntersect,
     group_sections_by_offset,
 )
+from OTAnalytics.application.analysis.intersection_tasks import (
+    IntersectionTask,
+    IntersectionTaskPlanner,
+)
+from OTAnalytics.application.logger import logger
 from OTAnalytics.application.use_cases.track_repository import GetAllTracks
-from OTAnalytics.domain.event import Event, EventBuilder, SectionEventBuilder
-from OTAnalytics.domain.geometry import (
-    DirectionVector2D,
-    RelativeOffsetCoordinate,
-    calculate_direction_vector,
+from OTAnalytics.domain.event import (
+    Event,
+    EventBatch,
+    EventBuilder,
+    SectionEventBuilder,
 )
+from OTAnalytics.domain.geometry import RelativeOffsetCoordinate
 from OTAnalytics.domain.intersect import Intersector, IntersectParallelizationStrategy
-from OTAnalytics.domain.section import Area, LineSection, Section
-from OTAnalytics.domain.track_dataset import TrackDataset
+from OTAnalytics.domain.section import Area, LineSection, Section, SectionId
+from OTAnalytics.domain.track import TrackId
+from OTAnalytics.domain.track_dataset import (
+    DetectionSelection,
+    TrackDataset,
+    TrackDoesNotExistError,
+)
 from OTAnalytics.domain.types import EventType
 
 
 class IntersectByIntersectionPoints(Intersector):
     """Use intersection points of tracks and sections to create events.
 
-    This strategy is intended to be used with LineSections.
+    This strategy is intended to be used with LineSections. The detections at all
+    intersection points are looked up at once and the events are created as a
+    columnar `EventBatch`.
     """
 
-    def __init__(
-        self,
-        calculate_direction_vector_: Callable[
-            [float, float, float, float], DirectionVector2D
-        ] = calculate_direction_vector,
-    ) -> None:
-        self._calculate_direction_vector = calculate_direction_vector_
-
     def intersect(
         self,
         track_dataset: TrackDataset,
         sections: Iterable[Section],
         event_builder: EventBuilder,
-    ) -> list[Event]:
+    ) -> EventBatch:
         sections_grouped_by_offset = group_sections_by_offset(
             sections, EventType.SECTION_ENTER
         )
-        events = []
-        for offset, section_group in sections_grouped_by_offset.items():
-            events.extend(
+        return EventBatch.concat(
+            [
                 self.__do_intersect(track_dataset, section_group, offset, event_builder)
-            )
-        return events
+                for offset, section_group in sections_grouped_by_offset.items()
+            ]
+        )
 
     def __do_intersect(
         self,
@@ -54,61 +60,51 @@ class IntersectByIntersectionPoints(Intersector):
         sections: list[Section],
         offset: RelativeOffsetCoordinate,
         event_builder: EventBuilder,
-    ) -> list[Event]:
+    ) -> EventBatch:
         intersection_result = track_dataset.intersection_points(sections, offset)
 
-        events: list[Event] = []
+        track_ids: list[TrackId] = []
+        section_ids: list[SectionId] = []
+        indices: list[int] = []
         for track_id, intersection_points in intersection_result.items():
-            if not (track := track_dataset.get_for(track_id)):
-                raise IntersectionError(
-                    "Track not found. Unable to create intersection event "
-                    f"for track {track_id}."
-                )
-            event_builder.add_road_user_type(track.classification)
             for section_id, intersection_point in intersection_points:
-                event_builder.add_section_id(section_id)
-                detection = track.get_detection(intersection_point.index)
-                current_coord = detection.get_coordinate(offset)
-                prev_coord = track.get_detection(
-                    intersection_point.index - 1
-                ).get_coordinate(offset)
-                direction_vector = self._calculate_direction_vector(
-                    prev_coord.x,
-                    prev_coord.y,
-                    current_coord.x,
-                    current_coord.y,
-                )
-                event_builder.add_event_type(EventType.SECTION_ENTER)
-                event_builder.add_direction_vector(direction_vector)
-                event_builder.add_event_coordinate(current_coord.x, current_coord.y)
-                events.append(event_builder.create_event(detection))
-        return events
+                track_ids.append(track_id)
+                section_ids.append(section_id)
+                indices.append(intersection_point.index)
+        try:
+            detections = track_dataset.get_detections_at(track_ids, indices, offset)
+        except TrackDoesNotExistError as cause:
+            raise IntersectionError(
+                f"Track not found. Unable to create intersection event. {cause}"
+            ) from cause
+        return event_builder.create_event_batch(
+            detections, section_ids, [EventType.SECTION_ENTER] * len(indices)
+        )
 
 
 class IntersectAreaByTrackPoints(Intersector):
-    def __init__(
-        self,
-        calculate_direction_vector_: Callable[
-            [float, float, float, float], DirectionVector2D
-        ] = calculate_direction_vector,
-    ) -> None:
-        self._calculate_direction_vector = calculate_direction_vector_
+    """Use the detections at which tracks enter or leave areas to create events.
+
+    This strategy is intended to be used with Areas. The transitions of all tracks
+    are computed by the track dataset at once and the events are created as a
+    columnar `EventBatch`.
+    """
 
     def intersect(
         self,
         track_dataset: TrackDataset,
         sections: Iterable[Section],
         event_builder: EventBuilder,
-    ) -> list[Event]:
+    ) -> EventBatch:
         sections_grouped_by_offset = group_sections_by_offset(
             sections, EventType.SECTION_ENTER
         )
-        events = []
-        for offset, section_group in sections_grouped_by_offset.items():
-            events.extend(
+        return EventBatch.concat(
+            [
                 self.__do_intersect(track_dataset, section_group, offset, event_builder)
-            )
-        return events
+                for offset, section_group in sections_grouped_by_offset.items()
+            ]
+        )
 
     def __do_intersect(
         self,
@@ -116,147 +112,195 @@ class IntersectAreaByTrackPoints(Intersector):
         sections: list[Section],
         offset: RelativeOffsetCoordinate,
         event_builder: EventBuilder,
-    ) -> list[Event]:
-        contained_by_sections_result = track_dataset.contained_by_sections(
-            sections, offset
+    ) -> EventBatch:
+        transitions = track_dataset.area_transitions(sections, offset)
+
+        track_ids = [TrackId(track_id) for track_id in transitions.track_id]
+        indices = list(transitions.index)
+        try:
+            detections = track_dataset.get_detections_at(track_ids, indices, offset)
+            detections = self.__locate_at_track_start(
+                track_dataset, track_ids, indices, detections
+            )
+        except TrackDoesNotExistError as cause:
+            raise IntersectionError(
+                f"Track not found. Unable to create intersection event. {cause}"
+            ) from cause
+        event_types = [
+            EventType.SECTION_ENTER if entered else EventType.SECTION_LEAVE
+            for entered in transitions.entered
+        ]
+        return event_builder.create_event_batch(
+            detections, transitions.section_id, event_types
         )
 
-        events = []
-        for (
-            track_id,
-            contained_by_sections_masks,
-        ) in contained_by_sections_result.items():
-            if not (track := track_dataset.get_for(track_id)):
-                raise IntersectionError(
-                    "Track not found. Unable to create intersection event "
-                    f"for track {track_id}."
-                )
-            track_detections = track.detections
-            for section_id, section_entered_mask in contained_by_sections_masks:
-                event_builder.add_section_id(section_id)
-                event_builder.add_road_user_type(track.classification)
-
-                track_starts_inside_area = section_entered_mask[0]
-                if track_starts_inside_area:
-                    first_detection = track_detections[0]
-                    first_coord = first_detection.get_coordinate(offset)
-                    second_coord = track_detections[1].get_coordinate(offset)
-
-                    event_builder.add_event_type(EventType.SECTION_ENTER)
-                    event_builder.add_direction_vector(
-                        self._calculate_direction_vector(
-                            first_coord.x,
-                            first_coord.y,
-                            second_coord.x,
-                            second_coord.y,
-                        )
-                    )
-                    event_builder.add_event_coordinate(
-                        first_detection.x, first_detection.y
-                    )
-                    event = event_builder.create_event(first_detection)
-                    events.append(event)
-
-                section_currently_entered = track_starts_inside_area
-                for current_index, current_detection in enumerate(
-                    track_detections[1:], start=1
-                ):
-                    entered = section_entered_mask[current_index]
-                    if section_currently_entered == entered:
-                        continue
-
-                    prev_coord = track_detections[current_index - 1].get_coordinate(
-                        offset
-                    )
-                    current_coord = current_detection.get_coordinate(offset)
-
-                    event_builder.add_direction_vector(
-                        self._calculate_direction_vector(
-                            prev_coord.x,
-                            prev_coord.y,
-                            current_coord.x,
-                            current_coord.y,
-                        )
-                    )
-                    event_builder.add_event_coordinate(current_coord.x, current_coord.y)
-
-                    if entered:
-                        event_builder.add_event_type(EventType.SECTION_ENTER)
-                    else:
-                        event_builder.add_event_type(EventType.SECTION_LEAVE)
-
-                    event = event_builder.create_event(current_detection)
-                    events.append(event)
-                    section_currently_entered = entered
-
-        return events
-
-
-class RunCreateIntersectionEvents:
-    def __init__(
+    def __locate_at_track_start(
         self,
-        intersect_line_section: Intersector,
-        intersect_area_section: Intersector,
         track_dataset: TrackDataset,
-        sections: Iterable[Section],
-        event_builder: SectionEventBuilder,
-    ):
-        self._intersect_line_section = intersect_line_section
-        self._intersect_area_section = intersect_area_section
-        self._track_dataset = track_dataset
-        self._sections = sections
-        self._event_builder = event_builder
-
-    def create(self) -> list[Event]:
-        events = []
-        line_sections, area_sections = separate_sections(self._sections)
-        events.extend(
-            self._intersect_line_section.intersect(
-                self._track_dataset, line_sections, self._event_builder
-            )
+        track_ids: list[TrackId],
+        indices: list[int],
+        detections: DetectionSelection,
+    ) -> DetectionSelection:
+        """Events of tracks starting inside an area are located at the first
+        detection without the offset applied.
+        """
+        at_start = [position for position, index in enumerate(indices) if index == 0]
+        if not at_start:
+            return detections
+        raw = track_dataset.get_detections_at(
+            [track_ids[position] for position in at_start],
+            [0] * len(at_start),
+            RelativeOffsetCoordinate(0, 0),
         )
-        events.extend(
-            self._intersect_area_section.intersect(
-                self._track_dataset, area_sections, self._event_builder
-            )
-        )
-        return events
+        x = list(detections.x)
+        y = list(detections.y)
+        for position, raw_x, raw_y in zip(at_start, raw.x, raw.y):
+            x[position] = raw_x
+            y[position] = raw_y
+        return replace(detections, x=x, y=y)
 
 
 class BatchedTracksRunIntersect(RunIntersect):
+    """Intersect all tracks with sections in batches executed by the given
+    parallelization strategy.
+
+    If more than one process is used, the tracks are shared with the processes of
+    the strategy and partitioned into more batches than processes by their
+    estimated cost. The timings of the batches are logged
+    and available at the parallelization strategy afterwards. The events of all
+    batches are returned in the order a single batch of all tracks would create
+    them to be independent of the number of processes.
+
+    Args:
+        intersect_parallelizer (IntersectParallelizationStrategy): the strategy
+            executing the batches.
+        get_tracks (GetAllTracks): provides the tracks to intersect.
+        task_planner (IntersectionTaskPlanner): partitions the tracks into batches.
+    """
+
     def __init__(
         self,
         intersect_parallelizer: IntersectParallelizationStrategy,
         get_tracks: GetAllTracks,
+        task_planner: IntersectionTaskPlanner = IntersectionTaskPlanner(),
     ) -> None:
         self._intersect_parallelizer = intersect_parallelizer
         self._get_tracks = get_tracks
+        self._task_planner = task_planner
 
-    def __call__(self, sections: Iterable[Section]) -> list[Event]:
+    def __call__(self, sections: Iterable[Section]) -> Sequence[Event]:
         filtered_tracks = self._get_tracks.as_dataset()
+        # Batches split from the tracks keep the geometries calculated beforehand
         filtered_tracks.calculate_geometries_for(
             {_section.get_offset(EventType.SECTION_ENTER) for _section in sections}
         )
 
-        batches = filtered_tracks.split(self._intersect_parallelizer.num_processes)
+        num_processes = self._intersect_parallelizer.num_processes
+        if num_processes <= 1:
+            return self._intersect_parallelizer.execute(
+                _create_events, [(filtered_tracks, sections)]
+            )
+
+        shared_tracks = self._intersect_parallelizer.share_tracks(filtered_tracks)
+        summaries = shared_tracks.get_summaries().as_list()
+        planned = self._task_planner.plan(summaries, sections, num_processes)
+        batches = shared_tracks.split_by_track_ids([task.track_ids for task in planned])
 
         tasks = [(batch, sections) for batch in batches]
-        return self._intersect_parallelizer.execute(_create_events, tasks)
+        events = self._intersect_parallelizer.execute(_create_events, tasks)
+        self._log_task_timings(planned)
+        # Batches are executed by cost, restore the order of a single batch
+        return _order_like_single_batch(
+            events, sections, [summary.id.id for summary in summaries]
+        )
+
+    def _log_task_timings(self, planned: list[IntersectionTask]) -> None:
+        timings = self._intersect_parallelizer.task_timings
+        if not timings:
+            return
+        for timing in timings:
+            description = ""
+            if timing.task < len(planned):
+                task = planned[timing.task]
+                description = (
+                    f" with {len(task.track_ids)} tracks, {task.detections} "
+                    f"detections and estimated cost {task.cost}"
+                )
+            logger().debug(
+                f"Intersection task {timing.task}{description} took "
+                f"{timing.duration:.3f}s in process {timing.process_id}."
+            )
+        durations = [timing.duration for timing in timings]
+        logger().debug(
+            f"Intersected tracks in {len(timings)} tasks. Slowest task took "
+            f"{max(durations):.3f}s, mean duration was "
+            f"{sum(durations) / len(durations):.3f}s."
+        )
 
 
-def _create_events(tracks: TrackDataset, sections: Iterable[Section]) -> list[Event]:
-    events = []
-    event_builder = SectionEventBuilder()
+def _order_like_single_batch(
+    events: Sequence[Event], sections: Iterable[Section], track_ids: list[str]
+) -> Sequence[Event]:
+    """Order the events of multiple batches like `_create_events` orders the events
+    of a single batch: line events before area events, grouped by the offset of
+    their sections and ordered by the position of their track. Area events are
+    additionally ordered by the first area of their track like the transitions of
+    the track dataset. The events of a track keep their order.
+    """
+    if isinstance(events, EventBatch):
+        road_user_ids = list(events.road_user_id)
+        section_ids = list(events.section_id)
+    else:
+        road_user_ids = [event.road_user_id for event in events]
+        section_ids = [event.section_id for event in events]
+
+    section_keys: dict[SectionId, tuple[int, int, int]] = {}
+    for phase, phase_sections in enumerate(separate_sections(sections)):
+        grouped_sections = group_sections_by_offset(phase_sections)
+        for group, section_group in enumerate(grouped_sections.values()):
+            for position, _section in enumerate(section_group):
+                section_keys[_section.id] = (phase, group, position)
+
+    event_sections = [section_keys[cast(SectionId, _id)] for _id in section_ids]
+    first_sections: dict[tuple[int, int, str], int] = {}
+    for (phase, group, position), road_user_id in zip(event_sections, road_user_ids):
+        first_key = (phase, group, road_user_id)
+        first_sections[first_key] = min(
+            first_sections.get(first_key, position), position
+        )
+
+    track_positions = {
+        track_id: position for position, track_id in enumerate(track_ids)
+    }
+    keys = [
+        (
+            phase,
+            group,
+            first_sections[(phase, group, road_user_id)] if phase else 0,
+            track_positions[road_user_id],
+        )
+        for (phase, group, _), road_user_id in zip(event_sections, road_user_ids)
+    ]
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    if isinstance(events, EventBatch):
+        return events.take(order)
+    return [events[position] for position in order]
 
-    create_intersection_events = RunCreateIntersectionEvents(
-        intersect_line_section=IntersectByIntersectionPoints(),
-        intersect_area_section=IntersectAreaByTrackPoints(),
-        track_dataset=tracks,
-        sections=sections,
-        event_builder=event_builder,
+
+def _create_events(tracks: TrackDataset, sections: Iterable[Section]) -> EventBatch:
+    # Events are returned as columns to keep them cheap to pass between processes
+    event_builder = SectionEventBuilder()
+    line_sections, area_sections = separate_sections(sections)
+    return EventBatch.concat(
+        [
+            IntersectByIntersectionPoints().intersect(
+                tracks, line_sections, event_builder
+            ),
+            IntersectAreaByTrackPoints().intersect(
+                tracks, area_sections, event_builder
+            ),
+        ]
     )
-    events.extend(create_intersection_events.create())
-    return events
 
 
 def separate_sections(
@@ -1,5 +1,4 @@
 from abc import ABC
-from datetime import datetime
 from typing import Iterable, Optional
 
 from OTAnalytics.application.analysis.intersect import TracksIntersectingSections
@@ -9,7 +8,7 @@ from OTAnalytics.application.use_cases.section_repository import GetSectionsById
 from OTAnalytics.domain.event import EventRepository
 from OTAnalytics.domain.flow import FlowId, FlowRepository
 from OTAnalytics.domain.section import SectionId
-from OTAnalytics.domain.track import Track, TrackId, TrackIdProvider
+from OTAnalytics.domain.track import TrackId, TrackIdProvider
 from OTAnalytics.domain.track_repository import TrackRepository
 
 
@@ -215,74 +214,20 @@ class TracksOverlapOccurrenceWindow(TrackIdProvider):
         self._track_view_state = track_view_state
 
     def get_ids(self) -> Iterable[TrackId]:
-        if self._other:
-            tracks = self._get_other_track_ids()
-        else:
-            tracks = self._track_repository.get_all()
-
-        return self._filter(tracks)
-
-    def _get_other_track_ids(self) -> Iterable[Track]:
-        if self._other:
-            track_ids = self._other.get_ids()
-            tracks: list[Track] = []
-            for track_id in track_ids:
-                if track := self._track_repository.get_for(track_id):
-                    tracks.append(track)
-            return tracks
-        return []
-
-    def _filter(self, tracks: Iterable[Track]) -> Iterable[TrackId]:
+        """Returns the ids of the tracks overlapping with the date range filter.
+
+        Raises:
+            ValueError: if the start of the date range is after its end.
+        """
         date_range = self._track_view_state.filter_element.get().date_range
-        start_date_filter = date_range.start_date
-        end_date_filter = date_range.end_date
-
-        match (start_date_filter, end_date_filter):
-            case (datetime() as start_date_filter, datetime() as end_date_filter):
-                return [
-                    track.id
-                    for track in tracks
-                    if self._has_overlap(
-                        start_date_filter,
-                        end_date_filter,
-                        track.start,
-                        track.end,
-                    )
-                ]
-            case (None, datetime() as end_date_filter):
-                return [
-                    track.id
-                    for track in tracks
-                    if self._has_overlap(
-                        datetime.min,
-                        end_date_filter,
-                        track.start,
-                        track.end,
-                    )
-                ]
-            case (datetime() as start_date_filter, None):
-                return [
-                    track.id
-                    for track in tracks
-                    if self._has_overlap(
-                        start_date_filter,
-                        datetime.max,
-                        track.start,
-                        track.end,
-                    )
-                ]
-            case _:
-                return [track.id for track in tracks]
-
-    @staticmethod
-    def _has_overlap(
-        start_1: datetime, end_1: datetime, start_2: datetime, end_2: datetime
-    ) -> bool:
-        if not start_1 <= end_1:
-            raise ValueError("start_1 needs to be lesser equal than end_1.")
-        if not start_2 <= end_2:
-            raise ValueError("start_2 needs to be lesser equal than end_2.")
-        latest_start = max(start_1, start_2)
-        earliest_end = min(end_1, end_2)
-
-        return latest_start <= earliest_end
+        start, end = date_range.start_date, date_range.end_date
+        if start is not None and end is not None and start > end:
+            raise ValueError("start of date range needs to be lesser equal than end.")
+        alive_ids = self._track_repository.get_summaries().get_ids_alive_between(
+            start, end
+        )
+        if self._other is None:
+            return alive_ids
+
+        alive = set(alive_ids)
+        return [track_id for track_id in self._other.get_ids() if track_id in alive]
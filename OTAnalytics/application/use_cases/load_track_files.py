@@ -2,6 +2,7 @@ from pathlib import Path
 
 from OTAnalytics.application.datastore import (
     TrackParser,
+    TrackParseResult,
     TrackToVideoRepository,
     TrackVideoParser,
 )
@@ -36,19 +37,38 @@ class LoadTrackFiles:
 
     def __call__(self, files: list[Path]) -> None:
         """
-        Load and parse the given track file together with the corresponding video file.
+        Load and parse the given track files together with the corresponding video
+        files.
+
+        The files are parsed by the track parser, possibly in parallel. The tracks of
+        all successfully parsed files are added to the track repository at once.
 
         Args:
             files (Path): files in ottrk format.
         """
         raised_exceptions: list[Exception] = []
-        for file in self._progressbar(
-            files, unit="files", description="Processed ottrk files: "
+        parsed_files: list[tuple[Path, TrackParseResult]] = []
+        parse_results = self._track_parser.parse_all(files)
+        for file, parse_result in zip(
+            self._progressbar(
+                files, unit="files", description="Processed ottrk files: "
+            ),
+            parse_results,
         ):
+            if isinstance(parse_result, Exception):
+                raised_exceptions.append(parse_result)
+                continue
             try:
-                self.load(file)
+                self._add_videos(file, parse_result)
+                parsed_files.append((file, parse_result))
             except Exception as cause:
                 raised_exceptions.append(cause)
+        if parsed_files:
+            self._track_repository.add_many(
+                [parse_result.tracks for _, parse_result in parsed_files]
+            )
+        for file, parse_result in parsed_files:
+            self._add_metadata(file, parse_result)
         if raised_exceptions:
             raise ExceptionGroup(
                 "Errors occurred while loading the track files:", raised_exceptions
@@ -62,13 +82,19 @@ class LoadTrackFiles:
             file (Path): file in ottrk format
         """
         parse_result = self._track_parser.parse(file)
+        self._add_videos(file, parse_result)
+        self._track_repository.add_all(parse_result.tracks)
+        self._add_metadata(file, parse_result)
+
+    def _add_videos(self, file: Path, parse_result: TrackParseResult) -> None:
         track_ids = list(parse_result.tracks.track_ids)
         track_ids, videos = self._track_video_parser.parse(
             file, track_ids, parse_result.video_metadata
         )
         self._video_repository.add_all(videos)
         self._track_to_video_repository.add_all(track_ids, videos)
-        self._track_repository.add_all(parse_result.tracks)
+
+    def _add_metadata(self, file: Path, parse_result: TrackParseResult) -> None:
         self._track_file_repository.add(file)
         self._tracks_metadata.update_detection_classes(
             parse_result.detection_metadata.detection_classes
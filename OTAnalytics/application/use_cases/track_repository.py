@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Sequence
 
 from OTAnalytics.application.logger import logger
 from OTAnalytics.domain.track import Track, TrackId
@@ -86,6 +86,9 @@ class AddAllTracks:
     def __call__(self, tracks: TrackDataset) -> None:
         self._track_repository.add_all(tracks)
 
+    def add_many(self, datasets: Sequence[TrackDataset]) -> None:
+        self._track_repository.add_many(datasets)
+
 
 class ClearAllTracks:
     """Clear the track repository.
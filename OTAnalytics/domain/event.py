@@ -4,13 +4,15 @@ from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Callable, Iterable, Optional, Sequence
+from functools import cached_property
+from typing import Callable, Iterable, Iterator, Optional, Sequence, overload
 
 from OTAnalytics.domain.common import DataclassValidation
 from OTAnalytics.domain.geometry import DirectionVector2D, ImageCoordinate
 from OTAnalytics.domain.observer import OBSERVER, Subject
 from OTAnalytics.domain.section import Section, SectionId
 from OTAnalytics.domain.track import Detection
+from OTAnalytics.domain.track_dataset import ColumnValues, DetectionSelection
 from OTAnalytics.domain.types import EventType
 
 EVENT_LIST = "event_list"
@@ -146,6 +148,158 @@ class Event(DataclassValidation):
         return self.section_id.serialize() if self.section_id else None
 
 
+EVENT_BATCH_COLUMNS = (
+    "road_user_id",
+    "road_user_type",
+    "occurrence",
+    "frame_number",
+    "section_id",
+    "event_x",
+    "event_y",
+    "event_type",
+    "direction_x",
+    "direction_y",
+    "video_name",
+)
+
+
+@dataclass(frozen=True, eq=False)
+class EventBatch(Sequence[Event]):
+    """Events stored as columns.
+
+    The columns are filled in bulk, e.g. by intersectors. The `Event` objects are
+    only created once the batch is iterated or indexed. Pickling a batch, e.g. to
+    return it from another process, transfers the columns only.
+
+    Args:
+        road_user_id (ColumnValues[str]): the road user id of each event.
+        road_user_type (ColumnValues[str]): the road user type of each event.
+        occurrence (ColumnValues[datetime]): the time each event occurred.
+        frame_number (ColumnValues[int]): the video frame number of each event.
+        section_id (ColumnValues[Optional[SectionId]]): the section of each event.
+        event_x (ColumnValues[float]): the x coordinate of each event.
+        event_y (ColumnValues[float]): the y coordinate of each event.
+        event_type (ColumnValues[EventType]): the type of each event.
+        direction_x (ColumnValues[float]): the x component of the direction vector
+            of each event.
+        direction_y (ColumnValues[float]): the y component of the direction vector
+            of each event.
+        video_name (ColumnValues[str]): the video name of each event.
+    """
+
+    road_user_id: ColumnValues[str]
+    road_user_type: ColumnValues[str]
+    occurrence: ColumnValues[datetime]
+    frame_number: ColumnValues[int]
+    section_id: ColumnValues[Optional[SectionId]]
+    event_x: ColumnValues[float]
+    event_y: ColumnValues[float]
+    event_type: ColumnValues[EventType]
+    direction_x: ColumnValues[float]
+    direction_y: ColumnValues[float]
+    video_name: ColumnValues[str]
+
+    def __len__(self) -> int:
+        return len(self.road_user_id)
+
+    @staticmethod
+    def concat(batches: Sequence["EventBatch"]) -> "EventBatch":
+        """Concatenate the columns of multiple batches.
+
+        Args:
+            batches (Sequence[EventBatch]): the batches to concatenate.
+
+        Returns:
+            EventBatch: the events of all batches in the given order.
+        """
+        if len(batches) == 1:
+            return batches[0]
+        return EventBatch(
+            **{
+                name: list(
+                    itertools.chain.from_iterable(
+                        _as_list(getattr(batch, name)) for batch in batches
+                    )
+                )
+                for name in EVENT_BATCH_COLUMNS
+            }
+        )
+
+    def take(self, positions: Sequence[int]) -> "EventBatch":
+        """Select events by their position without creating `Event` objects.
+
+        Args:
+            positions (Sequence[int]): the positions of the events to select.
+
+        Returns:
+            EventBatch: the selected events in the order of the given positions.
+        """
+        columns = {name: _as_list(getattr(self, name)) for name in EVENT_BATCH_COLUMNS}
+        return EventBatch(
+            **{
+                name: [values[position] for position in positions]
+                for name, values in columns.items()
+            }
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> Event: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Event]: ...
+
+    def __getitem__(self, index: int | slice) -> Event | Sequence[Event]:
+        return self._events[index]
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(self._events)
+
+    def __getstate__(self) -> dict:
+        # The events are created again on demand
+        return {key: value for key, value in self.__dict__.items() if key != "_events"}
+
+    @cached_property
+    def _events(self) -> list[Event]:
+        hostnames = {
+            video_name: EventBuilder.extract_hostname(video_name)
+            for video_name in set(self.video_name)
+        }
+        return [
+            Event(
+                road_user_id=str(road_user_id),
+                road_user_type=str(road_user_type),
+                hostname=hostnames[video_name],
+                occurrence=occurrence,
+                frame_number=int(frame_number),
+                section_id=section_id,
+                event_coordinate=ImageCoordinate(float(x), float(y)),
+                event_type=event_type,
+                direction_vector=DirectionVector2D(float(x1), float(x2)),
+                video_name=str(video_name),
+            )
+            for (
+                road_user_id,
+                road_user_type,
+                occurrence,
+                frame_number,
+                section_id,
+                x,
+                y,
+                event_type,
+                x1,
+                x2,
+                video_name,
+            ) in zip(*(_as_list(getattr(self, name)) for name in EVENT_BATCH_COLUMNS))
+        ]
+
+
+def _as_list(values: ColumnValues) -> list:
+    # Converting array columns at once is faster than iterating over their items
+    if (to_list := getattr(values, "tolist", None)) is not None:
+        return to_list()
+    return list(values)
+
+
 class EventBuilder(ABC):
     """Defines an interface to build various type of events.
 
@@ -172,6 +326,38 @@ class EventBuilder(ABC):
         """
         pass
 
+    def create_event_batch(
+        self,
+        detections: DetectionSelection,
+        section_ids: Sequence[Optional[SectionId]],
+        event_types: Sequence[EventType],
+    ) -> EventBatch:
+        """Creates one event per detection without creating the event objects.
+
+        The events are located at the detections and point into their direction.
+
+        Args:
+            detections (DetectionSelection): the detections holding the information.
+            section_ids (Sequence[Optional[SectionId]]): the section of each event.
+            event_types (Sequence[EventType]): the type of each event.
+
+        Returns:
+            EventBatch: the events in the order of the detections.
+        """
+        return EventBatch(
+            road_user_id=detections.track_id,
+            road_user_type=detections.classification,
+            occurrence=detections.occurrence,
+            frame_number=detections.frame,
+            section_id=section_ids,
+            event_x=detections.x,
+            event_y=detections.y,
+            event_type=event_types,
+            direction_x=detections.direction_x,
+            direction_y=detections.direction_y,
+            video_name=detections.video_name,
+        )
+
     @staticmethod
     def extract_hostname(name: str) -> str:
         """Extract hostname from name.
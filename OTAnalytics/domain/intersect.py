@@ -1,7 +1,11 @@
+import itertools
+import os
+import time
 from abc import ABC, abstractmethod
-from typing import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Callable, Iterable, Sequence, cast
 
-from OTAnalytics.domain.event import Event, EventBuilder
+from OTAnalytics.domain.event import Event, EventBatch, EventBuilder
 from OTAnalytics.domain.geometry import Coordinate, Line, Polygon
 from OTAnalytics.domain.section import Section
 from OTAnalytics.domain.track_dataset import TrackDataset
@@ -92,18 +96,83 @@ class IntersectImplementation(ABC):
         pass
 
 
+@dataclass(frozen=True)
+class TaskTiming:
+    """Time spent on a single task of an intersection.
+
+    Args:
+        task (int): the position of the task in the executed tasks.
+        process_id (int): the id of the process executing the task.
+        duration (float): the duration of the task in seconds.
+    """
+
+    task: int
+    process_id: int
+    duration: float
+
+
+def execute_timed(
+    intersect: Callable[[TrackDataset, Iterable[Section]], Iterable[Event]],
+    task: int,
+    tracks: TrackDataset,
+    sections: Iterable[Section],
+) -> tuple[Iterable[Event], TaskTiming]:
+    """Execute a single intersection task and measure its duration.
+
+    Args:
+        intersect (Callable[[TrackDataset, Iterable[Section]], Iterable[Event]]):
+            the function to be executed on the tracks and sections.
+        task (int): the position of the task in the executed tasks.
+        tracks (TrackDataset): the tracks of the task.
+        sections (Iterable[Section]): the sections of the task.
+
+    Returns:
+        tuple[Iterable[Event], TaskTiming]: the generated events and the timing of
+            the task.
+    """
+    start = time.perf_counter()
+    events = intersect(tracks, sections)
+    return events, TaskTiming(task, os.getpid(), time.perf_counter() - start)
+
+
+def concat_events(results: Iterable[Iterable[Event]]) -> Sequence[Event]:
+    """Concatenate the events of all tasks in the order of the tasks. Columnar
+    batches stay columnar.
+
+    Args:
+        results (Iterable[Iterable[Event]]): the events of each task.
+
+    Returns:
+        Sequence[Event]: the events of all tasks.
+    """
+    events = list(results)
+    if all(isinstance(task_events, EventBatch) for task_events in events):
+        return EventBatch.concat(cast(list[EventBatch], events))
+    return list(itertools.chain.from_iterable(events))
+
+
 class IntersectParallelizationStrategy(ABC):
     @property
     @abstractmethod
     def num_processes(self) -> int:
         raise NotImplementedError
 
+    @property
+    @abstractmethod
+    def task_timings(self) -> list[TaskTiming]:
+        """The timings of the tasks of the last execution in the order of the tasks.
+
+        Returns:
+            list[TaskTiming]: the timing of each task.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def execute(
         self,
         intersect: Callable[[TrackDataset, Iterable[Section]], Iterable[Event]],
         tasks: Sequence[tuple[TrackDataset, Iterable[Section]]],
-    ) -> list[Event]:
+    ) -> Sequence[Event]:
         """Executes the intersection of tracks with sections with the implemented
         parallelization strategy.
 
@@ -114,7 +183,7 @@ class IntersectParallelizationStrategy(ABC):
                 to intersect function.
 
         Returns:
-            Iterable[Event]: the generated events.
+            Sequence[Event]: the generated events in the order of the tasks.
         """
         raise NotImplementedError
 
@@ -127,6 +196,24 @@ class IntersectParallelizationStrategy(ABC):
         """
         raise NotImplementedError
 
+    def share_tracks(self, tracks: TrackDataset) -> TrackDataset:
+        """Provide the tracks in a form that is cheap to pass to the processes of
+        this strategy. Tasks should be created from the returned dataset.
+
+        Args:
+            tracks (TrackDataset): the tracks to be intersected.
+
+        Returns:
+            TrackDataset: the tracks to create the tasks from.
+        """
+        return tracks
+
+    def close(self) -> None:
+        """Release the processes of this strategy. It can still be used afterwards,
+        e.g. by starting new processes.
+        """
+        pass
+
 
 class Intersector(ABC):
     """
@@ -140,7 +227,7 @@ class Intersector(ABC):
         track_dataset: TrackDataset,
         sections: Iterable[Section],
         event_builder: EventBuilder,
-    ) -> list[Event]:
+    ) -> Sequence[Event]:
         """Intersect tracks with sections and generate events if they intersect.
 
         Args:
@@ -149,7 +236,7 @@ class Intersector(ABC):
             event_builder (EventBuilder): builder to generate events
 
         Returns:
-            list[Event]: the events if the track intersects with the sections.
-                Otherwise, return empty list.
+            Sequence[Event]: the events if the track intersects with the sections.
+                Otherwise, return empty sequence.
         """
         raise NotImplementedError
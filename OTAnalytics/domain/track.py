@@ -42,6 +42,8 @@ class TrackHasNoDetectionError(TrackError):
 
 
 class Detection(ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def classification(self) -> str:
@@ -137,6 +139,8 @@ class Detection(ABC):
 
 
 class Track(ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def id(self) -> TrackId:
@@ -1,11 +1,24 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
-
-from OTAnalytics.domain.geometry import RelativeOffsetCoordinate
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Protocol,
+    Sequence,
+    TypeVar,
+)
+
+from OTAnalytics.domain.geometry import (
+    Coordinate,
+    RelativeOffsetCoordinate,
+    apply_offset,
+)
 from OTAnalytics.domain.section import Section, SectionId
-from OTAnalytics.domain.track import Track, TrackId
+from OTAnalytics.domain.track import Detection, Track, TrackId
 
 START_X: str = "start_x"
 START_Y: str = "start_y"
@@ -28,6 +41,193 @@ class IntersectionPoint:
     index: int
 
 
+T_co = TypeVar("T_co", covariant=True)
+
+
+class ColumnValues(Protocol[T_co]):
+    """Indexable values of a column, e.g. a list or a NumPy array."""
+
+    def __len__(self) -> int: ...
+
+    def __getitem__(self, index: int) -> T_co: ...
+
+    def __iter__(self) -> Iterator[T_co]: ...
+
+
+@dataclass(frozen=True, eq=False)
+class DetectionArray:
+    """Detections of a single track as columns.
+
+    Allows processing all detections of a track without creating a detection object
+    per detection. Implementations may provide views on their stored columns, e.g.
+    NumPy arrays.
+
+    Args:
+        track_id (TrackId): the id of the track.
+        classification (str): the classification of the track.
+        x (ColumnValues[float]): x coordinates of the detections.
+        y (ColumnValues[float]): y coordinates of the detections.
+        w (ColumnValues[float]): widths of the detections.
+        h (ColumnValues[float]): heights of the detections.
+        frame (ColumnValues[int]): frame numbers of the detections.
+        occurrence (ColumnValues[datetime]): occurrences of the detections.
+    """
+
+    track_id: TrackId
+    classification: str
+    x: ColumnValues[float]
+    y: ColumnValues[float]
+    w: ColumnValues[float]
+    h: ColumnValues[float]
+    frame: ColumnValues[int]
+    occurrence: ColumnValues[datetime]
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def get_coordinate(
+        self, index: int, offset: RelativeOffsetCoordinate | None
+    ) -> Coordinate:
+        """Get the coordinate of the detection at the given index.
+
+        Args:
+            index (int): index of the detection within the track.
+            offset (RelativeOffsetCoordinate | None): relative offset to be applied.
+
+        Returns:
+            Coordinate: the detection's coordinate.
+        """
+        x = float(self.x[index])
+        y = float(self.y[index])
+        if not offset or offset == RelativeOffsetCoordinate(0, 0):
+            return Coordinate(x, y)
+        return Coordinate(
+            x=x + float(self.w[index]) * offset.x,
+            y=y + float(self.h[index]) * offset.y,
+        )
+
+    @staticmethod
+    def from_track(track: Track) -> "DetectionArray":
+        detections = track.detections
+        return DetectionArray(
+            track_id=track.id,
+            classification=track.classification,
+            x=[detection.x for detection in detections],
+            y=[detection.y for detection in detections],
+            w=[detection.w for detection in detections],
+            h=[detection.h for detection in detections],
+            frame=[detection.frame for detection in detections],
+            occurrence=[detection.occurrence for detection in detections],
+        )
+
+
+@dataclass(frozen=True, eq=False)
+class DetectionSelection:
+    """Detections of multiple tracks selected by their index within their track.
+
+    Allows processing detections of many tracks at once, e.g. to create the events of
+    all intersection points in bulk. The direction of a detection is the vector from
+    the previous detection of its track. The first detection of a track uses the
+    vector to the following detection instead.
+
+    Args:
+        track_id (ColumnValues[str]): track ids of the detections.
+        classification (ColumnValues[str]): classifications of their tracks.
+        x (ColumnValues[float]): x coordinates with the offset applied.
+        y (ColumnValues[float]): y coordinates with the offset applied.
+        direction_x (ColumnValues[float]): x components of the directions.
+        direction_y (ColumnValues[float]): y components of the directions.
+        frame (ColumnValues[int]): frame numbers of the detections.
+        occurrence (ColumnValues[datetime]): occurrences of the detections.
+        video_name (ColumnValues[str]): video names of the detections.
+    """
+
+    track_id: ColumnValues[str]
+    classification: ColumnValues[str]
+    x: ColumnValues[float]
+    y: ColumnValues[float]
+    direction_x: ColumnValues[float]
+    direction_y: ColumnValues[float]
+    frame: ColumnValues[int]
+    occurrence: ColumnValues[datetime]
+    video_name: ColumnValues[str]
+
+    def __len__(self) -> int:
+        return len(self.track_id)
+
+
+@dataclass(frozen=True, eq=False)
+class AreaTransitions:
+    """Detections at which tracks enter or leave areas.
+
+    A track enters an area at the first detection inside of it and leaves it at the
+    first detection outside of it again. A track starting inside an area enters it
+    at its first detection. The transitions are ordered like the results of
+    `contained_by_sections`: by track, area and index.
+
+    Args:
+        track_id (ColumnValues[str]): the track of each transition.
+        section_id (Sequence[SectionId]): the area of each transition.
+        index (ColumnValues[int]): the index of the detection within its track.
+        entered (ColumnValues[bool]): whether the track enters or leaves the area.
+    """
+
+    track_id: ColumnValues[str]
+    section_id: Sequence[SectionId]
+    index: ColumnValues[int]
+    entered: ColumnValues[bool]
+
+    def __len__(self) -> int:
+        return len(self.track_id)
+
+    @staticmethod
+    def from_masks(
+        contained: dict[TrackId, list[tuple[SectionId, list[bool]]]],
+    ) -> "AreaTransitions":
+        """Find the transitions in the results of `contained_by_sections`.
+
+        Args:
+            contained (dict[TrackId, list[tuple[SectionId, list[bool]]]]): boolean
+                masks of the track coordinates contained by areas.
+
+        Returns:
+            AreaTransitions: the transitions of all tracks.
+        """
+        track_ids: list[str] = []
+        section_ids: list[SectionId] = []
+        indices: list[int] = []
+        entered: list[bool] = []
+        for track_id, masks in contained.items():
+            for section_id, mask in masks:
+                previous = False
+                for index, inside in enumerate(mask):
+                    if inside == previous:
+                        continue
+                    track_ids.append(track_id.id)
+                    section_ids.append(section_id)
+                    indices.append(index)
+                    entered.append(bool(inside))
+                    previous = inside
+        return AreaTransitions(track_ids, section_ids, indices, entered)
+
+    @staticmethod
+    def concat(transitions: Sequence["AreaTransitions"]) -> "AreaTransitions":
+        """Concatenate the columns of multiple transitions.
+
+        Args:
+            transitions (Sequence[AreaTransitions]): the transitions to concatenate.
+
+        Returns:
+            AreaTransitions: all transitions in the given order.
+        """
+        return AreaTransitions(
+            [_id for other in transitions for _id in other.track_id],
+            [_id for other in transitions for _id in other.section_id],
+            [index for other in transitions for index in other.index],
+            [entered for other in transitions for entered in other.entered],
+        )
+
+
 class TrackSegmentDataset(ABC):
     """Collection of track segments. A track segment consists of a start and an end
     point with additional information about the corresponding detection.
@@ -39,6 +239,130 @@ class TrackSegmentDataset(ABC):
         raise NotImplementedError
 
 
+@dataclass(frozen=True)
+class TrackSummary:
+    """Aggregated values of all detections of a track.
+
+    Args:
+        id (TrackId): the id of the track.
+        classification (str): the classification of the track.
+        start (datetime): occurrence of the first detection.
+        end (datetime): occurrence of the last detection.
+        length (int): number of detections.
+        max_confidence (float): maximum confidence of all detections.
+        min_x (float): minimum x coordinate of all bounding boxes.
+        min_y (float): minimum y coordinate of all bounding boxes.
+        max_x (float): maximum x coordinate of all bounding boxes.
+        max_y (float): maximum y coordinate of all bounding boxes.
+    """
+
+    id: TrackId
+    classification: str
+    start: datetime
+    end: datetime
+    length: int
+    max_confidence: float
+    min_x: float
+    min_y: float
+    max_x: float
+    max_y: float
+
+
+class TrackSummaryDataset(ABC):
+    """Collection of one TrackSummary per track. Consumers needing only per-track
+    aggregates use the summaries instead of iterating all detections.
+    """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_for(self, track_id: TrackId) -> Optional[TrackSummary]:
+        """Get the summary of the track with the given id.
+
+        Args:
+            track_id (TrackId): the id of the track.
+
+        Returns:
+            Optional[TrackSummary]: the summary if the track exists.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def as_list(self) -> list[TrackSummary]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_all(self, other: "TrackSummaryDataset") -> "TrackSummaryDataset":
+        """Add the summaries of the other dataset. Existing summaries of tracks
+        contained in the other dataset are replaced.
+
+        Args:
+            other (TrackSummaryDataset): the summaries to add.
+
+        Returns:
+            TrackSummaryDataset: the dataset containing the summaries of both datasets.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove_multiple(self, track_ids: set[TrackId]) -> "TrackSummaryDataset":
+        """Remove the summaries of the given tracks.
+
+        Args:
+            track_ids (set[TrackId]): the ids of the tracks to remove.
+
+        Returns:
+            TrackSummaryDataset: the dataset without the given tracks.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def filter_by_min_detection_length(self, length: int) -> "TrackSummaryDataset":
+        """Keep only the summaries of tracks with at least the given number of
+        detections.
+
+        Args:
+            length (int): the minimum number of detections.
+
+        Returns:
+            TrackSummaryDataset: the summaries of the remaining tracks.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_max_confidences_for(self, track_ids: list[str]) -> dict[str, float]:
+        """Get max confidences for given track ids.
+
+        Args:
+            track_ids: the track ids to get the max confidences for.
+
+        Returns:
+            dict[str, float]: the max confidence values for the track ids.
+
+        Raises:
+            TrackDoesNotExistError: if given track id does not exist within dataset.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_ids_alive_between(
+        self, start: Optional[datetime], end: Optional[datetime]
+    ) -> list[TrackId]:
+        """Get the ids of all tracks whose lifetime overlaps with the given time
+        window. Both bounds are inclusive.
+
+        Args:
+            start (Optional[datetime]): start of the time window. Unbounded if None.
+            end (Optional[datetime]): end of the time window. Unbounded if None.
+
+        Returns:
+            list[TrackId]: ids of the tracks alive within the time window.
+        """
+        raise NotImplementedError
+
+
 class TrackDataset(ABC):
     @property
     @abstractmethod
@@ -77,6 +401,23 @@ class TrackDataset(ABC):
     def add_all(self, other: Iterable[Track]) -> "TrackDataset":
         raise NotImplementedError
 
+    def add_many(self, datasets: Sequence["TrackDataset"]) -> "TrackDataset":
+        """Add the tracks of multiple datasets at once.
+
+        Tracks with the same id in several datasets are merged. Implementations
+        should merge all datasets in a single step instead of adding them one by one.
+
+        Args:
+            datasets (Sequence[TrackDataset]): the datasets to add.
+
+        Returns:
+            TrackDataset: the dataset containing the tracks of all datasets.
+        """
+        merged = self
+        for dataset in datasets:
+            merged = merged.add_all(dataset)
+        return merged
+
     @abstractmethod
     def get_for(self, id: TrackId) -> Optional[Track]:
         """
@@ -90,6 +431,83 @@ class TrackDataset(ABC):
         """
         raise NotImplementedError
 
+    def detections_array(self, track_id: TrackId) -> Optional[DetectionArray]:
+        """Retrieve the detections of a track as columns.
+
+        Use this instead of `get_for` to process all detections of a track without
+        creating a detection object per detection.
+
+        Args:
+            track_id (TrackId): id of the track.
+
+        Returns:
+            Optional[DetectionArray]: the detections if the track exists.
+        """
+        if (track := self.get_for(track_id)) is None:
+            return None
+        return DetectionArray.from_track(track)
+
+    def get_detections_at(
+        self,
+        track_ids: Sequence[TrackId],
+        indices: Sequence[int],
+        offset: RelativeOffsetCoordinate,
+    ) -> DetectionSelection:
+        """Retrieve detections of multiple tracks by their index within their track.
+
+        Use this instead of `get_for` to look up detections of many tracks at once.
+        Implementations should gather all detections with a single lookup.
+
+        Args:
+            track_ids (Sequence[TrackId]): the track of each detection.
+            indices (Sequence[int]): the index of each detection within its track.
+            offset (RelativeOffsetCoordinate): the offset to be applied to the
+                coordinates.
+
+        Returns:
+            DetectionSelection: the selected detections in the given order.
+
+        Raises:
+            TrackDoesNotExistError: if one of the tracks does not exist.
+            IndexError: if an index lies outside of its track.
+        """
+        tracks: dict[TrackId, Track] = {}
+        selected: list[Detection] = []
+        coordinates: list[tuple[float, float]] = []
+        directions: list[tuple[float, float]] = []
+        for track_id, index in zip(track_ids, indices):
+            if (track := tracks.get(track_id)) is None:
+                if (track := self.get_for(track_id)) is None:
+                    raise TrackDoesNotExistError(f"Track {track_id.id} not found.")
+                tracks[track_id] = track
+            detections = track.detections
+            if not 0 <= index < len(detections):
+                raise IndexError(f"Track {track_id.id} has no detection {index}.")
+            x, y = _apply_offset(detections[index], offset)
+            if index > 0:
+                previous_x, previous_y = _apply_offset(detections[index - 1], offset)
+                directions.append((x - previous_x, y - previous_y))
+            elif len(detections) > 1:
+                next_x, next_y = _apply_offset(detections[index + 1], offset)
+                directions.append((next_x - x, next_y - y))
+            else:
+                directions.append((0.0, 0.0))
+            selected.append(detections[index])
+            coordinates.append((x, y))
+        return DetectionSelection(
+            track_id=[detection.track_id.id for detection in selected],
+            classification=[
+                tracks[detection.track_id].classification for detection in selected
+            ],
+            x=[x for x, _ in coordinates],
+            y=[y for _, y in coordinates],
+            direction_x=[x for x, _ in directions],
+            direction_y=[y for _, y in directions],
+            frame=[detection.frame for detection in selected],
+            occurrence=[detection.occurrence for detection in selected],
+            video_name=[detection.video_name for detection in selected],
+        )
+
     @abstractmethod
     def remove(self, track_id: TrackId) -> "TrackDataset":
         raise NotImplementedError
@@ -157,10 +575,41 @@ class TrackDataset(ABC):
         """
         raise NotImplementedError
 
+    def area_transitions(
+        self, sections: list[Section], offset: RelativeOffsetCoordinate
+    ) -> AreaTransitions:
+        """Return the detections at which tracks enter or leave the given sections.
+
+        Args:
+             sections (list[Section]): the area sections.
+             offset (RelativeOffsetCoordinate): the offset to be applied to the tracks.
+
+        Returns:
+            AreaTransitions: the transitions of all tracks.
+        """
+        return AreaTransitions.from_masks(self.contained_by_sections(sections, offset))
+
     @abstractmethod
     def split(self, chunks: int) -> Sequence["TrackDataset"]:
         raise NotImplementedError
 
+    def split_by_track_ids(
+        self, batches: Sequence[Iterable[TrackId]]
+    ) -> Sequence["TrackDataset"]:
+        """Split the dataset into one dataset per batch of track ids. Calculated
+        geometries are kept. Track ids not contained in the dataset are ignored.
+
+        Args:
+            batches (Sequence[Iterable[TrackId]]): the track ids of each batch.
+
+        Returns:
+            Sequence[TrackDataset]: the dataset of each batch.
+        """
+        return [
+            self.remove_multiple(set(self.track_ids.difference(batch)))
+            for batch in batches
+        ]
+
     @abstractmethod
     def filter_by_min_detection_length(self, length: int) -> "TrackDataset":
         """Filter tracks by the minimum length of detections.
@@ -220,6 +669,22 @@ class TrackDataset(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_summaries(self) -> TrackSummaryDataset:
+        """Get the per-track aggregates of this dataset. The summaries are built
+        once and updated together with the dataset.
+
+        Returns:
+            TrackSummaryDataset: one summary per track.
+        """
+        raise NotImplementedError
+
+
+def _apply_offset(
+    detection: Detection, offset: RelativeOffsetCoordinate
+) -> tuple[float, float]:
+    return apply_offset(detection.x, detection.y, detection.w, detection.h, offset)
+
 
 class FilteredTrackDataset(TrackDataset):
     @property
@@ -265,6 +730,17 @@ class FilteredTrackDataset(TrackDataset):
     def get_for(self, id: TrackId) -> Optional[Track]:
         return self._filter().get_for(id)
 
+    def detections_array(self, track_id: TrackId) -> Optional[DetectionArray]:
+        return self._filter().detections_array(track_id)
+
+    def get_detections_at(
+        self,
+        track_ids: Sequence[TrackId],
+        indices: Sequence[int],
+        offset: RelativeOffsetCoordinate,
+    ) -> DetectionSelection:
+        return self._filter().get_detections_at(track_ids, indices, offset)
+
     def as_list(self) -> list[Track]:
         return self._filter().as_list()
 
@@ -283,6 +759,11 @@ class FilteredTrackDataset(TrackDataset):
     ) -> dict[TrackId, list[tuple[SectionId, list[bool]]]]:
         return self._filter().contained_by_sections(sections, offset)
 
+    def area_transitions(
+        self, sections: list[Section], offset: RelativeOffsetCoordinate
+    ) -> AreaTransitions:
+        return self._filter().area_transitions(sections, offset)
+
     def filter_by_min_detection_length(self, length: int) -> "TrackDataset":
         return self._filter().filter_by_min_detection_length(length)
 
@@ -295,6 +776,9 @@ class FilteredTrackDataset(TrackDataset):
     def get_max_confidences_for(self, track_ids: list[str]) -> dict[str, float]:
         return self._filter().get_max_confidences_for(track_ids)
 
+    def get_summaries(self) -> TrackSummaryDataset:
+        return self._filter().get_summaries()
+
 
 class TrackGeometryDataset(ABC):
     """Dataset containing track geometries.
@@ -416,6 +900,17 @@ class TrackGeometryDataset(ABC):
         """
         raise NotImplementedError
 
+    def area_transitions(self, sections: list[Section]) -> AreaTransitions:
+        """Return the detections at which tracks enter or leave the given sections.
+
+        Args:
+             sections (list[Section]): the area sections.
+
+        Returns:
+            AreaTransitions: the transitions of all tracks.
+        """
+        return AreaTransitions.from_masks(self.contained_by_sections(sections))
+
     @abstractmethod
     def __eq__(self, other: Any) -> bool:
         raise NotImplementedError
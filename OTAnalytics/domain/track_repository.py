@@ -2,12 +2,12 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Optional, Sequence
 
 from OTAnalytics.application.logger import logger
 from OTAnalytics.domain.observer import OBSERVER, Subject
 from OTAnalytics.domain.track import Track, TrackId
-from OTAnalytics.domain.track_dataset import TrackDataset
+from OTAnalytics.domain.track_dataset import TrackDataset, TrackSummaryDataset
 
 
 @dataclass(frozen=True)
@@ -145,6 +145,24 @@ class TrackRepository:
             self._dataset = self._dataset.add_all(tracks)
             self.observers.notify(TrackRepositoryEvent.create_added(tracks.track_ids))
 
+    def add_many(self, datasets: Sequence[TrackDataset]) -> None:
+        """
+        Add the tracks of multiple datasets to the repository at once and notify only
+        once about it.
+
+        Args:
+            datasets (Sequence[TrackDataset]): datasets containing the tracks to be
+                added.
+        """
+        datasets = [tracks for tracks in datasets if len(tracks)]
+        if datasets:
+            self._dataset = self._dataset.add_many(datasets)
+            self.observers.notify(
+                TrackRepositoryEvent.create_added(
+                    track_id for tracks in datasets for track_id in tracks.track_ids
+                )
+            )
+
     def get_for(self, id: TrackId) -> Optional[Track]:
         """
         Retrieve a track for the given id.
@@ -166,6 +184,14 @@ class TrackRepository:
         """
         return self._dataset
 
+    def get_summaries(self) -> TrackSummaryDataset:
+        """Retrieve the per-track aggregates of all tracks, e.g. their time bounds.
+
+        Returns:
+            TrackSummaryDataset: one summary per track within the repository.
+        """
+        return self._dataset.get_summaries()
+
     def get_all_ids(self) -> Iterable[TrackId]:
         """Get all track ids in this repository.
 
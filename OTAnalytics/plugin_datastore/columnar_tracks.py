@@ -0,0 +1,850 @@
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+import numpy
+import pandas
+from pandas import CategoricalDtype, DataFrame, DatetimeTZDtype, Index, MultiIndex
+
+from OTAnalytics.domain import track
+from OTAnalytics.domain.track import Detection, Track, TrackId
+from OTAnalytics.domain.track_dataset import (
+    END_FRAME,
+    END_OCCURRENCE,
+    END_VIDEO_NAME,
+    END_X,
+    END_Y,
+    START_FRAME,
+    START_OCCURRENCE,
+    START_VIDEO_NAME,
+    START_X,
+    START_Y,
+    DetectionArray,
+)
+
+MANIFEST_FILE: str = "manifest.json"
+TRACK_IDS_FILE: str = "track_ids.npy"
+OFFSETS_FILE: str = "offsets.npy"
+COLUMN_FILE_TYPE: str = ".npy"
+
+NAME: str = "name"
+FILE: str = "file"
+KIND: str = "kind"
+CATEGORIES: str = "categories"
+TIMEZONE: str = "timezone"
+COLUMNS: str = "columns"
+
+KIND_NUMERIC: str = "numeric"
+KIND_TEXT: str = "text"
+KIND_CATEGORICAL: str = "categorical"
+KIND_DATETIME: str = "datetime"
+
+INDEX_NAMES = [track.TRACK_ID, track.OCCURRENCE]
+
+SEGMENT_COLUMNS = {
+    track.X: (START_X, END_X),
+    track.Y: (START_Y, END_Y),
+    track.OCCURRENCE: (START_OCCURRENCE, END_OCCURRENCE),
+    track.FRAME: (START_FRAME, END_FRAME),
+    track.VIDEO_NAME: (START_VIDEO_NAME, END_VIDEO_NAME),
+}
+
+
+class UnsupportedColumnError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """Describes how the values of a column are stored.
+
+    Text and categorical columns are stored as categorical codes. Datetime columns
+    are stored as nanoseconds since epoch.
+
+    Args:
+        name (str): name of the column.
+        kind (str): kind of the stored values.
+        categories (tuple[str, ...]): categories of text and categorical columns.
+        timezone (str | None): timezone of datetime columns.
+    """
+
+    name: str
+    kind: str
+    categories: tuple[str, ...] = ()
+    timezone: str | None = None
+
+    def encode(self, values: Any) -> numpy.ndarray:
+        if self.kind == KIND_DATETIME:
+            datetimes = pandas.DatetimeIndex(values)
+            if self.timezone is not None:
+                datetimes = datetimes.tz_convert(None)
+            return numpy.asarray(datetimes.as_unit("ns")).view(numpy.int64)
+        if self.kind in (KIND_TEXT, KIND_CATEGORICAL):
+            return pandas.Categorical(values, categories=self.categories).codes
+        return numpy.asarray(values)
+
+    def decode(self, values: Any) -> Any:
+        """Convert stored values into the values of a DataFrame column.
+
+        Args:
+            values (Any): the stored values as NumPy array.
+
+        Returns:
+            Any: array like column values.
+        """
+        if self.kind == KIND_DATETIME:
+            datetimes = pandas.DatetimeIndex(values.view("datetime64[ns]"))
+            if self.timezone is None:
+                return datetimes
+            return datetimes.tz_localize("UTC").tz_convert(self.timezone)
+        if self.kind == KIND_CATEGORICAL:
+            return pandas.Categorical.from_codes(
+                values, categories=Index(self.categories)
+            )
+        if self.kind == KIND_TEXT:
+            return numpy.array(self.categories, dtype=object).take(values)
+        return values
+
+    def decode_value(self, value: Any) -> Any:
+        """Convert a single stored value into a Python value.
+
+        Args:
+            value (Any): the stored value as NumPy scalar.
+
+        Returns:
+            Any: the decoded value.
+        """
+        if self.kind == KIND_DATETIME:
+            if self.timezone is None:
+                return pandas.Timestamp(int(value))
+            return pandas.Timestamp(int(value), tz="UTC").tz_convert(self.timezone)
+        if self.kind in (KIND_TEXT, KIND_CATEGORICAL):
+            return self.categories[value]
+        return value.item()
+
+    def to_dict(self) -> dict:
+        return {
+            NAME: self.name,
+            KIND: self.kind,
+            CATEGORIES: list(self.categories),
+            TIMEZONE: self.timezone,
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> "ColumnSpec":
+        return ColumnSpec(
+            data[NAME], data[KIND], tuple(data[CATEGORIES]), data[TIMEZONE]
+        )
+
+    @staticmethod
+    def describe(name: str, values: Any) -> "ColumnSpec":
+        """Create the spec to store the given column values.
+
+        Args:
+            name (str): name of the column.
+            values (Any): the column values as pandas Series or Index.
+
+        Returns:
+            ColumnSpec: the spec of the column.
+
+        Raises:
+            UnsupportedColumnError: if the values can not be stored.
+        """
+        dtype = values.dtype
+        if isinstance(dtype, DatetimeTZDtype):
+            return ColumnSpec(name, KIND_DATETIME, timezone=str(dtype.tz))
+        if dtype.kind == "M":
+            return ColumnSpec(name, KIND_DATETIME)
+        if dtype == object or isinstance(dtype, CategoricalDtype):
+            categorical = pandas.Categorical(values)
+            if categorical.isna().any() or not all(
+                isinstance(category, str) for category in categorical.categories
+            ):
+                raise UnsupportedColumnError(
+                    f"Column '{name}' contains non text values."
+                )
+            kind = KIND_CATEGORICAL if dtype != object else KIND_TEXT
+            return ColumnSpec(name, kind, tuple(categorical.categories))
+        if dtype.kind in "biuf":
+            return ColumnSpec(name, KIND_NUMERIC)
+        raise UnsupportedColumnError(f"Column '{name}' has unsupported {dtype}.")
+
+
+@dataclass(frozen=True)
+class ColumnarTracks:
+    """Detections stored as contiguous columns sorted by track id and occurrence.
+
+    The detections of the track at position `i` are stored in the rows
+    `offsets[i]` to `offsets[i + 1]` of every column (compressed sparse row layout).
+    Track ids are sorted, thus a track is found by binary search. The columns are
+    either kept in memory or memory mapped from a directory written by `save`.
+
+    Args:
+        track_ids (numpy.ndarray): sorted unicode array of the track ids.
+        offsets (numpy.ndarray): first row of each track and the number of rows.
+        specs (tuple[ColumnSpec, ...]): how the columns are stored.
+        columns (dict[str, numpy.ndarray]): the stored values of each column.
+        directory (Path | None): directory the columns are memory mapped from.
+    """
+
+    track_ids: numpy.ndarray
+    offsets: numpy.ndarray
+    specs: tuple[ColumnSpec, ...]
+    columns: dict[str, numpy.ndarray] = field(repr=False)
+    directory: Path | None = None
+
+    def __len__(self) -> int:
+        return len(self.track_ids)
+
+    def __reduce__(self) -> tuple:
+        if self.directory is not None:
+            # Memory mapped columns are opened again instead of being pickled
+            return ColumnarTracks.load, (self.directory,)
+        return ColumnarTracks, (self.track_ids, self.offsets, self.specs, self.columns)
+
+    @property
+    def number_of_rows(self) -> int:
+        return int(self.offsets[-1])
+
+    @cached_property
+    def _specs_by_name(self) -> dict[str, ColumnSpec]:
+        return {spec.name: spec for spec in self.specs}
+
+    def spec_of(self, name: str) -> ColumnSpec:
+        return self._specs_by_name[name]
+
+    def value(self, name: str, row: int) -> Any:
+        """Get the decoded value of a single row of a column.
+
+        Args:
+            name (str): name of the column.
+            row (int): the row to get the value for.
+
+        Returns:
+            Any: the decoded value.
+        """
+        return self._specs_by_name[name].decode_value(self.columns[name][row])
+
+    def track(self, position: int) -> "NumpyTrack":
+        return NumpyTrack(self, position)
+
+    def detections_array(self, position: int) -> DetectionArray:
+        """Get the detections of the track at the given position as views on the
+        columns.
+
+        Args:
+            position (int): the position of the track.
+
+        Returns:
+            DetectionArray: the detections of the track.
+        """
+        start = int(self.offsets[position])
+        rows = slice(start, int(self.offsets[position + 1]))
+        return DetectionArray(
+            track_id=TrackId(str(self.track_ids[position])),
+            classification=self.value(track.TRACK_CLASSIFICATION, start),
+            x=self.columns[track.X][rows],
+            y=self.columns[track.Y][rows],
+            w=self.columns[track.W][rows],
+            h=self.columns[track.H][rows],
+            frame=self.columns[track.FRAME][rows],
+            occurrence=self.values(track.OCCURRENCE, rows),
+        )
+
+    def select(self, positions: numpy.ndarray) -> "ColumnarTracks":
+        """Create tracks containing only the tracks at the given positions.
+
+        The columns of consecutive positions are views on the columns of these
+        tracks. Otherwise, the selected rows are copied.
+
+        Args:
+            positions (numpy.ndarray): the track positions in ascending order.
+
+        Returns:
+            ColumnarTracks: the selected tracks kept in memory.
+        """
+        rows: numpy.ndarray | slice | None = slice(0, 0)
+        if len(positions):
+            rows = _as_slice(positions, self.offsets)
+        if rows is None:
+            rows = self.rows(positions)
+        lengths = self.offsets[positions + 1] - self.offsets[positions]
+        return ColumnarTracks(
+            self.track_ids[positions],
+            numpy.concatenate([[0], numpy.cumsum(lengths)]).astype(numpy.int64),
+            self.specs,
+            {name: column[rows] for name, column in self.columns.items()},
+        )
+
+    def find(self, track_ids: Sequence[str] | numpy.ndarray) -> numpy.ndarray:
+        """Find the positions of the given track ids.
+
+        Args:
+            track_ids (Sequence[str] | numpy.ndarray): the track ids to search for.
+
+        Returns:
+            numpy.ndarray: positions of the track ids or -1 if a track does not exist.
+        """
+        if len(self) == 0 or len(track_ids) == 0:
+            return numpy.full(len(track_ids), -1, dtype=numpy.int64)
+        searched = numpy.asarray(track_ids, dtype=str)
+        positions = numpy.searchsorted(self.track_ids, searched)
+        found = numpy.minimum(positions, len(self) - 1)
+        return numpy.where(self.track_ids[found] == searched, found, -1)
+
+    def rows(self, positions: numpy.ndarray) -> numpy.ndarray:
+        """Get the rows of the tracks at the given positions.
+
+        Args:
+            positions (numpy.ndarray): the track positions.
+
+        Returns:
+            numpy.ndarray: the rows of all tracks in the order of the positions.
+        """
+        starts = self.offsets[positions]
+        return _expand(starts, self.offsets[positions + 1] - starts)
+
+    def values(self, name: str, rows: numpy.ndarray | slice) -> Any:
+        """Get the decoded values of a column.
+
+        Args:
+            name (str): name of the column.
+            rows (numpy.ndarray | slice): the rows to get the values for.
+
+        Returns:
+            Any: the decoded values.
+        """
+        return self.spec_of(name).decode(numpy.array(self.columns[name][rows]))
+
+    def to_dataframe(self, positions: numpy.ndarray) -> DataFrame:
+        """Create a DataFrame in the layout of a PandasTrackDataset containing the
+        tracks at the given positions.
+
+        Args:
+            positions (numpy.ndarray): the track positions in ascending order.
+
+        Returns:
+            DataFrame: detections indexed by track id and occurrence.
+        """
+        if len(positions) == 0:
+            return DataFrame()
+        rows: numpy.ndarray | slice | None = _as_slice(positions, self.offsets)
+        if rows is None:
+            rows = self.rows(positions)
+        lengths = self.offsets[positions + 1] - self.offsets[positions]
+        track_ids = Index(self.track_ids[positions].astype(object))
+        index = MultiIndex.from_arrays(
+            [
+                track_ids.repeat(lengths),
+                self.values(track.OCCURRENCE, rows),
+            ],
+            names=INDEX_NAMES,
+        )
+        return DataFrame(
+            {
+                spec.name: self.values(spec.name, rows)
+                for spec in self.specs
+                if spec.name != track.OCCURRENCE
+            },
+            index=index,
+        )
+
+    @staticmethod
+    def merge(parts: Sequence["ColumnarTracks"]) -> "ColumnarTracks":
+        """Merge tracks with disjoint track ids without converting them into
+        DataFrames.
+
+        The tracks are reordered by id. Categories of text and categorical columns
+        are united and the stored codes are mapped onto the united categories.
+
+        Args:
+            parts (Sequence[ColumnarTracks]): the tracks to merge.
+
+        Returns:
+            ColumnarTracks: the merged tracks kept in memory.
+
+        Raises:
+            UnsupportedColumnError: if the parts do not have the same columns.
+        """
+        parts = [part for part in parts if len(part)]
+        if not parts:
+            return ColumnarTracks.from_dataframe(DataFrame())
+        if len(parts) == 1:
+            return parts[0]
+        names = [spec.name for spec in parts[0].specs]
+        if any(sorted(part.columns) != sorted(names) for part in parts):
+            raise UnsupportedColumnError("Tracks to merge have different columns.")
+        track_ids = numpy.concatenate([part.track_ids for part in parts])
+        order = numpy.argsort(track_ids, kind="stable")
+        lengths = numpy.concatenate([numpy.diff(part.offsets) for part in parts])
+        first_rows = numpy.cumsum([0] + [part.number_of_rows for part in parts])
+        starts = numpy.concatenate(
+            [
+                part.offsets[:-1] + first_row
+                for part, first_row in zip(parts, first_rows)
+            ]
+        )
+        rows = _expand(starts[order], lengths[order])
+        specs = []
+        columns = {}
+        for name in names:
+            spec, values = _merge_column([part.spec_of(name) for part in parts], parts)
+            specs.append(spec)
+            columns[name] = values[rows]
+        return ColumnarTracks(
+            track_ids[order],
+            numpy.concatenate([[0], numpy.cumsum(lengths[order])]).astype(numpy.int64),
+            tuple(specs),
+            columns,
+        )
+
+    def save(self, directory: Path) -> None:
+        """Write the columns as NumPy files into the given directory.
+
+        Args:
+            directory (Path): the directory to write to.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        numpy.save(directory / TRACK_IDS_FILE, self.track_ids)
+        numpy.save(directory / OFFSETS_FILE, self.offsets)
+        columns = []
+        for position, spec in enumerate(self.specs):
+            file = f"{position}{COLUMN_FILE_TYPE}"
+            numpy.save(directory / file, self.columns[spec.name])
+            columns.append({**spec.to_dict(), FILE: file})
+        (directory / MANIFEST_FILE).write_text(json.dumps({COLUMNS: columns}))
+
+    @staticmethod
+    def load(directory: Path) -> "ColumnarTracks":
+        """Memory map the columns written to the given directory.
+
+        Args:
+            directory (Path): the directory written by `save`.
+
+        Returns:
+            ColumnarTracks: the memory mapped tracks.
+        """
+        manifest = json.loads((directory / MANIFEST_FILE).read_text())
+        specs = tuple(ColumnSpec.from_dict(column) for column in manifest[COLUMNS])
+        columns = {
+            spec.name: _memory_map(directory / column[FILE])
+            for spec, column in zip(specs, manifest[COLUMNS])
+        }
+        return ColumnarTracks(
+            _memory_map(directory / TRACK_IDS_FILE),
+            _memory_map(directory / OFFSETS_FILE),
+            specs,
+            columns,
+            directory,
+        )
+
+    @staticmethod
+    def from_dataframe(data: DataFrame) -> "ColumnarTracks":
+        """Convert a DataFrame in the layout of a PandasTrackDataset.
+
+        Args:
+            data (DataFrame): detections indexed by track id and occurrence.
+
+        Returns:
+            ColumnarTracks: the tracks stored in memory.
+
+        Raises:
+            UnsupportedColumnError: if a column can not be stored.
+        """
+        if data.empty:
+            return ColumnarTracks(
+                numpy.array([], dtype=str), numpy.zeros(1, dtype=numpy.int64), (), {}
+            )
+        if not data.index.is_monotonic_increasing:
+            data = data.sort_index()
+        track_ids = data.index.get_level_values(track.TRACK_ID)
+        codes, uniques = pandas.factorize(track_ids, sort=True)
+        offsets = numpy.searchsorted(codes, numpy.arange(len(uniques) + 1))
+        occurrences = data.index.get_level_values(track.OCCURRENCE)
+        specs = [ColumnSpec.describe(track.OCCURRENCE, occurrences)]
+        columns = {track.OCCURRENCE: specs[0].encode(occurrences)}
+        for name, values in data.items():
+            spec = ColumnSpec.describe(str(name), values)
+            specs.append(spec)
+            columns[spec.name] = spec.encode(values)
+        return ColumnarTracks(
+            numpy.asarray(uniques, dtype=str),
+            offsets.astype(numpy.int64),
+            tuple(specs),
+            columns,
+        )
+
+
+@dataclass(frozen=True)
+class TrackSelection:
+    """Selection of tracks of a ColumnarTracks instance.
+
+    Args:
+        tracks (ColumnarTracks): the selected tracks.
+        positions (numpy.ndarray): positions of the selected tracks in ascending
+            order.
+    """
+
+    tracks: ColumnarTracks
+    positions: numpy.ndarray
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @staticmethod
+    def all(tracks: ColumnarTracks) -> "TrackSelection":
+        return TrackSelection(tracks, numpy.arange(len(tracks)))
+
+    @property
+    def track_ids(self) -> numpy.ndarray:
+        return self.tracks.track_ids[self.positions]
+
+    @property
+    def starts(self) -> numpy.ndarray:
+        return self.tracks.offsets[self.positions]
+
+    @property
+    def stops(self) -> numpy.ndarray:
+        return self.tracks.offsets[self.positions + 1]
+
+    @property
+    def lengths(self) -> numpy.ndarray:
+        return self.stops - self.starts
+
+    def find(self, track_ids: Sequence[str] | numpy.ndarray) -> numpy.ndarray:
+        """Find the positions of the given track ids within the selection.
+
+        Args:
+            track_ids (Sequence[str] | numpy.ndarray): the track ids to search for.
+
+        Returns:
+            numpy.ndarray: positions of the track ids or -1 if a track is not
+                selected.
+        """
+        positions = self.tracks.find(track_ids)
+        selected = numpy.isin(positions, self.positions)
+        return numpy.where(selected, positions, -1)
+
+    def filter(self, mask: numpy.ndarray) -> "TrackSelection":
+        return TrackSelection(self.tracks, self.positions[mask])
+
+    def without(self, positions: numpy.ndarray) -> "TrackSelection":
+        return TrackSelection(
+            self.tracks, numpy.setdiff1d(self.positions, positions, assume_unique=True)
+        )
+
+    def batches(self, size: int) -> Iterator["TrackSelection"]:
+        for start in range(0, len(self), size):
+            yield TrackSelection(self.tracks, self.positions[start : start + size])
+
+    def to_dataframe(self) -> DataFrame:
+        return self.tracks.to_dataframe(self.positions)
+
+    def segments(self, first: bool) -> DataFrame | None:
+        """Read the first or last segment of each track with at least two
+        detections from the columns.
+
+        Args:
+            first (bool): whether to read the first or the last segments.
+
+        Returns:
+            DataFrame | None: the segments indexed by track id or None if no track
+                has a segment.
+        """
+        segment_tracks = self.filter(self.lengths > 1)
+        if not len(segment_tracks):
+            return None
+        ends = segment_tracks.starts + 1 if first else segment_tracks.stops - 1
+        segment = {
+            track.TRACK_CLASSIFICATION: self.tracks.values(
+                track.TRACK_CLASSIFICATION, ends
+            )
+        }
+        for column, (start, _) in SEGMENT_COLUMNS.items():
+            segment[start] = self.tracks.values(column, ends - 1)
+        for column, (_, end) in SEGMENT_COLUMNS.items():
+            segment[end] = self.tracks.values(column, ends)
+        return DataFrame(segment, index=segment_tracks.track_ids.astype(object))
+
+    def summaries(self) -> DataFrame:
+        """Aggregate the detections of each selected track. The detections of a
+        track are sorted by occurrence, thus its first and last row give the time
+        bounds.
+
+        Returns:
+            DataFrame: the summaries indexed by track id. The columns are named like
+                the fields of TrackSummary.
+        """
+        if not len(self):
+            return DataFrame()
+        starts = self.starts
+        lengths = self.lengths
+        rows = self.tracks.rows(self.positions)
+        first_rows = numpy.cumsum(lengths) - lengths
+
+        def column(name: str) -> numpy.ndarray:
+            return numpy.asarray(self.tracks.columns[name][rows])
+
+        x = column(track.X)
+        y = column(track.Y)
+        return DataFrame(
+            {
+                "classification": numpy.asarray(
+                    self.tracks.values(track.TRACK_CLASSIFICATION, starts),
+                    dtype=object,
+                ),
+                "start": self.tracks.values(track.OCCURRENCE, starts),
+                "end": self.tracks.values(track.OCCURRENCE, self.stops - 1),
+                "length": lengths,
+                "max_confidence": numpy.maximum.reduceat(
+                    column(track.CONFIDENCE), first_rows
+                ),
+                "min_x": numpy.minimum.reduceat(x, first_rows),
+                "min_y": numpy.minimum.reduceat(y, first_rows),
+                "max_x": numpy.maximum.reduceat(x + column(track.W), first_rows),
+                "max_y": numpy.maximum.reduceat(y + column(track.H), first_rows),
+            },
+            index=self.track_ids.astype(object),
+        )
+
+    def max_confidences(self, track_ids: numpy.ndarray) -> dict[str, float]:
+        """Get the maximum detection confidence of the selected tracks with the
+        given ids.
+
+        Args:
+            track_ids (numpy.ndarray): the track ids to get the confidences for.
+
+        Returns:
+            dict[str, float]: the maximum confidence of each selected track.
+        """
+        positions = self.find(track_ids)
+        found = positions >= 0
+        if not found.any():
+            return {}
+        positions = positions[found]
+        lengths = self.tracks.offsets[positions + 1] - self.tracks.offsets[positions]
+        confidences = numpy.maximum.reduceat(
+            self.tracks.values(track.CONFIDENCE, self.tracks.rows(positions)),
+            numpy.cumsum(lengths) - lengths,
+        )
+        return dict(zip(track_ids[found].tolist(), confidences.tolist()))
+
+
+def split_selections(
+    selections: Sequence[TrackSelection], size: int
+) -> list[list[TrackSelection]]:
+    """Split the given selections into chunks of the given number of tracks.
+
+    Args:
+        selections (Sequence[TrackSelection]): the selections to split.
+        size (int): maximum number of tracks per chunk.
+
+    Returns:
+        list[list[TrackSelection]]: the chunks.
+    """
+    chunks: list[list[TrackSelection]] = []
+    current: list[TrackSelection] = []
+    remaining = size
+    for selection in selections:
+        start = 0
+        while start < len(selection):
+            stop = start + remaining
+            current.append(
+                TrackSelection(selection.tracks, selection.positions[start:stop])
+            )
+            remaining -= len(current[-1])
+            start = stop
+            if remaining == 0:
+                chunks.append(current)
+                current = []
+                remaining = size
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class NumpyDetection(Detection):
+    """View on a single row of columnar tracks.
+
+    Args:
+        tracks (ColumnarTracks): the tracks containing the detection.
+        row (int): the row of the detection.
+        track_id (str): the id of the track containing the detection.
+    """
+
+    __slots__ = ("_tracks", "_row", "_track_id")
+
+    def __init__(self, tracks: ColumnarTracks, row: int, track_id: str) -> None:
+        self._tracks = tracks
+        self._row = row
+        self._track_id = track_id
+
+    @property
+    def classification(self) -> str:
+        return self._tracks.value(track.CLASSIFICATION, self._row)
+
+    @property
+    def confidence(self) -> float:
+        return self._tracks.value(track.CONFIDENCE, self._row)
+
+    @property
+    def x(self) -> float:
+        return self._tracks.value(track.X, self._row)
+
+    @property
+    def y(self) -> float:
+        return self._tracks.value(track.Y, self._row)
+
+    @property
+    def w(self) -> float:
+        return self._tracks.value(track.W, self._row)
+
+    @property
+    def h(self) -> float:
+        return self._tracks.value(track.H, self._row)
+
+    @property
+    def frame(self) -> int:
+        return self._tracks.value(track.FRAME, self._row)
+
+    @property
+    def occurrence(self) -> datetime:
+        return self._tracks.value(track.OCCURRENCE, self._row)
+
+    @property
+    def interpolated_detection(self) -> bool:
+        return self._tracks.value(track.INTERPOLATED_DETECTION, self._row)
+
+    @property
+    def track_id(self) -> TrackId:
+        return TrackId(self._track_id)
+
+    @property
+    def video_name(self) -> str:
+        return self._tracks.value(track.VIDEO_NAME, self._row)
+
+    @property
+    def input_file(self) -> str:
+        return self._tracks.value(track.INPUT_FILE, self._row)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, NumpyDetection):
+            return False
+        return self.to_dict() == other.to_dict()
+
+    def __hash__(self) -> int:
+        return hash(self._track_id) + hash(self.occurrence)
+
+
+class NumpyTrack(Track):
+    """View on the rows of a single track of columnar tracks. Detections are
+    created on access by their row.
+
+    Args:
+        tracks (ColumnarTracks): the tracks containing the track.
+        position (int): the position of the track.
+    """
+
+    __slots__ = ("_tracks", "_position", "_start", "_stop")
+
+    def __init__(self, tracks: ColumnarTracks, position: int) -> None:
+        self._tracks = tracks
+        self._position = position
+        self._start = int(tracks.offsets[position])
+        self._stop = int(tracks.offsets[position + 1])
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @property
+    def id(self) -> TrackId:
+        return TrackId(str(self._tracks.track_ids[self._position]))
+
+    @property
+    def classification(self) -> str:
+        return self._tracks.value(track.TRACK_CLASSIFICATION, self._start)
+
+    @property
+    def detections(self) -> list[Detection]:
+        track_id = str(self._tracks.track_ids[self._position])
+        return [
+            NumpyDetection(self._tracks, row, track_id)
+            for row in range(self._start, self._stop)
+        ]
+
+    def get_detection(self, index: int) -> Detection:
+        row = range(self._start, self._stop)[index]
+        return NumpyDetection(
+            self._tracks, row, str(self._tracks.track_ids[self._position])
+        )
+
+    @property
+    def first_detection(self) -> Detection:
+        return self.get_detection(0)
+
+    @property
+    def last_detection(self) -> Detection:
+        return self.get_detection(-1)
+
+
+def _expand(starts: numpy.ndarray, lengths: numpy.ndarray) -> numpy.ndarray:
+    """Get the rows of consecutive row ranges given by their starts and lengths."""
+    first_row_of_range = numpy.cumsum(lengths) - lengths
+    return numpy.arange(lengths.sum()) + numpy.repeat(
+        starts - first_row_of_range, lengths
+    )
+
+
+def _merge_column(
+    specs: list[ColumnSpec], parts: Sequence[ColumnarTracks]
+) -> tuple[ColumnSpec, numpy.ndarray]:
+    """Concatenate the stored values of a column of several tracks.
+
+    Args:
+        specs (list[ColumnSpec]): the spec of the column in each part.
+        parts (Sequence[ColumnarTracks]): the parts to concatenate.
+
+    Returns:
+        tuple[ColumnSpec, numpy.ndarray]: the spec and values of the merged column.
+    """
+    first = specs[0]
+    name = first.name
+    if first.kind not in (KIND_TEXT, KIND_CATEGORICAL):
+        return first, numpy.concatenate([part.columns[name] for part in parts])
+    united = dict.fromkeys(category for spec in specs for category in spec.categories)
+    categories = tuple(sorted(united) if first.kind == KIND_TEXT else united)
+    code_of = {category: code for code, category in enumerate(categories)}
+    values = [
+        (
+            numpy.array(
+                [code_of[category] for category in spec.categories], dtype=numpy.int64
+            )[part.columns[name]]
+            if spec.categories != categories
+            else part.columns[name]
+        )
+        for spec, part in zip(specs, parts)
+    ]
+    dtype = pandas.Categorical.from_codes([], categories=Index(categories)).codes.dtype
+    return (
+        ColumnSpec(name, first.kind, categories, first.timezone),
+        numpy.concatenate(values).astype(dtype),
+    )
+
+
+def _as_slice(positions: numpy.ndarray, offsets: numpy.ndarray) -> slice | None:
+    """Get the rows of consecutive track positions as slice to avoid copying the
+    rows."""
+    if positions[-1] - positions[0] + 1 != len(positions):
+        return None
+    return slice(int(offsets[positions[0]]), int(offsets[positions[-1] + 1]))
+
+
+def _memory_map(file: Path) -> numpy.ndarray:
+    try:
+        return numpy.load(file, mmap_mode="r")
+    except ValueError:
+        # Empty arrays can not be memory mapped
+        return numpy.load(file)
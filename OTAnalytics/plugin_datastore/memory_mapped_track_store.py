@@ -0,0 +1,599 @@
+import shutil
+import tempfile
+import uuid
+import weakref
+from datetime import datetime
+from math import ceil
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence
+
+import numpy
+from pandas import DataFrame, concat
+
+from OTAnalytics.application.logger import logger
+from OTAnalytics.domain import track
+from OTAnalytics.domain.geometry import RelativeOffsetCoordinate
+from OTAnalytics.domain.section import Section, SectionId
+from OTAnalytics.domain.track import Track, TrackId
+from OTAnalytics.domain.track_dataset import (
+    TRACK_GEOMETRY_FACTORY,
+    AreaTransitions,
+    DetectionArray,
+    DetectionSelection,
+    FilteredTrackDataset,
+    IntersectionPoint,
+    TrackDataset,
+    TrackDoesNotExistError,
+    TrackSegmentDataset,
+)
+from OTAnalytics.plugin_datastore.columnar_tracks import (
+    ColumnarTracks,
+    TrackSelection,
+    split_selections,
+)
+from OTAnalytics.plugin_datastore.track_store import (
+    DEFAULT_CLASSIFICATOR,
+    LEVEL_TRACK_ID,
+    PandasDataFrameProvider,
+    PandasTrackClassificationCalculator,
+    PandasTrackDataset,
+    PandasTrackSegmentDataset,
+    PandasTrackSummaryDataset,
+)
+
+DEFAULT_BATCH_SIZE: int = 10000
+"""Number of tracks loaded into memory at once."""
+TEMPORARY_PREFIX: str = "otanalytics-tracks-"
+
+
+class MemoryMappedTrackStore:
+    """Directory holding the memory mapped columnar files of track datasets.
+
+    Every write creates a new immutable subdirectory. It is removed as soon as the
+    tracks written to it are no longer referenced.
+
+    Args:
+        directory (Path | None): the directory to store the tracks in. A temporary
+            directory removed on exit is used if None.
+    """
+
+    def __init__(self, directory: Path | None = None) -> None:
+        if directory is None:
+            directory = Path(tempfile.mkdtemp(prefix=TEMPORARY_PREFIX))
+            weakref.finalize(self, shutil.rmtree, directory, True)
+        self._directory = directory
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def write(self, data: DataFrame) -> ColumnarTracks:
+        """Write the given detections and memory map them.
+
+        Args:
+            data (DataFrame): detections in the layout of a PandasTrackDataset.
+
+        Returns:
+            ColumnarTracks: the memory mapped tracks.
+        """
+        part = self._directory / uuid.uuid4().hex
+        ColumnarTracks.from_dataframe(data).save(part)
+        tracks = ColumnarTracks.load(part)
+        weakref.finalize(tracks, shutil.rmtree, part, True)
+        return tracks
+
+
+class MemoryMappedTrackDataset(TrackDataset, PandasDataFrameProvider):
+    """TrackDataset keeping the detections in memory mapped columnar files.
+
+    Only the tracks currently processed are loaded into memory. Operations on the
+    whole dataset, e.g. intersecting tracks with sections, are processed in batches
+    of tracks using a PandasTrackDataset per batch. Single tracks, segments, track
+    lengths and confidences are read directly from the columns. The geometries of
+    the tracks are not kept in memory. They are calculated per batch whenever they
+    are needed. Only the tasks of a parallel intersection keep their batch in
+    memory once it is loaded, if they fit into a single batch.
+
+    Args:
+        store (MemoryMappedTrackStore): the store to write added tracks to.
+        track_geometry_factory (TRACK_GEOMETRY_FACTORY): factory to create the
+            geometries of a batch of tracks.
+        selections (Sequence[TrackSelection]): the tracks of the dataset. Track ids
+            must be unique over all selections.
+        calculator (PandasTrackClassificationCalculator): calculates the
+            classification of tracks spread over several added datasets.
+        batch_size (int): maximum number of tracks loaded into memory at once.
+        keep_loaded (bool): whether to keep a single loaded batch and its geometries
+            in memory. Used for the tasks created by `split_by_track_ids`.
+    """
+
+    def __init__(
+        self,
+        store: MemoryMappedTrackStore,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+        selections: Sequence[TrackSelection] = (),
+        calculator: PandasTrackClassificationCalculator = DEFAULT_CLASSIFICATOR,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        keep_loaded: bool = False,
+    ) -> None:
+        self._store = store
+        self.track_geometry_factory = track_geometry_factory
+        self._selections = [selection for selection in selections if len(selection)]
+        self.calculator = calculator
+        self._batch_size = batch_size
+        self._keep_loaded = keep_loaded
+        self._summaries: PandasTrackSummaryDataset | None = None
+        self._loaded: PandasTrackDataset | None = None
+
+    def __getstate__(self) -> dict:
+        # The loaded batch is read from the memory mapped files again on demand
+        return {**self.__dict__, "_loaded": None}
+
+    @property
+    def track_ids(self) -> frozenset[TrackId]:
+        return frozenset(
+            TrackId(track_id)
+            for selection in self._selections
+            for track_id in selection.track_ids
+        )
+
+    @property
+    def first_occurrence(self) -> datetime | None:
+        if self.empty:
+            return None
+        return min(
+            selection.tracks.values(track.OCCURRENCE, selection.starts).min()
+            for selection in self._selections
+        )
+
+    @property
+    def last_occurrence(self) -> datetime | None:
+        if self.empty:
+            return None
+        return max(
+            selection.tracks.values(track.OCCURRENCE, selection.stops - 1).max()
+            for selection in self._selections
+        )
+
+    @property
+    def classifications(self) -> frozenset[str]:
+        return frozenset(
+            classification
+            for selection in self._selections
+            for classification in selection.tracks.values(
+                track.TRACK_CLASSIFICATION, selection.starts
+            )
+        )
+
+    @property
+    def empty(self) -> bool:
+        return not self._selections
+
+    def __len__(self) -> int:
+        return sum(len(selection) for selection in self._selections)
+
+    def __iter__(self) -> Iterator[Track]:
+        for selection in self._selections:
+            for position in selection.positions:
+                yield selection.tracks.track(position)
+
+    def _with(
+        self, selections: Sequence[TrackSelection], keep_loaded: bool = False
+    ) -> "MemoryMappedTrackDataset":
+        return MemoryMappedTrackDataset(
+            self._store,
+            self.track_geometry_factory,
+            selections,
+            calculator=self.calculator,
+            batch_size=self._batch_size,
+            keep_loaded=keep_loaded,
+        )
+
+    def _to_pandas(self, selections: Sequence[TrackSelection]) -> PandasTrackDataset:
+        datasets = [
+            PandasTrackDataset(
+                self.track_geometry_factory,
+                selection.to_dataframe(),
+                calculator=self.calculator,
+            )
+            for selection in selections
+        ]
+        if len(datasets) == 1:
+            return datasets[0]
+        return PandasTrackDataset(
+            self.track_geometry_factory, calculator=self.calculator
+        ).add_many(datasets)
+
+    def _batches(self) -> Iterator[PandasTrackDataset]:
+        if self._keep_loaded and self._selections and len(self) <= self._batch_size:
+            if self._loaded is None:
+                self._loaded = self._to_pandas(self._selections)
+            yield self._loaded
+            return
+        for selection in self._selections:
+            for batch in selection.batches(self._batch_size):
+                yield self._to_pandas([batch])
+
+    def add_all(self, other: Iterable[Track]) -> "MemoryMappedTrackDataset":
+        added = PandasTrackDataset(
+            self.track_geometry_factory, calculator=self.calculator
+        ).add_all(other)
+        return self.add_many([added])
+
+    def add_many(self, datasets: Sequence[TrackDataset]) -> "MemoryMappedTrackDataset":
+        """Add the tracks of multiple datasets at once.
+
+        The added tracks are written into a new file. Existing tracks continued by
+        the added tracks are read, merged with the added ones and classified again.
+
+        Args:
+            datasets (Sequence[TrackDataset]): the datasets to add.
+
+        Returns:
+            MemoryMappedTrackDataset: the dataset containing the tracks of all
+                datasets.
+        """
+        added = PandasTrackDataset(
+            self.track_geometry_factory, calculator=self.calculator
+        ).add_many(datasets)
+        if (added_ids := added.get_index()) is None:
+            return self
+        continued, remaining = self._extract(numpy.asarray(added_ids, dtype=str))
+        if continued:
+            added = self._to_pandas(continued).add_many([added])
+        return self._with(
+            [*remaining, TrackSelection.all(self._store.write(added.get_data()))]
+        )
+
+    def _extract(
+        self, track_ids: numpy.ndarray
+    ) -> tuple[list[TrackSelection], list[TrackSelection]]:
+        """Separate the tracks with the given ids from the other tracks.
+
+        Args:
+            track_ids (numpy.ndarray): the track ids to separate.
+
+        Returns:
+            tuple[list[TrackSelection], list[TrackSelection]]: the selections of the
+                given tracks and the selections of the remaining tracks.
+        """
+        extracted: list[TrackSelection] = []
+        remaining: list[TrackSelection] = []
+        for selection in self._selections:
+            positions = selection.find(track_ids)
+            positions = numpy.sort(positions[positions >= 0])
+            if len(positions):
+                extracted.append(TrackSelection(selection.tracks, positions))
+                remaining.append(selection.without(positions))
+            else:
+                remaining.append(selection)
+        return extracted, remaining
+
+    def _locate(self, track_id: TrackId) -> tuple[ColumnarTracks, int] | None:
+        searched = numpy.asarray([track_id.id], dtype=str)
+        for selection in self._selections:
+            if (position := int(selection.find(searched)[0])) >= 0:
+                return selection.tracks, position
+        return None
+
+    def get_for(self, id: TrackId) -> Optional[Track]:
+        if (location := self._locate(id)) is None:
+            return None
+        tracks, position = location
+        return tracks.track(position)
+
+    def detections_array(self, track_id: TrackId) -> Optional[DetectionArray]:
+        if (location := self._locate(track_id)) is None:
+            return None
+        tracks, position = location
+        return tracks.detections_array(position)
+
+    def get_detections_at(
+        self,
+        track_ids: Sequence[TrackId],
+        indices: Sequence[int],
+        offset: RelativeOffsetCoordinate,
+    ) -> DetectionSelection:
+        if self._loaded is not None:
+            return self._loaded.get_detections_at(track_ids, indices, offset)
+        # Only the tracks of the selected detections are loaded into memory
+        selected, _ = self._extract(
+            numpy.unique(numpy.asarray([track_id.id for track_id in track_ids]))
+        )
+        return self._to_pandas(selected).get_detections_at(track_ids, indices, offset)
+
+    def remove(self, track_id: TrackId) -> "MemoryMappedTrackDataset":
+        return self.remove_multiple({track_id})
+
+    def remove_multiple(self, track_ids: set[TrackId]) -> "MemoryMappedTrackDataset":
+        _, remaining = self._extract(
+            numpy.asarray([track_id.id for track_id in track_ids], dtype=str)
+        )
+        return self._with(remaining)
+
+    def clear(self) -> "MemoryMappedTrackDataset":
+        return self._with([])
+
+    def as_list(self) -> list[Track]:
+        return list(self)
+
+    def get_data(self) -> DataFrame:
+        logger().info(
+            "Loading all tracks into memory in "
+            f"'{MemoryMappedTrackDataset.get_data.__name__}'."
+        )
+        return self._to_pandas(self._selections).get_data()
+
+    def intersecting_tracks(
+        self, sections: list[Section], offset: RelativeOffsetCoordinate
+    ) -> set[TrackId]:
+        intersecting: set[TrackId] = set()
+        for batch in self._batches():
+            intersecting.update(batch.intersecting_tracks(sections, offset))
+        return intersecting
+
+    def intersection_points(
+        self, sections: list[Section], offset: RelativeOffsetCoordinate
+    ) -> dict[TrackId, list[tuple[SectionId, IntersectionPoint]]]:
+        intersection_points: dict[
+            TrackId, list[tuple[SectionId, IntersectionPoint]]
+        ] = {}
+        for batch in self._batches():
+            intersection_points.update(batch.intersection_points(sections, offset))
+        return intersection_points
+
+    def contained_by_sections(
+        self, sections: list[Section], offset: RelativeOffsetCoordinate
+    ) -> dict[TrackId, list[tuple[SectionId, list[bool]]]]:
+        contained: dict[TrackId, list[tuple[SectionId, list[bool]]]] = {}
+        for batch in self._batches():
+            contained.update(batch.contained_by_sections(sections, offset))
+        return contained
+
+    def area_transitions(
+        self, sections: list[Section], offset: RelativeOffsetCoordinate
+    ) -> AreaTransitions:
+        return AreaTransitions.concat(
+            [batch.area_transitions(sections, offset) for batch in self._batches()]
+        )
+
+    def split(self, chunks: int) -> Sequence["MemoryMappedTrackDataset"]:
+        if self.empty:
+            return [self]
+        chunk_size = ceil(len(self) / chunks)
+        return [
+            self._with(selections)
+            for selections in split_selections(self._selections, chunk_size)
+        ]
+
+    def split_by_track_ids(
+        self, batches: Sequence[Iterable[TrackId]]
+    ) -> Sequence["MemoryMappedTrackDataset"]:
+        return [
+            self._with(
+                self._extract(
+                    numpy.asarray([track_id.id for track_id in batch], dtype=str)
+                )[0],
+                keep_loaded=True,
+            )
+            for batch in batches
+        ]
+
+    def filter_by_min_detection_length(self, length: int) -> "MemoryMappedTrackDataset":
+        return self._with(
+            [
+                selection.filter(selection.lengths >= length)
+                for selection in self._selections
+            ]
+        )
+
+    def filter_by_classifications(
+        self, classifications: Iterable[str]
+    ) -> "MemoryMappedTrackDataset":
+        """Keep only tracks of the given classifications.
+
+        Args:
+            classifications (Iterable[str]): the track classifications to keep.
+
+        Returns:
+            MemoryMappedTrackDataset: the filtered dataset.
+        """
+        classes = list(classifications)
+        return self._with(
+            [
+                selection.filter(
+                    numpy.isin(
+                        selection.tracks.values(
+                            track.TRACK_CLASSIFICATION, selection.starts
+                        ),
+                        classes,
+                    )
+                )
+                for selection in self._selections
+            ]
+        )
+
+    def calculate_geometries_for(
+        self, offsets: Iterable[RelativeOffsetCoordinate]
+    ) -> None:
+        # Geometries are calculated per batch whenever they are needed
+        pass
+
+    def get_first_segments(self) -> TrackSegmentDataset:
+        return self._create_segments(first=True)
+
+    def get_last_segments(self) -> TrackSegmentDataset:
+        return self._create_segments(first=False)
+
+    def _create_segments(self, first: bool) -> PandasTrackSegmentDataset:
+        segments = [
+            segment
+            for selection in self._selections
+            if (segment := selection.segments(first)) is not None
+        ]
+        if not segments:
+            return PandasTrackSegmentDataset(DataFrame())
+        result = concat(segments) if len(segments) > 1 else segments[0]
+        result.index.name = LEVEL_TRACK_ID
+        return PandasTrackSegmentDataset(result)
+
+    def cut_with_section(
+        self, section: Section, offset: RelativeOffsetCoordinate
+    ) -> tuple["MemoryMappedTrackDataset", set[TrackId]]:
+        if self.empty:
+            logger().info("No tracks to cut")
+            return self, set()
+        cut_selections: list[TrackSelection] = []
+        original_track_ids: set[TrackId] = set()
+        for batch in self._batches():
+            cut_tracks, cut_track_ids = batch.cut_with_section(section, offset)
+            if cut_track_ids:
+                cut_selections.append(
+                    TrackSelection.all(self._store.write(cut_tracks.get_data()))
+                )
+                original_track_ids.update(cut_track_ids)
+        return self._with(cut_selections), original_track_ids
+
+    def get_summaries(self) -> PandasTrackSummaryDataset:
+        if self._summaries is None:
+            self._summaries = PandasTrackSummaryDataset(
+                concat([selection.summaries() for selection in self._selections])
+                if self._selections
+                else None
+            )
+        return self._summaries
+
+    def get_max_confidences_for(self, track_ids: list[str]) -> dict[str, float]:
+        searched = numpy.asarray(track_ids, dtype=str)
+        max_confidences: dict[str, float] = {}
+        for selection in self._selections:
+            max_confidences.update(selection.max_confidences(searched))
+        if len(max_confidences) != len(set(track_ids)):
+            raise TrackDoesNotExistError(
+                "Some tracks do not exists in dataset with given id"
+            )
+        return max_confidences
+
+
+class FilteredMemoryMappedTrackDataset(FilteredTrackDataset, PandasDataFrameProvider):
+    @property
+    def include_classes(self) -> frozenset[str]:
+        return self._include_classes
+
+    @property
+    def exclude_classes(self) -> frozenset[str]:
+        return self._exclude_classes
+
+    def __init__(
+        self,
+        other: MemoryMappedTrackDataset,
+        include_classes: frozenset[str],
+        exclude_classes: frozenset[str],
+    ) -> None:
+        self._other = other
+        self._include_classes = include_classes
+        self._exclude_classes = exclude_classes
+        self._cache: MemoryMappedTrackDataset | None = None
+
+    def _filter(self) -> MemoryMappedTrackDataset:
+        """Filter TrackDataset by classifications.
+
+        IMPORTANT: Classifications contained in the include_classes will not be
+        removed even if they appear in the set of exclude_classes.
+        Furthermore, the whitelist will not be applied if empty.
+
+        Returns:
+            MemoryMappedTrackDataset: the filtered dataset.
+        """
+        if not self.include_classes and not self.exclude_classes:
+            return self._other
+        if self._cache is None:
+            if self.include_classes:
+                classes = self._other.classifications & self.include_classes
+            else:
+                classes = self._other.classifications - self.exclude_classes
+            self._cache = self._other.filter_by_classifications(classes)
+        return self._cache
+
+    def add_all(self, other: Iterable[Track]) -> TrackDataset:
+        return self.wrap(self._other.add_all(other))
+
+    def add_many(self, datasets: Sequence[TrackDataset]) -> TrackDataset:
+        return self.wrap(self._other.add_many(datasets))
+
+    def remove(self, track_id: TrackId) -> TrackDataset:
+        return self.wrap(self._other.remove(track_id))
+
+    def remove_multiple(self, track_ids: set[TrackId]) -> TrackDataset:
+        return self.wrap(self._other.remove_multiple(track_ids))
+
+    def clear(self) -> TrackDataset:
+        return self.wrap(self._other.clear())
+
+    def split(self, chunks: int) -> Sequence[TrackDataset]:
+        return [self.wrap(dataset) for dataset in self._other.split(chunks)]
+
+    def split_by_track_ids(
+        self, batches: Sequence[Iterable[TrackId]]
+    ) -> Sequence[TrackDataset]:
+        return [
+            self.wrap(dataset) for dataset in self._other.split_by_track_ids(batches)
+        ]
+
+    def calculate_geometries_for(
+        self, offsets: Iterable[RelativeOffsetCoordinate]
+    ) -> None:
+        self._other.calculate_geometries_for(offsets)
+
+    def cut_with_section(
+        self, section: Section, offset: RelativeOffsetCoordinate
+    ) -> tuple[TrackDataset, set[TrackId]]:
+        dataset, original_track_ids = self._other.cut_with_section(section, offset)
+        return self.wrap(dataset), original_track_ids
+
+    def wrap(self, other: MemoryMappedTrackDataset) -> TrackDataset:
+        return FilteredMemoryMappedTrackDataset(
+            other, self.include_classes, self.exclude_classes
+        )
+
+    def get_data(self) -> DataFrame:
+        return self._filter().get_data()
+
+
+class MemoryMappedTrackSharing:
+    """Share tracks with other processes using memory mapped columnar files.
+
+    The tracks are written into the store once. Pickling the shared dataset
+    transfers the directories and positions of the tracks only, every process memory
+    maps the same files. The shared copy of the most recently shared dataset is
+    reused until another dataset is shared. Memory mapped datasets are already
+    shared.
+
+    Args:
+        store (MemoryMappedTrackStore): the store to write the shared tracks to.
+        track_geometry_factory (TRACK_GEOMETRY_FACTORY): factory to create the
+            geometries of the shared tracks.
+    """
+
+    def __init__(
+        self,
+        store: MemoryMappedTrackStore,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+    ) -> None:
+        self._store = store
+        self._track_geometry_factory = track_geometry_factory
+        self._source: weakref.ref[TrackDataset] | None = None
+        self._shared: MemoryMappedTrackDataset | None = None
+
+    def __call__(self, tracks: TrackDataset) -> TrackDataset:
+        if isinstance(
+            tracks, (MemoryMappedTrackDataset, FilteredMemoryMappedTrackDataset)
+        ):
+            return tracks
+        if self._shared is None or self._source is None or self._source() is not tracks:
+            logger().debug("Writing tracks to memory mapped files to share them.")
+            self._shared = MemoryMappedTrackDataset(
+                self._store, self._track_geometry_factory
+            ).add_many([tracks])
+            self._source = weakref.ref(tracks)
+        return self._shared
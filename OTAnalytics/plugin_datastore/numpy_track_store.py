@@ -0,0 +1,536 @@
+from datetime import datetime
+from math import ceil
+from typing import Iterable, Iterator, Optional, Sequence
+
+import numpy
+from pandas import DataFrame, Index, MultiIndex
+
+from OTAnalytics.application.logger import logger
+from OTAnalytics.domain import track
+from OTAnalytics.domain.geometry import RelativeOffsetCoordinate
+from OTAnalytics.domain.section import Section, SectionId
+from OTAnalytics.domain.track import Track, TrackId
+from OTAnalytics.domain.track_dataset import (
+    TRACK_GEOMETRY_FACTORY,
+    AreaTransitions,
+    DetectionArray,
+    DetectionSelection,
+    FilteredTrackDataset,
+    IntersectionPoint,
+    TrackDataset,
+    TrackDoesNotExistError,
+    TrackGeometryDataset,
+    TrackSegmentDataset,
+)
+from OTAnalytics.plugin_datastore.columnar_tracks import (
+    INDEX_NAMES,
+    ColumnarTracks,
+    TrackSelection,
+)
+from OTAnalytics.plugin_datastore.track_store import (
+    DEFAULT_CLASSIFICATOR,
+    LEVEL_TRACK_ID,
+    PandasDataFrameProvider,
+    PandasTrackClassificationCalculator,
+    PandasTrackDataset,
+    PandasTrackSegmentDataset,
+    PandasTrackSummaryDataset,
+    create_cut_track_ids,
+    offset_coordinates,
+    select_detection_rows,
+)
+
+
+class NumpyTrackDataset(TrackDataset, PandasDataFrameProvider):
+    """TrackDataset keeping the detections in contiguous NumPy columns sorted by
+    track id and occurrence.
+
+    The detections of a track are a slice of the columns given by the track offsets.
+    Thus, tracks are found by binary search and tracks as well as detections are
+    views on the columns instead of copies. Splitting the dataset slices the columns
+    without copying them.
+
+    Args:
+        track_geometry_factory (TRACK_GEOMETRY_FACTORY): factory to create the
+            geometries of the tracks.
+        tracks (ColumnarTracks | None): the tracks of the dataset.
+        geometry_datasets (dict[RelativeOffsetCoordinate, TrackGeometryDataset] |
+            None): already calculated geometries of the tracks.
+        calculator (PandasTrackClassificationCalculator): calculates the
+            classification of tracks spread over several added datasets.
+        summaries (PandasTrackSummaryDataset | None): already calculated summaries
+            of the tracks. Calculated on demand if None.
+    """
+
+    def __init__(
+        self,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+        tracks: ColumnarTracks | None = None,
+        geometry_datasets: (
+            dict[RelativeOffsetCoordinate, TrackGeometryDataset] | None
+        ) = None,
+        calculator: PandasTrackClassificationCalculator = DEFAULT_CLASSIFICATOR,
+        summaries: PandasTrackSummaryDataset | None = None,
+    ) -> None:
+        if tracks is None:
+            tracks = ColumnarTracks.from_dataframe(DataFrame())
+        self.track_geometry_factory = track_geometry_factory
+        self._tracks = tracks
+        self._selection = TrackSelection.all(tracks)
+        if geometry_datasets is None:
+            geometry_datasets = {}
+        self._geometry_datasets = geometry_datasets
+        self.calculator = calculator
+        self._summaries = summaries
+
+    @staticmethod
+    def from_dataframe(
+        tracks: DataFrame,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+        calculator: PandasTrackClassificationCalculator = DEFAULT_CLASSIFICATOR,
+    ) -> "NumpyTrackDataset":
+        """Create a dataset from detections in the layout of a PandasTrackDataset.
+
+        Args:
+            tracks (DataFrame): detections indexed by track id and occurrence.
+            track_geometry_factory (TRACK_GEOMETRY_FACTORY): factory to create the
+                geometries of the tracks.
+            calculator (PandasTrackClassificationCalculator): calculates the
+                classification of the tracks.
+
+        Returns:
+            NumpyTrackDataset: the dataset containing the given detections.
+        """
+        classified = PandasTrackDataset.from_dataframe(
+            tracks, track_geometry_factory, calculator=calculator
+        )
+        return NumpyTrackDataset(
+            track_geometry_factory,
+            ColumnarTracks.from_dataframe(classified.get_data()),
+            calculator=calculator,
+        )
+
+    @property
+    def track_ids(self) -> frozenset[TrackId]:
+        return frozenset(TrackId(track_id) for track_id in self._tracks.track_ids)
+
+    @property
+    def first_occurrence(self) -> datetime | None:
+        if self.empty:
+            return None
+        return self._tracks.values(track.OCCURRENCE, self._selection.starts).min()
+
+    @property
+    def last_occurrence(self) -> datetime | None:
+        if self.empty:
+            return None
+        return self._tracks.values(track.OCCURRENCE, self._selection.stops - 1).max()
+
+    @property
+    def classifications(self) -> frozenset[str]:
+        if self.empty:
+            return frozenset()
+        return frozenset(
+            self._tracks.values(track.TRACK_CLASSIFICATION, self._selection.starts)
+        )
+
+    @property
+    def empty(self) -> bool:
+        return len(self._tracks) == 0
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    def __iter__(self) -> Iterator[Track]:
+        for position in range(len(self._tracks)):
+            yield self._tracks.track(position)
+
+    def _with(
+        self,
+        tracks: ColumnarTracks,
+        geometry_datasets: (
+            dict[RelativeOffsetCoordinate, TrackGeometryDataset] | None
+        ) = None,
+        summaries: PandasTrackSummaryDataset | None = None,
+    ) -> "NumpyTrackDataset":
+        return NumpyTrackDataset(
+            self.track_geometry_factory,
+            tracks,
+            geometry_datasets,
+            calculator=self.calculator,
+            summaries=summaries,
+        )
+
+    def _to_pandas(self, tracks: ColumnarTracks | None = None) -> PandasTrackDataset:
+        if tracks is None:
+            tracks = self._tracks
+        return PandasTrackDataset(
+            self.track_geometry_factory,
+            TrackSelection.all(tracks).to_dataframe(),
+            calculator=self.calculator,
+        )
+
+    def add_all(self, other: Iterable[Track]) -> "NumpyTrackDataset":
+        added = PandasTrackDataset(
+            self.track_geometry_factory, calculator=self.calculator
+        ).add_all(other)
+        return self.add_many([added])
+
+    def add_many(self, datasets: Sequence[TrackDataset]) -> "NumpyTrackDataset":
+        """Add the tracks of multiple datasets at once.
+
+        Only the existing tracks continued by the added tracks are converted to
+        pandas, merged with the added ones and classified again. All other tracks
+        are merged column by column.
+
+        Args:
+            datasets (Sequence[TrackDataset]): the datasets to add.
+
+        Returns:
+            NumpyTrackDataset: the dataset containing the tracks of all datasets.
+        """
+        added = PandasTrackDataset(
+            self.track_geometry_factory, calculator=self.calculator
+        ).add_many(datasets)
+        if (added_ids := added.get_index()) is None:
+            return self
+        continued = self._tracks.find(numpy.asarray(added_ids, dtype=str))
+        continued = numpy.sort(continued[continued >= 0])
+        if len(continued):
+            added = self._to_pandas(self._tracks.select(continued)).add_many([added])
+        remaining = self._tracks.select(self._selection.without(continued).positions)
+        geometry_datasets = {
+            offset: geometries.remove(list(added_ids)).add_all(added)
+            for offset, geometries in self._geometry_datasets.items()
+        }
+        summaries = None
+        if self._summaries is not None:
+            summaries = self._summaries.add_all(added.get_summaries())
+        return self._with(
+            ColumnarTracks.merge(
+                [remaining, ColumnarTracks.from_dataframe(added.get_data())]
+            ),
+            geometry_datasets,
+            summaries,
+        )
+
+    def get_for(self, id: TrackId) -> Optional[Track]:
+        position = int(self._tracks.find([id.id])[0])
+        if position < 0:
+            return None
+        return self._tracks.track(position)
+
+    def detections_array(self, track_id: TrackId) -> Optional[DetectionArray]:
+        position = int(self._tracks.find([track_id.id])[0])
+        if position < 0:
+            return None
+        return self._tracks.detections_array(position)
+
+    def get_detections_at(
+        self,
+        track_ids: Sequence[TrackId],
+        indices: Sequence[int],
+        offset: RelativeOffsetCoordinate,
+    ) -> DetectionSelection:
+        positions = self._tracks.find([track_id.id for track_id in track_ids])
+        if (missing := numpy.flatnonzero(positions < 0)).size:
+            raise TrackDoesNotExistError(f"Track {track_ids[missing[0]].id} not found.")
+        columns = self._tracks.columns
+        rows, x, y, direction_x, direction_y = select_detection_rows(
+            self._tracks.offsets[positions],
+            self._tracks.offsets[positions + 1],
+            indices,
+            lambda selected: offset_coordinates(
+                columns[track.X],
+                columns[track.Y],
+                columns[track.W],
+                columns[track.H],
+                selected,
+                offset,
+            ),
+        )
+        return DetectionSelection(
+            track_id=self._tracks.track_ids[positions],
+            classification=self._tracks.values(track.TRACK_CLASSIFICATION, rows),
+            x=x,
+            y=y,
+            direction_x=direction_x,
+            direction_y=direction_y,
+            frame=self._tracks.values(track.FRAME, rows),
+            occurrence=self._tracks.values(track.OCCURRENCE, rows),
+            video_name=self._tracks.values(track.VIDEO_NAME, rows),
+        )
+
+    def remove(self, track_id: TrackId) -> "NumpyTrackDataset":
+        return self.remove_multiple({track_id})
+
+    def remove_multiple(self, track_ids: set[TrackId]) -> "NumpyTrackDataset":
+        removed = [track_id.id for track_id in track_ids]
+        positions = self._tracks.find(removed)
+        positions = positions[positions >= 0]
+        if not len(positions):
+            return self
+        remaining = self._selection.without(positions).positions
+        geometry_datasets = {
+            offset: geometries.remove(removed)
+            for offset, geometries in self._geometry_datasets.items()
+        }
+        summaries = None
+        if self._summaries is not None:
+            summaries = self._summaries.remove_multiple(track_ids)
+        return self._with(self._tracks.select(remaining), geometry_datasets, summaries)
+
+    def clear(self) -> "NumpyTrackDataset":
+        return self._with(ColumnarTracks.from_dataframe(DataFrame()))
+
+    def as_list(self) -> list[Track]:
+        return list(self)
+
+    def get_data(self) -> DataFrame:
+        return self._selection.to_dataframe()
+
+    def split(self, chunks: int) -> Sequence["NumpyTrackDataset"]:
+        if self.empty:
+            return [self]
+        chunk_size = ceil(len(self) / chunks)
+        return [
+            self._select(numpy.arange(start, min(start + chunk_size, len(self))))
+            for start in range(0, len(self), chunk_size)
+        ]
+
+    def split_by_track_ids(
+        self, batches: Sequence[Iterable[TrackId]]
+    ) -> Sequence["NumpyTrackDataset"]:
+        new_batches = []
+        for batch in batches:
+            positions = self._tracks.find([track_id.id for track_id in batch])
+            new_batches.append(self._select(numpy.sort(positions[positions >= 0])))
+        return new_batches
+
+    def _select(self, positions: numpy.ndarray) -> "NumpyTrackDataset":
+        track_ids = self._tracks.track_ids[positions].tolist()
+        geometry_datasets = {
+            offset: geometries.get_for(track_ids)
+            for offset, geometries in self._geometry_datasets.items()
+        }
+        return self._with(self._tracks.select(positions), geometry_datasets)
+
+    def filter_by_min_detection_length(self, length: int) -> "NumpyTrackDataset":
+        return self._select(numpy.flatnonzero(self._selection.lengths >= length))
+
+    def filter_by_classifications(
+        self, classifications: Iterable[str]
+    ) -> "NumpyTrackDataset":
+        """Keep only tracks of the given classifications. Calculated geometries of
+        the remaining tracks are kept.
+
+        Args:
+            classifications (Iterable[str]): the track classifications to keep.
+
+        Returns:
+            NumpyTrackDataset: the filtered dataset.
+        """
+        if self.empty:
+            return self
+        classes = self._tracks.values(
+            track.TRACK_CLASSIFICATION, self._selection.starts
+        )
+        return self._select(
+            numpy.flatnonzero(numpy.isin(classes, list(classifications)))
+        )
+
+    def _get_geometry_dataset_for(
+        self, offset: RelativeOffsetCoordinate
+    ) -> TrackGeometryDataset:
+        if (geometry_dataset := self._geometry_datasets.get(offset, None)) is None:
+            geometry_dataset = self.track_geometry_factory(self._to_pandas(), offset)
+            self._geometry_datasets[offset] = geometry_dataset
+        return geometry_dataset
+
+    def calculate_geometries_for(
+        self, offsets: Iterable[RelativeOffsetCoordinate]
+    ) -> None:
+        for offset in offsets:
+            self._get_geometry_dataset_for(offset)
+
+    def intersecting_tracks(
+        self, sections: list[Section], offset: RelativeOffsetCoordinate
+    ) -> set[TrackId]:
+        return self._get_geometry_dataset_for(offset).intersecting_tracks(sections)
+
+    def intersection_points(
+        self, sections: list[Section], offset: RelativeOffsetCoordinate
+    ) -> dict[TrackId, list[tuple[SectionId, IntersectionPoint]]]:
+        return self._get_geometry_dataset_for(offset).intersection_points(sections)
+
+    def contained_by_sections(
+        self, sections: list[Section], offset: RelativeOffsetCoordinate
+    ) -> dict[TrackId, list[tuple[SectionId, list[bool]]]]:
+        return self._get_geometry_dataset_for(offset).contained_by_sections(sections)
+
+    def area_transitions(
+        self, sections: list[Section], offset: RelativeOffsetCoordinate
+    ) -> AreaTransitions:
+        return self._get_geometry_dataset_for(offset).area_transitions(sections)
+
+    def get_first_segments(self) -> TrackSegmentDataset:
+        return self._create_segments(first=True)
+
+    def get_last_segments(self) -> TrackSegmentDataset:
+        return self._create_segments(first=False)
+
+    def _create_segments(self, first: bool) -> PandasTrackSegmentDataset:
+        segments = self._selection.segments(first)
+        if segments is None:
+            return PandasTrackSegmentDataset(DataFrame())
+        segments.index.name = LEVEL_TRACK_ID
+        return PandasTrackSegmentDataset(segments)
+
+    def cut_with_section(
+        self, section: Section, offset: RelativeOffsetCoordinate
+    ) -> tuple["NumpyTrackDataset", set[TrackId]]:
+        """Cut the tracks intersecting the given section at the intersection points.
+
+        The new track ids of all detections are calculated at once from the track
+        offsets and the sorted indices of the intersection points.
+
+        Args:
+            section (Section): the section to cut the tracks with.
+            offset (RelativeOffsetCoordinate): the offset applied to the detections.
+
+        Returns:
+            tuple[NumpyTrackDataset, set[TrackId]]: the cut tracks and the ids of the
+                tracks that have been cut.
+        """
+        if self.empty:
+            logger().info("No tracks to cut")
+            return self, set()
+        intersection_points = self.intersection_points([section], offset)
+        if not intersection_points:
+            return self._with(ColumnarTracks.from_dataframe(DataFrame())), set()
+        cut_track_ids = sorted(track_id.id for track_id in intersection_points)
+        cut_indices = [
+            [
+                point.index
+                for _, point in sorted(
+                    intersection_points[TrackId(track_id)], key=lambda entry: entry[1]
+                )
+            ]
+            for track_id in cut_track_ids
+        ]
+        positions = self._tracks.find(cut_track_ids)
+        cut_tracks = self._tracks.select(positions)
+        cut_data = TrackSelection.all(cut_tracks).to_dataframe()
+        new_track_ids = create_cut_track_ids(
+            cut_tracks.track_ids, numpy.diff(cut_tracks.offsets), cut_indices
+        )
+        cut_data.index = MultiIndex.from_arrays(
+            [
+                Index(new_track_ids.astype(object)),
+                cut_data.index.get_level_values(track.OCCURRENCE),
+            ],
+            names=INDEX_NAMES,
+        )
+        return self._with(ColumnarTracks.from_dataframe(cut_data)), set(
+            intersection_points.keys()
+        )
+
+    def get_summaries(self) -> PandasTrackSummaryDataset:
+        if self._summaries is None:
+            self._summaries = PandasTrackSummaryDataset(self._selection.summaries())
+        return self._summaries
+
+    def get_max_confidences_for(self, track_ids: list[str]) -> dict[str, float]:
+        max_confidences = self._selection.max_confidences(
+            numpy.asarray(track_ids, dtype=str)
+        )
+        if len(max_confidences) != len(set(track_ids)):
+            raise TrackDoesNotExistError(
+                "Some tracks do not exists in dataset with given id"
+            )
+        return max_confidences
+
+
+class FilteredNumpyTrackDataset(FilteredTrackDataset, PandasDataFrameProvider):
+    @property
+    def include_classes(self) -> frozenset[str]:
+        return self._include_classes
+
+    @property
+    def exclude_classes(self) -> frozenset[str]:
+        return self._exclude_classes
+
+    def __init__(
+        self,
+        other: NumpyTrackDataset,
+        include_classes: frozenset[str],
+        exclude_classes: frozenset[str],
+    ) -> None:
+        self._other = other
+        self._include_classes = include_classes
+        self._exclude_classes = exclude_classes
+        self._cache: NumpyTrackDataset | None = None
+
+    def _filter(self) -> NumpyTrackDataset:
+        """Filter TrackDataset by classifications.
+
+        IMPORTANT: Classifications contained in the include_classes will not be
+        removed even if they appear in the set of exclude_classes.
+        Furthermore, the whitelist will not be applied if empty.
+
+        Returns:
+            NumpyTrackDataset: the filtered dataset.
+        """
+        if not self.include_classes and not self.exclude_classes:
+            return self._other
+        if self._cache is None:
+            if self.include_classes:
+                classes = self._other.classifications & self.include_classes
+            else:
+                classes = self._other.classifications - self.exclude_classes
+            self._cache = self._other.filter_by_classifications(classes)
+        return self._cache
+
+    def add_all(self, other: Iterable[Track]) -> TrackDataset:
+        return self.wrap(self._other.add_all(other))
+
+    def add_many(self, datasets: Sequence[TrackDataset]) -> TrackDataset:
+        return self.wrap(self._other.add_many(datasets))
+
+    def remove(self, track_id: TrackId) -> TrackDataset:
+        return self.wrap(self._other.remove(track_id))
+
+    def remove_multiple(self, track_ids: set[TrackId]) -> TrackDataset:
+        return self.wrap(self._other.remove_multiple(track_ids))
+
+    def clear(self) -> TrackDataset:
+        return self.wrap(self._other.clear())
+
+    def split(self, chunks: int) -> Sequence[TrackDataset]:
+        return [self.wrap(dataset) for dataset in self._other.split(chunks)]
+
+    def split_by_track_ids(
+        self, batches: Sequence[Iterable[TrackId]]
+    ) -> Sequence[TrackDataset]:
+        return [
+            self.wrap(dataset) for dataset in self._other.split_by_track_ids(batches)
+        ]
+
+    def calculate_geometries_for(
+        self, offsets: Iterable[RelativeOffsetCoordinate]
+    ) -> None:
+        self._other.calculate_geometries_for(offsets)
+
+    def cut_with_section(
+        self, section: Section, offset: RelativeOffsetCoordinate
+    ) -> tuple[TrackDataset, set[TrackId]]:
+        dataset, original_track_ids = self._other.cut_with_section(section, offset)
+        return self.wrap(dataset), original_track_ids
+
+    def wrap(self, other: NumpyTrackDataset) -> TrackDataset:
+        return FilteredNumpyTrackDataset(
+            other, self.include_classes, self.exclude_classes
+        )
+
+    def get_data(self) -> DataFrame:
+        return self._filter().get_data()
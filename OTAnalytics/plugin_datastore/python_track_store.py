@@ -1,5 +1,8 @@
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import cached_property
 from math import ceil
 from typing import Callable, Iterable, Optional, Sequence
 
@@ -33,12 +36,15 @@ from OTAnalytics.domain.track_dataset import (
     START_X,
     START_Y,
     TRACK_GEOMETRY_FACTORY,
+    AreaTransitions,
     FilteredTrackDataset,
     IntersectionPoint,
     TrackDataset,
     TrackDoesNotExistError,
     TrackGeometryDataset,
     TrackSegmentDataset,
+    TrackSummary,
+    TrackSummaryDataset,
 )
 from OTAnalytics.plugin_intersect.shapely.mapping import ShapelyMapper
 
@@ -320,6 +326,116 @@ class PythonTrackSegmentDataset(TrackSegmentDataset):
             consumer(segment.as_dict())
 
 
+def create_summary_for(track: Track) -> TrackSummary:
+    detections = track.detections
+    return TrackSummary(
+        id=track.id,
+        classification=track.classification,
+        start=track.first_detection.occurrence,
+        end=track.last_detection.occurrence,
+        length=len(detections),
+        max_confidence=max(detection.confidence for detection in detections),
+        min_x=min(detection.x for detection in detections),
+        min_y=min(detection.y for detection in detections),
+        max_x=max(detection.x + detection.w for detection in detections),
+        max_y=max(detection.y + detection.h for detection in detections),
+    )
+
+
+@dataclass(frozen=True)
+class PythonTrackSummaryDataset(TrackSummaryDataset):
+    summaries: dict[TrackId, TrackSummary]
+
+    @staticmethod
+    def from_tracks(tracks: Iterable[Track]) -> "PythonTrackSummaryDataset":
+        return PythonTrackSummaryDataset(
+            {track.id: create_summary_for(track) for track in tracks}
+        )
+
+    def __len__(self) -> int:
+        return len(self.summaries)
+
+    def get_for(self, track_id: TrackId) -> Optional[TrackSummary]:
+        return self.summaries.get(track_id)
+
+    def as_list(self) -> list[TrackSummary]:
+        return list(self.summaries.values())
+
+    def add_all(self, other: TrackSummaryDataset) -> "PythonTrackSummaryDataset":
+        added = {summary.id: summary for summary in other.as_list()}
+        return PythonTrackSummaryDataset(self.summaries | added)
+
+    def remove_multiple(self, track_ids: set[TrackId]) -> "PythonTrackSummaryDataset":
+        return PythonTrackSummaryDataset(
+            {
+                track_id: summary
+                for track_id, summary in self.summaries.items()
+                if track_id not in track_ids
+            }
+        )
+
+    def filter_by_min_detection_length(
+        self, length: int
+    ) -> "PythonTrackSummaryDataset":
+        return PythonTrackSummaryDataset(
+            {
+                track_id: summary
+                for track_id, summary in self.summaries.items()
+                if summary.length >= length
+            }
+        )
+
+    def get_max_confidences_for(self, track_ids: list[str]) -> dict[str, float]:
+        result: dict[str, float] = {}
+        for track_id in track_ids:
+            if (summary := self.summaries.get(TrackId(track_id))) is None:
+                raise TrackDoesNotExistError(f"Track {track_id} not found.")
+            result[track_id] = summary.max_confidence
+        return result
+
+    def get_ids_alive_between(
+        self, start: Optional[datetime], end: Optional[datetime]
+    ) -> list[TrackId]:
+        by_start, buckets = self._lifetimes
+        alive: list[int] = []
+        for positions, starts, max_duration in buckets:
+            lower = 0 if start is None else bisect_left(starts, start - max_duration)
+            upper = len(starts) if end is None else bisect_right(starts, end)
+            alive.extend(
+                position
+                for position in positions[lower:upper]
+                if start is None or by_start[position].end >= start
+            )
+        return [by_start[position].id for position in sorted(alive)]
+
+    @cached_property
+    def _lifetimes(
+        self,
+    ) -> tuple[list[TrackSummary], list[tuple[list[int], list[datetime], timedelta]]]:
+        """Summaries sorted by start together with buckets of tracks whose lifetimes
+        lie within the same power of two. Each bucket holds the positions and starts
+        of its tracks and their longest lifetime. Tracks of a bucket alive at a point
+        in time t started within [t - longest lifetime of the bucket, t].
+        """
+        by_start = sorted(self.summaries.values(), key=lambda summary: summary.start)
+        positions_by_class: dict[int, list[int]] = defaultdict(list)
+        for position, summary in enumerate(by_start):
+            duration = (summary.end - summary.start) // timedelta(microseconds=1)
+            positions_by_class[duration.bit_length()].append(position)
+        buckets = [
+            (
+                positions,
+                [by_start[position].start for position in positions],
+                max(
+                    by_start[position].end - by_start[position].start
+                    for position in positions
+                ),
+            )
+            for positions in positions_by_class.values()
+        ]
+        return by_start, buckets
+
+
 class PythonTrackDataset(TrackDataset):
     """Pure Python implementation of a TrackDataset."""
 
@@ -369,6 +485,7 @@ class PythonTrackDataset(TrackDataset):
             ]()
         else:
             self._geometry_datasets = geometry_datasets
+        self._summaries: PythonTrackSummaryDataset | None = None
 
     @staticmethod
     def from_list(
@@ -383,16 +500,23 @@ class PythonTrackDataset(TrackDataset):
         )
 
     def add_all(self, other: Iterable[Track]) -> "PythonTrackDataset":
-        if isinstance(other, PythonTrackDataset):
-            return self.__merge(other._tracks)
-        new_tracks = {track.id: track for track in other}
-        return self.__merge(new_tracks)
+        tracks = (
+            other._tracks.values() if isinstance(other, PythonTrackDataset) else other
+        )
+        return self.__merge({track.id: track.detections for track in tracks})
 
-    def __merge(self, other: dict[TrackId, Track]) -> "PythonTrackDataset":
+    def add_many(self, datasets: Sequence[TrackDataset]) -> "PythonTrackDataset":
+        detections: dict[TrackId, list[Detection]] = defaultdict(list)
+        for dataset in datasets:
+            for track in dataset:
+                detections[track.id].extend(track.detections)
+        return self.__merge(detections)
+
+    def __merge(self, other: dict[TrackId, list[Detection]]) -> "PythonTrackDataset":
         merged_tracks: dict[TrackId, Track] = {}
-        for track_id, other_track in other.items():
+        for track_id, other_detections in other.items():
             existing_detections = self._get_existing_detections(track_id)
-            all_detections = existing_detections + other_track.detections
+            all_detections = existing_detections + other_detections
             sort_dets_by_occurrence = sorted(
                 all_detections, key=lambda det: det.occurrence
             )
@@ -487,6 +611,27 @@ class PythonTrackDataset(TrackDataset):
             )
         return dataset_batches
 
+    def split_by_track_ids(
+        self, batches: Sequence[Iterable[TrackId]]
+    ) -> Sequence["PythonTrackDataset"]:
+        dataset_batches = []
+        for batch in batches:
+            batch_ids = set(batch)
+            current_batch = {
+                track_id: current
+                for track_id, current in self._tracks.items()
+                if track_id in batch_ids
+            }
+            dataset_batches.append(
+                PythonTrackDataset(
+                    self.track_geometry_factory,
+                    current_batch,
+                    self._get_geometries_for(current_batch.keys()),
+                    calculator=self.calculator,
+                )
+            )
+        return dataset_batches
+
     def _get_geometries_for(
         self, track_ids: Iterable[TrackId]
     ) -> dict[RelativeOffsetCoordinate, TrackGeometryDataset]:
@@ -548,6 +693,12 @@ class PythonTrackDataset(TrackDataset):
         geometry_dataset = self._get_geometry_dataset_for(offset)
         return geometry_dataset.contained_by_sections(sections)
 
+    def area_transitions(
+        self, sections: list[Section], offset: RelativeOffsetCoordinate
+    ) -> AreaTransitions:
+        geometry_dataset = self._get_geometry_dataset_for(offset)
+        return geometry_dataset.area_transitions(sections)
+
     def calculate_geometries_for(
         self, offsets: Iterable[RelativeOffsetCoordinate]
     ) -> None:
@@ -660,6 +811,13 @@ class PythonTrackDataset(TrackDataset):
             result[track_id] = max_confidence
         return result
 
+    def get_summaries(self) -> TrackSummaryDataset:
+        if self._summaries is None:
+            self._summaries = PythonTrackSummaryDataset.from_tracks(
+                self._tracks.values()
+            )
+        return self._summaries
+
 
 class FilteredPythonTrackDataset(FilteredTrackDataset):
     @property
@@ -747,6 +905,9 @@ class FilteredPythonTrackDataset(FilteredTrackDataset):
     def add_all(self, other: Iterable[Track]) -> "TrackDataset":
         return self.wrap(self._other.add_all(other))
 
+    def add_many(self, datasets: Sequence[TrackDataset]) -> "TrackDataset":
+        return self.wrap(self._other.add_many(datasets))
+
     def remove(self, track_id: TrackId) -> "TrackDataset":
         return self.wrap(self._other.remove(track_id))
 
@@ -759,6 +920,13 @@ class FilteredPythonTrackDataset(FilteredTrackDataset):
     def split(self, chunks: int) -> Sequence["TrackDataset"]:
         return [self.wrap(dataset) for dataset in self._other.split(chunks)]
 
+    def split_by_track_ids(
+        self, batches: Sequence[Iterable[TrackId]]
+    ) -> Sequence["TrackDataset"]:
+        return [
+            self.wrap(dataset) for dataset in self._other.split_by_track_ids(batches)
+        ]
+
     def calculate_geometries_for(
         self, offsets: Iterable[RelativeOffsetCoordinate]
     ) -> None:
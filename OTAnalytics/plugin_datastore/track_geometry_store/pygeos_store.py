@@ -3,14 +3,15 @@ from collections import defaultdict
 from itertools import chain
 from typing import Any, Iterable, Literal, Sequence
 
+import numpy
 from pandas import DataFrame, Series, concat
 from pygeos import (
     Geometry,
+    STRtree,
     contains,
     geometrycollections,
     get_coordinates,
     intersection,
-    intersects,
     is_empty,
     line_locate_point,
     linestrings,
@@ -19,22 +20,27 @@ from pygeos import (
     prepare,
 )
 
+from OTAnalytics.application.logger import logger
 from OTAnalytics.domain import track
 from OTAnalytics.domain.geometry import RelativeOffsetCoordinate, apply_offset
 from OTAnalytics.domain.section import Section, SectionId
 from OTAnalytics.domain.track import Track, TrackId
 from OTAnalytics.domain.track_dataset import (
+    AreaTransitions,
     IntersectionPoint,
     TrackDataset,
     TrackGeometryDataset,
 )
+from OTAnalytics.plugin_datastore.track_geometry_store.transitions import (
+    find_transitions,
+    order_transitions,
+)
 from OTAnalytics.plugin_datastore.track_store import LEVEL_TRACK_ID, PandasTrackDataset
 
 TRACK_ID = "track_id"
 GEOMETRY = "geom"
 PROJECTION = "projection"
 INTERSECTIONS = "intersections"
-INTERSECTS = "intersects"
 COLUMNS = [GEOMETRY, PROJECTION]
 BASE_GEOMETRY = RelativeOffsetCoordinate(0, 0)
 ORIENTATION_INDEX: Literal["index"] = "index"
@@ -44,6 +50,10 @@ def line_sections_to_pygeos_multi(sections: Iterable[Section]) -> Geometry:
     return geometrycollections([line_section_to_pygeos(s) for s in sections])
 
 
+def line_sections_to_pygeos(sections: Iterable[Section]) -> Any:
+    return numpy.concatenate([line_section_to_pygeos(s) for s in sections])
+
+
 def line_section_to_pygeos(section: Section) -> Geometry:
     return linestrings([[(c.x, c.y) for c in section.get_coordinates()]])
 
@@ -101,10 +111,58 @@ class PygeosTrackGeometryDataset(TrackGeometryDataset):
             self._dataset = self._create_empty()
         else:
             self._dataset = dataset
+        self._tree: STRtree | None = None
 
     def _create_empty(self) -> DataFrame:
         return DataFrame(columns=COLUMNS)
 
+    def __getstate__(self) -> dict:
+        # STRtree can not be pickled. It is rebuilt on demand.
+        return {**self.__dict__, "_tree": None}
+
+    def _get_tree(self) -> STRtree:
+        if self._tree is None:
+            self._tree = STRtree(self._dataset[GEOMETRY].to_numpy())
+        return self._tree
+
+    def _query_candidates(self, section_geoms: Any) -> DataFrame:
+        """Select the track geometries intersecting at least one of the given
+        section geometries. The spatial index prunes all tracks whose bounding box
+        does not come near any section before the exact predicate is evaluated.
+
+        Args:
+            section_geoms (Any): array of section geometries.
+
+        Returns:
+            DataFrame: the entries of the candidate tracks in dataset order.
+        """
+        if self._dataset.empty:
+            return self._dataset
+        return self._dataset.iloc[self._query_positions(section_geoms)]
+
+    def _query_positions(self, section_geoms: Any) -> numpy.ndarray:
+        """Find the positions of the track geometries intersecting at least one of
+        the given section geometries, see `_query_candidates`.
+
+        Args:
+            section_geoms (Any): array of section geometries.
+
+        Returns:
+            numpy.ndarray: the sorted positions of the candidate tracks.
+        """
+        if self._dataset.empty:
+            return numpy.empty(0, dtype=numpy.int64)
+        _, track_positions = self._get_tree().query_bulk(
+            section_geoms, predicate="intersects"
+        )
+        positions = numpy.unique(track_positions)
+        logger().debug(
+            f"Spatial index pruned {len(self._dataset) - len(positions)} of "
+            f"{len(self._dataset)} track geometries "
+            f"({1 - len(positions) / len(self._dataset):.1%})."
+        )
+        return positions
+
     @property
     def track_ids(self) -> set[str]:
         return set(self._dataset.index)
@@ -235,29 +293,25 @@ class PygeosTrackGeometryDataset(TrackGeometryDataset):
         return PygeosTrackGeometryDataset(self.offset, filtered_df)
 
     def intersecting_tracks(self, sections: list[Section]) -> set[TrackId]:
-        intersecting_tracks = set()
-        section_geoms = line_sections_to_pygeos_multi(sections)
-
-        self._dataset[INTERSECTS] = (
-            self._dataset[GEOMETRY]
-            .apply(lambda line: intersects(line, section_geoms))
-            .map(any)
-            .astype(bool)
-        )
-        track_ids = [
-            TrackId(_id) for _id in self._dataset[self._dataset[INTERSECTS]].index
-        ]
-        intersecting_tracks.update(track_ids)
-
-        return intersecting_tracks
+        if not sections:
+            return set()
+        candidates = self._query_candidates(line_sections_to_pygeos(sections))
+        return {TrackId(_id) for _id in candidates.index}
 
     def intersection_points(
         self, sections: list[Section]
     ) -> dict[TrackId, list[tuple[SectionId, IntersectionPoint]]]:
-        intersection_points = defaultdict(list)
+        intersection_points: dict[
+            TrackId, list[tuple[SectionId, IntersectionPoint]]
+        ] = defaultdict(list)
+        if not sections:
+            return intersection_points
         section_geoms = line_sections_to_pygeos_multi(sections)
+        candidates = self._query_candidates(line_sections_to_pygeos(sections)).copy()
+        if candidates.empty:
+            return intersection_points
 
-        self._dataset[INTERSECTIONS] = self._dataset[GEOMETRY].apply(
+        candidates[INTERSECTIONS] = candidates[GEOMETRY].apply(
             lambda line: [
                 (sections[index].id, ip)
                 for index, ip in enumerate(intersection(line, section_geoms))
@@ -265,7 +319,7 @@ class PygeosTrackGeometryDataset(TrackGeometryDataset):
             ]
         )
         intersections = (
-            self._dataset[self._dataset[INTERSECTIONS].apply(lambda i: len(i) > 0)]
+            candidates[candidates[INTERSECTIONS].apply(lambda i: len(i) > 0)]
             .apply(
                 lambda r: [
                     self._next_event(
@@ -302,6 +356,28 @@ class PygeosTrackGeometryDataset(TrackGeometryDataset):
             IntersectionPoint(bisect(projection, dist)),
         )
 
+    def _contained(
+        self, section: Section
+    ) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """Test which detections of the tracks near the given area lie inside it.
+
+        Args:
+            section (Section): the area section.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: the positions of the
+                tracks near the area, their number of detections and whether each of
+                their detections lies inside the area.
+        """
+        section_geom = area_section_to_pygeos(section)
+        track_positions = self._query_positions(section_geom)
+        coordinates, track_of_point = get_coordinates(
+            self._dataset[GEOMETRY].to_numpy()[track_positions], return_index=True
+        )
+        contained = contains(section_geom, points(coordinates))
+        sizes = numpy.bincount(track_of_point, minlength=len(track_positions))
+        return track_positions, sizes, contained
+
     def contained_by_sections(
         self, sections: list[Section]
     ) -> dict[TrackId, list[tuple[SectionId, list[bool]]]]:
@@ -309,22 +385,40 @@ class PygeosTrackGeometryDataset(TrackGeometryDataset):
             defaultdict(list)
         )
         for _section in sections:
-            section_geom = area_section_to_pygeos(_section)
+            track_positions, sizes, contained = self._contained(_section)
+            masks = numpy.split(contained, numpy.cumsum(sizes)[:-1])
+            for track_id, mask in zip(self._dataset.index[track_positions], masks):
+                if mask.any():
+                    contains_result[TrackId(track_id)].append(
+                        (_section.id, mask.tolist())
+                    )
+        return contains_result
 
-            contains_masks = self._dataset[GEOMETRY].apply(
-                lambda line: [
-                    contains(section_geom, points(p))[0] for p in get_coordinates(line)
-                ]
+    def area_transitions(self, sections: list[Section]) -> AreaTransitions:
+        track_positions: list[numpy.ndarray] = [numpy.empty(0, numpy.int64)]
+        section_positions: list[numpy.ndarray] = [numpy.empty(0, numpy.int64)]
+        indices: list[numpy.ndarray] = [numpy.empty(0, numpy.int64)]
+        entered: list[numpy.ndarray] = [numpy.empty(0, bool)]
+        for position, _section in enumerate(sections):
+            candidates, sizes, contained = self._contained(_section)
+            tracks, section_indices, section_entered = find_transitions(
+                contained, sizes
             )
-            tracks_contained = contains_masks[contains_masks.map(any)]
-
-            if tracks_contained.empty:
-                continue
-
-            tracks_contained.index = tracks_contained.index.map(TrackId)
-            for track_id, contains_mask in tracks_contained.to_dict().items():
-                contains_result[track_id].append((_section.id, contains_mask))
-        return contains_result
+            track_positions.append(candidates[tracks])
+            section_positions.append(numpy.full(len(tracks), position))
+            indices.append(section_indices)
+            entered.append(section_entered)
+        track_position = numpy.concatenate(track_positions)
+        section_position = numpy.concatenate(section_positions)
+        index = numpy.concatenate(indices)
+        order = order_transitions(track_position, section_position, index)
+        section_ids = [section.id for section in sections]
+        return AreaTransitions(
+            track_id=self._dataset.index.to_numpy()[track_position[order]],
+            section_id=[section_ids[position] for position in section_position[order]],
+            index=index[order],
+            entered=numpy.concatenate(entered)[order],
+        )
 
     def as_dict(self) -> dict:
         return self._dataset[COLUMNS].to_dict(orient=ORIENTATION_INDEX)
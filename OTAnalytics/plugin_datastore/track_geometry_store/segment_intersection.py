@@ -0,0 +1,277 @@
+from typing import Iterable
+
+import numpy
+from numpy import ndarray
+
+from OTAnalytics.domain.section import Section
+
+
+def _orientation(
+    ax: ndarray | float,
+    ay: ndarray | float,
+    bx: ndarray | float,
+    by: ndarray | float,
+    cx: ndarray | float,
+    cy: ndarray | float,
+) -> ndarray:
+    """Sign of the orientation of c relative to the directed line from a to b.
+
+    Returns:
+        ndarray: 1 if c lies left of the line, -1 if right of it and 0 if c lies
+            on the line.
+    """
+    return numpy.sign((bx - ax) * (cy - ay) - (by - ay) * (cx - ax))
+
+
+class SectionSegments:
+    """Segments of the polylines of line sections.
+
+    Args:
+        sections (Iterable[Section]): the line sections.
+    """
+
+    __slots__ = ("section", "is_last", "x0", "y0", "x1", "y1")
+
+    def __init__(self, sections: Iterable[Section]) -> None:
+        section: list[int] = []
+        is_last: list[bool] = []
+        start: list[tuple[float, float]] = []
+        end: list[tuple[float, float]] = []
+        for position, _section in enumerate(sections):
+            coordinates = [(c.x, c.y) for c in _section.get_coordinates()]
+            segments = [
+                (first, second)
+                for first, second in zip(coordinates, coordinates[1:])
+                if first != second
+            ]
+            for index, (first, second) in enumerate(segments):
+                section.append(position)
+                is_last.append(index == len(segments) - 1)
+                start.append(first)
+                end.append(second)
+        self.section = numpy.array(section, dtype=numpy.int64)
+        self.is_last = numpy.array(is_last, dtype=bool)
+        starts = numpy.array(start, dtype=numpy.float64).reshape(-1, 2)
+        ends = numpy.array(end, dtype=numpy.float64).reshape(-1, 2)
+        self.x0, self.y0 = starts[:, 0], starts[:, 1]
+        self.x1, self.y1 = ends[:, 0], ends[:, 1]
+
+    def __len__(self) -> int:
+        return len(self.section)
+
+
+class TrackSegments:
+    """Segments between consecutive detections of multiple tracks.
+
+    Intersections with line sections are computed with vectorized orientation
+    tests between all track segments and each section segment. No geometries are
+    built.
+
+    A crossing is reported with the index of the first detection behind it. A
+    crossing lying exactly on a detection is reported once with the index of the
+    following detection, or with the number of detections if it lies on the last
+    one. Segments of consecutive detections at the same position are skipped.
+
+    Args:
+        x (ndarray): the x coordinates of the detections of all tracks.
+        y (ndarray): the y coordinates of the detections of all tracks.
+        sizes (ndarray): the number of detections of each track. The detections of
+            each track are stored consecutively.
+    """
+
+    __slots__ = (
+        "track",
+        "index",
+        "track_size",
+        "is_last",
+        "x0",
+        "y0",
+        "x1",
+        "y1",
+        "min_x",
+        "min_y",
+        "max_x",
+        "max_y",
+    )
+
+    def __init__(self, x: ndarray, y: ndarray, sizes: ndarray) -> None:
+        starts = numpy.cumsum(sizes) - sizes
+        track_of_detection = numpy.repeat(numpy.arange(len(sizes)), sizes)
+        first = numpy.arange(len(x) - 1)
+        same_track = track_of_detection[:-1] == track_of_detection[1:]
+        moved = (x[:-1] != x[1:]) | (y[:-1] != y[1:])
+        first = first[same_track & moved]
+
+        self.track = track_of_detection[first]
+        self.index = first - starts[self.track] + 1
+        self.track_size = sizes[self.track]
+        self.is_last = numpy.ones(len(first), dtype=bool)
+        self.is_last[:-1] = self.track[:-1] != self.track[1:]
+        self.x0, self.y0 = x[first], y[first]
+        self.x1, self.y1 = x[first + 1], y[first + 1]
+        self.min_x = numpy.minimum(self.x0, self.x1)
+        self.min_y = numpy.minimum(self.y0, self.y1)
+        self.max_x = numpy.maximum(self.x0, self.x1)
+        self.max_y = numpy.maximum(self.y0, self.y1)
+
+    def intersecting_tracks(self, sections: Iterable[Section]) -> ndarray:
+        """Find the tracks touching or crossing at least one of the sections.
+
+        Args:
+            sections (Iterable[Section]): the line sections.
+
+        Returns:
+            ndarray: the sorted positions of the intersecting tracks.
+        """
+        tracks = [
+            self.track[candidates[hit | collinear]]
+            for candidates, hit, collinear, *_ in self._test(SectionSegments(sections))
+        ]
+        return numpy.unique(numpy.concatenate([numpy.empty(0, numpy.int64), *tracks]))
+
+    def intersection_points(
+        self, sections: Iterable[Section]
+    ) -> tuple[ndarray, ndarray, ndarray]:
+        """Find all crossings of tracks and line sections.
+
+        Args:
+            sections (Iterable[Section]): the line sections.
+
+        Returns:
+            tuple[ndarray, ndarray, ndarray]: the track position, section position
+                and detection index of each crossing sorted by track, section and
+                index.
+        """
+        section_segments = SectionSegments(sections)
+        tracks: list[ndarray] = [numpy.empty(0, numpy.int64)]
+        section_positions: list[ndarray] = [numpy.empty(0, numpy.int64)]
+        indices: list[ndarray] = [numpy.empty(0, numpy.int64)]
+        for (
+            candidates,
+            hit,
+            collinear,
+            at_track_end,
+            at_section_end,
+            segment,
+        ) in self._test(section_segments):
+            is_last_section_segment = section_segments.is_last[segment]
+            counted = (
+                hit
+                & (~at_track_end | self.is_last[candidates])
+                & (~at_section_end | is_last_section_segment)
+            )
+            crossing = candidates[counted]
+            tracks.append(self.track[crossing])
+            section_positions.append(
+                numpy.full(len(crossing), section_segments.section[segment])
+            )
+            indices.append(
+                numpy.where(
+                    at_track_end[counted],
+                    self.track_size[crossing],
+                    self.index[crossing],
+                )
+            )
+            for candidate in candidates[collinear].tolist():
+                for collinear_index in self._collinear_indices(
+                    candidate, section_segments, segment, is_last_section_segment
+                ):
+                    tracks.append(numpy.array([self.track[candidate]]))
+                    section_positions.append(
+                        numpy.array([section_segments.section[segment]])
+                    )
+                    indices.append(numpy.array([collinear_index]))
+
+        track_positions = numpy.concatenate(tracks)
+        section_position = numpy.concatenate(section_positions)
+        index = numpy.concatenate(indices)
+        order = numpy.lexsort((index, section_position, track_positions))
+        return track_positions[order], section_position[order], index[order]
+
+    def _test(
+        self, section_segments: SectionSegments
+    ) -> Iterable[tuple[ndarray, ndarray, ndarray, ndarray, ndarray, int]]:
+        """Test all track segments against each section segment.
+
+        Yields:
+            tuple[ndarray, ndarray, ndarray, ndarray, ndarray, int]: the candidate
+                track segments whose bounding boxes overlap the section segment,
+                whether they intersect the section segment in a single point,
+                whether they overlap with it, whether the intersection point is
+                the end of the track segment or of the section segment, and the
+                position of the section segment.
+        """
+        for segment in range(len(section_segments)):
+            qx0 = section_segments.x0[segment]
+            qy0 = section_segments.y0[segment]
+            qx1 = section_segments.x1[segment]
+            qy1 = section_segments.y1[segment]
+            candidates = numpy.flatnonzero(
+                (self.min_x <= max(qx0, qx1))
+                & (self.max_x >= min(qx0, qx1))
+                & (self.min_y <= max(qy0, qy1))
+                & (self.max_y >= min(qy0, qy1))
+            )
+            px0 = self.x0[candidates]
+            py0 = self.y0[candidates]
+            px1 = self.x1[candidates]
+            py1 = self.y1[candidates]
+            start_side = _orientation(qx0, qy0, qx1, qy1, px0, py0)
+            end_side = _orientation(qx0, qy0, qx1, qy1, px1, py1)
+            section_start_side = _orientation(px0, py0, px1, py1, qx0, qy0)
+            section_end_side = _orientation(px0, py0, px1, py1, qx1, qy1)
+            collinear = (start_side == 0) & (end_side == 0)
+            hit = (
+                (start_side * end_side <= 0)
+                & (section_start_side * section_end_side <= 0)
+                & ~collinear
+            )
+            yield (
+                candidates,
+                hit,
+                collinear,
+                end_side == 0,
+                section_end_side == 0,
+                segment,
+            )
+
+    def _collinear_indices(
+        self,
+        candidate: int,
+        section_segments: SectionSegments,
+        segment: int,
+        is_last_section_segment: bool,
+    ) -> list[int]:
+        """Detection indices of the end points of the overlap of a track segment
+        and a section segment lying on the same line.
+        """
+        track_start = (self.x0[candidate], self.y0[candidate])
+        track_end = (self.x1[candidate], self.y1[candidate])
+        section_end = (section_segments.x1[segment], section_segments.y1[segment])
+        points = {
+            track_start,
+            track_end,
+            (section_segments.x0[segment], section_segments.y0[segment]),
+            section_end,
+        }
+        indices = []
+        for point in points:
+            if not (
+                self.min_x[candidate] <= point[0] <= self.max_x[candidate]
+                and self.min_y[candidate] <= point[1] <= self.max_y[candidate]
+                and min(section_segments.x0[segment], section_end[0])
+                <= point[0]
+                <= max(section_segments.x0[segment], section_end[0])
+                and min(section_segments.y0[segment], section_end[1])
+                <= point[1]
+                <= max(section_segments.y0[segment], section_end[1])
+            ):
+                continue
+            if point == section_end and not is_last_section_segment:
+                continue
+            if point == track_end:
+                if self.is_last[candidate]:
+                    indices.append(int(self.track_size[candidate]))
+                continue
+            indices.append(int(self.index[candidate]))
+        return indices
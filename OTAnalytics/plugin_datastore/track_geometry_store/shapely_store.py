@@ -0,0 +1,366 @@
+from collections import defaultdict
+from typing import Any, Iterable, Sequence
+
+import numpy
+import shapely
+from numpy import ndarray
+from shapely import STRtree
+
+from OTAnalytics.application.logger import logger
+from OTAnalytics.domain import track
+from OTAnalytics.domain.geometry import RelativeOffsetCoordinate
+from OTAnalytics.domain.section import Section, SectionId
+from OTAnalytics.domain.track import Track, TrackId
+from OTAnalytics.domain.track_dataset import (
+    AreaTransitions,
+    IntersectionPoint,
+    TrackDataset,
+    TrackGeometryDataset,
+)
+from OTAnalytics.plugin_datastore.track_geometry_store.segment_intersection import (
+    TrackSegments,
+)
+from OTAnalytics.plugin_datastore.track_geometry_store.transitions import (
+    find_transitions,
+    order_transitions,
+)
+from OTAnalytics.plugin_datastore.track_store import LEVEL_TRACK_ID, PandasTrackDataset
+
+BASE_GEOMETRY = RelativeOffsetCoordinate(0, 0)
+
+
+def area_section_to_shapely(section: Section) -> shapely.Polygon:
+    geometry = shapely.polygons([(c.x, c.y) for c in section.get_coordinates()])
+    shapely.prepare(geometry)
+    return geometry
+
+
+class TrackCoordinates:
+    """Coordinates of the detections of multiple tracks sorted by track.
+
+    Args:
+        track_ids (ndarray): the id of each track.
+        x (ndarray): the x coordinates of all detections.
+        y (ndarray): the y coordinates of all detections.
+        sizes (ndarray): the number of detections of each track.
+    """
+
+    __slots__ = ("track_ids", "x", "y", "sizes")
+
+    def __init__(self, track_ids: ndarray, x: ndarray, y: ndarray, sizes: ndarray):
+        self.track_ids = track_ids
+        self.x = x
+        self.y = y
+        self.sizes = sizes
+
+    @staticmethod
+    def from_tracks(
+        tracks: Iterable[Track], offset: RelativeOffsetCoordinate
+    ) -> "TrackCoordinates":
+        if isinstance(tracks, PandasTrackDataset):
+            return TrackCoordinates.__from_dataframe(tracks, offset)
+        track_ids: list[str] = []
+        sizes: list[int] = []
+        x: list[float] = []
+        y: list[float] = []
+        for _track in tracks:
+            detections = _track.detections
+            if len(detections) < 2:
+                # Disregard single detection tracks
+                continue
+            track_ids.append(_track.id.id)
+            sizes.append(len(detections))
+            for detection in detections:
+                x.append(detection.x + offset.x * detection.w)
+                y.append(detection.y + offset.y * detection.h)
+        return TrackCoordinates(
+            numpy.array(track_ids, dtype=object),
+            numpy.array(x, dtype=numpy.float64),
+            numpy.array(y, dtype=numpy.float64),
+            numpy.array(sizes, dtype=numpy.int64),
+        )
+
+    @staticmethod
+    def __from_dataframe(
+        dataset: PandasTrackDataset, offset: RelativeOffsetCoordinate
+    ) -> "TrackCoordinates":
+        data = dataset.get_data()
+        codes, uniques = data.index.get_level_values(LEVEL_TRACK_ID).factorize()
+        sizes = numpy.bincount(codes, minlength=len(uniques))
+        valid_rows = sizes[codes] > 1
+        x = data[track.X].to_numpy(dtype=numpy.float64)
+        y = data[track.Y].to_numpy(dtype=numpy.float64)
+        if offset != BASE_GEOMETRY:
+            x = x + offset.x * data[track.W].to_numpy(dtype=numpy.float64)
+            y = y + offset.y * data[track.H].to_numpy(dtype=numpy.float64)
+        valid_tracks = sizes > 1
+        return TrackCoordinates(
+            numpy.asarray(uniques, dtype=object)[valid_tracks],
+            x[valid_rows],
+            y[valid_rows],
+            sizes[valid_tracks],
+        )
+
+    def create_geometries(self) -> ndarray:
+        """Create one linestring per track with a single call.
+
+        Returns:
+            ndarray: the linestrings in track order.
+        """
+        track_of_row = numpy.repeat(numpy.arange(len(self.sizes)), self.sizes)
+        return shapely.linestrings(self.x, self.y, indices=track_of_row)
+
+
+class ShapelyTrackGeometryDataset(TrackGeometryDataset):
+    """TrackGeometryDataset based on the vectorized array API of Shapely 2.
+
+    The linestrings of all tracks are kept in a NumPy object array next to the
+    flat coordinates of their detections. Areas are evaluated in bulk against the
+    track/area pairs found by an STRtree. Line sections are intersected with the
+    segments between consecutive detections without building geometries, see
+    `TrackSegments`.
+
+    Args:
+        offset (RelativeOffsetCoordinate): the offset applied to the detections.
+        track_ids (ndarray | None): the id of each track.
+        geometries (ndarray | None): the linestring of each track.
+        x (ndarray | None): the x coordinates of all detections in track order.
+        y (ndarray | None): the y coordinates of all detections in track order.
+        sizes (ndarray | None): the number of detections of each track.
+    """
+
+    def __init__(
+        self,
+        offset: RelativeOffsetCoordinate,
+        track_ids: ndarray | None = None,
+        geometries: ndarray | None = None,
+        x: ndarray | None = None,
+        y: ndarray | None = None,
+        sizes: ndarray | None = None,
+    ) -> None:
+        self._offset = offset
+        self._track_ids = (
+            track_ids if track_ids is not None else numpy.empty(0, dtype=object)
+        )
+        self._geometries = (
+            geometries if geometries is not None else numpy.empty(0, dtype=object)
+        )
+        self._x = x if x is not None else numpy.empty(0, numpy.float64)
+        self._y = y if y is not None else numpy.empty(0, numpy.float64)
+        self._sizes = sizes if sizes is not None else numpy.empty(0, numpy.int64)
+        self._tree: STRtree | None = None
+        self._segments: TrackSegments | None = None
+
+    @property
+    def track_ids(self) -> set[str]:
+        return set(self._track_ids)
+
+    @property
+    def offset(self) -> RelativeOffsetCoordinate:
+        return self._offset
+
+    @property
+    def empty(self) -> bool:
+        return len(self._track_ids) == 0
+
+    @staticmethod
+    def from_track_dataset(
+        dataset: TrackDataset, offset: RelativeOffsetCoordinate
+    ) -> TrackGeometryDataset:
+        return ShapelyTrackGeometryDataset._from_tracks(dataset, offset)
+
+    @staticmethod
+    def _from_tracks(
+        tracks: Iterable[Track], offset: RelativeOffsetCoordinate
+    ) -> "ShapelyTrackGeometryDataset":
+        coordinates = TrackCoordinates.from_tracks(tracks, offset)
+        if not len(coordinates.track_ids):
+            return ShapelyTrackGeometryDataset(offset)
+        return ShapelyTrackGeometryDataset(
+            offset,
+            coordinates.track_ids,
+            coordinates.create_geometries(),
+            coordinates.x,
+            coordinates.y,
+            coordinates.sizes,
+        )
+
+    def _select(self, mask: ndarray) -> "ShapelyTrackGeometryDataset":
+        rows = numpy.repeat(mask, self._sizes)
+        return ShapelyTrackGeometryDataset(
+            self._offset,
+            self._track_ids[mask],
+            self._geometries[mask],
+            self._x[rows],
+            self._y[rows],
+            self._sizes[mask],
+        )
+
+    def add_all(self, tracks: Iterable[Track]) -> TrackGeometryDataset:
+        added = self._from_tracks(tracks, self._offset)
+        if self.empty:
+            return added
+        if added.empty:
+            return self
+        remaining = self._select(~numpy.isin(self._track_ids, added._track_ids))
+        return ShapelyTrackGeometryDataset(
+            self._offset,
+            numpy.concatenate([remaining._track_ids, added._track_ids]),
+            numpy.concatenate([remaining._geometries, added._geometries]),
+            numpy.concatenate([remaining._x, added._x]),
+            numpy.concatenate([remaining._y, added._y]),
+            numpy.concatenate([remaining._sizes, added._sizes]),
+        )
+
+    def remove(self, ids: Sequence[str]) -> TrackGeometryDataset:
+        if self.empty:
+            return self
+        return self._select(~numpy.isin(self._track_ids, list(ids)))
+
+    def get_for(self, track_ids: list[str]) -> TrackGeometryDataset:
+        if self.empty:
+            return self
+        return self._select(numpy.isin(self._track_ids, track_ids))
+
+    def __getstate__(self) -> dict:
+        # The spatial index and the segments are rebuilt on demand.
+        return {**self.__dict__, "_tree": None, "_segments": None}
+
+    def _get_tree(self) -> STRtree:
+        if self._tree is None:
+            self._tree = STRtree(self._geometries)
+        return self._tree
+
+    def _get_segments(self) -> TrackSegments:
+        if self._segments is None:
+            self._segments = TrackSegments(self._x, self._y, self._sizes)
+        return self._segments
+
+    def _query(self, section_geoms: ndarray) -> tuple[ndarray, ndarray]:
+        """Find all pairs of sections and tracks intersecting each other.
+
+        Args:
+            section_geoms (ndarray): the section geometries.
+
+        Returns:
+            tuple[ndarray, ndarray]: the section and track positions of each pair
+                sorted by track and section.
+        """
+        section_positions, track_positions = self._get_tree().query(
+            section_geoms, predicate="intersects"
+        )
+        order = numpy.lexsort((section_positions, track_positions))
+        logger().debug(
+            f"Spatial index pruned {len(self._track_ids) - len(set(track_positions))}"
+            f" of {len(self._track_ids)} track geometries."
+        )
+        return section_positions[order], track_positions[order]
+
+    def intersecting_tracks(self, sections: list[Section]) -> set[TrackId]:
+        if self.empty or not sections:
+            return set()
+        track_positions = self._get_segments().intersecting_tracks(sections)
+        return {TrackId(_id) for _id in self._track_ids[track_positions]}
+
+    def intersection_points(
+        self, sections: list[Section]
+    ) -> dict[TrackId, list[tuple[SectionId, IntersectionPoint]]]:
+        intersection_points: dict[
+            TrackId, list[tuple[SectionId, IntersectionPoint]]
+        ] = defaultdict(list)
+        if self.empty or not sections:
+            return intersection_points
+        track_positions, section_positions, indices = (
+            self._get_segments().intersection_points(sections)
+        )
+        section_ids = [section.id for section in sections]
+        for track_position, section_position, index in zip(
+            track_positions.tolist(), section_positions.tolist(), indices.tolist()
+        ):
+            intersection_points[TrackId(self._track_ids[track_position])].append(
+                (section_ids[section_position], IntersectionPoint(index))
+            )
+        return intersection_points
+
+    def _contained(self, section: Section) -> tuple[ndarray, ndarray]:
+        """Test which detections of the tracks near the given area lie inside it.
+
+        Args:
+            section (Section): the area section.
+
+        Returns:
+            tuple[ndarray, ndarray]: the positions of the tracks near the area and
+                whether each of their detections lies inside it.
+        """
+        section_geom = area_section_to_shapely(section)
+        _, track_positions = self._query(numpy.array([section_geom]))
+        coordinates = shapely.get_coordinates(self._geometries[track_positions])
+        contained = shapely.contains_xy(
+            section_geom, coordinates[:, 0], coordinates[:, 1]
+        )
+        return track_positions, contained
+
+    def contained_by_sections(
+        self, sections: list[Section]
+    ) -> dict[TrackId, list[tuple[SectionId, list[bool]]]]:
+        contains_result: dict[TrackId, list[tuple[SectionId, list[bool]]]] = (
+            defaultdict(list)
+        )
+        if self.empty:
+            return contains_result
+        for _section in sections:
+            track_positions, contained = self._contained(_section)
+            if not len(track_positions):
+                continue
+            sizes = self._sizes[track_positions]
+            any_contained = numpy.logical_or.reduceat(
+                contained, numpy.cumsum(sizes) - sizes
+            )
+            masks = numpy.split(contained, numpy.cumsum(sizes))
+            for track_position, is_contained, mask in zip(
+                track_positions.tolist(), any_contained, masks
+            ):
+                if is_contained:
+                    contains_result[TrackId(self._track_ids[track_position])].append(
+                        (_section.id, mask.tolist())
+                    )
+        return contains_result
+
+    def area_transitions(self, sections: list[Section]) -> AreaTransitions:
+        track_positions: list[ndarray] = [numpy.empty(0, numpy.int64)]
+        section_positions: list[ndarray] = [numpy.empty(0, numpy.int64)]
+        indices: list[ndarray] = [numpy.empty(0, numpy.int64)]
+        entered: list[ndarray] = [numpy.empty(0, bool)]
+        if not self.empty:
+            for position, _section in enumerate(sections):
+                candidates, contained = self._contained(_section)
+                tracks, section_indices, section_entered = find_transitions(
+                    contained, self._sizes[candidates]
+                )
+                track_positions.append(candidates[tracks])
+                section_positions.append(numpy.full(len(tracks), position))
+                indices.append(section_indices)
+                entered.append(section_entered)
+        track_position = numpy.concatenate(track_positions)
+        section_position = numpy.concatenate(section_positions)
+        index = numpy.concatenate(indices)
+        order = order_transitions(track_position, section_position, index)
+        section_ids = [section.id for section in sections]
+        return AreaTransitions(
+            track_id=self._track_ids[track_position[order]],
+            section_id=[section_ids[position] for position in section_position[order]],
+            index=index[order],
+            entered=numpy.concatenate(entered)[order],
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ShapelyTrackGeometryDataset):
+            return False
+        return (
+            self._offset == other._offset
+            and numpy.array_equal(self._track_ids, other._track_ids)
+            and numpy.array_equal(self._sizes, other._sizes)
+            and bool(shapely.equals_exact(self._geometries, other._geometries).all())
+            and numpy.array_equal(self._x, other._x)
+            and numpy.array_equal(self._y, other._y)
+        )
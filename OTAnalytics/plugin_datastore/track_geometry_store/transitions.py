@@ -0,0 +1,49 @@
+import numpy
+from numpy import ndarray
+
+
+def find_transitions(
+    contained: ndarray, sizes: ndarray
+) -> tuple[ndarray, ndarray, ndarray]:
+    """Find the detections at which tracks enter or leave an area.
+
+    Args:
+        contained (ndarray): whether each detection lies inside the area. The
+            detections of each track are stored consecutively.
+        sizes (ndarray): the number of detections of each track.
+
+    Returns:
+        tuple[ndarray, ndarray, ndarray]: the track position, the detection index
+            within the track and whether the track enters the area for each
+            transition sorted by track and index.
+    """
+    starts = numpy.cumsum(sizes) - sizes
+    changed = numpy.empty(len(contained), dtype=bool)
+    changed[1:] = contained[1:] != contained[:-1]
+    changed[starts[sizes > 0]] = contained[starts[sizes > 0]]
+    rows = numpy.flatnonzero(changed)
+    track_positions = numpy.repeat(numpy.arange(len(sizes)), sizes)[rows]
+    return track_positions, rows - starts[track_positions], contained[rows]
+
+
+def order_transitions(
+    track_positions: ndarray, section_positions: ndarray, indices: ndarray
+) -> ndarray:
+    """Order transitions like the results of `contained_by_sections`. Tracks are
+    ordered by the first section they are contained by and their position.
+
+    Args:
+        track_positions (ndarray): the track position of each transition.
+        section_positions (ndarray): the section position of each transition.
+        indices (ndarray): the detection index of each transition.
+
+    Returns:
+        ndarray: the order of the transitions.
+    """
+    if not len(track_positions):
+        return numpy.empty(0, dtype=numpy.int64)
+    first_sections = numpy.full(track_positions.max() + 1, section_positions.max())
+    numpy.minimum.at(first_sections, track_positions, section_positions)
+    return numpy.lexsort(
+        (indices, section_positions, track_positions, first_sections[track_positions])
+    )
@@ -1,14 +1,22 @@
 from abc import ABC, abstractmethod
-from bisect import bisect
-from dataclasses import dataclass
+from dataclasses import asdict
 from datetime import datetime
 from math import ceil
-from typing import Any, Callable, Generator, Iterable, Iterator, Optional, Sequence
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    cast,
+)
 
 import numpy
 import pandas
 from more_itertools import batched
-from pandas import DataFrame, Index, MultiIndex, Series
+from pandas import CategoricalDtype, DataFrame, Index, MultiIndex, Series
 
 from OTAnalytics.application.logger import logger
 from OTAnalytics.domain import track
@@ -27,62 +35,330 @@ from OTAnalytics.domain.track_dataset import (
     START_X,
     START_Y,
     TRACK_GEOMETRY_FACTORY,
+    AreaTransitions,
+    DetectionArray,
+    DetectionSelection,
     FilteredTrackDataset,
     IntersectionPoint,
     TrackDataset,
     TrackDoesNotExistError,
     TrackGeometryDataset,
     TrackSegmentDataset,
+    TrackSummary,
+    TrackSummaryDataset,
 )
 
+REQUIRED_DETECTION_COLUMNS = [
+    track.CLASSIFICATION,
+    track.CONFIDENCE,
+    track.X,
+    track.Y,
+    track.W,
+    track.H,
+    track.FRAME,
+    track.TRACK_CLASSIFICATION,
+]
+OPTIONAL_DETECTION_COLUMNS = [
+    track.INTERPOLATED_DETECTION,
+    track.VIDEO_NAME,
+    track.INPUT_FILE,
+]
+
+
+ColumnArray = numpy.ndarray | pandas.Categorical
+
+
+class MissingDetectionColumnError(Exception):
+    pass
+
+
+def _available(values: ColumnArray | None, name: str) -> ColumnArray:
+    if values is None:
+        raise MissingDetectionColumnError(f"Detections have no column '{name}'.")
+    return values
+
+
+class DetectionColumns:
+    """Detections of a DataFrame as NumPy arrays grouped by track.
+
+    The rows of the track at position `i` are `offsets[i]` to `offsets[i + 1]`.
+    Detection and track views of a dataset share these arrays and reference rows
+    only. Categorical columns are kept as `Categorical` and only converted to their
+    values by the views. Optional columns missing in the DataFrame are None and
+    raise an error once their values are requested.
+
+    Args:
+        data (DataFrame): detections indexed by track id and occurrence.
+
+    Raises:
+        MissingDetectionColumnError: if a required column is missing.
+    """
+
+    __slots__ = (
+        "track_ids",
+        "offsets",
+        "_positions",
+        "classification",
+        "confidence",
+        "x",
+        "y",
+        "w",
+        "h",
+        "frame",
+        "occurrence",
+        "interpolated_detection",
+        "video_name",
+        "input_file",
+        "track_classification",
+    )
+
+    def __init__(self, data: DataFrame) -> None:
+        codes, uniques = pandas.factorize(data.index.get_level_values(LEVEL_TRACK_ID))
+        order: numpy.ndarray | None = None
+        if len(codes) and (numpy.diff(codes) < 0).any():
+            # Keep the order of the detections within each track
+            order = numpy.argsort(codes, kind="stable")
+        self.track_ids: numpy.ndarray = numpy.asarray(uniques, dtype=object)
+        self.offsets = numpy.concatenate(
+            [[0], numpy.cumsum(numpy.bincount(codes, minlength=len(uniques)))]
+        )
+        self._positions = {
+            track_id: position for position, track_id in enumerate(self.track_ids)
+        }
+        occurrences = data.index.get_level_values(LEVEL_OCCURRENCE)
+        self.occurrence: Index = occurrences if order is None else occurrences[order]
+
+        names = REQUIRED_DETECTION_COLUMNS + OPTIONAL_DETECTION_COLUMNS
+        locations = dict(zip(names, data.columns.get_indexer(names)))
+        if missing := [
+            name for name in REQUIRED_DETECTION_COLUMNS if locations[name] < 0
+        ]:
+            raise MissingDetectionColumnError(
+                f"Detections have no columns {', '.join(missing)}."
+            )
+
+        def array(name: str) -> numpy.ndarray:
+            values = data.iloc[:, locations[name]].to_numpy()
+            return values if order is None else values[order]
+
+        def column(name: str) -> ColumnArray:
+            series = data.iloc[:, locations[name]]
+            if not isinstance(series.dtype, CategoricalDtype):
+                return array(name)
+            values = cast(pandas.Categorical, series.array)
+            return values if order is None else values[order]
+
+        def optional(name: str) -> ColumnArray | None:
+            return column(name) if locations[name] >= 0 else None
+
+        self.classification = column(track.CLASSIFICATION)
+        self.confidence = array(track.CONFIDENCE)
+        self.x = array(track.X)
+        self.y = array(track.Y)
+        self.w = array(track.W)
+        self.h = array(track.H)
+        self.frame = array(track.FRAME)
+        self.track_classification = column(track.TRACK_CLASSIFICATION)
+        self.interpolated_detection = optional(track.INTERPOLATED_DETECTION)
+        self.video_name = optional(track.VIDEO_NAME)
+        self.input_file = optional(track.INPUT_FILE)
+
+    def find(self, track_id: str) -> int | None:
+        return self._positions.get(track_id)
+
+    def track(self, position: int) -> "PandasTrack":
+        return PandasTrack(self, position)
+
+    def detections_array(self, position: int) -> DetectionArray:
+        rows = slice(self.offsets[position], self.offsets[position + 1])
+        return DetectionArray(
+            track_id=TrackId(self.track_ids[position]),
+            classification=self.track_classification[rows.start],
+            x=self.x[rows],
+            y=self.y[rows],
+            w=self.w[rows],
+            h=self.h[rows],
+            frame=self.frame[rows],
+            occurrence=self.occurrence[rows],
+        )
+
+    def select(
+        self,
+        track_ids: Sequence[TrackId],
+        indices: Sequence[int],
+        offset: RelativeOffsetCoordinate,
+    ) -> DetectionSelection:
+        positions = numpy.fromiter(
+            (self._positions.get(track_id.id, -1) for track_id in track_ids),
+            dtype=numpy.int64,
+            count=len(track_ids),
+        )
+        if (missing := numpy.flatnonzero(positions < 0)).size:
+            raise TrackDoesNotExistError(f"Track {track_ids[missing[0]].id} not found.")
+        rows, x, y, direction_x, direction_y = select_detection_rows(
+            self.offsets[positions],
+            self.offsets[positions + 1],
+            indices,
+            lambda selected: offset_coordinates(
+                self.x, self.y, self.w, self.h, selected, offset
+            ),
+        )
+        return DetectionSelection(
+            track_id=self.track_ids[positions],
+            classification=self.track_classification[rows],
+            x=x,
+            y=y,
+            direction_x=direction_x,
+            direction_y=direction_y,
+            frame=self.frame[rows],
+            occurrence=self.occurrence[rows],
+            video_name=_available(self.video_name, track.VIDEO_NAME)[rows],
+        )
+
+
+def offset_coordinates(
+    x: numpy.ndarray,
+    y: numpy.ndarray,
+    w: numpy.ndarray,
+    h: numpy.ndarray,
+    rows: numpy.ndarray,
+    offset: RelativeOffsetCoordinate,
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Get the coordinates of the given rows with the offset applied.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: the x and y coordinates.
+    """
+    selected_x = x[rows].astype(numpy.float64)
+    selected_y = y[rows].astype(numpy.float64)
+    if offset == RelativeOffsetCoordinate(0, 0):
+        return selected_x, selected_y
+    return (
+        selected_x + w[rows].astype(numpy.float64) * offset.x,
+        selected_y + h[rows].astype(numpy.float64) * offset.y,
+    )
+
+
+def select_detection_rows(
+    starts: numpy.ndarray,
+    ends: numpy.ndarray,
+    indices: Sequence[int],
+    get_coordinates: Callable[[numpy.ndarray], tuple[numpy.ndarray, numpy.ndarray]],
+) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Locate detections by their index within their track and calculate their
+    directions as described by `DetectionSelection`.
+
+    Args:
+        starts (numpy.ndarray): first row of the track of each detection.
+        ends (numpy.ndarray): row after the last row of the track of each detection.
+        indices (Sequence[int]): index of each detection within its track.
+        get_coordinates (Callable[[numpy.ndarray], tuple[numpy.ndarray,
+            numpy.ndarray]]): provides the x and y coordinates of rows.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray,
+            numpy.ndarray]: the rows, x and y coordinates and x and y components of
+            the directions of the detections.
+
+    Raises:
+        IndexError: if an index lies outside of its track.
+    """
+    index = numpy.asarray(indices, dtype=numpy.int64)
+    if (outside := numpy.flatnonzero((index < 0) | (index >= ends - starts))).size:
+        # Rows outside of a track belong to another track
+        raise IndexError(f"No detection at index {index[outside[0]]} of its track.")
+    rows = starts + index
+    first = index == 0
+    neighbours = numpy.where(first, numpy.minimum(rows + 1, ends - 1), rows - 1)
+    x, y = get_coordinates(rows)
+    neighbour_x, neighbour_y = get_coordinates(neighbours)
+    direction_x = numpy.where(first, neighbour_x - x, x - neighbour_x)
+    direction_y = numpy.where(first, neighbour_y - y, y - neighbour_y)
+    return rows, x, y, direction_x, direction_y
+
+
+class PandasTrackStructure:
+    """Structural metadata of a non-empty DataFrame of detections.
+
+    Args:
+        data (DataFrame): detections indexed by track id and occurrence.
+    """
+
+    __slots__ = (
+        "index",
+        "track_ids",
+        "first_occurrence",
+        "last_occurrence",
+        "classifications",
+    )
+
+    def __init__(self, data: DataFrame) -> None:
+        self.index: Index = data.index.get_level_values(LEVEL_TRACK_ID).unique()
+        self.track_ids: frozenset[TrackId] = frozenset(
+            TrackId(_id) for _id in self.index
+        )
+        occurrences = data.index.get_level_values(LEVEL_OCCURRENCE)
+        self.first_occurrence: datetime | None = occurrences.min()
+        self.last_occurrence: datetime | None = occurrences.max()
+        self.classifications: frozenset[str] = frozenset(
+            data[track.TRACK_CLASSIFICATION].unique()
+        )
+
 
 class PandasDetection(Detection):
-    def __init__(self, track_id: str, data: Series):
+    """View on a single row of the detection columns of a dataset.
+
+    Args:
+        columns (DetectionColumns): the columns containing the detection.
+        row (int): the row of the detection.
+        track_id (str): the id of the track containing the detection.
+    """
+
+    __slots__ = ("_columns", "_row", "_track_id")
+
+    def __init__(self, columns: DetectionColumns, row: int, track_id: str) -> None:
+        self._columns = columns
+        self._row = row
         self._track_id = track_id
-        self._occurrence: Any = data.name  # data.name is tuple
-        self._data = data
 
     @property
     def classification(self) -> str:
-        return self.__get_attribute(track.CLASSIFICATION)
-
-    def __get_attribute(self, column: str) -> Any:
-        return self._data.loc[column]
+        return self._columns.classification[self._row]
 
     @property
     def confidence(self) -> float:
-        return self.__get_attribute(track.CONFIDENCE)
+        return float(self._columns.confidence[self._row])
 
     @property
     def x(self) -> float:
-        return self.__get_attribute(track.X)
+        return float(self._columns.x[self._row])
 
     @property
     def y(self) -> float:
-        return self.__get_attribute(track.Y)
+        return float(self._columns.y[self._row])
 
     @property
     def w(self) -> float:
-        return self.__get_attribute(track.W)
+        return float(self._columns.w[self._row])
 
     @property
     def h(self) -> float:
-        return self.__get_attribute(track.H)
+        return float(self._columns.h[self._row])
 
     @property
     def frame(self) -> int:
-        frame_number = self.__get_attribute(track.FRAME)
-        if isinstance(frame_number, numpy.int64):
-            return frame_number.item()
-        return frame_number
+        return int(self._columns.frame[self._row])
 
     @property
     def occurrence(self) -> datetime:
-        return self._occurrence
+        return self._columns.occurrence[self._row]
 
     @property
     def interpolated_detection(self) -> bool:
-        return self.__get_attribute(track.INTERPOLATED_DETECTION)
+        interpolated = _available(
+            self._columns.interpolated_detection, track.INTERPOLATED_DETECTION
+        )
+        return bool(interpolated[self._row])
 
     @property
     def track_id(self) -> TrackId:
@@ -90,52 +366,63 @@ class PandasDetection(Detection):
 
     @property
     def video_name(self) -> str:
-        return self.__get_attribute(track.VIDEO_NAME)
+        return _available(self._columns.video_name, track.VIDEO_NAME)[self._row]
 
     @property
     def input_file(self) -> str:
-        return self.__get_attribute(track.INPUT_FILE)
+        return _available(self._columns.input_file, track.INPUT_FILE)[self._row]
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, PandasDetection):
             return False
-        return (
-            self._track_id == other._track_id
-            and self._occurrence == other._occurrence
-            and (self._data == other._data).all()
-        )
+        if self._columns is other._columns:
+            return self._row == other._row
+        return self.to_dict() == other.to_dict()
 
     def __hash__(self) -> int:
-        return hash(self._track_id) + hash(self._occurrence) + hash(self._data)
+        return hash(self._track_id) + hash(self.occurrence)
 
 
-@dataclass
 class PandasTrack(Track):
-    _id: str
-    _data: DataFrame
+    """View on the rows of a single track of the detection columns of a dataset.
+
+    Args:
+        columns (DetectionColumns): the columns containing the track.
+        position (int): the position of the track.
+    """
+
+    __slots__ = ("_columns", "_position", "_rows")
+
+    def __init__(self, columns: DetectionColumns, position: int) -> None:
+        self._columns = columns
+        self._position = position
+        self._rows = range(columns.offsets[position], columns.offsets[position + 1])
 
     @property
     def id(self) -> TrackId:
-        return TrackId(self._id)
+        return TrackId(self._columns.track_ids[self._position])
 
     @property
     def classification(self) -> str:
-        return self._data[track.TRACK_CLASSIFICATION].iloc[0]
+        return self._columns.track_classification[self._rows.start]
 
     @property
     def detections(self) -> list[Detection]:
-        return [PandasDetection(self._id, row) for _, row in self._data.iterrows()]
+        track_id = self._columns.track_ids[self._position]
+        return [PandasDetection(self._columns, row, track_id) for row in self._rows]
 
     def get_detection(self, index: int) -> Detection:
-        return PandasDetection(self._id, self._data.iloc[index])
+        return PandasDetection(
+            self._columns, self._rows[index], self._columns.track_ids[self._position]
+        )
 
     @property
     def first_detection(self) -> Detection:
-        return PandasDetection(self._id, self._data.iloc[0])
+        return self.get_detection(0)
 
     @property
     def last_detection(self) -> Detection:
-        return PandasDetection(self._id, self._data.iloc[-1])
+        return self.get_detection(-1)
 
 
 class PandasTrackClassificationCalculator(ABC):
@@ -165,7 +452,7 @@ class PandasByMaxConfidence(PandasTrackClassificationCalculator):
             return DataFrame()
         classifications = (
             detections.loc[:, [track.CLASSIFICATION, track.CONFIDENCE]]
-            .groupby(by=[track.TRACK_ID, track.CLASSIFICATION])
+            .groupby(by=[track.TRACK_ID, track.CLASSIFICATION], observed=True)
             .sum()
             .sort_values(track.CONFIDENCE)
             .groupby(level=0)
@@ -211,6 +498,255 @@ class PandasTrackSegmentDataset(TrackSegmentDataset):
             consumer(value)
 
 
+def _nanoseconds(occurrences: Series) -> numpy.ndarray:
+    return (
+        pandas.DatetimeIndex(occurrences)
+        .to_numpy(dtype="datetime64[ns]")
+        .view(numpy.int64)
+    )
+
+
+class TrackLifetimeIndex:
+    """Index over the lifetimes of tracks answering which tracks are alive within
+    a time window. Tracks are grouped into buckets whose lifetimes lie within the
+    same power of two. Tracks of a bucket alive at a point in time t started within
+    [t - longest lifetime of the bucket, t]. Thus, binary search over the sorted
+    starts of each bucket narrows the candidates before their ends are compared. A
+    single long track only widens the search within its own bucket. The candidates
+    of a bucket that already ended before the time window lived at least half as
+    long as the longest track of the bucket.
+
+    Args:
+        track_ids (numpy.ndarray): the ids of the tracks.
+        starts (Series): the first occurrence of each track.
+        ends (Series): the last occurrence of each track.
+    """
+
+    __slots__ = ("_track_ids", "_buckets")
+
+    def __init__(self, track_ids: numpy.ndarray, starts: Series, ends: Series) -> None:
+        start_values = _nanoseconds(starts)
+        order = numpy.argsort(start_values, kind="stable")
+        self._track_ids = track_ids[order]
+        start_values = start_values[order]
+        end_values = _nanoseconds(ends)[order]
+        durations = end_values - start_values
+        duration_classes = numpy.frexp(durations.astype(float))[1]
+        self._buckets = [
+            (
+                positions,
+                start_values[positions],
+                end_values[positions],
+                int(durations[positions].max()),
+            )
+            for positions in (
+                numpy.flatnonzero(duration_classes == duration_class)
+                for duration_class in numpy.unique(duration_classes)
+            )
+        ]
+
+    def alive_between(
+        self, start: Optional[datetime], end: Optional[datetime]
+    ) -> numpy.ndarray:
+        """Get the ids of all tracks overlapping with the inclusive time window.
+
+        Args:
+            start (Optional[datetime]): start of the time window. Unbounded if None.
+            end (Optional[datetime]): end of the time window. Unbounded if None.
+
+        Returns:
+            numpy.ndarray: the ids of the tracks alive within the time window ordered
+                by their start.
+        """
+        start_value = None if start is None else pandas.Timestamp(start).value
+        end_value = None if end is None else pandas.Timestamp(end).value
+        alive = []
+        for positions, starts, ends, max_duration in self._buckets:
+            lower = (
+                0
+                if start_value is None
+                else starts.searchsorted(start_value - max_duration, side="left")
+            )
+            upper = (
+                len(starts)
+                if end_value is None
+                else starts.searchsorted(end_value, side="right")
+            )
+            candidates = positions[lower:upper]
+            if start_value is not None:
+                candidates = candidates[ends[lower:upper] >= start_value]
+            alive.append(candidates)
+        if not alive:
+            return self._track_ids[:0]
+        return self._track_ids[numpy.sort(numpy.concatenate(alive))]
+
+
+class PandasTrackSummaryDataset(TrackSummaryDataset):
+    """TrackSummaryDataset keeping one row per track in a DataFrame indexed by
+    track id. The columns are named like the fields of TrackSummary.
+
+    Args:
+        summaries (DataFrame | None): the summaries indexed by track id.
+    """
+
+    def __init__(self, summaries: DataFrame | None = None) -> None:
+        if summaries is None:
+            summaries = DataFrame()
+        self._summaries = summaries
+        self._lifetimes: TrackLifetimeIndex | None = None
+
+    @staticmethod
+    def from_detections(data: DataFrame) -> "PandasTrackSummaryDataset":
+        """Aggregate the detections of each track.
+
+        Args:
+            data (DataFrame): classified detections indexed by track id and
+                occurrence.
+
+        Returns:
+            PandasTrackSummaryDataset: one summary per track.
+        """
+        if data.empty:
+            return PandasTrackSummaryDataset()
+        x = data[track.X].to_numpy()
+        y = data[track.Y].to_numpy()
+        values = DataFrame(
+            {
+                "classification": data[track.TRACK_CLASSIFICATION].to_numpy(),
+                "occurrence": data.index.get_level_values(LEVEL_OCCURRENCE),
+                "confidence": data[track.CONFIDENCE].to_numpy(),
+                "x": x,
+                "y": y,
+                "x_end": x + data[track.W].to_numpy(),
+                "y_end": y + data[track.H].to_numpy(),
+            },
+            index=data.index.get_level_values(LEVEL_TRACK_ID),
+        )
+        summaries = values.groupby(level=0, sort=False).agg(
+            classification=("classification", "first"),
+            start=("occurrence", "min"),
+            end=("occurrence", "max"),
+            length=("occurrence", "size"),
+            max_confidence=("confidence", "max"),
+            min_x=("x", "min"),
+            min_y=("y", "min"),
+            max_x=("x_end", "max"),
+            max_y=("y_end", "max"),
+        )
+        return PandasTrackSummaryDataset(summaries)
+
+    def get_data(self) -> DataFrame:
+        return self._summaries
+
+    def get_index(self) -> Index:
+        return self._summaries.index
+
+    def __len__(self) -> int:
+        return len(self._summaries)
+
+    def get_for(self, track_id: TrackId) -> Optional[TrackSummary]:
+        if track_id.id not in self._summaries.index:
+            return None
+        row = self._summaries.loc[track_id.id]
+        return _create_summary(track_id.id, *row.to_numpy())
+
+    def as_list(self) -> list[TrackSummary]:
+        return [
+            _create_summary(*row)
+            for row in self._summaries.itertuples(index=True, name=None)
+        ]
+
+    def add_all(self, other: TrackSummaryDataset) -> "PandasTrackSummaryDataset":
+        if not len(other):
+            return self
+        if isinstance(other, PandasTrackSummaryDataset):
+            added = other.get_data()
+        else:
+            summaries = other.as_list()
+            added = DataFrame(
+                [asdict(summary) for summary in summaries],
+                index=[summary.id.id for summary in summaries],
+            ).drop(columns="id")
+        if self._summaries.empty:
+            return PandasTrackSummaryDataset(added)
+        remaining = self._summaries.drop(added.index, errors="ignore")
+        return PandasTrackSummaryDataset(pandas.concat([remaining, added]))
+
+    def remove_multiple(self, track_ids: set[TrackId]) -> "PandasTrackSummaryDataset":
+        if self._summaries.empty:
+            return self
+        return PandasTrackSummaryDataset(
+            self._summaries.drop(
+                [track_id.id for track_id in track_ids], errors="ignore"
+            )
+        )
+
+    def filter_by_min_detection_length(
+        self, length: int
+    ) -> "PandasTrackSummaryDataset":
+        if self._summaries.empty:
+            return self
+        return PandasTrackSummaryDataset(
+            self._summaries[self._summaries["length"] >= length]
+        )
+
+    def get_max_confidences_for(self, track_ids: list[str]) -> dict[str, float]:
+        if not track_ids:
+            return {}
+        try:
+            confidences = self._summaries["max_confidence"].loc[track_ids]
+        except KeyError as cause:
+            raise TrackDoesNotExistError(
+                "Some tracks do not exists in dataset with given id"
+            ) from cause
+        return dict(zip(track_ids, confidences.tolist()))
+
+    def get_ids_alive_between(
+        self, start: Optional[datetime], end: Optional[datetime]
+    ) -> list[TrackId]:
+        if self._summaries.empty:
+            return []
+        return [
+            TrackId(track_id)
+            for track_id in self._get_lifetimes().alive_between(start, end)
+        ]
+
+    def _get_lifetimes(self) -> TrackLifetimeIndex:
+        if self._lifetimes is None:
+            self._lifetimes = TrackLifetimeIndex(
+                self._summaries.index.to_numpy(),
+                self._summaries["start"],
+                self._summaries["end"],
+            )
+        return self._lifetimes
+
+
+def _create_summary(
+    track_id: str,
+    classification: str,
+    start: datetime,
+    end: datetime,
+    length: int,
+    max_confidence: float,
+    min_x: float,
+    min_y: float,
+    max_x: float,
+    max_y: float,
+) -> TrackSummary:
+    return TrackSummary(
+        id=TrackId(track_id),
+        classification=classification,
+        start=start,
+        end=end,
+        length=int(length),
+        max_confidence=float(max_confidence),
+        min_x=float(min_x),
+        min_y=float(min_y),
+        max_x=float(max_x),
+        max_y=float(max_y),
+    )
+
+
 class PandasDataFrameProvider:
     @abstractmethod
     def get_data(self) -> DataFrame:
@@ -222,30 +758,25 @@ class PandasTrackDataset(TrackDataset, PandasDataFrameProvider):
     def track_ids(self) -> frozenset[TrackId]:
         if self._dataset.empty:
             return frozenset()
-        return frozenset(
-            [
-                TrackId(_id)
-                for _id in self._dataset.index.get_level_values(LEVEL_TRACK_ID)
-            ]
-        )
+        return self._get_structure().track_ids
 
     @property
     def first_occurrence(self) -> datetime | None:
-        if not len(self):
+        if self._dataset.empty:
             return None
-        return self._dataset.index.get_level_values(LEVEL_OCCURRENCE).min()
+        return self._get_structure().first_occurrence
 
     @property
     def last_occurrence(self) -> datetime | None:
-        if not len(self):
+        if self._dataset.empty:
             return None
-        return self._dataset.index.get_level_values(LEVEL_OCCURRENCE).max()
+        return self._get_structure().last_occurrence
 
     @property
     def classifications(self) -> frozenset[str]:
-        if not len(self):
+        if self._dataset.empty:
             return frozenset()
-        return frozenset(self._dataset[track.TRACK_CLASSIFICATION].unique())
+        return self._get_structure().classifications
 
     @property
     def empty(self) -> bool:
@@ -259,6 +790,7 @@ class PandasTrackDataset(TrackDataset, PandasDataFrameProvider):
             dict[RelativeOffsetCoordinate, TrackGeometryDataset] | None
         ) = None,
         calculator: PandasTrackClassificationCalculator = DEFAULT_CLASSIFICATOR,
+        summaries: PandasTrackSummaryDataset | None = None,
     ):
         if dataset is not None:
             self._dataset: DataFrame = dataset
@@ -273,16 +805,51 @@ class PandasTrackDataset(TrackDataset, PandasDataFrameProvider):
             ]()
         else:
             self._geometry_datasets = geometry_datasets
+        self._detection_columns: DetectionColumns | None = None
+        self._structure: PandasTrackStructure | None = None
+        self._summaries = summaries
+        self._class_views: dict[frozenset[str], PandasTrackDataset] = {}
+
+    def __getstate__(self) -> dict:
+        # The detection columns are recreated from the DataFrame on demand
+        return {**self.__dict__, "_detection_columns": None, "_class_views": {}}
 
     def __iter__(self) -> Iterator[Track]:
         yield from self.as_generator()
 
     def as_generator(self) -> Generator[Track, None, None]:
-        if (track_ids := self.get_index()) is None:
-            yield from []
-        else:
-            for current in track_ids.array:
-                yield self._create_track_flyweight(current)
+        if self._dataset.empty:
+            return
+        columns = self._get_detection_columns()
+        for position in range(len(columns.track_ids)):
+            yield columns.track(position)
+
+    def _get_detection_columns(self) -> DetectionColumns:
+        """Get the detections as NumPy arrays shared by all track and detection
+        views. The arrays are created once on first access.
+
+        Returns:
+            DetectionColumns: the detection columns of this dataset.
+        """
+        if self._detection_columns is None:
+            self._detection_columns = DetectionColumns(self._dataset)
+        return self._detection_columns
+
+    def _get_structure(self) -> PandasTrackStructure:
+        """Get the structural metadata of this dataset. The dataset is never
+        modified in place, thus the metadata is computed once on first access.
+
+        Returns:
+            PandasTrackStructure: track ids, time bounds and classifications.
+        """
+        if self._structure is None:
+            self._structure = PandasTrackStructure(self._dataset)
+        return self._structure
+
+    def get_summaries(self) -> PandasTrackSummaryDataset:
+        if self._summaries is None:
+            self._summaries = PandasTrackSummaryDataset.from_detections(self._dataset)
+        return self._summaries
 
     @staticmethod
     def from_list(
@@ -304,6 +871,7 @@ class PandasTrackDataset(TrackDataset, PandasDataFrameProvider):
             dict[RelativeOffsetCoordinate, TrackGeometryDataset] | None
         ) = None,
         calculator: PandasTrackClassificationCalculator = DEFAULT_CLASSIFICATOR,
+        summaries: PandasTrackSummaryDataset | None = None,
     ) -> "PandasTrackDataset":
         if tracks.empty:
             return PandasTrackDataset(track_geometry_factory)
@@ -312,26 +880,84 @@ class PandasTrackDataset(TrackDataset, PandasDataFrameProvider):
             track_geometry_factory,
             classified_tracks,
             geometry_datasets=geometry_dataset,
+            summaries=summaries,
         )
 
     def add_all(self, other: Iterable[Track]) -> "PandasTrackDataset":
-        new_tracks = self.__get_tracks(other)
-        if new_tracks.empty:
+        return self._add_frames([self.__get_tracks(other)])
+
+    def add_many(self, datasets: Sequence[TrackDataset]) -> "PandasTrackDataset":
+        """Add the tracks of multiple datasets at once.
+
+        All detections are concatenated and sorted only once. Only tracks spread
+        over several datasets are classified again. Existing geometries are updated
+        once for all added tracks.
+
+        Args:
+            datasets (Sequence[TrackDataset]): the datasets to add.
+
+        Returns:
+            PandasTrackDataset: the dataset containing the tracks of all datasets.
+        """
+        return self._add_frames([self.__get_tracks(dataset) for dataset in datasets])
+
+    def _add_frames(self, frames: list[DataFrame]) -> "PandasTrackDataset":
+        new_frames = [frame for frame in frames if not frame.empty]
+        if not new_frames:
             return self
-        if self._dataset.empty:
-            return PandasTrackDataset.from_dataframe(
-                new_tracks, self.track_geometry_factory, calculator=self.calculator
-            )
-        updated_dataset = pandas.concat([self._dataset, new_tracks]).sort_index()
-        new_track_ids = new_tracks.index.unique(LEVEL_TRACK_ID)
-        new_dataset = updated_dataset.loc[new_track_ids]
-        updated_geometry_dataset = self._add_to_geometry_dataset(
-            PandasTrackDataset.from_dataframe(new_dataset, self.track_geometry_factory)
-        )
-        return PandasTrackDataset.from_dataframe(
-            updated_dataset, self.track_geometry_factory, updated_geometry_dataset
+        frames = new_frames if self._dataset.empty else [self._dataset, *new_frames]
+        merged = _concat(frames).sort_index()
+        merged = self._reclassify(merged, _ids_to_reclassify(frames))
+        updated_geometry_datasets = None
+        updated_summaries = None
+        if self._geometry_datasets or self._summaries is not None:
+            new_track_ids = Index(
+                numpy.concatenate(
+                    [frame.index.unique(LEVEL_TRACK_ID) for frame in new_frames]
+                )
+            ).unique()
+            new_tracks = merged.loc[new_track_ids]
+            if self._geometry_datasets:
+                updated_geometry_datasets = self._add_to_geometry_dataset(
+                    PandasTrackDataset(
+                        self.track_geometry_factory,
+                        new_tracks,
+                        calculator=self.calculator,
+                    )
+                )
+            if self._summaries is not None:
+                updated_summaries = self._summaries.add_all(
+                    PandasTrackSummaryDataset.from_detections(new_tracks)
+                )
+        return PandasTrackDataset(
+            self.track_geometry_factory,
+            merged,
+            updated_geometry_datasets,
+            calculator=self.calculator,
+            summaries=updated_summaries,
         )
 
+    def _reclassify(self, tracks: DataFrame, track_ids: Index) -> DataFrame:
+        if track_ids.empty:
+            return tracks
+        if track.TRACK_CLASSIFICATION not in tracks.columns:
+            return _assign_track_classification(tracks, self.calculator)
+        classifications = self.calculator.calculate(
+            _drop_track_classification(tracks.loc[track_ids])
+        )[track.TRACK_CLASSIFICATION]
+        all_track_ids = tracks.index.get_level_values(LEVEL_TRACK_ID)
+        positions = numpy.flatnonzero(all_track_ids.isin(track_ids))
+        new_values = all_track_ids[positions].map(classifications)
+        column = tracks[track.TRACK_CLASSIFICATION]
+        if isinstance(column.dtype, CategoricalDtype):
+            missing = Index(new_values).difference(column.cat.categories)
+            column = column.cat.add_categories(missing)
+        else:
+            column = column.copy()
+        column.iloc[positions] = new_values
+        tracks[track.TRACK_CLASSIFICATION] = column
+        return tracks
+
     def _add_to_geometry_dataset(
         self, new_tracks: TrackDataset
     ) -> dict[RelativeOffsetCoordinate, TrackGeometryDataset]:
@@ -353,10 +979,28 @@ class PandasTrackDataset(TrackDataset, PandasDataFrameProvider):
     def get_for(self, id: TrackId) -> Optional[Track]:
         if self._dataset.empty:
             return None
-        try:
-            return self._create_track_flyweight(id.id)
-        except KeyError:
+        columns = self._get_detection_columns()
+        if (position := columns.find(id.id)) is None:
+            return None
+        return columns.track(position)
+
+    def detections_array(self, track_id: TrackId) -> Optional[DetectionArray]:
+        if self._dataset.empty:
             return None
+        columns = self._get_detection_columns()
+        if (position := columns.find(track_id.id)) is None:
+            return None
+        return columns.detections_array(position)
+
+    def get_detections_at(
+        self,
+        track_ids: Sequence[TrackId],
+        indices: Sequence[int],
+        offset: RelativeOffsetCoordinate,
+    ) -> DetectionSelection:
+        if self._dataset.empty:
+            return super().get_detections_at(track_ids, indices, offset)
+        return self._get_detection_columns().select(track_ids, indices, offset)
 
     def clear(self) -> "PandasTrackDataset":
         return PandasTrackDataset(self.track_geometry_factory)
@@ -365,7 +1009,10 @@ class PandasTrackDataset(TrackDataset, PandasDataFrameProvider):
         remaining_tracks = self._dataset.drop(track_id.id, errors="ignore")
         updated_geometry_datasets = self._remove_from_geometry_dataset([track_id.id])
         return PandasTrackDataset.from_dataframe(
-            remaining_tracks, self.track_geometry_factory, updated_geometry_datasets
+            remaining_tracks,
+            self.track_geometry_factory,
+            updated_geometry_datasets,
+            summaries=self._remove_from_summaries({track_id}),
         )
 
     def remove_multiple(self, track_ids: set[TrackId]) -> "PandasTrackDataset":
@@ -375,9 +1022,19 @@ class PandasTrackDataset(TrackDataset, PandasDataFrameProvider):
             track_ids_primitive
         )
         return PandasTrackDataset.from_dataframe(
-            remaining_tracks, self.track_geometry_factory, updated_geometry_datasets
+            remaining_tracks,
+            self.track_geometry_factory,
+            updated_geometry_datasets,
+            summaries=self._remove_from_summaries(track_ids),
         )
 
+    def _remove_from_summaries(
+        self, track_ids: set[TrackId]
+    ) -> PandasTrackSummaryDataset | None:
+        if self._summaries is None:
+            return None
+        return self._summaries.remove_multiple(track_ids)
+
     def _remove_from_geometry_dataset(
         self, track_ids: Sequence[str]
     ) -> dict[RelativeOffsetCoordinate, TrackGeometryDataset]:
@@ -387,22 +1044,7 @@ class PandasTrackDataset(TrackDataset, PandasDataFrameProvider):
         return updated_dataset
 
     def as_list(self) -> list[Track]:
-        if (track_ids := self.get_index()) is not None:
-            logger().warning(
-                "Creating track flyweight objects which is really slow in "
-                f"'{PandasTrackDataset.as_list.__name__}'."
-            )
-            return [self._create_track_flyweight(current) for current in track_ids]
-
-        return []
-
-    def _create_track_flyweight(self, track_id: str) -> Track:
-        track_frame = self._dataset.loc[track_id, :]
-        if isinstance(track_frame, DataFrame):
-            return PandasTrack(track_id, track_frame)
-        if isinstance(track_frame, Series):
-            return PandasTrack(track_id, track_frame.to_frame(track_id))
-        raise NotImplementedError(f"Not implemented for {type(track_frame)}")
+        return list(self.as_generator())
 
     def get_data(self) -> DataFrame:
         return self._dataset
@@ -429,10 +1071,29 @@ class PandasTrackDataset(TrackDataset, PandasDataFrameProvider):
 
         return [self]
 
+    def split_by_track_ids(
+        self, batches: Sequence[Iterable[TrackId]]
+    ) -> Sequence["PandasTrackDataset"]:
+        if (index := self.get_index()) is None:
+            return [self for _ in batches]
+        new_batches = []
+        for batch in batches:
+            positions = index.get_indexer([track_id.id for track_id in batch])
+            batch_ids = index[numpy.sort(positions[positions >= 0])].tolist()
+            new_batches.append(
+                PandasTrackDataset.from_dataframe(
+                    self._dataset.loc[batch_ids, :],
+                    self.track_geometry_factory,
+                    self._get_geometries_for(batch_ids),
+                    calculator=self.calculator,
+                )
+            )
+        return new_batches
+
     def get_index(self) -> Index | None:
         if self._dataset.empty:
             return None
-        return self._dataset.index.get_level_values(LEVEL_TRACK_ID).unique()
+        return self._get_structure().index
 
     def _get_geometries_for(
         self, track_ids: list[str]
@@ -445,20 +1106,63 @@ class PandasTrackDataset(TrackDataset, PandasDataFrameProvider):
     def __len__(self) -> int:
         if self._dataset.empty:
             return 0
-        return len(self._dataset.index.get_level_values(LEVEL_TRACK_ID).unique())
+        return len(self._get_structure().index)
 
     def filter_by_min_detection_length(self, length: int) -> "PandasTrackDataset":
-        detection_counts_per_track: Series[int] = self._dataset.groupby(
-            level=LEVEL_TRACK_ID
-        )[track.FRAME].size()
-        filtered_ids = detection_counts_per_track[
-            detection_counts_per_track >= length
-        ].index
-        filtered_dataset = self._dataset.loc[filtered_ids]
+        if self._dataset.empty:
+            return self
+        summaries = self.get_summaries().filter_by_min_detection_length(length)
+        if len(summaries) == len(self):
+            return self
+        track_ids = self._dataset.index.get_level_values(LEVEL_TRACK_ID)
+        filtered_dataset = self._dataset[track_ids.isin(summaries.get_index())]
         return PandasTrackDataset(
-            self.track_geometry_factory, filtered_dataset, calculator=self.calculator
+            self.track_geometry_factory,
+            filtered_dataset,
+            calculator=self.calculator,
+            summaries=summaries,
         )
 
+    def filter_by_classifications(
+        self, classifications: Iterable[str]
+    ) -> "PandasTrackDataset":
+        """Keep only tracks of the given classifications. Calculated geometries and
+        summaries of the remaining tracks are kept. The filtered dataset is
+        memoized per set of classifications.
+
+        Args:
+            classifications (Iterable[str]): the track classifications to keep.
+
+        Returns:
+            PandasTrackDataset: the filtered dataset.
+        """
+        classes = frozenset(classifications)
+        if self._dataset.empty:
+            return self
+        if (filtered := self._class_views.get(classes)) is not None:
+            return filtered
+        mask = self._dataset[track.TRACK_CLASSIFICATION].isin(list(classes))
+        if mask.all():
+            filtered = self
+        else:
+            filtered_df = self._dataset[mask]
+            track_ids = filtered_df.index.get_level_values(LEVEL_TRACK_ID).unique()
+            summaries = None
+            if self._summaries is not None:
+                summary_data = self._summaries.get_data()
+                summaries = PandasTrackSummaryDataset(
+                    summary_data[summary_data["classification"].isin(list(classes))]
+                )
+            filtered = PandasTrackDataset(
+                self.track_geometry_factory,
+                filtered_df,
+                geometry_datasets=self._get_geometries_for(list(track_ids)),
+                calculator=self.calculator,
+                summaries=summaries,
+            )
+        self._class_views[classes] = filtered
+        return filtered
+
     def intersecting_tracks(
         self, sections: list[Section], offset: RelativeOffsetCoordinate
     ) -> set[TrackId]:
@@ -498,6 +1202,12 @@ class PandasTrackDataset(TrackDataset, PandasDataFrameProvider):
         geometry_dataset = self._get_geometry_dataset_for(offset)
         return geometry_dataset.contained_by_sections(sections)
 
+    def area_transitions(
+        self, sections: list[Section], offset: RelativeOffsetCoordinate
+    ) -> AreaTransitions:
+        geometry_dataset = self._get_geometry_dataset_for(offset)
+        return geometry_dataset.area_transitions(sections)
+
     def calculate_geometries_for(
         self, offsets: Iterable[RelativeOffsetCoordinate]
     ) -> None:
@@ -577,41 +1287,27 @@ class PandasTrackDataset(TrackDataset, PandasDataFrameProvider):
             for track_id, intersection_points in intersection_points.items()
         }
         tracks_to_cut = list(cut_indices.keys())
-        cut_tracks_df = self._dataset.loc[tracks_to_cut].copy()
-        index_as_df = cut_tracks_df.index.to_frame(
-            name=[track.TRACK_ID, track.OCCURRENCE]
-        )
-        index_as_df["cumcount"] = index_as_df.groupby(level=LEVEL_TRACK_ID).transform(
-            "cumcount"
-        )
-        index_as_df[track.TRACK_ID] = index_as_df.apply(
-            lambda row: self._create_cut_track_id(row, cut_indices), axis=1
+        cut_tracks_df = self._dataset.loc[tracks_to_cut]
+        track_ids = cut_tracks_df.index.get_level_values(LEVEL_TRACK_ID)
+        codes, uniques = pandas.factorize(track_ids)
+        new_track_ids = create_cut_track_ids(
+            numpy.asarray(uniques, dtype=str),
+            numpy.bincount(codes, minlength=len(uniques)),
+            [cut_indices[track_id] for track_id in uniques],
         )
-        cut_tracks_df.index = MultiIndex.from_frame(
-            index_as_df[[track.TRACK_ID, track.OCCURRENCE]]
+        cut_tracks_df.index = MultiIndex.from_arrays(
+            [
+                Index(new_track_ids.astype(object)),
+                cut_tracks_df.index.get_level_values(LEVEL_OCCURRENCE),
+            ],
+            names=cut_tracks_df.index.names,
         )
         return PandasTrackDataset(self.track_geometry_factory, cut_tracks_df), set(
             intersection_points.keys()
         )
 
-    def _create_cut_track_id(self, row: Series, cut_info: dict[str, list[int]]) -> str:
-        if (track_id := row[track.TRACK_ID]) in cut_info.keys():
-            cut_segment_index = bisect(cut_info[track_id], row["cumcount"])
-            return f"{track_id}_{cut_segment_index}"
-        return row[track.TRACK_ID]
-
     def get_max_confidences_for(self, track_ids: list[str]) -> dict[str, float]:
-        try:
-            return (
-                self._dataset.loc[track_ids][track.CONFIDENCE]
-                .groupby(level=[LEVEL_TRACK_ID])
-                .max()
-                .to_dict()
-            )
-        except KeyError as cause:
-            raise TrackDoesNotExistError(
-                "Some tracks do not exists in dataset with given id"
-            ) from cause
+        return self.get_summaries().get_max_confidences_for(track_ids)
 
 
 class FilteredPandasTrackDataset(FilteredTrackDataset, PandasDataFrameProvider):
@@ -673,29 +1369,14 @@ class FilteredPandasTrackDataset(FilteredTrackDataset, PandasDataFrameProvider):
         return filtered_dataset
 
     def _get_dataset_with_classes(self, classes: list[str]) -> PandasTrackDataset:
-        if self._other.empty:
-            return self._other
-        dataset = self._other.get_data()
-        mask = dataset[track.TRACK_CLASSIFICATION].isin(classes)
-        filtered_df = dataset[mask]
-        # The pandas Index does not implement the Sequence interface, which causes
-        # compatibility issues with the PandasTrackDataset._remove_from_geometry method
-        # when trying to remove geometries for tracks that have been deleted.
-        # To address this, we invalidate the entire geometry cache rather than
-        # attempting selective removal.
-        # This approach is acceptable because track removal only occurs when
-        # cutting tracks, which is a rare use case.
-
-        return PandasTrackDataset(
-            track_geometry_factory=self._other.track_geometry_factory,
-            dataset=filtered_df,
-            geometry_datasets=None,
-            calculator=self._other.calculator,
-        )
+        return self._other.filter_by_classifications(classes)
 
     def add_all(self, other: Iterable[Track]) -> TrackDataset:
         return self.wrap(self._other.add_all(other))
 
+    def add_many(self, datasets: Sequence[TrackDataset]) -> TrackDataset:
+        return self.wrap(self._other.add_many(datasets))
+
     def remove(self, track_id: TrackId) -> "TrackDataset":
         return self.wrap(self._other.remove(track_id))
 
@@ -708,6 +1389,13 @@ class FilteredPandasTrackDataset(FilteredTrackDataset, PandasDataFrameProvider):
     def split(self, chunks: int) -> Sequence["TrackDataset"]:
         return [self.wrap(dataset) for dataset in self._other.split(chunks)]
 
+    def split_by_track_ids(
+        self, batches: Sequence[Iterable[TrackId]]
+    ) -> Sequence["TrackDataset"]:
+        return [
+            self.wrap(dataset) for dataset in self._other.split_by_track_ids(batches)
+        ]
+
     def calculate_geometries_for(
         self, offsets: Iterable[RelativeOffsetCoordinate]
     ) -> None:
@@ -728,6 +1416,49 @@ class FilteredPandasTrackDataset(FilteredTrackDataset, PandasDataFrameProvider):
         return self._filter().get_data()
 
 
+def create_cut_track_ids(
+    track_ids: numpy.ndarray,
+    lengths: numpy.ndarray,
+    cut_indices: Sequence[Sequence[int]],
+) -> numpy.ndarray:
+    """Create the track ids of every detection of tracks cut at the given detection
+    indices.
+
+    A detection belongs to the segment counting the cut indices less or equal to its
+    index within the track. The new id of the detection is `<track id>_<segment>`.
+
+    Args:
+        track_ids (numpy.ndarray): the ids of the tracks to cut.
+        lengths (numpy.ndarray): the number of detections of each track.
+        cut_indices (Sequence[Sequence[int]]): the detection indices to cut each
+            track at.
+
+    Returns:
+        numpy.ndarray: the new track id of each detection in track order.
+    """
+    number_of_cuts = numpy.array([len(indices) for indices in cut_indices], dtype=int)
+    cuts = numpy.fromiter(
+        (index for indices in cut_indices for index in indices),
+        dtype=numpy.int64,
+        count=int(number_of_cuts.sum()),
+    )
+    step = int(max(lengths.max(initial=0), cuts.max(initial=0))) + 1
+    # Encode track and index into a single sortable key to search all tracks at once
+    keys = numpy.sort(
+        numpy.repeat(numpy.arange(len(cut_indices)), number_of_cuts) * step + cuts
+    )
+    track_of_row = numpy.repeat(numpy.arange(len(lengths)), lengths)
+    first_row = numpy.cumsum(lengths) - lengths
+    index_in_track = numpy.arange(lengths.sum()) - first_row[track_of_row]
+    cuts_before = numpy.cumsum(number_of_cuts) - number_of_cuts
+    segments = (
+        numpy.searchsorted(keys, track_of_row * step + index_in_track, side="right")
+        - cuts_before[track_of_row]
+    )
+    prefixes = numpy.char.add(numpy.asarray(track_ids, dtype=str)[track_of_row], "_")
+    return numpy.char.add(prefixes, segments.astype(str))
+
+
 def _assign_track_classification(
     data: DataFrame, calculator: PandasTrackClassificationCalculator
 ) -> DataFrame:
@@ -736,6 +1467,33 @@ def _assign_track_classification(
     return dropped.merge(classification_per_track, left_index=True, right_index=True)
 
 
+def _ids_to_reclassify(frames: list[DataFrame]) -> Index:
+    """Determine the track ids whose classification has to be calculated after
+    concatenating the given dataframes.
+
+    These are the ids of tracks spread over several dataframes and of all tracks of
+    dataframes without track classification.
+
+    Args:
+        frames (list[DataFrame]): the dataframes to concatenate.
+
+    Returns:
+        Index: the track ids to classify.
+    """
+    unclassified = [
+        frame.index.unique(LEVEL_TRACK_ID)
+        for frame in frames
+        if track.TRACK_CLASSIFICATION not in frame.columns
+    ]
+    occurrences = Series(
+        numpy.concatenate([frame.index.unique(LEVEL_TRACK_ID) for frame in frames])
+    ).value_counts()
+    spread = occurrences.index[occurrences > 1]
+    if not unclassified:
+        return Index(spread)
+    return Index(numpy.concatenate([spread, *unclassified])).unique()
+
+
 def _drop_track_classification(data: DataFrame) -> DataFrame:
     if track.TRACK_CLASSIFICATION in data.columns:
         return data.drop(columns=[track.TRACK_CLASSIFICATION])
@@ -765,6 +1523,48 @@ def _convert_tracks(tracks: Iterable[Track]) -> DataFrame:
     return _sort_tracks(df)
 
 
+def _concat(frames: list[DataFrame]) -> DataFrame:
+    """Concatenate the given dataframes.
+
+    Categorical columns stay categorical even if their categories differ between the
+    dataframes.
+
+    Args:
+        frames (list[DataFrame]): dataframes to concatenate.
+
+    Returns:
+        DataFrame: the concatenated dataframe.
+    """
+    categorical_columns = {
+        column
+        for frame in frames
+        for column, dtype in frame.dtypes.items()
+        if isinstance(dtype, CategoricalDtype)
+    }
+    if categorical_columns:
+        dtypes = {
+            column: CategoricalDtype(
+                Index(
+                    numpy.concatenate(
+                        [
+                            frame[column].astype("category").cat.categories
+                            for frame in frames
+                            if column in frame.columns
+                        ]
+                    )
+                ).unique()
+            )
+            for column in categorical_columns
+        }
+        frames = [
+            frame.astype(
+                {column: dtype for column, dtype in dtypes.items() if column in frame}
+            )
+            for frame in frames
+        ]
+    return pandas.concat(frames)
+
+
 def _sort_tracks(track_df: DataFrame) -> DataFrame:
     """Sort the given dataframe by trackId and occurrence.
 
@@ -1,50 +1,111 @@
-import itertools
+import weakref
 from multiprocessing import Pool
-from typing import Callable, Iterable, Sequence
+from multiprocessing.pool import Pool as ProcessPool
+from typing import Callable, Iterable, Optional, Sequence
 
 from OTAnalytics.application.config import DEFAULT_NUM_PROCESSES
 from OTAnalytics.application.logger import logger
 from OTAnalytics.domain.event import Event
-from OTAnalytics.domain.intersect import IntersectParallelizationStrategy
+from OTAnalytics.domain.intersect import (
+    IntersectParallelizationStrategy,
+    TaskTiming,
+    concat_events,
+    execute_timed,
+)
 from OTAnalytics.domain.section import Section
 from OTAnalytics.domain.track_dataset import TrackDataset
 
+TRACK_SHARING = Callable[[TrackDataset], TrackDataset]
+
+
+def _terminate(pool: ProcessPool) -> None:
+    pool.terminate()
+    pool.join()
+
 
 class MultiprocessingIntersectParallelization(IntersectParallelizationStrategy):
     """Executes the intersection of tracks and sections in parallel if num_processes
-    is greater than 1. Otherwise, executes sequentially"""
+    is greater than 1. Otherwise, executes sequentially.
+
+    Tasks are handed out one at a time to the next idle process. Thus, a process
+    finishing a cheap task early continues with the next task instead of waiting
+    for the other processes.
+
+    The processes are started on the first parallel execution and reused by all
+    following executions until the strategy is closed or the number of processes
+    changes. They are terminated on exit at the latest.
+
+    Args:
+        num_processes (int): the number of processes to run in parallel.
+        share_tracks (Optional[TRACK_SHARING]): provides the tracks in a form that is
+            cheap to pickle, e.g. as memory mapped files. The tracks are pickled as
+            they are if None.
+    """
 
-    def __init__(self, num_processes: int = DEFAULT_NUM_PROCESSES):
+    def __init__(
+        self,
+        num_processes: int = DEFAULT_NUM_PROCESSES,
+        share_tracks: Optional[TRACK_SHARING] = None,
+    ):
         self._validate_num_processes(num_processes)
         self._num_processes = num_processes
+        self._share_tracks = share_tracks
+        self._task_timings: list[TaskTiming] = []
+        self._pool: ProcessPool | None = None
+        self._terminate_pool: weakref.finalize | None = None
 
     @property
     def num_processes(self) -> int:
         return self._num_processes
 
+    @property
+    def task_timings(self) -> list[TaskTiming]:
+        return self._task_timings
+
     def _validate_num_processes(self, value: int) -> None:
         if value < 1:
             raise ValueError("Number of processes must be greater than zero.")
 
     def set_num_processes(self, value: int) -> None:
         self._validate_num_processes(value)
+        if value != self._num_processes:
+            self.close()
         self._num_processes = value
 
+    def share_tracks(self, tracks: TrackDataset) -> TrackDataset:
+        if self._num_processes > 1 and self._share_tracks is not None:
+            return self._share_tracks(tracks)
+        return tracks
+
     def execute(
         self,
         intersect: Callable[[TrackDataset, Iterable[Section]], Iterable[Event]],
         tasks: Sequence[tuple[TrackDataset, Iterable[Section]]],
-    ) -> list[Event]:
+    ) -> Sequence[Event]:
         logger().debug(
             f"Start intersection in parallel with {self._num_processes} processes."
         )
+        timed_tasks = [
+            (intersect, index, tracks, sections)
+            for index, (tracks, sections) in enumerate(tasks)
+        ]
         if self._num_processes > 1:
-            with Pool(processes=self._num_processes) as pool:
-                events = pool.starmap(intersect, tasks)
+            results = self._get_pool().starmap(execute_timed, timed_tasks, chunksize=1)
         else:
-            events = [intersect(tracks, sections) for tracks, sections in tasks]
+            results = [execute_timed(*task) for task in timed_tasks]
+
+        self._task_timings = [timing for _, timing in results]
+        return concat_events(events for events, _ in results)
 
-        return self._flatten_events(events)
+    def _get_pool(self) -> ProcessPool:
+        if self._pool is None:
+            logger().debug(f"Start {self._num_processes} intersection processes.")
+            self._pool = Pool(processes=self._num_processes)
+            self._terminate_pool = weakref.finalize(self, _terminate, self._pool)
+        return self._pool
 
-    def _flatten_events(self, events: Iterable[Iterable[Event]]) -> list[Event]:
-        return list(itertools.chain.from_iterable(events))
+    def close(self) -> None:
+        if self._terminate_pool is not None:
+            self._terminate_pool()
+        self._pool = None
+        self._terminate_pool = None
@@ -1,7 +1,12 @@
 from typing import Callable, Iterable, Sequence
 
 from OTAnalytics.domain.event import Event
-from OTAnalytics.domain.intersect import IntersectParallelizationStrategy
+from OTAnalytics.domain.intersect import (
+    IntersectParallelizationStrategy,
+    TaskTiming,
+    concat_events,
+    execute_timed,
+)
 from OTAnalytics.domain.section import Section
 from OTAnalytics.domain.track_dataset import TrackDataset
 
@@ -9,20 +14,28 @@ from OTAnalytics.domain.track_dataset import TrackDataset
 class SequentialIntersect(IntersectParallelizationStrategy):
     """Executes the intersection of tracks and sections in sequential order."""
 
+    def __init__(self) -> None:
+        self._task_timings: list[TaskTiming] = []
+
     @property
     def num_processes(self) -> int:
         return 1
 
+    @property
+    def task_timings(self) -> list[TaskTiming]:
+        return self._task_timings
+
     def execute(
         self,
         intersect: Callable[[TrackDataset, Iterable[Section]], Iterable[Event]],
         tasks: Sequence[tuple[TrackDataset, Iterable[Section]]],
-    ) -> list[Event]:
-        events: list[Event] = []
-        for task in tasks:
-            track_dataset, sections = task
-            events.extend(intersect(track_dataset, sections))
-        return events
+    ) -> Sequence[Event]:
+        results = [
+            execute_timed(intersect, index, track_dataset, sections)
+            for index, (track_dataset, sections) in enumerate(tasks)
+        ]
+        self._task_timings = [timing for _, timing in results]
+        return concat_events(events for events, _ in results)
 
     def set_num_processes(self, value: int) -> None:
         pass
@@ -0,0 +1,89 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Sequence
+
+from OTAnalytics.application.config import DEFAULT_NUM_PROCESSES
+from OTAnalytics.application.logger import logger
+from OTAnalytics.domain.event import Event
+from OTAnalytics.domain.intersect import (
+    IntersectParallelizationStrategy,
+    TaskTiming,
+    concat_events,
+    execute_timed,
+)
+from OTAnalytics.domain.section import Section
+from OTAnalytics.domain.track_dataset import TrackDataset
+
+
+class ThreadedIntersectParallelization(IntersectParallelizationStrategy):
+    """Executes the intersection of tracks and sections in parallel threads if
+    num_processes is greater than 1. Otherwise, executes sequentially.
+
+    All threads share the tracks in memory, thus tasks are neither pickled nor
+    copied. Threads only run in parallel while the geometry operations release the
+    GIL, e.g. the vectorized operations of pygeos and Shapely.
+
+    Tasks are handed out one at a time to the next idle thread. The threads are
+    started on the first parallel execution and reused by all following executions
+    until the strategy is closed or the number of threads changes.
+
+    Args:
+        num_processes (int): the number of threads to run in parallel.
+    """
+
+    def __init__(self, num_processes: int = DEFAULT_NUM_PROCESSES) -> None:
+        self._validate_num_processes(num_processes)
+        self._num_processes = num_processes
+        self._task_timings: list[TaskTiming] = []
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def num_processes(self) -> int:
+        return self._num_processes
+
+    @property
+    def task_timings(self) -> list[TaskTiming]:
+        return self._task_timings
+
+    def _validate_num_processes(self, value: int) -> None:
+        if value < 1:
+            raise ValueError("Number of threads must be greater than zero.")
+
+    def set_num_processes(self, value: int) -> None:
+        self._validate_num_processes(value)
+        if value != self._num_processes:
+            self.close()
+        self._num_processes = value
+
+    def execute(
+        self,
+        intersect: Callable[[TrackDataset, Iterable[Section]], Iterable[Event]],
+        tasks: Sequence[tuple[TrackDataset, Iterable[Section]]],
+    ) -> Sequence[Event]:
+        logger().debug(
+            f"Start intersection in parallel with {self._num_processes} threads."
+        )
+        timed_tasks = [
+            (intersect, index, tracks, sections)
+            for index, (tracks, sections) in enumerate(tasks)
+        ]
+        if self._num_processes > 1:
+            executor = self._get_executor()
+            futures = [executor.submit(execute_timed, *task) for task in timed_tasks]
+            results = [future.result() for future in futures]
+        else:
+            results = [execute_timed(*task) for task in timed_tasks]
+
+        self._task_timings = [timing for _, timing in results]
+        return concat_events(events for events, _ in results)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._num_processes, thread_name_prefix="intersect"
+            )
+        return self._executor
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+        self._executor = None
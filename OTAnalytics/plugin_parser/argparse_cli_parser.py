@@ -1,5 +1,17 @@
 from argparse import ArgumentParser
 
+from OTAnalytics.application.config import (
+    DEFAULT_GEOMETRY_STORE,
+    DEFAULT_INTERSECTION_PARALLELIZATION,
+    DEFAULT_TRACK_STORE,
+    GEOMETRY_STORE_SHAPELY,
+    GEOMETRY_STORES,
+    INTERSECTION_PARALLELIZATION_THREADS,
+    INTERSECTION_PARALLELIZATIONS,
+    TRACK_STORE_MEMORY_MAPPED,
+    TRACK_STORE_NUMPY,
+    TRACK_STORES,
+)
 from OTAnalytics.application.parser.cli_parser import CliArguments, CliParser
 
 
@@ -135,6 +147,77 @@ class ArgparseCliParser(CliParser):
             help="Blacklist filter to exclude tracks with given classes.",
             required=False,
         )
+        self._parser.add_argument(
+            "--track-cache",
+            action="store_true",
+            help="Cache parsed ottrk files to load them faster next time.",
+            required=False,
+        )
+        self._parser.add_argument(
+            "--track-cache-dir",
+            type=str,
+            help="Directory of the cache of parsed ottrk files.",
+            required=False,
+        )
+        self._parser.add_argument(
+            "--clear-track-cache",
+            action="store_true",
+            help="Remove all cached ottrk files before loading.",
+            required=False,
+        )
+        self._parser.add_argument(
+            "--stream-track-files",
+            action="store_true",
+            help=(
+                "Parse ottrk files in chunks to reduce the peak memory usage. "
+                "Parsing takes longer."
+            ),
+            required=False,
+        )
+        self._parser.add_argument(
+            "--track-store",
+            choices=TRACK_STORES,
+            default=DEFAULT_TRACK_STORE,
+            help=(
+                "Where to keep the detections of loaded tracks. "
+                f"'{TRACK_STORE_NUMPY}' keeps them in memory as columns sorted by "
+                "track for fast access to single tracks. "
+                f"'{TRACK_STORE_MEMORY_MAPPED}' keeps them in files on disk to "
+                "analyse datasets larger than the available memory."
+            ),
+            required=False,
+        )
+        self._parser.add_argument(
+            "--track-store-dir",
+            type=str,
+            help=(
+                f"Directory of the '{TRACK_STORE_MEMORY_MAPPED}' track store. "
+                "A temporary directory is used by default."
+            ),
+            required=False,
+        )
+        self._parser.add_argument(
+            "--geometry-store",
+            choices=GEOMETRY_STORES,
+            default=DEFAULT_GEOMETRY_STORE,
+            help=(
+                "Library used to intersect track geometries with sections. "
+                f"'{GEOMETRY_STORE_SHAPELY}' computes the intersections of all "
+                "tracks in bulk."
+            ),
+            required=False,
+        )
+        self._parser.add_argument(
+            "--intersection-parallelization",
+            choices=INTERSECTION_PARALLELIZATIONS,
+            default=DEFAULT_INTERSECTION_PARALLELIZATION,
+            help=(
+                "How to intersect tracks with sections in parallel. "
+                f"'{INTERSECTION_PARALLELIZATION_THREADS}' shares the tracks in "
+                "memory instead of passing them to other processes."
+            ),
+            required=False,
+        )
 
     def parse(self) -> CliArguments:
         """Parse and checks for cli arg
@@ -161,4 +244,12 @@ class ArgparseCliParser(CliParser):
             log_file=args.logfile,
             include_classes=args.include_classes,
             exclude_classes=args.exclude_classes,
+            track_cache=args.track_cache,
+            track_cache_dir=args.track_cache_dir,
+            clear_track_cache=args.clear_track_cache,
+            stream_track_files=args.stream_track_files,
+            track_store=args.track_store,
+            track_store_dir=args.track_store_dir,
+            geometry_store=args.geometry_store,
+            intersection_parallelization=args.intersection_parallelization,
         )
@@ -1,62 +1,328 @@
 import bz2
+import gzip
+import importlib
+import os
+import re
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from json import JSONDecodeError, JSONDecoder
 from pathlib import Path
+from typing import Any, Iterator, TextIO
 
+import orjson
 import ujson
 
 ENCODING: str = "UTF-8"
 
+DEFAULT_BLOCK_SIZE: int = 1024 * 1024
+"""Number of characters read from a text stream at once."""
 
-def parse_json_bz2(path: Path) -> dict:
+PREFIX_BLOCK_SIZE: int = 64 * 1024
+"""Number of characters read at once when only a prefix of a file is decoded."""
+
+WHITESPACE: str = " \t\n\r"
+
+NUMBER_CONTINUATION = re.compile(r"[0-9eE.+\-]*\Z")
+"""Matches the rest of a buffer if a number decoded before it might continue."""
+
+MAGIC_SIZE: int = 4
+BZ2_MAGIC: bytes = b"BZh"
+GZIP_MAGIC: bytes = b"\x1f\x8b"
+ZSTD_MAGIC: bytes = b"\x28\xb5\x2f\xfd"
+LZ4_MAGIC: bytes = b"\x04\x22\x4d\x18"
+
+BZ2_STREAM_HEADER: re.Pattern[bytes] = re.compile(rb"BZh[1-9]\x31\x41\x59\x26\x53\x59")
+"""Start of a bz2 stream containing at least one block. Files written by parallel
+compressors, e.g. pbzip2, consist of multiple such streams."""
+
+BZ2_STREAM_SIZE: int = 8 * 1024 * 1024
+"""Number of uncompressed bytes written per bz2 stream."""
+
+DEFAULT_WORKERS: int = os.cpu_count() or 1
+"""Number of threads to decompress or compress independent bz2 streams with."""
+
+
+class Compression(Enum):
+    NONE = "none"
+    BZ2 = "bz2"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+    LZ4 = "lz4"
+
+
+class UnsupportedCompressionError(Exception):
+    pass
+
+
+class JsonDecoder(ABC):
+    """Decode the content of a JSON file."""
+
+    @abstractmethod
+    def decode(self, content: bytes) -> Any:
+        """Decode the given UTF-8 encoded JSON document.
+
+        Args:
+            content (bytes): the JSON document.
+
+        Returns:
+            Any: the decoded document.
+        """
+        raise NotImplementedError
+
+
+class UjsonDecoder(JsonDecoder):
+    def decode(self, content: bytes) -> Any:
+        return ujson.loads(content)
+
+
+class OrjsonDecoder(JsonDecoder):
+    """Decode JSON documents directly from bytes using orjson.
+
+    orjson is strict about the JSON standard. Documents containing non standard
+    values like NaN, as written by ujson, are decoded by the fallback decoder.
+
+    Args:
+        fallback (JsonDecoder): decoder for documents orjson can not decode.
+    """
+
+    def __init__(self, fallback: JsonDecoder = UjsonDecoder()) -> None:
+        self._fallback = fallback
+
+    def decode(self, content: bytes) -> Any:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return self._fallback.decode(content)
+
+
+DEFAULT_DECODER: JsonDecoder = OrjsonDecoder()
+
+
+def detect_compression(path: Path) -> Compression:
+    """Detect the compression of the given file by its magic number.
+
+    Args:
+        path (Path): the file.
+
+    Returns:
+        Compression: the compression of the file.
+    """
+    with open(path, "rb") as file:
+        magic = file.read(MAGIC_SIZE)
+    if magic.startswith(BZ2_MAGIC):
+        return Compression.BZ2
+    if magic.startswith(GZIP_MAGIC):
+        return Compression.GZIP
+    if magic.startswith(ZSTD_MAGIC):
+        return Compression.ZSTD
+    if magic.startswith(LZ4_MAGIC):
+        return Compression.LZ4
+    return Compression.NONE
+
+
+def _import_compression_module(name: str, compression: Compression) -> Any:
+    try:
+        return importlib.import_module(name)
+    except ImportError as cause:
+        raise UnsupportedCompressionError(
+            f"Reading {compression.value} compressed files requires the package "
+            f"'{name.split('.')[0]}'."
+        ) from cause
+
+
+def read_bytes(path: Path, workers: int = DEFAULT_WORKERS) -> bytes:
+    """Read the decompressed content of the given file.
+
+    The compression is detected by the magic number of the file. Multi stream bz2
+    files are decompressed in parallel.
+
+    Args:
+        path (Path): the file.
+        workers (int): number of threads to decompress bz2 streams with.
+
+    Returns:
+        bytes: the decompressed content.
+    """
+    compression = detect_compression(path)
+    content = path.read_bytes()
+    match compression:
+        case Compression.BZ2:
+            return decompress_bz2(content, workers)
+        case Compression.GZIP:
+            return gzip.decompress(content)
+        case Compression.ZSTD:
+            zstandard = _import_compression_module("zstandard", compression)
+            with zstandard.ZstdDecompressor().stream_reader(content) as reader:
+                return reader.read()
+        case Compression.LZ4:
+            lz4_frame = _import_compression_module("lz4.frame", compression)
+            return lz4_frame.decompress(content)
+    return content
+
+
+def open_text(path: Path) -> TextIO:
+    """Open the given file as decompressed text stream.
+
+    The compression is detected by the magic number of the file.
+
+    Args:
+        path (Path): the file.
+
+    Returns:
+        TextIO: the decompressed text stream.
+    """
+    compression = detect_compression(path)
+    match compression:
+        case Compression.BZ2:
+            return bz2.open(path, "rt", encoding=ENCODING)
+        case Compression.GZIP:
+            return gzip.open(path, "rt", encoding=ENCODING)
+        case Compression.ZSTD:
+            zstandard = _import_compression_module("zstandard", compression)
+            return zstandard.open(path, "rt", encoding=ENCODING)
+        case Compression.LZ4:
+            lz4_frame = _import_compression_module("lz4.frame", compression)
+            return lz4_frame.open(path, "rt", encoding=ENCODING)
+    return open(path, "rt", encoding=ENCODING)
+
+
+def decompress_bz2(content: bytes, workers: int = DEFAULT_WORKERS) -> bytes:
+    """Decompress bz2 content consisting of one or more streams.
+
+    Multiple streams are decompressed in parallel. If the content can not be split
+    into valid streams, it is decompressed sequentially.
+
+    Args:
+        content (bytes): the compressed content.
+        workers (int): number of threads to decompress the streams with.
+
+    Returns:
+        bytes: the decompressed content.
+    """
+    starts = [match.start() for match in BZ2_STREAM_HEADER.finditer(content)]
+    if workers <= 1 or len(starts) <= 1 or starts[0] != 0:
+        return bz2.decompress(content)
+    view = memoryview(content)
+    streams = [
+        view[start:end] for start, end in zip(starts, starts[1:] + [len(content)])
+    ]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        parts = list(executor.map(_decompress_bz2_stream, streams))
+    if any(part is None for part in parts):
+        return bz2.decompress(content)
+    return b"".join(part for part in parts if part is not None)
+
+
+def _decompress_bz2_stream(stream: memoryview) -> bytes | None:
+    decompressor = bz2.BZ2Decompressor()
+    try:
+        decompressed = decompressor.decompress(stream)
+    except (OSError, EOFError):
+        return None
+    if not decompressor.eof or decompressor.unused_data:
+        return None
+    return decompressed
+
+
+def compress_bz2(
+    content: bytes,
+    workers: int = DEFAULT_WORKERS,
+    stream_size: int = BZ2_STREAM_SIZE,
+) -> bytes:
+    """Compress the given content into multiple bz2 streams.
+
+    The streams are compressed in parallel and can be decompressed in parallel by
+    `decompress_bz2`. Any bz2 decompressor supporting multiple streams can read
+    the result.
+
+    Args:
+        content (bytes): the content to compress.
+        workers (int): number of threads to compress the streams with.
+        stream_size (int): number of uncompressed bytes per stream.
+
+    Returns:
+        bytes: the compressed content.
+    """
+    view = memoryview(content)
+    chunks = [
+        view[start : start + stream_size]
+        for start in range(0, max(len(content), 1), stream_size)
+    ]
+    if workers <= 1 or len(chunks) <= 1:
+        return b"".join(bz2.compress(chunk) for chunk in chunks)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return b"".join(executor.map(bz2.compress, chunks))
+
+
+def parse_json_bz2(path: Path, decoder: JsonDecoder = DEFAULT_DECODER) -> dict:
     """Parse JSON bz2.
 
+    Despite its name, files with any supported compression are parsed. The
+    compression is detected by the magic number of the file.
+
     Args:
         path (Path): Path to bz2 JSON.
+        decoder (JsonDecoder): decoder of the decompressed content.
 
     Returns:
         dict: The content of the JSON file.
     """
+    return decoder.decode(read_bytes(path))
 
-    with bz2.open(path, "rt", encoding=ENCODING) as file:
-        return ujson.load(file)
 
+def parse_json_bz2_entry(
+    path: Path, key: str, block_size: int = PREFIX_BLOCK_SIZE
+) -> Any:
+    """Parse the value of a single top level entry of a bz2 JSON object.
 
-def write_json_bz2(data: dict, path: Path) -> None:
-    """Serialize JSON bz2.
+    The file is decompressed and decoded only until the entry has been read. Thus,
+    entries stored at the beginning of large files are read in a fraction of the
+    time needed to parse the whole file.
 
     Args:
-        data (dict): The content of the JSON file.
         path (Path): Path to bz2 JSON.
+        key (str): the key of the top level entry.
+        block_size (int): number of characters to read from the file at once.
+
+    Raises:
+        JsonStreamError: if the file contains no entry with the given key.
+
+    Returns:
+        Any: the value of the entry.
     """
-    with bz2.open(path, "wt", encoding=ENCODING) as file:
-        ujson.dump(data, file)
+    with open_text(path) as file:
+        stream = JsonStream(file, block_size)
+        for current_key in stream.object_keys():
+            if current_key == key:
+                return stream.decode_value()
+            stream.skip_value()
+    raise JsonStreamError(f"No entry '{key}' found in '{path}'.")
 
 
-def _parse_json(path: Path) -> dict:
-    """Parse JSON.
+def write_json_bz2(data: dict, path: Path) -> None:
+    """Serialize JSON bz2.
 
-    Args:
-        path (Path): Path to JSON.
+    Large content is compressed into multiple bz2 streams in parallel.
 
-    Returns:
-        dict: The content of the JSON file.
+    Args:
+        data (dict): The content of the JSON file.
+        path (Path): Path to bz2 JSON.
     """
-    with open(path, "rt", encoding=ENCODING) as file:
-        return ujson.load(file)
+    path.write_bytes(compress_bz2(ujson.dumps(data).encode(ENCODING)))
 
 
-def parse_json(path: Path) -> dict:
-    """Parse file as JSON or bzip2 compressed JSON.
+def parse_json(path: Path, decoder: JsonDecoder = DEFAULT_DECODER) -> dict:
+    """Parse file as JSON or compressed JSON.
 
     Args:
         path (Path): Path to file
+        decoder (JsonDecoder): decoder of the decompressed content.
 
     Returns:
         dict: The content of the JSON file.
     """
-    try:
-        return _parse_json(path)
-    except UnicodeDecodeError:
-        return parse_json_bz2(path)
+    return decoder.decode(read_bytes(path))
 
 
 def write_json(data: dict, path: Path) -> None:
@@ -68,3 +334,185 @@ def write_json(data: dict, path: Path) -> None:
     """
     with open(path, "wt", encoding=ENCODING) as file:
         ujson.dump(data, file, indent=4)
+
+
+class JsonStreamError(Exception):
+    pass
+
+
+class JsonStream:
+    """Incrementally decode a JSON document from a text stream.
+
+    Only the parts of the document that are requested are held in memory. Nested
+    values are decoded as a whole, whereas objects and arrays can be iterated
+    element by element.
+
+    Args:
+        file (TextIO): the text stream to read from.
+        block_size (int): number of characters to read at once.
+    """
+
+    def __init__(self, file: TextIO, block_size: int = DEFAULT_BLOCK_SIZE) -> None:
+        self._file = file
+        self._block_size = block_size
+        self._decoder = JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read the next block of the stream into the buffer.
+
+        Returns:
+            bool: False if the end of the stream has been reached, True otherwise.
+        """
+        if self._eof:
+            return False
+        block = self._file.read(self._block_size)
+        if not block:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._position :] + block
+        self._position = 0
+        return True
+
+    def _peek(self) -> str:
+        """Return the next non whitespace character without consuming it.
+
+        Returns:
+            str: the next character or an empty string at the end of the stream.
+        """
+        if (
+            self._position < len(self._buffer)
+            and self._buffer[self._position] not in WHITESPACE
+        ):
+            return self._buffer[self._position]
+        while True:
+            while (
+                self._position < len(self._buffer)
+                and self._buffer[self._position] in WHITESPACE
+            ):
+                self._position += 1
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._fill():
+                return ""
+
+    def _expect(self, *characters: str) -> str:
+        """Consume the next non whitespace character.
+
+        Args:
+            characters (str): the allowed characters.
+
+        Raises:
+            JsonStreamError: if the next character is not allowed.
+
+        Returns:
+            str: the consumed character.
+        """
+        character = self._peek()
+        if character not in characters or not character:
+            raise JsonStreamError(
+                f"Expected one of {characters} but found '{character}' in JSON stream."
+            )
+        self._position += 1
+        return character
+
+    def decode_value(self) -> Any:
+        """Decode the next complete JSON value.
+
+        Returns:
+            Any: the decoded value.
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except JSONDecodeError as cause:
+                if self._fill():
+                    continue
+                raise JsonStreamError("Incomplete JSON value in stream.") from cause
+            if self._may_continue(value, end) and self._fill():
+                continue
+            self._position = end
+            return value
+
+    def _may_continue(self, value: Any, end: int) -> bool:
+        """Whether the decoded value might continue in the next block.
+
+        Numbers end at the first character that cannot be part of them, e.g. a
+        number split after its decimal point is decoded up to the point.
+
+        Args:
+            value (Any): the decoded value.
+            end (int): the position in the buffer after the decoded value.
+
+        Returns:
+            bool: True if the value might be incomplete, False otherwise.
+        """
+        if end == len(self._buffer):
+            return True
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return NUMBER_CONTINUATION.match(self._buffer, end) is not None
+        return False
+
+    def object_keys(self) -> Iterator[str]:
+        """Iterate over the keys of the next JSON object.
+
+        The consumer has to consume the value of each key, e.g. by calling
+        `decode_value`, before requesting the next key.
+
+        Returns:
+            Iterator[str]: the keys of the object.
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self._position += 1
+            return
+        while True:
+            key = self.decode_value()
+            if not isinstance(key, str):
+                raise JsonStreamError(f"Expected key of JSON object but got {key}.")
+            self._expect(":")
+            yield key
+            if self._expect(",", "}") == "}":
+                return
+
+    def array_chunks(self, chunk_size: int) -> Iterator[list[Any]]:
+        """Iterate over the elements of the next JSON array in chunks.
+
+        Args:
+            chunk_size (int): maximum number of elements per chunk.
+
+        Returns:
+            Iterator[list[Any]]: the elements of the array.
+        """
+        self._expect("[")
+        if self._peek() == "]":
+            self._position += 1
+            return
+        chunk: list[Any] = []
+        while True:
+            chunk.append(self.decode_value())
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+            if self._expect(",", "]") == "]":
+                break
+        if chunk:
+            yield chunk
+
+    def skip_value(self) -> None:
+        """Consume the next JSON value without holding it in memory as a whole.
+
+        Objects and arrays are skipped element by element.
+        """
+        character = self._peek()
+        if character == "{":
+            for _ in self.object_keys():
+                self.skip_value()
+        elif character == "[":
+            for _ in self.array_chunks(chunk_size=1):
+                pass
+        else:
+            self.decode_value()
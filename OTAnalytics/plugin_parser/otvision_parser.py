@@ -1,9 +1,13 @@
+import heapq
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Callable, Iterable, Optional, Sequence, Tuple
 
+import pandas
+from pandas import DataFrame
+
 import OTAnalytics.plugin_parser.ottrk_dataformat as ottrk_format
 from OTAnalytics import version
 from OTAnalytics.application.config import (
@@ -13,6 +17,7 @@ from OTAnalytics.application.config import (
 from OTAnalytics.application.datastore import (
     DetectionMetadata,
     EventListParser,
+    TrackFileMetadata,
     TrackParser,
     TrackParseResult,
     TrackVideoParser,
@@ -52,6 +57,7 @@ from OTAnalytics.plugin_parser import dataformat_versions
 from OTAnalytics.plugin_parser.json_parser import (
     parse_json,
     parse_json_bz2,
+    parse_json_bz2_entry,
     write_json,
     write_json_bz2,
 )
@@ -127,6 +133,26 @@ class DetectionFixer(ABC):
     def fix(self, detection: dict, current_version: Version) -> dict:
         pass
 
+    def fix_columns(self, detections: DataFrame, current_version: Version) -> DataFrame:
+        """Fix the given detections stored column wise.
+
+        Fixers should override this method with a vectorized implementation. By
+        default, each detection is converted into a dict and fixed on its own.
+
+        Args:
+            detections (DataFrame): detections with one column per ottrk detection
+                key.
+            current_version (Version): otdet version of the detections.
+
+        Returns:
+            DataFrame: the fixed detections.
+        """
+        fixed_detections = [
+            self.fix(detection, current_version)
+            for detection in detections.to_dict("records")
+        ]
+        return DataFrame(fixed_detections, columns=detections.columns)
+
 
 class MetadataFixer(ABC):
     def __init__(
@@ -184,6 +210,18 @@ class Otdet_Version_1_0_to_1_1(DetectionFixer):
             detection[ottrk_format.Y] = y
         return detection
 
+    def fix_columns(
+        self, detections: DataFrame, otdet_format_version: Version
+    ) -> DataFrame:
+        if otdet_format_version <= self.to_version():
+            detections[ottrk_format.X] = (
+                detections[ottrk_format.X] - detections[ottrk_format.W] / 2
+            )
+            detections[ottrk_format.Y] = (
+                detections[ottrk_format.Y] - detections[ottrk_format.H] / 2
+            )
+        return detections
+
 
 class Otdet_Version_1_0_To_1_2(DetectionFixer):
     def __init__(self) -> None:
@@ -209,6 +247,19 @@ class Otdet_Version_1_0_To_1_2(DetectionFixer):
             detection[ottrk_format.OCCURRENCE] = str(occurrence.timestamp())
         return detection
 
+    def fix_columns(
+        self, detections: DataFrame, otdet_format_version: Version
+    ) -> DataFrame:
+        if otdet_format_version < self.to_version():
+            # Occurrences are given in UTC without timezone information
+            occurrences = pandas.to_datetime(
+                detections[ottrk_format.OCCURRENCE], format=ottrk_format.DATE_FORMAT
+            )
+            # Convert via microseconds to get the same floats as datetime.timestamp
+            microseconds = occurrences.to_numpy().astype("datetime64[us]").view("i8")
+            detections[ottrk_format.OCCURRENCE] = microseconds / 1e6
+        return detections
+
 
 class Ottrk_Version_1_0_To_1_1(MetadataFixer):
     def __init__(self) -> None:
@@ -250,40 +301,83 @@ class OttrkFormatFixer:
         Returns:
             dict: fixed ottrk file content
         """
-        otdet_version = self.__parse_otdet_version(content)
-        content = self.__fix_metadata(content)
-        return self.__fix_detections(content, otdet_version)
+        otdet_version = self.parse_otdet_version(content[ottrk_format.METADATA])
+        content[ottrk_format.METADATA] = self.fix_metadata(
+            content[ottrk_format.METADATA]
+        )
+        content[ottrk_format.DATA][ottrk_format.DATA_DETECTIONS] = self.fix_detections(
+            content[ottrk_format.DATA][ottrk_format.DATA_DETECTIONS],
+            otdet_version,
+        )
+        return content
 
-    def __parse_otdet_version(self, content: dict) -> Version:
-        """Parse the otdet format version from the input.
+    def parse_otdet_version(self, metadata: dict) -> Version:
+        """Parse the otdet format version from the metadata.
 
         Args:
-            content (dict): ottrk file content
+            metadata (dict): metadata of the ottrk file
 
         Returns:
             Version: otdet format version
         """
-        version = content[ottrk_format.METADATA][ottrk_format.OTDET_VERSION]
-        return Version.from_str(version)
+        return Version.from_str(metadata[ottrk_format.OTDET_VERSION])
+
+    def fix_metadata(self, metadata: dict) -> dict:
+        """Fix format changes of the metadata from older ottrk versions.
 
-    def __fix_metadata(self, content: dict) -> dict:
-        metadata = content[ottrk_format.METADATA]
+        Args:
+            metadata (dict): metadata of the ottrk file
+
+        Returns:
+            dict: fixed metadata
+        """
         current_version = Version.from_str(metadata[ottrk_format.OTTRK_VERSION])
         for fixer in self._metadata_fixes:
             metadata = fixer.fix(metadata, current_version)
-        content[ottrk_format.METADATA] = metadata
-        return content
+        return metadata
+
+    def fix_detections(
+        self, detections: list[dict], current_otdet_version: Version
+    ) -> list[dict]:
+        """Fix format changes of the given detections from older otdet versions.
 
-    def __fix_detections(self, content: dict, current_otdet_version: Version) -> dict:
-        detections = content[ottrk_format.DATA][ottrk_format.DATA_DETECTIONS]
+        The detections may be a subset of all detections of an ottrk file. This
+        allows fixing detections chunk by chunk.
+
+        Args:
+            detections (list[dict]): detections to fix
+            current_otdet_version (Version): otdet version of the detections
+
+        Returns:
+            list[dict]: fixed detections
+        """
         fixed_detections: list[dict] = []
         for detection in detections:
             fixed_detection = detection
             for fixer in self._detection_fixes:
                 fixed_detection = fixer.fix(detection, current_otdet_version)
             fixed_detections.append(fixed_detection)
-        content[ottrk_format.DATA][ottrk_format.DATA_DETECTIONS] = fixed_detections
-        return content
+        return fixed_detections
+
+    def fix_detection_columns(
+        self, detections: DataFrame, current_otdet_version: Version
+    ) -> DataFrame:
+        """Fix format changes of the given detections stored column wise from older
+        otdet versions.
+
+        Args:
+            detections (DataFrame): detections with one column per ottrk detection
+                key. The dataframe might be modified in place.
+            current_otdet_version (Version): otdet version of the detections
+
+        Returns:
+            DataFrame: fixed detections
+        """
+        if detections.empty:
+            return detections
+        for fixer in self._detection_fixes:
+            detections = fixer.fix_columns(detections, current_otdet_version)
+        return detections
 
 
 class DetectionParser(ABC):
@@ -368,27 +462,28 @@ class PythonDetectionParser(DetectionParser):
             input_file=input_file,
             id_generator=id_generator,
         )
+        continued_track_ids = self._find_continued_tracks(tracks_dict.keys())
         tracks: list[Track] = []
         for track_id, detections in tracks_dict.items():
-            existing_detections = self._get_existing_detections(track_id)
-            all_detections = existing_detections + detections
-            track_length = len(all_detections)
+            detections = _sort_by_occurrence(detections)
+            if track_id in continued_track_ids:
+                detections = _merge_by_occurrence(
+                    self._get_existing_detections(track_id), detections
+                )
+            track_length = len(detections)
             if (
                 self._track_length_limit.lower_bound
                 <= track_length
                 <= self._track_length_limit.upper_bound
             ):
-                sort_dets_by_occurrence = sorted(
-                    all_detections, key=lambda det: det.occurrence
-                )
                 classification = self._track_classification_calculator.calculate(
-                    sort_dets_by_occurrence
+                    detections
                 )
                 try:
                     current_track = PythonTrack(
                         _id=track_id,
                         _classification=classification,
-                        _detections=sort_dets_by_occurrence,
+                        _detections=detections,
                     )
                     tracks.append(current_track)
                 except TrackHasNoDetectionError as build_error:
@@ -407,6 +502,22 @@ class PythonDetectionParser(DetectionParser):
             self._track_classification_calculator,
         )
 
+    def _find_continued_tracks(self, track_ids: Iterable[TrackId]) -> set[TrackId]:
+        """
+        Returns the ids of the given tracks already existing in the track repository,
+        e.g. tracks continued from a previous track file.
+
+        The ids of the repository are fetched once per parsed file. Thus, only tracks
+        spanning the boundary between track files are looked up and merged.
+
+        Args:
+            track_ids (Iterable[TrackId]): ids of the parsed tracks.
+
+        Returns:
+            set[TrackId]: ids of the tracks to merge with existing tracks.
+        """
+        return set(track_ids).intersection(self._track_repository.get_all_ids())
+
     def _get_existing_detections(self, track_id: TrackId) -> list[Detection]:
         """
         Returns the detections of an already existing track with the same id or
@@ -456,6 +567,49 @@ class PythonDetectionParser(DetectionParser):
         return tracks_dict
 
 
+def _sort_by_occurrence(detections: list[Detection]) -> list[Detection]:
+    """Sort the given detections by occurrence unless they are sorted already.
+
+    Args:
+        detections (list[Detection]): the detections to sort.
+
+    Returns:
+        list[Detection]: the sorted detections.
+    """
+    if all(
+        previous.occurrence <= current.occurrence
+        for previous, current in zip(detections, detections[1:])
+    ):
+        return detections
+    return sorted(detections, key=lambda detection: detection.occurrence)
+
+
+def _merge_by_occurrence(
+    first: list[Detection], second: list[Detection]
+) -> list[Detection]:
+    """Merge two lists of detections sorted by occurrence.
+
+    Tracks continued in the next track file are appended without sorting.
+    Overlapping detections are merged in linear time.
+
+    Args:
+        first (list[Detection]): detections sorted by occurrence.
+        second (list[Detection]): detections sorted by occurrence.
+
+    Returns:
+        list[Detection]: all detections sorted by occurrence.
+    """
+    if not first:
+        return second
+    if not second:
+        return first
+    if first[-1].occurrence <= second[0].occurrence:
+        return first + second
+    if second[-1].occurrence <= first[0].occurrence:
+        return second + first
+    return list(heapq.merge(first, second, key=lambda detection: detection.occurrence))
+
+
 class OttrkParser(TrackParser):
     """Parse an ottrk file and convert its contents to our domain objects namely
     `Tracks`.
@@ -497,6 +651,26 @@ class OttrkParser(TrackParser):
         detection_metadata = self._parse_metadata(ottrk_dict[ottrk_format.METADATA])
         return TrackParseResult(tracks, detection_metadata, video_metadata)
 
+    def parse_metadata(self, ottrk_file: Path) -> TrackFileMetadata:
+        """Parse only the metadata of the ottrk file.
+
+        The file is decompressed and decoded only until the metadata has been read.
+        The detections are not parsed.
+
+        Args:
+            ottrk_file (Path): the track file.
+
+        Returns:
+            TrackFileMetadata: the detection and video metadata of the file.
+        """
+        metadata = self._format_fixer.fix_metadata(
+            parse_json_bz2_entry(ottrk_file, ottrk_format.METADATA)
+        )
+        return TrackFileMetadata(
+            self._parse_metadata(metadata),
+            self._parse_video_metadata(metadata[ottrk_format.VIDEO]),
+        )
+
     def _parse_video_metadata(self, metadata_video: dict) -> VideoMetadata:
         video_path = (
             metadata_video[ottrk_format.FILENAME]
@@ -1,7 +1,6 @@
-from datetime import datetime, timezone
-from functools import partial
-
-from pandas import DataFrame
+import numpy
+import pandas
+from pandas import DataFrame, Series
 
 from OTAnalytics.application.logger import logger
 from OTAnalytics.domain import track
@@ -21,15 +20,31 @@ from OTAnalytics.plugin_parser.otvision_parser import (
 
 
 class PandasDetectionParser(DetectionParser):
+    """Parse detections into a `PandasTrackDataset`.
+
+    Args:
+        calculator (PandasTrackClassificationCalculator): calculates the
+            classification of each track.
+        track_geometry_factory (TRACK_GEOMETRY_FACTORY): creates the geometries of
+            the tracks.
+        track_length_limit (TrackLengthLimit): tracks with fewer or more detections
+            are dropped.
+        use_categoricals (bool): store text columns, e.g. the classification or the
+            video name, as categoricals instead of repeating the text for every
+            detection.
+    """
+
     def __init__(
         self,
         calculator: PandasTrackClassificationCalculator,
         track_geometry_factory: TRACK_GEOMETRY_FACTORY,
         track_length_limit: TrackLengthLimit = DEFAULT_TRACK_LENGTH_LIMIT,
+        use_categoricals: bool = False,
     ) -> None:
         self._calculator = calculator
         self._track_geometry_factory = track_geometry_factory
         self._track_length_limit = track_length_limit
+        self._use_categoricals = use_categoricals
 
     def parse_tracks(
         self,
@@ -52,11 +67,40 @@ class PandasDetectionParser(DetectionParser):
         input_file: str,
         id_generator: TrackIdGenerator,
     ) -> TrackDataset:
+        return self.parse_dataframe(
+            DataFrame(detections),
+            metadata_video=metadata_video,
+            input_file=input_file,
+            id_generator=id_generator,
+        )
+
+    def parse_dataframe(
+        self,
+        data: DataFrame,
+        metadata_video: dict,
+        input_file: str,
+        id_generator: TrackIdGenerator = TrackId,
+    ) -> TrackDataset:
+        """Parse detections already converted into columns.
+
+        The columns of the given dataframe must be named as in the ottrk format. The
+        dataframe will be modified in place.
+
+        Args:
+            data (DataFrame): the detections with one column per ottrk detection key.
+            metadata_video (dict): metadata of the track file in dict format.
+            input_file (str): path to the input file containing the detections.
+            id_generator (TrackIdGenerator): generator used to create track ids.
+
+        Returns:
+            TrackDataset: the tracks.
+        """
+        if data.empty:
+            return PandasTrackDataset(self._track_geometry_factory)
         video_name = (
             metadata_video[ottrk_format.FILENAME]
             + metadata_video[ottrk_format.FILETYPE]
         )
-        data = DataFrame(detections)
         data.rename(
             columns={
                 ottrk_format.CLASS: track.CLASSIFICATION,
@@ -72,18 +116,10 @@ class PandasDetectionParser(DetectionParser):
             },
             inplace=True,
         )
-        data[track.TRACK_ID] = (
-            data[track.TRACK_ID]
-            .astype(str)
-            .apply(lambda track_id: str(id_generator(track_id)))
-        )
+        data[track.TRACK_ID] = _create_track_ids(data[track.TRACK_ID], id_generator)
         data[track.VIDEO_NAME] = video_name
         data[track.INPUT_FILE] = input_file
-        data[track.OCCURRENCE] = (
-            data[track.OCCURRENCE]
-            .astype(float)
-            .apply(partial(datetime.fromtimestamp, tz=timezone.utc))
-        )
+        data[track.OCCURRENCE] = _to_datetime(data[track.OCCURRENCE])
         tracks_by_size = data.groupby(by=[track.TRACK_ID]).size().reset_index()
         track_ids_to_remain = tracks_by_size.loc[
             (tracks_by_size[0] >= self._track_length_limit.lower_bound)
@@ -109,6 +145,62 @@ class PandasDetectionParser(DetectionParser):
         )
         tracks_to_remain.index.names = [track.TRACK_ID, track.OCCURRENCE]
         tracks_to_remain = tracks_to_remain.sort_index()
+        if self._use_categoricals:
+            tracks_to_remain = _convert_text_to_categoricals(tracks_to_remain)
         return PandasTrackDataset.from_dataframe(
             tracks_to_remain, self._track_geometry_factory, calculator=self._calculator
         )
+
+
+def _create_track_ids(track_ids: Series, id_generator: TrackIdGenerator) -> Series:
+    """Create the track ids of all detections.
+
+    The id generator is called only once per track.
+
+    Args:
+        track_ids (Series): the track ids as given in the ottrk file.
+        id_generator (TrackIdGenerator): generator used to create track ids.
+
+    Returns:
+        Series: the generated track ids of each detection.
+    """
+    codes, uniques = pandas.factorize(track_ids, use_na_sentinel=False)
+    generated_ids = numpy.array(
+        [str(id_generator(str(track_id))) for track_id in uniques], dtype=object
+    )
+    return Series(generated_ids.take(codes), index=track_ids.index)
+
+
+def _to_datetime(occurrences: Series) -> Series:
+    """Convert unix timestamps in seconds to UTC datetimes.
+
+    The timestamps are rounded to microseconds the same way as
+    `datetime.fromtimestamp` does.
+
+    Args:
+        occurrences (Series): unix timestamps in seconds.
+
+    Returns:
+        Series: the UTC datetimes.
+    """
+    seconds = occurrences.to_numpy(dtype=numpy.float64)
+    whole_seconds = numpy.trunc(seconds)
+    microseconds = numpy.round((seconds - whole_seconds) * 1e6)
+    return pandas.to_datetime(
+        Series(
+            whole_seconds.astype(numpy.int64) * 1_000_000
+            + microseconds.astype(numpy.int64),
+            index=occurrences.index,
+        ),
+        unit="us",
+        utc=True,
+    )
+
+
+def _convert_text_to_categoricals(data: DataFrame) -> DataFrame:
+    text_columns = [
+        column
+        for column in data.columns
+        if data[column].dtype == object and not data[column].hasnans
+    ]
+    return data.astype({column: "category" for column in text_columns})
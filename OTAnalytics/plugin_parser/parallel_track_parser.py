@@ -0,0 +1,148 @@
+from dataclasses import dataclass
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Iterator, Sequence
+
+from pandas import DataFrame
+
+from OTAnalytics.application.config import DEFAULT_NUM_PROCESSES
+from OTAnalytics.application.datastore import (
+    DetectionMetadata,
+    TrackFileMetadata,
+    TrackParser,
+    TrackParseResult,
+)
+from OTAnalytics.application.logger import logger
+from OTAnalytics.domain.track_dataset import TRACK_GEOMETRY_FACTORY, TrackDataset
+from OTAnalytics.domain.video import VideoMetadata
+from OTAnalytics.plugin_datastore.track_store import (
+    PandasTrackClassificationCalculator,
+    PandasTrackDataset,
+)
+
+
+@dataclass(frozen=True)
+class CompactPandasTracks:
+    """Compact columnar representation of a PandasTrackDataset to be transferred
+    between processes.
+
+    Object columns without missing values are stored as categoricals. Thus, values
+    repeated for every detection, e.g. the input file path or the classification,
+    are pickled only once.
+    """
+
+    data: DataFrame
+    categorical_columns: list[str]
+    track_geometry_factory: TRACK_GEOMETRY_FACTORY
+    calculator: PandasTrackClassificationCalculator
+
+    @staticmethod
+    def from_dataset(dataset: PandasTrackDataset) -> "CompactPandasTracks":
+        data = dataset.get_data().copy(deep=False)
+        categorical_columns: list[str] = []
+        for column in data.columns:
+            if data[column].dtype != object or data[column].hasnans:
+                continue
+            try:
+                data[column] = data[column].astype("category")
+            except TypeError:
+                # Unhashable values can not be converted
+                continue
+            categorical_columns.append(column)
+        return CompactPandasTracks(
+            data,
+            categorical_columns,
+            dataset.track_geometry_factory,
+            dataset.calculator,
+        )
+
+    def to_dataset(self) -> PandasTrackDataset:
+        data = self.data
+        if self.categorical_columns:
+            data = data.astype({column: object for column in self.categorical_columns})
+        return PandasTrackDataset(
+            self.track_geometry_factory, data, calculator=self.calculator
+        )
+
+
+@dataclass(frozen=True)
+class CompactParseResult:
+    tracks: CompactPandasTracks | TrackDataset
+    detection_metadata: DetectionMetadata
+    video_metadata: VideoMetadata
+
+    @staticmethod
+    def from_parse_result(parse_result: TrackParseResult) -> "CompactParseResult":
+        tracks = parse_result.tracks
+        return CompactParseResult(
+            (
+                CompactPandasTracks.from_dataset(tracks)
+                if isinstance(tracks, PandasTrackDataset)
+                else tracks
+            ),
+            parse_result.detection_metadata,
+            parse_result.video_metadata,
+        )
+
+    def to_parse_result(self) -> TrackParseResult:
+        tracks = (
+            self.tracks.to_dataset()
+            if isinstance(self.tracks, CompactPandasTracks)
+            else self.tracks
+        )
+        return TrackParseResult(tracks, self.detection_metadata, self.video_metadata)
+
+
+def _parse_compact(parser: TrackParser, file: Path) -> CompactParseResult:
+    return CompactParseResult.from_parse_result(parser.parse(file))
+
+
+class ProcessPoolTrackParser(TrackParser):
+    """Parse multiple track files in parallel if num_processes is greater than 1.
+    Otherwise, parses sequentially.
+
+    Each file is parsed as a whole by a worker process using the given parser. The
+    parse results are transferred back in a compact columnar representation.
+
+    Args:
+        other (TrackParser): the parser to parse a single file with. It has to be
+            picklable to be sent to the worker processes.
+        num_processes (int): number of processes to parse files in parallel.
+    """
+
+    def __init__(
+        self, other: TrackParser, num_processes: int = DEFAULT_NUM_PROCESSES
+    ) -> None:
+        if num_processes < 1:
+            raise ValueError("Number of processes must be greater than zero.")
+        self._other = other
+        self._num_processes = num_processes
+
+    @property
+    def num_processes(self) -> int:
+        return self._num_processes
+
+    def parse(self, file: Path) -> TrackParseResult:
+        return self._other.parse(file)
+
+    def parse_metadata(self, file: Path) -> TrackFileMetadata:
+        return self._other.parse_metadata(file)
+
+    def parse_all(
+        self, files: Sequence[Path]
+    ) -> Iterator[TrackParseResult | Exception]:
+        num_processes = min(self._num_processes, len(files))
+        if num_processes <= 1:
+            yield from self._other.parse_all(files)
+            return
+
+        logger().debug(f"Parse track files in parallel with {num_processes} processes.")
+        with Pool(processes=num_processes) as pool:
+            pending = [
+                pool.apply_async(_parse_compact, (self._other, file)) for file in files
+            ]
+            for result in pending:
+                try:
+                    yield result.get().to_parse_result()
+                except Exception as cause:
+                    yield cause
@@ -0,0 +1,210 @@
+from array import array
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Iterator
+
+import numpy
+from pandas import DataFrame
+
+import OTAnalytics.plugin_parser.ottrk_dataformat as ottrk_format
+from OTAnalytics.application.datastore import TrackParseResult
+from OTAnalytics.plugin_parser.json_parser import (
+    DEFAULT_BLOCK_SIZE,
+    JsonStream,
+    JsonStreamError,
+    open_text,
+)
+from OTAnalytics.plugin_parser.otvision_parser import OttrkFormatFixer, OttrkParser
+from OTAnalytics.plugin_parser.pandas_parser import PandasDetectionParser
+
+DEFAULT_CHUNK_SIZE: int = 10000
+"""Number of detections decoded before they are moved into the column buffers."""
+
+COLUMN_TYPES: dict[str, str] = {
+    ottrk_format.CONFIDENCE: "d",
+    ottrk_format.X: "d",
+    ottrk_format.Y: "d",
+    ottrk_format.W: "d",
+    ottrk_format.H: "d",
+    ottrk_format.FRAME: "q",
+    ottrk_format.OCCURRENCE: "d",
+    ottrk_format.TRACK_ID: "q",
+}
+"""Typecodes of the detection columns that are buffered as typed arrays. All other
+columns are buffered as python lists and their dtype is inferred by pandas."""
+
+NUMPY_TYPES: dict[str, type] = {"d": numpy.float64, "q": numpy.int64}
+
+MISSING_VALUE: float = float("nan")
+"""Value of detection keys missing in some detections, as filled in by pandas."""
+
+
+class OttrkStreamError(JsonStreamError):
+    pass
+
+
+def stream_ottrk(
+    path: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> Iterator[tuple[str, Any]]:
+    """Stream the content of an ottrk file.
+
+    Yields the metadata as `(METADATA, dict)` and the detections as
+    `(DATA_DETECTIONS, list[dict])` chunks in the order they appear in the file. All
+    other entries are skipped. Closing the iterator closes the file.
+
+    Args:
+        path (Path): path to the ottrk file.
+        chunk_size (int): maximum number of detections per chunk.
+        block_size (int): number of characters to read from the file at once.
+
+    Returns:
+        Iterator[tuple[str, Any]]: the metadata and the detection chunks.
+    """
+    with open_text(path) as file:
+        stream = JsonStream(file, block_size)
+        for key in stream.object_keys():
+            if key == ottrk_format.METADATA:
+                yield ottrk_format.METADATA, stream.decode_value()
+            elif key == ottrk_format.DATA:
+                for data_key in stream.object_keys():
+                    if data_key == ottrk_format.DATA_DETECTIONS:
+                        for chunk in stream.array_chunks(chunk_size):
+                            yield ottrk_format.DATA_DETECTIONS, chunk
+                    else:
+                        stream.skip_value()
+            else:
+                stream.skip_value()
+
+
+class ColumnBuffer:
+    """Growable buffer holding the values of a single detection column.
+
+    Values are stored in a typed array as long as they match the given typecode.
+    Otherwise, the buffer falls back to a python list.
+
+    Args:
+        typecode (str | None): typecode of the array or None to use a list.
+        size (int): number of missing values to prepend.
+    """
+
+    def __init__(self, typecode: str | None, size: int = 0) -> None:
+        self._typecode = typecode
+        self._values: array | list = array(typecode) if typecode else []
+        if size:
+            self.extend([MISSING_VALUE] * size)
+
+    def extend(self, values: list[Any]) -> None:
+        if isinstance(self._values, array):
+            current_size = len(self._values)
+            try:
+                self._values.extend(values)
+                return
+            except (TypeError, OverflowError):
+                del self._values[current_size:]
+                self._values = self._values.tolist()
+        self._values.extend(values)
+
+    def to_array(self) -> numpy.ndarray | list:
+        if isinstance(self._values, list):
+            return self._values
+        return numpy.frombuffer(self._values, dtype=NUMPY_TYPES[self._values.typecode])
+
+
+class DetectionColumns:
+    """Collect detections chunk by chunk as columns.
+
+    Columns are ordered by the first appearance of their key. Missing values are
+    filled with NaN.
+    """
+
+    def __init__(self) -> None:
+        self._columns: dict[str, ColumnBuffer] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, detections: list[dict]) -> None:
+        if not detections:
+            return
+        keys = set().union(*detections)
+        first_keys = list(detections[0].keys())
+        for key in first_keys + [key for key in keys if key not in detections[0]]:
+            if key not in self._columns:
+                self._columns[key] = ColumnBuffer(COLUMN_TYPES.get(key), self._size)
+        for key, column in self._columns.items():
+            if key in keys:
+                column.extend(_get_values(detections, key))
+            else:
+                column.extend([MISSING_VALUE] * len(detections))
+        self._size += len(detections)
+
+    def to_dataframe(self) -> DataFrame:
+        """Convert the buffered detections into a dataframe.
+
+        Returns:
+            DataFrame: the detections with one column per ottrk detection key.
+        """
+        return DataFrame(
+            {key: column.to_array() for key, column in self._columns.items()},
+            columns=list(self._columns.keys()),
+        )
+
+
+def _get_values(detections: list[dict], key: str) -> list[Any]:
+    try:
+        return list(map(itemgetter(key), detections))
+    except KeyError:
+        return [detection.get(key, MISSING_VALUE) for detection in detections]
+
+
+class StreamingOttrkParser(OttrkParser):
+    """Parse an ottrk file without loading its whole content into memory.
+
+    The file is decompressed and decoded incrementally. Detections are moved into
+    typed column buffers in chunks of `chunk_size`. Thus, the peak memory is bounded
+    by the size of a chunk and the resulting columns. Format fixes of older otdet
+    versions are applied column wise afterwards.
+
+    Args:
+        detection_parser (PandasDetectionParser): parses the detection columns.
+        format_fixer (OttrkFormatFixer): to fix older ottrk version files.
+        chunk_size (int): number of detections to decode at once.
+    """
+
+    def __init__(
+        self,
+        detection_parser: PandasDetectionParser,
+        format_fixer: OttrkFormatFixer = OttrkFormatFixer(),
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        super().__init__(detection_parser, format_fixer)
+        self._pandas_detection_parser = detection_parser
+        self._chunk_size = chunk_size
+
+    def parse(self, ottrk_file: Path) -> TrackParseResult:
+        metadata: dict | None = None
+        columns = DetectionColumns()
+        for key, value in stream_ottrk(ottrk_file, self._chunk_size):
+            if key == ottrk_format.METADATA:
+                metadata = value
+            else:
+                columns.append(value)
+        if metadata is None:
+            raise OttrkStreamError(f"No metadata found in ottrk file '{ottrk_file}'.")
+
+        otdet_version = self._format_fixer.parse_otdet_version(metadata)
+        metadata = self._format_fixer.fix_metadata(metadata)
+        detections = self._format_fixer.fix_detection_columns(
+            columns.to_dataframe(), otdet_version
+        )
+        metadata_video = metadata[ottrk_format.VIDEO]
+        video_metadata = self._parse_video_metadata(metadata_video)
+        id_generator = self._create_id_generator_from(metadata)
+        tracks = self._pandas_detection_parser.parse_dataframe(
+            detections, metadata_video, str(ottrk_file), id_generator
+        )
+        detection_metadata = self._parse_metadata(metadata)
+        return TrackParseResult(tracks, detection_metadata, video_metadata)
@@ -0,0 +1,384 @@
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy
+import pandas
+from pandas import CategoricalDtype, DataFrame, DatetimeTZDtype, Series
+
+from OTAnalytics import version
+from OTAnalytics.application.config import DEFAULT_TRACK_CACHE_SIZE
+from OTAnalytics.application.datastore import (
+    DetectionMetadata,
+    TrackFileMetadata,
+    TrackParser,
+    TrackParseResult,
+)
+from OTAnalytics.application.logger import logger
+from OTAnalytics.domain.track_dataset import TRACK_GEOMETRY_FACTORY
+from OTAnalytics.domain.video import VideoMetadata
+from OTAnalytics.plugin_datastore.track_store import (
+    DEFAULT_CLASSIFICATOR,
+    PandasTrackClassificationCalculator,
+    PandasTrackDataset,
+)
+
+CACHE_FORMAT_VERSION: int = 1
+# Increase whenever parsing or fixing ottrk files changes the parsed tracks
+PARSER_VERSION: int = 1
+MANIFEST_FILE: str = "manifest.json"
+COLUMN_FILE_TYPE: str = ".npy"
+TEMPORARY_PREFIX: str = "."
+
+VERSION: str = "version"
+KEY: str = "key"
+SOURCE: str = "source"
+SIZE: str = "size"
+MTIME: str = "mtime"
+HASH: str = "hash"
+INDEX: str = "index"
+COLUMNS: str = "columns"
+NAME: str = "name"
+FILE: str = "file"
+KIND: str = "kind"
+CATEGORIES: str = "categories"
+TIMEZONE: str = "timezone"
+DETECTION_CLASSES: str = "detection_classes"
+VIDEO_METADATA: str = "video_metadata"
+
+KIND_NUMERIC: str = "numeric"
+KIND_CATEGORICAL: str = "categorical"
+KIND_CATEGORICAL_DTYPE: str = "category"
+KIND_DATETIME: str = "datetime"
+
+
+class UncacheableTracks(Exception):
+    pass
+
+
+def create_cache_key(**settings: Any) -> str:
+    """Create the key identifying the parser configuration of cache entries.
+
+    The key contains the versions of OTAnalytics and the parser as well as the given
+    settings of the parser.
+
+    Args:
+        **settings (Any): the settings of the parser changing the parsed tracks.
+
+    Returns:
+        str: the key of the cache entries.
+    """
+    values = {
+        "otanalytics": version.__version__,
+        "parser": PARSER_VERSION,
+        **settings,
+    }
+    return "|".join(f"{name}={value}" for name, value in values.items())
+
+
+class TrackParseCache:
+    """Columnar on disk cache of parsed track files.
+
+    Each entry is a directory containing one `.npy` file per column of the parsed
+    track data and a manifest describing the source file, the columns and the
+    parsed metadata. Object and categorical columns are stored as categorical codes.
+
+    An entry is valid as long as the source file has the same size and modification
+    time or, if only the modification time differs, the same content hash. The new
+    modification time is stored once the content hash matched. Once the cache
+    exceeds its maximum size, the least recently used entries are evicted.
+
+    Args:
+        cache_dir (Path): directory to store the cache entries in.
+        track_geometry_factory (TRACK_GEOMETRY_FACTORY): factory to create the
+            geometries of loaded tracks.
+        max_size (int): maximum size of the cache in bytes.
+        key (str): identifies the configuration of the parser. Entries written with
+            a different key are not used.
+        calculator (PandasTrackClassificationCalculator): classification calculator
+            of loaded tracks.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+        max_size: int = DEFAULT_TRACK_CACHE_SIZE,
+        key: str = "",
+        calculator: PandasTrackClassificationCalculator = DEFAULT_CLASSIFICATOR,
+    ) -> None:
+        self._cache_dir = cache_dir
+        self._track_geometry_factory = track_geometry_factory
+        self._max_size = max_size
+        self._key = key
+        self._calculator = calculator
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir
+
+    def get(self, file: Path) -> TrackParseResult | None:
+        """Load the cached parse result of the given file.
+
+        Args:
+            file (Path): the parsed track file.
+
+        Returns:
+            TrackParseResult | None: the cached parse result or None if there is no
+                valid entry for the file.
+        """
+        entry = self._entry_for(file)
+        manifest_file = entry / MANIFEST_FILE
+        try:
+            manifest = json.loads(manifest_file.read_text())
+            stat = file.stat()
+            if not self._is_valid(manifest, file, stat):
+                return None
+            parse_result = self._load(entry, manifest)
+            self._mark_used(manifest_file, manifest, stat)
+        except FileNotFoundError:
+            return None
+        except Exception as cause:
+            logger().warning(f"Unable to read cached tracks of '{file}': {cause}")
+            return None
+        return parse_result
+
+    def put(self, file: Path, parse_result: TrackParseResult) -> None:
+        """Store the parse result of the given file and evict old entries if the
+        cache exceeds its maximum size.
+
+        Errors while writing the entry are logged and do not abort parsing.
+
+        Args:
+            file (Path): the parsed track file.
+            parse_result (TrackParseResult): the parse result to store.
+        """
+        temporary = self._cache_dir / f"{TEMPORARY_PREFIX}{uuid.uuid4().hex}"
+        try:
+            temporary.mkdir(parents=True)
+            self._write(temporary, file, parse_result)
+            entry = self._entry_for(file)
+            shutil.rmtree(entry, ignore_errors=True)
+            os.replace(temporary, entry)
+        except (OSError, UncacheableTracks) as cause:
+            logger().warning(f"Unable to cache tracks of '{file}': {cause}")
+            shutil.rmtree(temporary, ignore_errors=True)
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache does not exceed its
+        maximum size."""
+        entries: list[tuple[float, int, Path]] = []
+        for entry in self._list_entries():
+            try:
+                last_used = (entry / MANIFEST_FILE).stat().st_mtime
+                size = sum(file.stat().st_size for file in entry.iterdir())
+            except OSError:
+                continue
+            entries.append((last_used, size, entry))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda element: element[0]):
+            if total_size <= self._max_size:
+                break
+            logger().debug(f"Evict cached tracks '{entry.name}'.")
+            shutil.rmtree(entry, ignore_errors=True)
+            total_size -= size
+
+    def clear(self) -> None:
+        """Remove all entries of the cache."""
+        for entry in self._list_entries():
+            shutil.rmtree(entry, ignore_errors=True)
+
+    def _list_entries(self) -> list[Path]:
+        if not self._cache_dir.is_dir():
+            return []
+        return [
+            entry
+            for entry in self._cache_dir.iterdir()
+            if entry.is_dir() and not entry.name.startswith(TEMPORARY_PREFIX)
+        ]
+
+    def _entry_for(self, file: Path) -> Path:
+        identifier = f"{file.resolve()}|{self._key}".encode()
+        return self._cache_dir / hashlib.sha256(identifier).hexdigest()
+
+    def _is_valid(self, manifest: dict, file: Path, stat: os.stat_result) -> bool:
+        if (
+            manifest.get(VERSION) != CACHE_FORMAT_VERSION
+            or manifest.get(KEY) != self._key
+            or manifest.get(SOURCE) != str(file.resolve())
+        ):
+            return False
+        if stat.st_size != manifest[SIZE]:
+            return False
+        if stat.st_mtime_ns == manifest[MTIME]:
+            return True
+        return _hash(file) == manifest[HASH]
+
+    def _mark_used(
+        self, manifest_file: Path, manifest: dict, stat: os.stat_result
+    ) -> None:
+        """Update the last usage of an entry. The modification time of a source file
+        with matching content hash is stored to not hash it again.
+        """
+        if manifest[MTIME] == stat.st_mtime_ns:
+            os.utime(manifest_file)
+            return
+        manifest[MTIME] = stat.st_mtime_ns
+        manifest_file.write_text(json.dumps(manifest))
+
+    def _write(self, entry: Path, file: Path, parse_result: TrackParseResult) -> None:
+        tracks = parse_result.tracks
+        if not isinstance(tracks, PandasTrackDataset):
+            raise UncacheableTracks(f"Unsupported track dataset {type(tracks)}.")
+        data = tracks.get_data()
+        index = [name for name in data.index.names if name is not None]
+        columns = _write_columns(data.reset_index() if index else data, entry)
+        stat = file.stat()
+        manifest = {
+            VERSION: CACHE_FORMAT_VERSION,
+            KEY: self._key,
+            SOURCE: str(file.resolve()),
+            SIZE: stat.st_size,
+            MTIME: stat.st_mtime_ns,
+            HASH: _hash(file),
+            INDEX: index,
+            COLUMNS: columns,
+            DETECTION_CLASSES: sorted(
+                parse_result.detection_metadata.detection_classes
+            ),
+            VIDEO_METADATA: _serialize_video_metadata(parse_result.video_metadata),
+        }
+        (entry / MANIFEST_FILE).write_text(json.dumps(manifest))
+
+    def _load(self, entry: Path, manifest: dict) -> TrackParseResult:
+        columns = manifest[COLUMNS]
+        data = DataFrame(
+            {column[NAME]: _read_column(entry, column) for column in columns}
+        )
+        if index := manifest[INDEX]:
+            data = data.set_index(index)
+        tracks = PandasTrackDataset(
+            self._track_geometry_factory, data, calculator=self._calculator
+        )
+        return TrackParseResult(
+            tracks,
+            DetectionMetadata(frozenset(manifest[DETECTION_CLASSES])),
+            _deserialize_video_metadata(manifest[VIDEO_METADATA]),
+        )
+
+
+def _hash(file: Path) -> str:
+    with open(file, "rb") as content:
+        return hashlib.file_digest(content, "sha256").hexdigest()
+
+
+def _write_columns(data: DataFrame, entry: Path) -> list[dict]:
+    columns: list[dict] = []
+    for position, (name, values) in enumerate(data.items()):
+        column: dict[str, Any] = {NAME: name, FILE: f"{position}{COLUMN_FILE_TYPE}"}
+        numpy.save(entry / column[FILE], _encode_column(values, column))
+        columns.append(column)
+    return columns
+
+
+def _encode_column(values: Series, column: dict) -> numpy.ndarray:
+    if isinstance(values.dtype, DatetimeTZDtype):
+        column[KIND] = KIND_DATETIME
+        column[TIMEZONE] = str(values.dtype.tz)
+        return values.dt.tz_convert(None).to_numpy().view(numpy.int64)
+    if values.dtype == object or isinstance(values.dtype, CategoricalDtype):
+        categorical = pandas.Categorical(values)
+        if values.hasnans or not all(
+            isinstance(category, str) for category in categorical.categories
+        ):
+            raise UncacheableTracks(f"Column '{values.name}' contains non text values.")
+        column[KIND] = (
+            KIND_CATEGORICAL if values.dtype == object else KIND_CATEGORICAL_DTYPE
+        )
+        column[CATEGORIES] = list(categorical.categories)
+        return categorical.codes
+    if values.dtype.kind in "biuf":
+        column[KIND] = KIND_NUMERIC
+        return values.to_numpy()
+    raise UncacheableTracks(f"Column '{values.name}' has unsupported {values.dtype}.")
+
+
+def _read_column(entry: Path, column: dict) -> Any:
+    values = numpy.load(entry / column[FILE])
+    kind = column[KIND]
+    if kind == KIND_CATEGORICAL:
+        return numpy.array(column[CATEGORIES], dtype=object).take(values)
+    if kind == KIND_CATEGORICAL_DTYPE:
+        return pandas.Categorical.from_codes(values, categories=column[CATEGORIES])
+    if kind == KIND_DATETIME:
+        return (
+            pandas.to_datetime(values, unit="ns", utc=True)
+            .tz_convert(column[TIMEZONE])
+            .array
+        )
+    if kind == KIND_NUMERIC:
+        return values
+    raise UncacheableTracks(f"Unknown kind '{kind}' of column '{column[NAME]}'.")
+
+
+def _serialize_video_metadata(metadata: VideoMetadata) -> dict:
+    return {
+        "path": metadata.path,
+        "recorded_start_date": metadata.recorded_start_date.timestamp(),
+        "expected_duration": (
+            metadata.expected_duration.total_seconds()
+            if metadata.expected_duration is not None
+            else None
+        ),
+        "recorded_fps": metadata.recorded_fps,
+        "actual_fps": metadata.actual_fps,
+        "number_of_frames": metadata.number_of_frames,
+    }
+
+
+def _deserialize_video_metadata(data: dict) -> VideoMetadata:
+    return VideoMetadata(
+        path=data["path"],
+        recorded_start_date=datetime.fromtimestamp(
+            data["recorded_start_date"], timezone.utc
+        ),
+        expected_duration=(
+            timedelta(seconds=data["expected_duration"])
+            if data["expected_duration"] is not None
+            else None
+        ),
+        recorded_fps=data["recorded_fps"],
+        actual_fps=data["actual_fps"],
+        number_of_frames=data["number_of_frames"],
+    )
+
+
+class CachedTrackParser(TrackParser):
+    """Parse track files using a columnar cache of previous parse results.
+
+    Args:
+        other (TrackParser): parser to parse files that are not cached yet.
+        cache (TrackParseCache): the cache of parse results.
+    """
+
+    def __init__(self, other: TrackParser, cache: TrackParseCache) -> None:
+        self._other = other
+        self._cache = cache
+
+    def parse(self, file: Path) -> TrackParseResult:
+        if (cached := self._cache.get(file)) is not None:
+            logger().debug(f"Loaded cached tracks of '{file}'.")
+            return cached
+        parse_result = self._other.parse(file)
+        self._cache.put(file, parse_result)
+        return parse_result
+
+    def parse_metadata(self, file: Path) -> TrackFileMetadata:
+        return self._other.parse_metadata(file)
@@ -44,6 +44,7 @@ from OTAnalytics.domain.event import EventRepository
 from OTAnalytics.domain.flow import Flow
 from OTAnalytics.domain.progress import ProgressbarBuilder
 from OTAnalytics.domain.section import Section
+from OTAnalytics.domain.track_dataset import TrackDataset
 from OTAnalytics.domain.track_repository import TrackRepositoryEvent
 from OTAnalytics.plugin_parser.road_user_assignment_export import CSV_FORMAT
 
@@ -122,14 +123,32 @@ class OTAnalyticsCli:
         for flow in flows:
             self._add_flow(flow)
 
-    def _parse_tracks(self, track_files: list[Path]) -> None:
-        for track_file in self._progressbar(track_files, "Parsed track files", "files"):
-            parse_result = self._track_parser.parse(track_file)
-            self._add_all_tracks(parse_result.tracks)
+    def _register_metadata(self, track_files: list[Path]) -> None:
+        """Register the detection and video metadata of all track files. Only the
+        metadata of the files is read, so files with invalid metadata are rejected
+        before any tracks are parsed.
+
+        Args:
+            track_files (list[Path]): the track files to register.
+        """
+        for track_file in track_files:
+            metadata = self._track_parser.parse_metadata(track_file)
             self._tracks_metadata.update_detection_classes(
-                parse_result.detection_metadata.detection_classes
+                metadata.detection_metadata.detection_classes
             )
-            self._videos_metadata.update(parse_result.video_metadata)
+            self._videos_metadata.update(metadata.video_metadata)
+
+    def _parse_tracks(self, track_files: list[Path]) -> None:
+        parsed_tracks: list[TrackDataset] = []
+        parse_results = self._track_parser.parse_all(track_files)
+        for _, parse_result in zip(
+            self._progressbar(track_files, "Parsed track files", "files"),
+            parse_results,
+        ):
+            if isinstance(parse_result, Exception):
+                raise parse_result
+            parsed_tracks.append(parse_result.tracks)
+        self._add_all_tracks.add_many(parsed_tracks)
 
     def _run_analysis(
         self, ottrk_files: set[Path], sections: Iterable[Section], flows: Iterable[Flow]
@@ -142,6 +161,7 @@ class OTAnalyticsCli:
         ottrk_files_sorted: list[Path] = sorted(
             ottrk_files, key=lambda file: str(file).lower()
         )
+        self._register_metadata(ottrk_files_sorted)
         self._parse_tracks(ottrk_files_sorted)
         self._apply_cli_cuts.apply(
             self._get_all_sections(), preserve_cutting_sections=False
@@ -1,6 +1,6 @@
 import logging
 from pathlib import Path
-from typing import Sequence
+from typing import Any, Sequence
 
 from OTAnalytics.adapter_visualization.color_provider import (
     DEFAULT_COLOR_PALETTE,
@@ -19,7 +19,13 @@ from OTAnalytics.application.analysis.traffic_counting import (
 )
 from OTAnalytics.application.analysis.traffic_counting_specification import ExportCounts
 from OTAnalytics.application.application import OTAnalyticsApplication
-from OTAnalytics.application.config import DEFAULT_NUM_PROCESSES
+from OTAnalytics.application.config import (
+    DEFAULT_NUM_PROCESSES,
+    GEOMETRY_STORE_SHAPELY,
+    INTERSECTION_PARALLELIZATION_THREADS,
+    TRACK_STORE_MEMORY_MAPPED,
+    TRACK_STORE_NUMPY,
+)
 from OTAnalytics.application.config_specification import OtConfigDefaultValueProvider
 from OTAnalytics.application.datastore import (
     Datastore,
@@ -150,14 +156,29 @@ from OTAnalytics.application.use_cases.video_repository import (
 from OTAnalytics.domain.event import EventRepository
 from OTAnalytics.domain.filter import FilterElementSettingRestorer
 from OTAnalytics.domain.flow import FlowRepository
+from OTAnalytics.domain.intersect import IntersectParallelizationStrategy
 from OTAnalytics.domain.progress import ProgressbarBuilder
 from OTAnalytics.domain.section import SectionRepository
+from OTAnalytics.domain.track_dataset import TRACK_GEOMETRY_FACTORY
 from OTAnalytics.domain.track_repository import TrackFileRepository, TrackRepository
 from OTAnalytics.domain.video import VideoRepository
 from OTAnalytics.helpers.time_profiling import log_processing_time
+from OTAnalytics.plugin_datastore.memory_mapped_track_store import (
+    FilteredMemoryMappedTrackDataset,
+    MemoryMappedTrackDataset,
+    MemoryMappedTrackSharing,
+    MemoryMappedTrackStore,
+)
+from OTAnalytics.plugin_datastore.numpy_track_store import (
+    FilteredNumpyTrackDataset,
+    NumpyTrackDataset,
+)
 from OTAnalytics.plugin_datastore.track_geometry_store.pygeos_store import (
     PygeosTrackGeometryDataset,
 )
+from OTAnalytics.plugin_datastore.track_geometry_store.shapely_store import (
+    ShapelyTrackGeometryDataset,
+)
 from OTAnalytics.plugin_datastore.track_store import (
     FilteredPandasTrackDataset,
     PandasByMaxConfidence,
@@ -172,6 +193,9 @@ from OTAnalytics.plugin_intersect.simple_intersect import (
 from OTAnalytics.plugin_intersect_parallelization.multiprocessing import (
     MultiprocessingIntersectParallelization,
 )
+from OTAnalytics.plugin_intersect_parallelization.threading import (
+    ThreadedIntersectParallelization,
+)
 from OTAnalytics.plugin_parser.argparse_cli_parser import ArgparseCliParser
 from OTAnalytics.plugin_parser.export import (
     AddSectionInformationExporterFactory,
@@ -195,10 +219,17 @@ from OTAnalytics.plugin_parser.otvision_parser import (
     SimpleVideoParser,
 )
 from OTAnalytics.plugin_parser.pandas_parser import PandasDetectionParser
+from OTAnalytics.plugin_parser.parallel_track_parser import ProcessPoolTrackParser
 from OTAnalytics.plugin_parser.road_user_assignment_export import (
     SimpleRoadUserAssignmentExporterFactory,
 )
+from OTAnalytics.plugin_parser.streaming_parser import StreamingOttrkParser
 from OTAnalytics.plugin_parser.track_export import CsvTrackExport
+from OTAnalytics.plugin_parser.track_parse_cache import (
+    CachedTrackParser,
+    TrackParseCache,
+    create_cache_key,
+)
 from OTAnalytics.plugin_progress.tqdm_progressbar import TqdmBuilder
 from OTAnalytics.plugin_prototypes.eventlist_exporter.eventlist_exporter import (
     AVAILABLE_EVENTLIST_EXPORTERS,
@@ -217,6 +248,8 @@ class ApplicationStarter:
         self._setup_logger(
             Path(run_config.log_file), run_config.logfile_overwrite, run_config.debug
         )
+        if run_config.clear_track_cache:
+            self._create_track_parse_cache(run_config).clear()
         if run_config.start_cli:
             try:
                 self.start_cli(run_config)
@@ -296,6 +329,7 @@ class ApplicationStarter:
             flow_repository,
             event_repository,
             pulling_progressbar_builder,
+            run_config,
         )
         flow_parser = self._create_flow_parser()
         track_state = self._create_track_state()
@@ -375,20 +409,23 @@ class ApplicationStarter:
         section_provider = FilterOutCuttingSections(
             MissingEventsSectionProvider(section_repository, event_repository)
         )
+        intersect_parallelizer = self._create_intersect_parallelizer(
+            run_config, DEFAULT_NUM_PROCESSES
+        )
         create_events = self._create_use_case_create_events(
             section_provider,
             clear_all_events,
             get_all_tracks,
             get_tracks_without_single_detections,
             add_events,
-            DEFAULT_NUM_PROCESSES,
+            intersect_parallelizer,
         )
         intersect_tracks_with_sections = (
             self._create_use_case_create_intersection_events(
                 section_provider,
                 get_all_tracks,
                 add_events,
-                DEFAULT_NUM_PROCESSES,
+                intersect_parallelizer,
             )
         )
         export_counts = self._create_export_counts(
@@ -415,6 +452,7 @@ class ApplicationStarter:
             pulling_progressbar_builder,
             tracks_metadata,
             videos_metadata,
+            run_config,
         )
         clear_repositories = self._create_use_case_clear_all_repositories(
             clear_all_events,
@@ -616,15 +654,22 @@ class ApplicationStarter:
             load_track_files=load_track_files,
             apply_cli_cuts=apply_cli_cuts,
         )
-        OTAnalyticsGui(
-            main_window, dummy_viewmodel, layer_groups, preload_input_files, run_config
-        ).start()
+        try:
+            OTAnalyticsGui(
+                main_window,
+                dummy_viewmodel,
+                layer_groups,
+                preload_input_files,
+                run_config,
+            ).start()
+        finally:
+            intersect_parallelizer.close()
 
     def start_cli(self, run_config: RunConfiguration) -> None:
         track_repository = self._create_track_repository(run_config)
         section_repository = self._create_section_repository()
         flow_repository = self._create_flow_repository()
-        track_parser = self._create_track_parser(track_repository)
+        track_parser = self._create_parallel_track_parser(track_repository, run_config)
         event_repository = self._create_event_repository()
         add_section = AddSection(section_repository)
         get_sections_by_id = GetSectionsById(section_repository)
@@ -636,13 +681,16 @@ class ApplicationStarter:
         get_all_tracks = GetAllTracks(track_repository)
         get_all_track_ids = GetAllTrackIds(track_repository)
         clear_all_events = ClearAllEvents(event_repository)
+        intersect_parallelizer = self._create_intersect_parallelizer(
+            run_config, run_config.num_processes
+        )
         create_events = self._create_use_case_create_events(
             section_repository.get_all,
             clear_all_events,
             get_all_tracks,
             get_tracks_without_single_detections,
             add_events,
-            run_config.num_processes,
+            intersect_parallelizer,
         )
         cut_tracks = self._create_cut_tracks_intersecting_section(
             GetSectionsById(section_repository),
@@ -673,7 +721,7 @@ class ApplicationStarter:
             flow_repository,
             create_events,
         )
-        OTAnalyticsCli(
+        cli = OTAnalyticsCli(
             run_config,
             track_parser=track_parser,
             event_repository=event_repository,
@@ -692,7 +740,11 @@ class ApplicationStarter:
             progressbar=TqdmBuilder(),
             export_tracks=export_tracks,
             export_road_user_assignments=export_road_user_assignments,
-        ).start()
+        )
+        try:
+            cli.start()
+        finally:
+            intersect_parallelizer.close()
 
     def _create_datastore(
         self,
@@ -705,6 +757,7 @@ class ApplicationStarter:
         flow_repository: FlowRepository,
         event_repository: EventRepository,
         progressbar_builder: ProgressbarBuilder,
+        run_config: RunConfiguration,
     ) -> Datastore:
         """
         Build all required objects and inject them where necessary
@@ -712,8 +765,9 @@ class ApplicationStarter:
         Args:
             track_repository (TrackRepository): the track repository to inject
             progressbar_builder (ProgressbarBuilder): the progressbar builder to inject
+            run_config (RunConfiguration): the configuration of the current run
         """
-        track_parser = self._create_track_parser(track_repository)
+        track_parser = self._create_track_parser(track_repository, run_config)
         event_list_parser = self._create_event_list_parser()
         track_video_parser = OttrkVideoParser(video_parser)
         return Datastore(
@@ -731,31 +785,90 @@ class ApplicationStarter:
             progressbar_builder,
         )
 
+    @staticmethod
+    def _create_track_geometry_factory(
+        run_config: RunConfiguration,
+    ) -> TRACK_GEOMETRY_FACTORY:
+        if run_config.geometry_store == GEOMETRY_STORE_SHAPELY:
+            return ShapelyTrackGeometryDataset.from_track_dataset
+        return PygeosTrackGeometryDataset.from_track_dataset
+
     def _create_track_repository(self, run_config: RunConfiguration) -> TrackRepository:
+        track_geometry_factory = self._create_track_geometry_factory(run_config)
+        if run_config.track_store == TRACK_STORE_MEMORY_MAPPED:
+            return TrackRepository(
+                FilteredMemoryMappedTrackDataset(
+                    MemoryMappedTrackDataset(
+                        MemoryMappedTrackStore(run_config.track_store_dir),
+                        track_geometry_factory,
+                    ),
+                    run_config.include_classes,
+                    run_config.exclude_classes,
+                )
+            )
+        if run_config.track_store == TRACK_STORE_NUMPY:
+            return TrackRepository(
+                FilteredNumpyTrackDataset(
+                    NumpyTrackDataset(track_geometry_factory),
+                    run_config.include_classes,
+                    run_config.exclude_classes,
+                )
+            )
         return TrackRepository(
             FilteredPandasTrackDataset(
-                PandasTrackDataset.from_list(
-                    [], PygeosTrackGeometryDataset.from_track_dataset
-                ),
+                PandasTrackDataset.from_list([], track_geometry_factory),
                 run_config.include_classes,
                 run_config.exclude_classes,
             )
         )
         # return TrackRepository(PythonTrackDataset())
 
-    def _create_track_parser(self, track_repository: TrackRepository) -> TrackParser:
+    def _create_track_parser(
+        self, track_repository: TrackRepository, run_config: RunConfiguration
+    ) -> TrackParser:
         calculator = PandasByMaxConfidence()
         detection_parser = PandasDetectionParser(
             calculator,
-            PygeosTrackGeometryDataset.from_track_dataset,
-            track_length_limit=DEFAULT_TRACK_LENGTH_LIMIT,
+            self._create_track_geometry_factory(run_config),
+            **self._detection_parser_settings(),
         )
         # calculator = ByMaxConfidence()
         # detection_parser = PythonDetectionParser(
         # noqa   calculator, track_repository, track_length_limit=DEFAULT_TRACK_LENGTH_LIMIT
         # )
+        if run_config.stream_track_files:
+            return StreamingOttrkParser(detection_parser)
         return OttrkParser(detection_parser)
 
+    def _create_parallel_track_parser(
+        self, track_repository: TrackRepository, run_config: RunConfiguration
+    ) -> TrackParser:
+        track_parser = self._create_track_parser(track_repository, run_config)
+        if run_config.track_cache:
+            track_parser = CachedTrackParser(
+                track_parser, self._create_track_parse_cache(run_config)
+            )
+        return ProcessPoolTrackParser(track_parser, run_config.num_processes)
+
+    def _create_track_parse_cache(
+        self, run_config: RunConfiguration
+    ) -> TrackParseCache:
+        return TrackParseCache(
+            run_config.track_cache_dir,
+            self._create_track_geometry_factory(run_config),
+            key=create_cache_key(
+                geometry_store=run_config.geometry_store,
+                **self._detection_parser_settings(),
+            ),
+        )
+
+    @staticmethod
+    def _detection_parser_settings() -> dict[str, Any]:
+        return {
+            "track_length_limit": DEFAULT_TRACK_LENGTH_LIMIT,
+            "use_categoricals": True,
+        }
+
     def _create_section_repository(self) -> SectionRepository:
         return SectionRepository()
 
@@ -838,17 +951,31 @@ class ApplicationStarter:
         section_provider: SectionProvider,
         get_tracks: GetAllTracks,
         add_events: AddEvents,
-        num_processes: int,
+        intersect_parallelizer: IntersectParallelizationStrategy,
     ) -> CreateIntersectionEvents:
-        intersect = self._create_intersect(get_tracks, num_processes)
+        intersect = self._create_intersect(get_tracks, intersect_parallelizer)
         return SimpleCreateIntersectionEvents(intersect, section_provider, add_events)
 
+    def _create_intersect_parallelizer(
+        self, run_config: RunConfiguration, num_processes: int
+    ) -> IntersectParallelizationStrategy:
+        if run_config.intersection_parallelization == (
+            INTERSECTION_PARALLELIZATION_THREADS
+        ):
+            return ThreadedIntersectParallelization(num_processes)
+        share_tracks = MemoryMappedTrackSharing(
+            MemoryMappedTrackStore(run_config.track_store_dir),
+            self._create_track_geometry_factory(run_config),
+        )
+        return MultiprocessingIntersectParallelization(num_processes, share_tracks)
+
     @staticmethod
-    def _create_intersect(get_tracks: GetAllTracks, num_processes: int) -> RunIntersect:
+    def _create_intersect(
+        get_tracks: GetAllTracks,
+        intersect_parallelizer: IntersectParallelizationStrategy,
+    ) -> RunIntersect:
         return BatchedTracksRunIntersect(
-            intersect_parallelizer=MultiprocessingIntersectParallelization(
-                num_processes
-            ),
+            intersect_parallelizer=intersect_parallelizer,
             get_tracks=get_tracks,
         )
 
@@ -892,9 +1019,9 @@ class ApplicationStarter:
         get_all_tracks: GetAllTracks,
         get_all_tracks_without_single_detections: GetTracksWithoutSingleDetections,
         add_events: AddEvents,
-        num_processes: int,
+        intersect_parallelizer: IntersectParallelizationStrategy,
     ) -> CreateEvents:
-        run_intersect = self._create_intersect(get_all_tracks, num_processes)
+        run_intersect = self._create_intersect(get_all_tracks, intersect_parallelizer)
         create_intersection_events = SimpleCreateIntersectionEvents(
             run_intersect, section_provider, add_events
         )
@@ -1001,8 +1128,9 @@ class ApplicationStarter:
         progressbar: ProgressbarBuilder,
         tracks_metadata: TracksMetadata,
         videos_metadata: VideosMetadata,
+        run_config: RunConfiguration,
     ) -> LoadTrackFiles:
-        track_parser = self._create_track_parser(track_repository)
+        track_parser = self._create_parallel_track_parser(track_repository, run_config)
         track_video_parser = OttrkVideoParser(video_parser)
         return LoadTrackFiles(
             track_parser,
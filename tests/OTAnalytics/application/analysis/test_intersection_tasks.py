@@ -0,0 +1,94 @@
+from datetime import datetime
+
+import pytest
+
+from OTAnalytics.application.analysis.intersection_tasks import (
+    IntersectionTaskPlanner,
+    estimate_cost,
+)
+from OTAnalytics.domain.geometry import Coordinate
+from OTAnalytics.domain.section import LineSection, SectionId
+from OTAnalytics.domain.track import TrackId
+from OTAnalytics.domain.track_dataset import TrackSummary
+
+
+def create_summary(
+    track_id: str, length: int, min_x: float = 0, max_x: float = 10
+) -> TrackSummary:
+    return TrackSummary(
+        id=TrackId(track_id),
+        classification="car",
+        start=datetime(2020, 1, 1),
+        end=datetime(2020, 1, 1),
+        length=length,
+        max_confidence=1,
+        min_x=min_x,
+        min_y=0,
+        max_x=max_x,
+        max_y=10,
+    )
+
+
+def create_section(section_id: str, x: float) -> LineSection:
+    return LineSection(
+        SectionId(section_id),
+        section_id,
+        {},
+        {},
+        [Coordinate(x, 0), Coordinate(x, 10)],
+    )
+
+
+def test_estimate_cost() -> None:
+    summary = create_summary("1", 10, min_x=0, max_x=10)
+    boxes = [(5.0, 0.0, 5.0, 10.0), (10.0, 5.0, 20.0, 20.0), (11.0, 0.0, 12.0, 10.0)]
+
+    assert estimate_cost(summary, boxes) == 30
+
+
+class TestIntersectionTaskPlanner:
+    def test_plan_balances_costs(self) -> None:
+        summaries = [
+            create_summary("short-1", 10),
+            create_summary("long", 100),
+            create_summary("short-2", 30),
+            create_summary("short-3", 40),
+            create_summary("short-4", 20),
+        ]
+        planner = IntersectionTaskPlanner(tasks_per_process=1)
+
+        tasks = planner.plan(summaries, [create_section("1", 5)], num_processes=2)
+
+        assert [task.track_ids for task in tasks] == [
+            [TrackId("long")],
+            [
+                TrackId("short-3"),
+                TrackId("short-2"),
+                TrackId("short-4"),
+                TrackId("short-1"),
+            ],
+        ]
+        assert [task.detections for task in tasks] == [100, 100]
+        assert [task.cost for task in tasks] == [200, 200]
+
+    def test_plan_creates_multiple_tasks_per_process(self) -> None:
+        summaries = [create_summary(str(index), 10) for index in range(20)]
+        planner = IntersectionTaskPlanner(tasks_per_process=3)
+
+        tasks = planner.plan(summaries, [], num_processes=2)
+
+        assert len(tasks) == 6
+        assert sorted(
+            track_id.id for task in tasks for track_id in task.track_ids
+        ) == sorted(summary.id.id for summary in summaries)
+
+    def test_plan_does_not_create_empty_tasks(self) -> None:
+        planner = IntersectionTaskPlanner()
+
+        assert len(planner.plan([create_summary("1", 5)], [], num_processes=4)) == 1
+        assert planner.plan([], [], num_processes=4) == []
+
+    @pytest.mark.parametrize("tasks_per_process", [-1, 0])
+    def test_invalid_tasks_per_process(self, tasks_per_process: int) -> None:
+        with pytest.raises(ValueError):
+            IntersectionTaskPlanner(tasks_per_process)
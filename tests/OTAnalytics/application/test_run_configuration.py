@@ -7,6 +7,10 @@ from OTAnalytics.application.config import (
     DEFAULT_COUNTING_INTERVAL_IN_MINUTES,
     DEFAULT_EVENTLIST_FILE_TYPE,
     DEFAULT_NUM_PROCESSES,
+    DEFAULT_TRACK_CACHE_DIR,
+    GEOMETRY_STORE_SHAPELY,
+    INTERSECTION_PARALLELIZATION_THREADS,
+    TRACK_STORE_MEMORY_MAPPED,
 )
 from OTAnalytics.application.logger import DEFAULT_LOG_FILE
 from OTAnalytics.application.parser.cli_parser import CliArguments
@@ -456,3 +460,41 @@ class TestRunConfiguration:
         assert build_config(cli_args, otconfig).exclude_classes == exclude_classes
         cli_args.exclude_classes = None
         assert build_config(cli_args, otconfig).exclude_classes == frozenset()
+
+    def test_track_cache(self, cli_args: Mock, otconfig: Mock) -> None:
+        cli_args.track_cache = True
+        cli_args.clear_track_cache = True
+        cli_args.track_cache_dir = "path/to/cache"
+        run_config = build_config(cli_args, otconfig)
+        assert run_config.track_cache
+        assert run_config.clear_track_cache
+        assert run_config.track_cache_dir == Path("path/to/cache")
+        cli_args.track_cache_dir = None
+        assert build_config(cli_args, otconfig).track_cache_dir == (
+            DEFAULT_TRACK_CACHE_DIR
+        )
+
+    def test_stream_track_files(self, cli_args: Mock, otconfig: Mock) -> None:
+        cli_args.stream_track_files = True
+        assert build_config(cli_args, otconfig).stream_track_files
+
+    def test_track_store(self, cli_args: Mock, otconfig: Mock) -> None:
+        cli_args.track_store = TRACK_STORE_MEMORY_MAPPED
+        cli_args.track_store_dir = "path/to/store"
+        run_config = build_config(cli_args, otconfig)
+        assert run_config.track_store == TRACK_STORE_MEMORY_MAPPED
+        assert run_config.track_store_dir == Path("path/to/store")
+        cli_args.track_store_dir = None
+        assert build_config(cli_args, otconfig).track_store_dir is None
+
+    def test_geometry_store(self, cli_args: Mock, otconfig: Mock) -> None:
+        cli_args.geometry_store = GEOMETRY_STORE_SHAPELY
+        run_config = build_config(cli_args, otconfig)
+        assert run_config.geometry_store == GEOMETRY_STORE_SHAPELY
+
+    def test_intersection_parallelization(self, cli_args: Mock, otconfig: Mock) -> None:
+        cli_args.intersection_parallelization = INTERSECTION_PARALLELIZATION_THREADS
+        run_config = build_config(cli_args, otconfig)
+        assert run_config.intersection_parallelization == (
+            INTERSECTION_PARALLELIZATION_THREADS
+        )
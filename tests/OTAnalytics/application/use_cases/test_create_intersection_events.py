@@ -1,19 +1,32 @@
 from dataclasses import dataclass
-from unittest.mock import Mock, call
+from datetime import datetime
+from functools import partial
+from typing import Sequence
+from unittest.mock import Mock
 
 import pytest
 
+from OTAnalytics.application.analysis.intersect import IntersectionError
+from OTAnalytics.application.analysis.intersection_tasks import (
+    IntersectionTask,
+    IntersectionTaskPlanner,
+)
 from OTAnalytics.application.use_cases.create_intersection_events import (
+    BatchedTracksRunIntersect,
     IntersectAreaByTrackPoints,
     IntersectByIntersectionPoints,
+    _create_events,
     separate_sections,
 )
+from OTAnalytics.domain.event import Event, EventBatch, SectionEventBuilder
 from OTAnalytics.domain.geometry import (
     Coordinate,
     DirectionVector2D,
+    ImageCoordinate,
     RelativeOffsetCoordinate,
     apply_offset,
 )
+from OTAnalytics.domain.intersect import IntersectParallelizationStrategy, TaskTiming
 from OTAnalytics.domain.section import (
     Area,
     LineSection,
@@ -21,8 +34,14 @@ from OTAnalytics.domain.section import (
     SectionId,
     SectionType,
 )
-from OTAnalytics.domain.track import Detection, Track
-from OTAnalytics.domain.track_dataset import IntersectionPoint, TrackDataset
+from OTAnalytics.domain.track import Detection, Track, TrackId
+from OTAnalytics.domain.track_dataset import (
+    DetectionArray,
+    IntersectionPoint,
+    TrackDataset,
+    TrackDoesNotExistError,
+    TrackSummary,
+)
 from OTAnalytics.domain.types import EventType
 from tests.utils.builders.track_builder import TrackBuilder
 
@@ -66,40 +85,33 @@ class _TestCase:
         self.expected_event_coords = expected_event_coords
         self.direction_vectors = direction_vectors
 
-    def assert_valid(self, event_results: list, event_builder: Mock) -> None:
-        assert len(event_results) == len(self.expected_event_coords)
-        if self.expected_event_coords:
-            self._assert_has_calls(event_builder)
-        else:
-            self._assert_no_calls(event_builder)
-
-    def _assert_has_calls(self, event_builder: Mock) -> None:
-        event_builder.add_road_user_type.assert_called_once_with(
-            self.track.classification
-        )
-        assert event_builder.add_direction_vector.call_args_list == [
-            call(DirectionVector2D(x, y)) for x, y in self.direction_vectors
-        ]
-        assert event_builder.add_event_type.call_args_list == [
-            call(expected_event.event_type)
-            for expected_event in self.expected_event_coords
-        ]
-        assert event_builder.add_event_coordinate.call_args_list == [
-            call(expected_event.x, expected_event.y)
-            for expected_event in self.expected_event_coords
-        ]
-        assert event_builder.create_event.call_args_list == [
-            call(self.track.detections[expected_event.detection_index])
-            for expected_event in self.expected_event_coords
+    def assert_valid_events(self, events: Sequence[Event]) -> None:
+        assert [
+            (
+                event.road_user_id,
+                event.road_user_type,
+                event.frame_number,
+                event.section_id,
+                event.event_type,
+                event.event_coordinate,
+                event.direction_vector,
+            )
+            for event in events
+        ] == [
+            (
+                self.track.id.id,
+                self.track.classification,
+                self.track.detections[expected_event.detection_index].frame,
+                self.section.id,
+                expected_event.event_type,
+                ImageCoordinate(expected_event.x, expected_event.y),
+                DirectionVector2D(x, y),
+            )
+            for expected_event, (x, y) in zip(
+                self.expected_event_coords, self.direction_vectors
+            )
         ]
 
-    def _assert_no_calls(self, event_builder: Mock) -> None:
-        event_builder.add_road_user_type.assert_not_called()
-        event_builder.add_direction_vector.assert_not_called()
-        event_builder.add_event_type.assert_not_called()
-        event_builder.add_event.assert_not_called()
-        event_builder.add_event.assert_not_called()
-
 
 class LineSectionTestCase(_TestCase):
     def __init__(
@@ -114,8 +126,8 @@ class LineSectionTestCase(_TestCase):
             track, track_dataset, section, expected_event_coords, direction_vectors
         )
 
-    def assert_valid(self, event_results: list, event_builder: Mock) -> None:
-        super().assert_valid(event_results, event_builder)
+    def assert_valid(self, events: Sequence[Event]) -> None:
+        self.assert_valid_events(events)
         self._assert_valid()
 
     def _assert_valid(self) -> None:
@@ -137,8 +149,8 @@ class AreaSectionTestCase(_TestCase):
             track, track_dataset, section, expected_event_coords, direction_vectors
         )
 
-    def assert_valid(self, event_results: list, event_builder: Mock) -> None:
-        super().assert_valid(event_results, event_builder)
+    def assert_valid(self, events: Sequence[Event]) -> None:
+        self.assert_valid_events(events)
         self._assert_valid()
 
     def _assert_valid(self) -> None:
@@ -220,6 +232,7 @@ def test_case_track_line_section(track: Track) -> _TestCase:
         track.id: [(section.id, IntersectionPoint(detection_index))]
     }
     track_dataset.get_for.return_value = track
+    track_dataset.detections_array.return_value = DetectionArray.from_track(track)
     expected_event_coords = [
         _ExpectedEventCoord.from_detection(
             detection,
@@ -248,6 +261,9 @@ def test_case_closed_track_line_section(
         ]
     }
     track_dataset.get_for.return_value = closed_track
+    track_dataset.detections_array.return_value = DetectionArray.from_track(
+        closed_track
+    )
     expected_event_coords = [
         _ExpectedEventCoord(2, 2.0, 2.0),
         _ExpectedEventCoord(4, 1.0, 1.0),
@@ -268,6 +284,7 @@ def test_case_line_section_no_intersection(track: Track) -> _TestCase:
     track_dataset = Mock(spec=TrackDataset)
     track_dataset.intersection_points.return_value = {}
     track_dataset.get_for.return_value = track
+    track_dataset.detections_array.return_value = DetectionArray.from_track(track)
 
     return _TestCase(track, track_dataset, section, [], [])
 
@@ -292,16 +309,33 @@ class TestIntersectByIntersectionPoints:
         test_case: _TestCase
         test_case = request.getfixturevalue(test_case_name)
 
-        event = Mock()
-        event_builder = Mock()
-        event_builder.create_event.return_value = event
+        track_dataset = test_case.track_dataset
+        track_dataset.get_detections_at.side_effect = partial(
+            TrackDataset.get_detections_at, track_dataset
+        )
 
         intersector = self._create_intersector()
         result_events = intersector.intersect(
-            test_case.track_dataset, [test_case.section], event_builder
+            track_dataset, [test_case.section], SectionEventBuilder()
         )
 
-        test_case.assert_valid(result_events, event_builder)
+        test_case.assert_valid_events(result_events)
+        track_dataset.intersection_points.assert_called_once_with(
+            [test_case.section], test_case.section.get_offset(EventType.SECTION_ENTER)
+        )
+
+    def test_intersect_missing_track(
+        self, test_case_track_line_section: _TestCase
+    ) -> None:
+        track_dataset = test_case_track_line_section.track_dataset
+        track_dataset.get_detections_at.side_effect = TrackDoesNotExistError
+
+        with pytest.raises(IntersectionError):
+            self._create_intersector().intersect(
+                track_dataset,
+                [test_case_track_line_section.section],
+                SectionEventBuilder(),
+            )
 
 
 class TestIntersectAreaByTrackPoints:
@@ -323,6 +357,9 @@ class TestIntersectAreaByTrackPoints:
             straight_track.id: [(section.id, [False, True, False])]
         }
         track_dataset.get_for.return_value = straight_track
+        track_dataset.detections_array.return_value = DetectionArray.from_track(
+            straight_track
+        )
         expected_event_coords = [
             _ExpectedEventCoord.from_detection(
                 straight_track.detections[1], 1, EventType.SECTION_ENTER, offset
@@ -351,6 +388,9 @@ class TestIntersectAreaByTrackPoints:
             straight_track.id: [(section.id, [True, False, False])]
         }
         track_dataset.get_for.return_value = straight_track
+        track_dataset.detections_array.return_value = DetectionArray.from_track(
+            straight_track
+        )
         expected_event_coords = [
             _ExpectedEventCoord(0, 1.0, 1.0, EventType.SECTION_ENTER),
             _ExpectedEventCoord(1, 2.0, 1.0, EventType.SECTION_LEAVE),
@@ -375,6 +415,9 @@ class TestIntersectAreaByTrackPoints:
             straight_track.id: [(section.id, [True, True, True])]
         }
         track_dataset.get_for.return_value = straight_track
+        track_dataset.detections_array.return_value = DetectionArray.from_track(
+            straight_track
+        )
         expected_event_coords = [
             _ExpectedEventCoord(0, 1.0, 1.0, EventType.SECTION_ENTER)
         ]
@@ -398,6 +441,9 @@ class TestIntersectAreaByTrackPoints:
             straight_track.id: [(section.id, [False, True, True])]
         }
         track_dataset.get_for.return_value = straight_track
+        track_dataset.detections_array.return_value = DetectionArray.from_track(
+            straight_track
+        )
         expected_event_coords = [
             _ExpectedEventCoord(1, 2.0, 1.0, EventType.SECTION_ENTER)
         ]
@@ -424,6 +470,9 @@ class TestIntersectAreaByTrackPoints:
             complex_track.id: [(section.id, [False, True, True, False, False, True])]
         }
         track_dataset.get_for.return_value = complex_track
+        track_dataset.detections_array.return_value = DetectionArray.from_track(
+            complex_track
+        )
         expected_event_coords = [
             _ExpectedEventCoord(1, 2.0, 1.0, EventType.SECTION_ENTER),
             _ExpectedEventCoord(3, 1.0, 1.5, EventType.SECTION_LEAVE),
@@ -452,6 +501,9 @@ class TestIntersectAreaByTrackPoints:
             complex_track.id: [(section.id, [True, False, False, True, True, False])]
         }
         track_dataset.get_for.return_value = complex_track
+        track_dataset.detections_array.return_value = DetectionArray.from_track(
+            complex_track
+        )
         expected_event_coords = [
             _ExpectedEventCoord(0, 1.0, 1.0, EventType.SECTION_ENTER),
             _ExpectedEventCoord(1, 2.0, 1.0, EventType.SECTION_LEAVE),
@@ -478,6 +530,9 @@ class TestIntersectAreaByTrackPoints:
             closed_track.id: [(section.id, [False, True, False, False, False])]
         }
         track_dataset.get_for.return_value = closed_track
+        track_dataset.detections_array.return_value = DetectionArray.from_track(
+            closed_track
+        )
         expected_event_coords = [
             _ExpectedEventCoord(1, 2.0, 1.0, EventType.SECTION_ENTER),
             _ExpectedEventCoord(2, 2.0, 2.0, EventType.SECTION_LEAVE),
@@ -508,19 +563,158 @@ class TestIntersectAreaByTrackPoints:
         test_case_name: str,
         request: pytest.FixtureRequest,
     ) -> None:
-        test_case: _TestCase
+        test_case: AreaSectionTestCase
         test_case = request.getfixturevalue(test_case_name)
 
-        event = Mock()
-        event_builder = Mock()
-        event_builder.create_event.return_value = event
+        track_dataset = test_case.track_dataset
+        track_dataset.area_transitions.side_effect = partial(
+            TrackDataset.area_transitions, track_dataset
+        )
+        track_dataset.get_detections_at.side_effect = partial(
+            TrackDataset.get_detections_at, track_dataset
+        )
 
         intersector = self._create_intersector()
         result_events = intersector.intersect(
-            test_case.track_dataset, [test_case.section], event_builder
+            track_dataset, [test_case.section], SectionEventBuilder()
         )
 
-        test_case.assert_valid(result_events, event_builder)
+        test_case.assert_valid(result_events)
+
+    def test_intersect_missing_track(
+        self, test_case_track_starts_outside_section: AreaSectionTestCase
+    ) -> None:
+        track_dataset = test_case_track_starts_outside_section.track_dataset
+        track_dataset.area_transitions.side_effect = partial(
+            TrackDataset.area_transitions, track_dataset
+        )
+        track_dataset.get_detections_at.side_effect = TrackDoesNotExistError
+
+        with pytest.raises(IntersectionError):
+            self._create_intersector().intersect(
+                track_dataset,
+                [test_case_track_starts_outside_section.section],
+                SectionEventBuilder(),
+            )
+
+
+def create_mock_section(section_type: type[Section], section_id: str) -> Mock:
+    section = Mock(spec=section_type)
+    section.id = SectionId(section_id)
+    section.get_offset.return_value = RelativeOffsetCoordinate(0, 0)
+    return section
+
+
+def create_batch(events: list[tuple[str, str]]) -> EventBatch:
+    size = len(events)
+    return EventBatch(
+        road_user_id=[track_id for track_id, _ in events],
+        road_user_type=["car"] * size,
+        occurrence=[datetime(2020, 1, 1)] * size,
+        frame_number=[1] * size,
+        section_id=[SectionId(section_id) for _, section_id in events],
+        event_x=[0.0] * size,
+        event_y=[0.0] * size,
+        event_type=[EventType.SECTION_ENTER] * size,
+        direction_x=[0.0] * size,
+        direction_y=[0.0] * size,
+        video_name=["video"] * size,
+    )
+
+
+def create_summary(track_id: str) -> Mock:
+    summary = Mock(spec=TrackSummary)
+    summary.id = TrackId(track_id)
+    return summary
+
+
+class TestBatchedTracksRunIntersect:
+    def test_intersect_tasks_of_planner(self) -> None:
+        line = create_mock_section(LineSection, "line")
+        first_area = create_mock_section(Area, "first area")
+        second_area = create_mock_section(Area, "second area")
+        sections = [first_area, line, second_area]
+        tracks = Mock(spec=TrackDataset)
+        shared_tracks = Mock(spec=TrackDataset)
+        summaries = [create_summary("1"), create_summary("2"), create_summary("3")]
+        shared_tracks.get_summaries.return_value.as_list.return_value = summaries
+        first_batch = Mock(spec=TrackDataset)
+        second_batch = Mock(spec=TrackDataset)
+        shared_tracks.split_by_track_ids.return_value = [first_batch, second_batch]
+        get_tracks = Mock()
+        get_tracks.as_dataset.return_value = tracks
+        planned = [
+            IntersectionTask([TrackId("3")], 20, 40),
+            IntersectionTask([TrackId("1"), TrackId("2")], 10, 20),
+        ]
+        task_planner = Mock(spec=IntersectionTaskPlanner)
+        task_planner.plan.return_value = planned
+        parallelizer = Mock(spec=IntersectParallelizationStrategy)
+        parallelizer.num_processes = 2
+        parallelizer.share_tracks.return_value = shared_tracks
+        parallelizer.task_timings = [TaskTiming(0, 1, 0.5), TaskTiming(1, 2, 0.25)]
+        parallelizer.execute.return_value = create_batch(
+            [
+                ("3", "line"),
+                ("3", "second area"),
+                ("3", "first area"),
+                ("1", "line"),
+                ("1", "first area"),
+                ("2", "second area"),
+            ]
+        )
+
+        run_intersect = BatchedTracksRunIntersect(
+            parallelizer, get_tracks, task_planner
+        )
+        result = run_intersect(sections)
+
+        assert isinstance(result, EventBatch)
+        tracks.calculate_geometries_for.assert_called_once_with(
+            {RelativeOffsetCoordinate(0, 0)}
+        )
+        assert list(zip(result.road_user_id, result.section_id)) == [
+            ("1", SectionId("line")),
+            ("3", SectionId("line")),
+            ("1", SectionId("first area")),
+            ("3", SectionId("second area")),
+            ("3", SectionId("first area")),
+            ("2", SectionId("second area")),
+        ]
+        parallelizer.share_tracks.assert_called_once_with(tracks)
+        task_planner.plan.assert_called_once_with(summaries, sections, 2)
+        shared_tracks.split_by_track_ids.assert_called_once_with(
+            [[TrackId("3")], [TrackId("1"), TrackId("2")]]
+        )
+        parallelizer.execute.assert_called_once_with(
+            _create_events, [(first_batch, sections), (second_batch, sections)]
+        )
+
+    def test_intersect_single_process(self) -> None:
+        section = Mock(spec=Section)
+        tracks = Mock(spec=TrackDataset)
+        get_tracks = Mock()
+        get_tracks.as_dataset.return_value = tracks
+        task_planner = Mock(spec=IntersectionTaskPlanner)
+        parallelizer = Mock(spec=IntersectParallelizationStrategy)
+        parallelizer.num_processes = 1
+        parallelizer.task_timings = []
+        parallelizer.execute.return_value = []
+
+        run_intersect = BatchedTracksRunIntersect(
+            parallelizer, get_tracks, task_planner
+        )
+        run_intersect([section])
+
+        tracks.calculate_geometries_for.assert_called_once_with(
+            {section.get_offset.return_value}
+        )
+        task_planner.plan.assert_not_called()
+        parallelizer.share_tracks.assert_not_called()
+        tracks.split_by_track_ids.assert_not_called()
+        parallelizer.execute.assert_called_once_with(
+            _create_events, [(tracks, [section])]
+        )
 
 
 def test_separate_sections_with_valid_args() -> None:
@@ -1,5 +1,5 @@
 from datetime import datetime
-from unittest.mock import Mock, PropertyMock, call, patch
+from unittest.mock import Mock
 
 import pytest
 
@@ -30,7 +30,8 @@ from OTAnalytics.domain.event import Event, EventRepository
 from OTAnalytics.domain.filter import FilterElement
 from OTAnalytics.domain.flow import Flow, FlowId, FlowRepository
 from OTAnalytics.domain.section import Section, SectionId
-from OTAnalytics.domain.track import Detection, Track, TrackId, TrackIdProvider
+from OTAnalytics.domain.track import Track, TrackId, TrackIdProvider
+from OTAnalytics.domain.track_dataset import TrackSummaryDataset
 from OTAnalytics.domain.track_repository import TrackRepository
 
 
@@ -311,200 +312,61 @@ class TestTracksAssignedToSelectedFlows:
 
 
 class TestTracksOverlapOccurrenceWindow:
-    @pytest.mark.parametrize(
-        "start_1,end_1,start_2,end_2,expected",
-        [
-            (
-                datetime(2020, 1, 1, 13),
-                datetime(2020, 1, 1, 14),
-                datetime(2020, 1, 1, 14, 30),
-                datetime(2020, 1, 1, 15),
-                False,
-            ),
-            (
-                datetime(2020, 1, 1, 13),
-                datetime(2020, 1, 1, 14),
-                datetime(2020, 1, 1, 13),
-                datetime(2020, 1, 1, 13, 30),
-                True,
-            ),
-            (
-                datetime(2020, 1, 1, 13),
-                datetime(2020, 1, 1, 14),
-                datetime(2020, 1, 1, 13, 30),
-                datetime(2020, 1, 1, 14),
-                True,
-            ),
-            (
-                datetime(2020, 1, 1, 13),
-                datetime(2020, 1, 1, 14),
-                datetime(2020, 1, 1, 13, 30),
-                datetime(2020, 1, 1, 14, 30),
-                True,
-            ),
-            (
-                datetime(2020, 1, 1, 13),
-                datetime(2020, 1, 1, 14),
-                datetime(2020, 1, 1, 14, 00),
-                datetime(2020, 1, 1, 14, 30),
-                True,
-            ),
-        ],
-    )
-    def test_has_overlap(
-        self,
-        start_1: datetime,
-        end_1: datetime,
-        start_2: datetime,
-        end_2: datetime,
-        expected: bool,
-    ) -> None:
-        assert (
-            TracksOverlapOccurrenceWindow._has_overlap(start_1, end_1, start_2, end_2)
-            == expected
-        )
-        assert (
-            TracksOverlapOccurrenceWindow._has_overlap(start_2, end_2, start_1, end_1)
-            == expected
-        )
-
-    def test_has_overlap_wrong_order_of_arguments(self) -> None:
-        start_1 = datetime(2022, 1, 2)
-        start_2 = datetime(2022, 1, 1)
-        end_1 = datetime(2022, 1, 3)
-        end_2 = datetime(2022, 1, 4)
-        with pytest.raises(
-            ValueError, match="start_1 needs to be lesser equal than end_1."
-        ):
-            TracksOverlapOccurrenceWindow._has_overlap(
-                start_1,
-                start_2,
-                end_1,
-                end_2,
-            )
-        with pytest.raises(
-            ValueError, match="start_2 needs to be lesser equal than end_2."
-        ):
-            TracksOverlapOccurrenceWindow._has_overlap(
-                start_2,
-                start_1,
-                end_2,
-                end_1,
-            )
+    def _create_track_view_state(
+        self, start: datetime | None, end: datetime | None
+    ) -> Mock:
+        filter_element = Mock(spec=FilterElement)
+        filter_element.date_range = DateRange(start, end)
+        observable_property = Mock(spec=ObservableProperty)
+        observable_property.get.return_value = filter_element
+        track_view_state = Mock(spec=TrackViewState)
+        track_view_state.filter_element = observable_property
+        return track_view_state
 
     def test_get_ids(self) -> None:
+        start = datetime(2020, 1, 1, 13)
+        end = datetime(2020, 1, 1, 14)
+        track_ids = [TrackId("1"), TrackId("2")]
+        summaries = Mock(spec=TrackSummaryDataset)
+        summaries.get_ids_alive_between.return_value = track_ids
         track_repository = Mock(spec=TrackRepository)
-        track_view_state = Mock(spec=TrackViewState)
-        track_ids = [Mock(spec=TrackId), Mock(spec=TrackId)]
-        tracks = [Mock(spec=Track), None]
-        track_repository.get_all.return_value = tracks
+        track_repository.get_summaries.return_value = summaries
 
-        with patch.object(
-            TracksOverlapOccurrenceWindow, "_filter", return_value=[track_ids[0]]
-        ):
-            id_provider = TracksOverlapOccurrenceWindow(
-                track_repository, track_view_state
-            )
-            result_ids = id_provider.get_ids()
+        id_provider = TracksOverlapOccurrenceWindow(
+            track_repository, self._create_track_view_state(start, end)
+        )
+        result_ids = id_provider.get_ids()
 
-            assert result_ids == [track_ids[0]]
-            track_repository.get_all.assert_called_once()
+        assert result_ids == track_ids
+        summaries.get_ids_alive_between.assert_called_once_with(start, end)
 
-    def test_get_ids_as_decorator(self) -> None:
+    def test_get_ids_of_invalid_window(self) -> None:
         track_repository = Mock(spec=TrackRepository)
-        track_view_state = Mock(spec=TrackViewState)
-        track_ids = [Mock(spec=TrackId), Mock(spec=TrackId)]
-        tracks = [Mock(spec=Track), None]
-        track_repository.get_for.side_effect = tracks
+        id_provider = TracksOverlapOccurrenceWindow(
+            track_repository,
+            self._create_track_view_state(datetime(2022, 1, 2), datetime(2022, 1, 1)),
+        )
 
-        with patch.object(
-            TracksOverlapOccurrenceWindow, "_filter", return_value=[track_ids[0]]
+        with pytest.raises(
+            ValueError,
+            match="start of date range needs to be lesser equal than end.",
         ):
-            id_provider = TracksOverlapOccurrenceWindow(
-                track_repository, track_view_state
-            )
-            result_ids = id_provider.get_ids()
-
-            assert result_ids == [track_ids[0]]
-            track_repository.get_for.call_args_list == [call(id) for id in track_ids]
-
-    @pytest.mark.parametrize(
-        (
-            "filter_start,filter_end,"
-            "expected_has_overlap_filter_start,expected_has_overlap_filter_end,"
-        ),
-        [
-            (datetime(2020, 1, 1, 13), None, datetime(2020, 1, 1, 13), datetime.max),
-            (None, datetime(2020, 1, 1, 14), datetime.min, datetime(2020, 1, 1, 14)),
-            (
-                datetime(2020, 1, 1, 13),
-                datetime(2020, 1, 1, 14),
-                datetime(2020, 1, 1, 13),
-                datetime(2020, 1, 1, 14),
-            ),
-            (None, None, datetime.min, datetime.max),
-        ],
-    )
-    def test_filter(
-        self,
-        filter_start: datetime | None,
-        filter_end: datetime | None,
-        expected_has_overlap_filter_start: datetime,
-        expected_has_overlap_filter_end: datetime,
-    ) -> None:
-        track_repository = Mock(spec=TrackRepository)
+            id_provider.get_ids()
+        track_repository.get_summaries.assert_not_called()
 
-        filter_element = Mock(spec=FilterElement)
-        filter_element.date_range = DateRange(filter_start, filter_end)
+    def test_get_ids_as_decorator(self) -> None:
+        track_ids = [TrackId("1"), TrackId("2"), TrackId("3")]
+        other = Mock(spec=TrackIdProvider)
+        other.get_ids.return_value = track_ids
+        summaries = Mock(spec=TrackSummaryDataset)
+        summaries.get_ids_alive_between.return_value = [track_ids[2], track_ids[0]]
+        track_repository = Mock(spec=TrackRepository)
+        track_repository.get_summaries.return_value = summaries
 
-        track_view_state = Mock(spec=TrackViewState)
-        observable_property = Mock(spec=ObservableProperty)
-        observable_property.get.return_value = filter_element
-        track_view_state.filter_element = observable_property
+        id_provider = TracksOverlapOccurrenceWindow(
+            track_repository, self._create_track_view_state(None, None), other
+        )
+        result_ids = id_provider.get_ids()
 
-        start_detection = Mock(spec=Detection)
-        start_time = datetime(2020, 1, 1, 13)
-        start_detection.occurrence = start_time
-
-        end_detection = Mock(spec=Detection)
-        end_time = datetime(2020, 1, 1, 13, 30)
-        end_detection.occurrence = end_time
-
-        with (
-            patch.object(
-                TracksOverlapOccurrenceWindow, "_has_overlap", return_value=True
-            ) as mock_has_overlap,
-            patch(
-                "OTAnalytics.application.use_cases.highlight_intersections.Track.start",
-                new_callable=PropertyMock,
-                return_value=start_time,
-            ) as mock_start,
-            patch(
-                "OTAnalytics.application.use_cases.highlight_intersections.Track.end",
-                new_callable=PropertyMock,
-                return_value=end_time,
-            ) as mock_end,
-        ):
-            track_id = TrackId("1")
-            track = Mock(spec=Track)
-            track.id = track_id
-            track.start.return_value = start_detection
-            track.end.return_value = end_detection
-
-            id_provider = TracksOverlapOccurrenceWindow(
-                track_repository, track_view_state
-            )
-            result_ids = id_provider._filter([track])
-
-            assert result_ids == [track_id]
-            mock_start.assert_called_once()
-            mock_end.assert_called_once()
-            if filter_start or filter_end:
-                mock_has_overlap.assert_called_once_with(
-                    expected_has_overlap_filter_start,
-                    expected_has_overlap_filter_end,
-                    track.start,
-                    track.end,
-                )
-            else:
-                mock_has_overlap.assert_not_called()
+        assert result_ids == [track_ids[0], track_ids[2]]
+        summaries.get_ids_alive_between.assert_called_once_with(None, None)
@@ -1,6 +1,8 @@
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, call, patch
+from unittest.mock import MagicMock, Mock, call
+
+import pytest
 
 from OTAnalytics.application.use_cases.load_track_files import LoadTrackFiles
 from OTAnalytics.domain.track import TrackId
@@ -10,18 +12,49 @@ START_DATE = datetime(2023, 1, 1)
 
 
 class TestLoadTrackFile:
-    @patch("OTAnalytics.application.use_cases.load_track_files.LoadTrackFiles.load")
-    def test_load_multiple_files(self, mock_load: Mock) -> None:
+    def test_load_multiple_files(self) -> None:
         some_file = Path("some.file.ottrk")
         other_file = Path("other.file.ottrk")
+        failing_file = Path("failing.file.ottrk")
         progressbar = Mock()
-        progressbar.return_value = [some_file, other_file]
+        progressbar.return_value = [some_file, other_file, failing_file]
+        track_parser = Mock()
+        track_video_parser = Mock()
+        track_repository = Mock()
+        track_file_repository = Mock()
+        some_result = Mock()
+        other_result = Mock()
+        some_result.tracks.track_ids = frozenset()
+        other_result.tracks.track_ids = frozenset()
+        error = ValueError("invalid file")
+        track_parser.parse_all.return_value = iter([some_result, other_result, error])
+        track_video_parser.parse.return_value = [], []
 
         load_track_files = LoadTrackFiles(
-            Mock(), Mock(), Mock(), Mock(), Mock(), Mock(), progressbar, Mock(), Mock()
+            track_parser,
+            track_video_parser,
+            track_repository,
+            track_file_repository,
+            Mock(),
+            Mock(),
+            progressbar,
+            Mock(),
+            Mock(),
         )
-        load_track_files([some_file, other_file])
-        assert mock_load.call_args_list == [call(some_file), call(other_file)]
+        with pytest.raises(ExceptionGroup) as exception_info:
+            load_track_files([some_file, other_file, failing_file])
+
+        assert exception_info.value.exceptions == (error,)
+        track_parser.parse_all.assert_called_once_with(
+            [some_file, other_file, failing_file]
+        )
+        track_repository.add_many.assert_called_once_with(
+            [some_result.tracks, other_result.tracks]
+        )
+        assert track_file_repository.add.call_args_list == [
+            call(some_file),
+            call(other_file),
+        ]
 
     def test_load(self) -> None:
         track_repository = Mock()
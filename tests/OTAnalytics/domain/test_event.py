@@ -1,4 +1,5 @@
-from datetime import datetime
+import pickle
+from datetime import datetime, timedelta
 from unittest.mock import Mock
 
 import pytest
@@ -17,6 +18,7 @@ from OTAnalytics.domain.event import (
     SECTION_ID,
     VIDEO_NAME,
     Event,
+    EventBatch,
     EventBuilder,
     EventRepository,
     EventRepositoryEvent,
@@ -28,6 +30,7 @@ from OTAnalytics.domain.event import (
 from OTAnalytics.domain.geometry import DirectionVector2D, ImageCoordinate
 from OTAnalytics.domain.section import Section, SectionId
 from OTAnalytics.domain.track import Detection, TrackId
+from OTAnalytics.domain.track_dataset import DetectionSelection
 from OTAnalytics.domain.types import EventType, EventTypeParseError
 from tests.utils.builders import event_builder
 
@@ -162,6 +165,103 @@ class TestEventBuilder:
             EventBuilder.extract_hostname(wrong_formatted_name)
 
 
+@pytest.fixture
+def detection_selection() -> DetectionSelection:
+    return DetectionSelection(
+        track_id=["1", "2"],
+        classification=["car", "bicycle"],
+        x=[1.0, 2.0],
+        y=[3.0, 4.0],
+        direction_x=[0.5, -0.5],
+        direction_y=[1.5, -1.5],
+        frame=[1, 7],
+        occurrence=[EVENT_OCCURRENCE, EVENT_OCCURRENCE + timedelta(seconds=1)],
+        video_name=["myhostname_something.mp4", "otherhost_something.mp4"],
+    )
+
+
+class TestEventBatch:
+    def create_batch(self, detections: DetectionSelection) -> EventBatch:
+        return SectionEventBuilder().create_event_batch(
+            detections,
+            [SECTION_ID_1, SECTION_ID_2],
+            [EventType.SECTION_ENTER, EventType.SECTION_LEAVE],
+        )
+
+    def test_create_event_batch(self, detection_selection: DetectionSelection) -> None:
+        batch = self.create_batch(detection_selection)
+
+        assert len(batch) == 2
+        assert list(batch) == [
+            Event(
+                road_user_id="1",
+                road_user_type="car",
+                hostname="myhostname",
+                occurrence=EVENT_OCCURRENCE,
+                frame_number=1,
+                section_id=SECTION_ID_1,
+                event_coordinate=ImageCoordinate(1.0, 3.0),
+                event_type=EventType.SECTION_ENTER,
+                direction_vector=DirectionVector2D(0.5, 1.5),
+                video_name="myhostname_something.mp4",
+            ),
+            Event(
+                road_user_id="2",
+                road_user_type="bicycle",
+                hostname="otherhost",
+                occurrence=EVENT_OCCURRENCE + timedelta(seconds=1),
+                frame_number=7,
+                section_id=SECTION_ID_2,
+                event_coordinate=ImageCoordinate(2.0, 4.0),
+                event_type=EventType.SECTION_LEAVE,
+                direction_vector=DirectionVector2D(-0.5, -1.5),
+                video_name="otherhost_something.mp4",
+            ),
+        ]
+        assert batch[1] is list(batch)[1]
+
+    def test_events_are_created_on_access(
+        self, detection_selection: DetectionSelection
+    ) -> None:
+        invalid = DetectionSelection(
+            **{**detection_selection.__dict__, "frame": [0, 1]}
+        )
+        batch = self.create_batch(invalid)
+
+        assert len(batch) == 2
+        with pytest.raises(ValueError):
+            batch[0]
+
+    def test_pickle_transfers_columns_only(
+        self, detection_selection: DetectionSelection
+    ) -> None:
+        batch = self.create_batch(detection_selection)
+        events = list(batch)
+
+        unpickled = pickle.loads(pickle.dumps(batch))
+
+        assert "_events" not in unpickled.__dict__
+        assert list(unpickled) == events
+
+    def test_concat(self, detection_selection: DetectionSelection) -> None:
+        batch = self.create_batch(detection_selection)
+        empty = EventBatch.concat([])
+
+        concatenated = EventBatch.concat([batch, empty, batch])
+
+        assert len(empty) == 0
+        assert EventBatch.concat([batch]) is batch
+        assert list(concatenated) == [*batch, *batch]
+
+    def test_take(self, detection_selection: DetectionSelection) -> None:
+        batch = self.create_batch(detection_selection)
+
+        taken = batch.take([1, 0, 1])
+
+        assert "_events" not in batch.__dict__
+        assert list(taken) == [batch[1], batch[0], batch[1]]
+
+
 class TestSectionEventBuilder:
     def test_create_event_without_adds(self, valid_detection: Detection) -> None:
         event_builder = SectionEventBuilder()
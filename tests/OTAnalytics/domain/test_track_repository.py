@@ -4,7 +4,7 @@ from unittest.mock import MagicMock, Mock, PropertyMock, call
 import pytest
 
 from OTAnalytics.domain.track import Track, TrackId
-from OTAnalytics.domain.track_dataset import TrackDataset
+from OTAnalytics.domain.track_dataset import TrackDataset, TrackSummaryDataset
 from OTAnalytics.domain.track_repository import (
     TrackFileRepository,
     TrackListObserver,
@@ -65,6 +65,28 @@ class TestTrackRepository:
             TrackRepositoryEvent.create_added([track_1.id, track_2.id])
         )
 
+    def test_add_many(self, track_1: Mock, track_2: Mock) -> None:
+        first_tracks = MagicMock(spec=TrackDataset)
+        first_tracks.__len__.return_value = 1
+        first_tracks.track_ids = frozenset([track_1.id])
+        second_tracks = MagicMock(spec=TrackDataset)
+        second_tracks.__len__.return_value = 1
+        second_tracks.track_ids = frozenset([track_2.id])
+        empty_tracks = MagicMock(spec=TrackDataset)
+        empty_tracks.__len__.return_value = 0
+        dataset = Mock(spec=TrackDataset)
+        observer = Mock(spec=TrackListObserver)
+        repository = TrackRepository(dataset)
+        repository.register_tracks_observer(observer)
+
+        repository.add_many([first_tracks, empty_tracks, second_tracks])
+
+        dataset.add_many.assert_called_once_with([first_tracks, second_tracks])
+        assert repository.get_all() == dataset.add_many.return_value
+        observer.notify_tracks.assert_called_once_with(
+            TrackRepositoryEvent.create_added([track_1.id, track_2.id])
+        )
+
     def test_add_nothing(self) -> None:
         empty_dataset = MagicMock()
         empty_dataset.__len__.return_value = 0
@@ -116,6 +138,16 @@ class TestTrackRepository:
 
         assert actual_ids is ids
 
+    def test_get_summaries(self) -> None:
+        summaries = Mock(spec=TrackSummaryDataset)
+        dataset = Mock(spec=TrackDataset)
+        dataset.get_summaries.return_value = summaries
+        repository = TrackRepository(dataset)
+
+        actual = repository.get_summaries()
+
+        assert actual is summaries
+
     def test_remove(self, track_1: Track, track_2: Track) -> None:
         dataset = Mock(spec=TrackDataset)
         dataset.remove.return_value = dataset
@@ -1,3 +1,4 @@
+from datetime import datetime, timedelta, timezone
 from typing import Iterable
 from unittest.mock import Mock
 
@@ -10,15 +11,25 @@ from OTAnalytics.adapter_visualization.color_provider import (
     CLASS_CARGOBIKE,
     CLASS_PEDESTRIAN,
 )
+from OTAnalytics.domain.geometry import (
+    Coordinate,
+    RelativeOffsetCoordinate,
+    apply_offset,
+)
+from OTAnalytics.domain.section import Area, Section, SectionId
 from OTAnalytics.domain.track import Track, TrackId
 from OTAnalytics.domain.track_dataset import (
+    AreaTransitions,
     FilteredTrackDataset,
     TrackDoesNotExistError,
 )
+from OTAnalytics.plugin_datastore.python_track_store import create_summary_for
 from tests.utils.assertions import (
+    assert_area_transitions_equal,
     assert_equal_track_properties,
     assert_track_dataset_has_tracks,
 )
+from tests.utils.builders.track_builder import TrackBuilder
 from tests.utils.builders.track_dataset_provider import (
     IMPLEMENTATIONS,
     TrackDatasetProvider,
@@ -28,6 +39,10 @@ from tests.utils.builders.track_segment_builder import (
 )
 
 
+def at(hour: int, minute: int = 0) -> datetime:
+    return datetime(2020, 1, 1, hour, minute, tzinfo=timezone.utc)
+
+
 class TestFilteredTrackDataset:
     def get_datasets(
         self,
@@ -443,3 +458,290 @@ class TestFilteredTrackDataset:
 
             result = filled_dataset.get_max_confidences_for(all_track_ids)
             assert result == expected
+
+    @pytest.mark.parametrize(
+        "include_classes,exclude_classes,expected_track_fixture_name",
+        [
+            ([], [], ["car_track", "pedestrian_track"]),
+            ([CLASS_CAR], [], ["car_track"]),
+            ([], [CLASS_CAR], ["pedestrian_track"]),
+        ],
+    )
+    def test_get_summaries(
+        self,
+        include_classes: list[str],
+        exclude_classes: list[str],
+        expected_track_fixture_name: list[str],
+        car_track: Track,
+        pedestrian_track: Track,
+        car_track_continuing: Track,
+        request: FixtureRequest,
+    ) -> None:
+        expected_tracks: list[Track] = [
+            request.getfixturevalue(name) for name in expected_track_fixture_name
+        ]
+        expected = {track.id: create_summary_for(track) for track in expected_tracks}
+        datasets = self.get_datasets(
+            [car_track, pedestrian_track], include_classes, exclude_classes
+        )
+
+        for dataset in datasets.values():
+            summaries = dataset.get_summaries()
+            assert {summary.id: summary for summary in summaries.as_list()} == expected
+            assert summaries.get_for(pedestrian_track.id) == expected.get(
+                pedestrian_track.id
+            )
+
+            removed = dataset.remove(pedestrian_track.id).get_summaries()
+            assert removed.get_for(pedestrian_track.id) is None
+
+            continued = dataset.add_all([car_track_continuing]).get_summaries()
+            if (car_summary := continued.get_for(car_track.id)) is not None:
+                assert car_summary.length == 5
+                assert car_summary.end == car_track_continuing.end
+
+    @pytest.mark.parametrize(
+        "start,end,expected",
+        [
+            (at(14, 30), at(15), False),
+            (at(11), at(12, 59), False),
+            (at(13), at(13, 30), True),
+            (at(13, 30), at(14), True),
+            (at(13, 30), at(14, 30), True),
+            (at(12), at(15), True),
+            (at(14), at(14, 30), True),
+            (at(12), at(13), True),
+            (at(14), None, True),
+            (at(14, 1), None, False),
+            (None, at(13), True),
+            (None, at(12, 59), False),
+            (None, None, True),
+        ],
+    )
+    def test_get_ids_alive_between_overlap(
+        self, start: datetime | None, end: datetime | None, expected: bool
+    ) -> None:
+        builder = TrackBuilder()
+        builder.add_occurrence(2020, 1, 1, 13, 0, 0, 0)
+        builder.append_detection()
+        builder.next_frame()
+        builder.add_occurrence(2020, 1, 1, 14, 0, 0, 0)
+        builder.append_detection()
+        track = builder.build_track()
+        datasets = self.get_datasets([track], [], [])
+
+        for dataset in datasets.values():
+            alive = dataset.get_summaries().get_ids_alive_between(start, end)
+            assert alive == ([track.id] if expected else [])
+
+    def test_get_ids_alive_between(
+        self, car_track: Track, pedestrian_track: Track, bicycle_track: Track
+    ) -> None:
+        tracks = [car_track, pedestrian_track, bicycle_track]
+        windows: list[tuple[datetime | None, datetime | None]] = [
+            (None, None),
+            (car_track.end, None),
+            (None, car_track.start),
+            (pedestrian_track.end, bicycle_track.start),
+            (car_track.end + timedelta(microseconds=1), bicycle_track.start),
+            (bicycle_track.end + timedelta(seconds=1), None),
+        ]
+        datasets = self.get_datasets(tracks, [], [])
+
+        for dataset in datasets.values():
+            summaries = dataset.get_summaries()
+            for start, end in windows:
+                expected = {
+                    track.id
+                    for track in tracks
+                    if (start is None or track.end >= start)
+                    and (end is None or track.start <= end)
+                }
+                actual = summaries.get_ids_alive_between(start, end)
+                assert len(actual) == len(expected)
+                assert set(actual) == expected
+
+    def test_get_detections_at(self, car_track: Track, pedestrian_track: Track) -> None:
+        offset = RelativeOffsetCoordinate(0.5, 1)
+        track_ids = [pedestrian_track.id, car_track.id, car_track.id]
+        indices = [1, 0, len(car_track.detections) - 1]
+        detections = [
+            track.detections[index]
+            for track, index in zip([pedestrian_track, car_track, car_track], indices)
+        ]
+        neighbours = [
+            pedestrian_track.detections[0],
+            car_track.detections[1],
+            car_track.detections[-2],
+        ]
+        expected_coordinates = [
+            apply_offset(d.x, d.y, d.w, d.h, offset) for d in detections
+        ]
+        neighbour_coordinates = [
+            apply_offset(d.x, d.y, d.w, d.h, offset) for d in neighbours
+        ]
+        signs = [1, -1, 1]
+        datasets = self.get_datasets([car_track, pedestrian_track], [], [])
+
+        for dataset in datasets.values():
+            selection = dataset.get_detections_at(track_ids, indices, offset)
+
+            assert len(selection) == 3
+            assert [str(_id) for _id in selection.track_id] == [
+                _id.id for _id in track_ids
+            ]
+            assert list(selection.classification) == [
+                pedestrian_track.classification,
+                car_track.classification,
+                car_track.classification,
+            ]
+            assert [
+                (float(x), float(y)) for x, y in zip(selection.x, selection.y)
+            ] == expected_coordinates
+            assert [
+                (float(x), float(y))
+                for x, y in zip(selection.direction_x, selection.direction_y)
+            ] == [
+                (sign * (x - other_x), sign * (y - other_y))
+                for sign, (x, y), (other_x, other_y) in zip(
+                    signs, expected_coordinates, neighbour_coordinates
+                )
+            ]
+            assert [int(frame) for frame in selection.frame] == [
+                d.frame for d in detections
+            ]
+            assert list(selection.occurrence) == [d.occurrence for d in detections]
+            assert [str(name) for name in selection.video_name] == [
+                d.video_name for d in detections
+            ]
+            with pytest.raises(TrackDoesNotExistError):
+                dataset.get_detections_at([TrackId("missing")], [0], offset)
+
+    def test_get_detections_at_outside_of_track(
+        self, car_track: Track, pedestrian_track: Track
+    ) -> None:
+        offset = RelativeOffsetCoordinate(0, 0)
+        datasets = self.get_datasets([car_track, pedestrian_track], [], [])
+
+        for dataset in datasets.values():
+            for track in [car_track, pedestrian_track]:
+                last = dataset.get_detections_at(
+                    [track.id], [len(track.detections) - 1], offset
+                )
+                assert [int(frame) for frame in last.frame] == [
+                    track.detections[-1].frame
+                ]
+                with pytest.raises(IndexError):
+                    dataset.get_detections_at(
+                        [track.id], [len(track.detections)], offset
+                    )
+                with pytest.raises(IndexError):
+                    dataset.get_detections_at([track.id], [-1], offset)
+
+    def test_area_transitions(self, car_track: Track, pedestrian_track: Track) -> None:
+        offset = RelativeOffsetCoordinate(0, 0)
+        areas: list[Section] = [
+            create_square_area("middle", 1.5, 2.5),
+            create_square_area("start", 0, 1.5),
+        ]
+        datasets = self.get_datasets([car_track, pedestrian_track], [], [])
+
+        for dataset in datasets.values():
+            transitions = dataset.area_transitions(areas, offset)
+
+            assert_area_transitions_equal(
+                transitions,
+                AreaTransitions.from_masks(
+                    dataset.contained_by_sections(areas, offset)
+                ),
+            )
+            assert sorted(
+                (str(track_id), section_id.id, int(index), bool(entered))
+                for track_id, section_id, index, entered in zip(
+                    transitions.track_id,
+                    transitions.section_id,
+                    transitions.index,
+                    transitions.entered,
+                )
+            ) == [
+                (car_track.id.id, "middle", 1, True),
+                (car_track.id.id, "start", 0, True),
+                (car_track.id.id, "start", 1, False),
+                (pedestrian_track.id.id, "middle", 1, True),
+                (pedestrian_track.id.id, "middle", 2, False),
+                (pedestrian_track.id.id, "start", 0, True),
+                (pedestrian_track.id.id, "start", 1, False),
+            ]
+
+    def test_split_by_track_ids(
+        self, car_track: Track, pedestrian_track: Track, bicycle_track: Track
+    ) -> None:
+        datasets = self.get_datasets(
+            [car_track, pedestrian_track, bicycle_track], [], []
+        )
+
+        for dataset in datasets.values():
+            batches = dataset.split_by_track_ids(
+                [
+                    [bicycle_track.id, car_track.id],
+                    [pedestrian_track.id, TrackId("missing")],
+                    [],
+                ]
+            )
+
+            assert len(batches) == 3
+            assert_track_dataset_has_tracks(batches[0], [car_track, bicycle_track])
+            assert_track_dataset_has_tracks(batches[1], [pedestrian_track])
+            assert batches[2].empty
+
+
+def create_square_area(name: str, start: float, end: float) -> Area:
+    return Area(
+        SectionId(name),
+        name,
+        {},
+        {},
+        [
+            Coordinate(start, start),
+            Coordinate(end, start),
+            Coordinate(end, end),
+            Coordinate(start, end),
+            Coordinate(start, start),
+        ],
+    )
+
+
+class TestAreaTransitions:
+    def test_from_masks(self) -> None:
+        first, second = SectionId("first"), SectionId("second")
+        contained = {
+            TrackId("1"): [
+                (first, [False, True, True, False]),
+                (second, [True, False, False, True]),
+            ],
+            TrackId("2"): [(first, [True, True])],
+        }
+
+        transitions = AreaTransitions.from_masks(contained)
+
+        assert_area_transitions_equal(
+            transitions,
+            AreaTransitions(
+                track_id=["1", "1", "1", "1", "1", "2"],
+                section_id=[first, first, second, second, second, first],
+                index=[1, 3, 0, 1, 3, 0],
+                entered=[True, False, True, False, True, True],
+            ),
+        )
+
+    def test_concat(self) -> None:
+        section = SectionId("section")
+        first = AreaTransitions(["1"], [section], [0], [True])
+        second = AreaTransitions(["2", "2"], [section, section], [1, 2], [True, False])
+
+        assert_area_transitions_equal(
+            AreaTransitions.concat([first, second]),
+            AreaTransitions(
+                ["1", "2", "2"], [section] * 3, [0, 1, 2], [True, True, False]
+            ),
+        )
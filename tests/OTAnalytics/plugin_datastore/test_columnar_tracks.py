@@ -0,0 +1,151 @@
+import pickle
+from pathlib import Path
+
+import numpy
+import pytest
+from pandas import DataFrame, concat
+
+from OTAnalytics.domain import track
+from OTAnalytics.domain.track import Track
+from OTAnalytics.domain.track_dataset import TRACK_GEOMETRY_FACTORY
+from OTAnalytics.plugin_datastore.columnar_tracks import (
+    ColumnarTracks,
+    TrackSelection,
+    UnsupportedColumnError,
+    split_selections,
+)
+from OTAnalytics.plugin_datastore.track_store import PandasTrackDataset
+
+
+@pytest.fixture
+def data(
+    car_track: Track,
+    pedestrian_track: Track,
+    track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+) -> DataFrame:
+    return PandasTrackDataset.from_list(
+        [pedestrian_track, car_track], track_geometry_factory
+    ).get_data()
+
+
+class TestColumnarTracks:
+    def test_from_dataframe(self, data: DataFrame) -> None:
+        tracks = ColumnarTracks.from_dataframe(data)
+
+        assert list(tracks.track_ids) == ["1", "2"]
+        assert list(tracks.offsets) == [0, 2, 5]
+        assert tracks.to_dataframe(numpy.arange(2)).equals(data)
+
+    def test_keep_categoricals(self, data: DataFrame) -> None:
+        data = data.astype({track.CLASSIFICATION: "category"})
+
+        actual = ColumnarTracks.from_dataframe(data).to_dataframe(numpy.arange(2))
+
+        assert actual.dtypes.equals(data.dtypes)
+
+    def test_save_and_load(self, data: DataFrame, tmp_path: Path) -> None:
+        ColumnarTracks.from_dataframe(data).save(tmp_path)
+
+        loaded = ColumnarTracks.load(tmp_path)
+
+        assert isinstance(loaded.columns[track.X], numpy.memmap)
+        assert loaded.to_dataframe(numpy.array([1])).equals(data.loc[["2"]])
+
+    def test_pickle_memory_mapped_tracks_by_directory(
+        self, data: DataFrame, tmp_path: Path
+    ) -> None:
+        ColumnarTracks.from_dataframe(data).save(tmp_path)
+        loaded = ColumnarTracks.load(tmp_path)
+
+        unpickled = pickle.loads(pickle.dumps(loaded))
+
+        assert unpickled.directory == tmp_path
+        assert unpickled.to_dataframe(numpy.arange(2)).equals(data)
+
+    def test_find(self, data: DataFrame) -> None:
+        tracks = ColumnarTracks.from_dataframe(data)
+
+        assert list(tracks.find(["2", "0", "1", "3"])) == [1, -1, 0, -1]
+
+    def test_rows(self, data: DataFrame) -> None:
+        tracks = ColumnarTracks.from_dataframe(data)
+
+        assert list(tracks.rows(numpy.array([1, 0]))) == [2, 3, 4, 0, 1]
+
+    @pytest.mark.parametrize("positions", [[0, 1], [1], [0], []])
+    def test_select(self, data: DataFrame, positions: list[int]) -> None:
+        tracks = ColumnarTracks.from_dataframe(data)
+
+        selected = tracks.select(numpy.array(positions, dtype=int))
+
+        assert list(selected.track_ids) == [str(p + 1) for p in positions]
+        assert selected.to_dataframe(numpy.arange(len(positions))).equals(
+            tracks.to_dataframe(numpy.array(positions, dtype=int))
+        )
+
+    def test_merge(self, data: DataFrame) -> None:
+        pedestrian = data.loc[["2"]].copy()
+        pedestrian[track.VIDEO_NAME] = "other.mp4"
+        car = data.loc[["1"]]
+        expected = ColumnarTracks.from_dataframe(concat([car, pedestrian]))
+
+        merged = ColumnarTracks.merge(
+            [
+                ColumnarTracks.from_dataframe(pedestrian),
+                ColumnarTracks.from_dataframe(car),
+            ]
+        )
+
+        assert merged.spec_of(track.VIDEO_NAME) == expected.spec_of(track.VIDEO_NAME)
+        assert merged.to_dataframe(numpy.arange(2)).equals(
+            expected.to_dataframe(numpy.arange(2))
+        )
+
+    def test_merge_different_columns(self, data: DataFrame) -> None:
+        car = ColumnarTracks.from_dataframe(data.loc[["1"]])
+        pedestrian = ColumnarTracks.from_dataframe(
+            data.loc[["2"]].drop(columns=[track.VIDEO_NAME])
+        )
+
+        with pytest.raises(UnsupportedColumnError):
+            ColumnarTracks.merge([car, pedestrian])
+
+    def test_track_view(self, data: DataFrame, pedestrian_track: Track) -> None:
+        tracks = ColumnarTracks.from_dataframe(data)
+
+        actual = tracks.track(1)
+
+        assert actual.id == pedestrian_track.id
+        assert actual.classification == pedestrian_track.classification
+        assert actual.last_detection.to_dict() == (
+            pedestrian_track.last_detection.to_dict()
+        )
+        assert actual.get_detection(1) == tracks.track(1).detections[1]
+
+    def test_unsupported_column(self, data: DataFrame) -> None:
+        data[track.VIDEO_NAME] = None
+
+        with pytest.raises(UnsupportedColumnError):
+            ColumnarTracks.from_dataframe(data)
+
+
+class TestTrackSelection:
+    def test_lengths_and_filter(self, data: DataFrame) -> None:
+        selection = TrackSelection.all(ColumnarTracks.from_dataframe(data))
+
+        filtered = selection.filter(selection.lengths > 2)
+
+        assert list(filtered.track_ids) == ["2"]
+        assert list(selection.without(numpy.array([0])).positions) == [1]
+        assert list(filtered.find(["1", "2"])) == [-1, 1]
+
+    def test_split_selections(self, data: DataFrame) -> None:
+        tracks = ColumnarTracks.from_dataframe(data)
+        selections = [TrackSelection.all(tracks), TrackSelection.all(tracks)]
+
+        chunks = split_selections(selections, 3)
+
+        assert [[len(selection) for selection in chunk] for chunk in chunks] == [
+            [2, 1],
+            [1],
+        ]
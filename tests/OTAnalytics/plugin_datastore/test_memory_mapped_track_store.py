@@ -0,0 +1,404 @@
+import pickle
+from pathlib import Path
+
+import pytest
+
+from OTAnalytics.domain.geometry import RelativeOffsetCoordinate
+from OTAnalytics.domain.section import LineSection
+from OTAnalytics.domain.track import Track, TrackId
+from OTAnalytics.domain.track_dataset import (
+    TRACK_GEOMETRY_FACTORY,
+    TrackDoesNotExistError,
+)
+from OTAnalytics.plugin_datastore.memory_mapped_track_store import (
+    FilteredMemoryMappedTrackDataset,
+    MemoryMappedTrackDataset,
+    MemoryMappedTrackSharing,
+    MemoryMappedTrackStore,
+)
+from OTAnalytics.plugin_datastore.track_store import PandasTrackDataset
+from tests.utils.assertions import (
+    assert_equal_track_properties,
+    assert_track_datasets_equal,
+)
+from tests.utils.builders.track_builder import TrackBuilder, create_track
+from tests.utils.builders.track_segment_builder import TrackSegmentDatasetBuilder
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> MemoryMappedTrackStore:
+    return MemoryMappedTrackStore(tmp_path)
+
+
+@pytest.fixture
+def empty_dataset(
+    store: MemoryMappedTrackStore, track_geometry_factory: TRACK_GEOMETRY_FACTORY
+) -> MemoryMappedTrackDataset:
+    return MemoryMappedTrackDataset(store, track_geometry_factory, batch_size=1)
+
+
+@pytest.fixture
+def dataset(
+    empty_dataset: MemoryMappedTrackDataset, car_track: Track, pedestrian_track: Track
+) -> MemoryMappedTrackDataset:
+    return empty_dataset.add_all([car_track, pedestrian_track])
+
+
+class TestMemoryMappedTrackDataset:
+    def test_add_all(
+        self,
+        dataset: MemoryMappedTrackDataset,
+        car_track: Track,
+        pedestrian_track: Track,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+    ) -> None:
+        expected = PandasTrackDataset.from_list(
+            [car_track, pedestrian_track], track_geometry_factory
+        )
+
+        assert len(dataset) == 2
+        assert_track_datasets_equal(dataset, expected)
+
+    def test_add_nothing(self, empty_dataset: MemoryMappedTrackDataset) -> None:
+        assert empty_dataset.add_all([]) is empty_dataset
+        assert empty_dataset.empty
+
+    def test_add_many_merges_continued_tracks(
+        self,
+        dataset: MemoryMappedTrackDataset,
+        car_track: Track,
+        car_track_continuing: Track,
+        pedestrian_track: Track,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+    ) -> None:
+        expected = PandasTrackDataset.from_list(
+            [car_track, car_track_continuing, pedestrian_track],
+            track_geometry_factory,
+        )
+
+        merged = dataset.add_many(
+            [
+                PandasTrackDataset.from_list(
+                    [car_track_continuing], track_geometry_factory
+                )
+            ]
+        )
+
+        assert len(merged) == 2
+        assert_track_datasets_equal(merged, expected)
+        assert merged.get_data().equals(expected.get_data())
+
+    def test_get_for(self, dataset: MemoryMappedTrackDataset, car_track: Track) -> None:
+        actual = dataset.get_for(car_track.id)
+
+        assert actual is not None
+        assert_equal_track_properties(actual, car_track)
+        assert dataset.get_for(TrackId("missing")) is None
+
+    def test_get_detections_at_of_several_files(
+        self,
+        empty_dataset: MemoryMappedTrackDataset,
+        car_track: Track,
+        pedestrian_track: Track,
+    ) -> None:
+        offset = RelativeOffsetCoordinate(0, 0)
+        dataset = empty_dataset.add_all([car_track]).add_all([pedestrian_track])
+
+        selection = dataset.get_detections_at(
+            [pedestrian_track.id, car_track.id], [1, 0], offset
+        )
+
+        assert list(selection.track_id) == [pedestrian_track.id.id, car_track.id.id]
+        assert [int(frame) for frame in selection.frame] == [
+            pedestrian_track.detections[1].frame,
+            car_track.detections[0].frame,
+        ]
+        with pytest.raises(TrackDoesNotExistError):
+            dataset.get_detections_at([TrackId("missing")], [0], offset)
+
+    def test_remove(
+        self,
+        dataset: MemoryMappedTrackDataset,
+        car_track: Track,
+        pedestrian_track: Track,
+    ) -> None:
+        assert dataset.remove(car_track.id).track_ids == {pedestrian_track.id}
+        assert dataset.remove_multiple({car_track.id, pedestrian_track.id}).empty
+        assert dataset.clear().empty
+        assert len(dataset) == 2
+
+    def test_properties(
+        self,
+        dataset: MemoryMappedTrackDataset,
+        empty_dataset: MemoryMappedTrackDataset,
+        car_track: Track,
+        pedestrian_track: Track,
+    ) -> None:
+        assert dataset.track_ids == {car_track.id, pedestrian_track.id}
+        assert dataset.first_occurrence == car_track.first_detection.occurrence
+        assert dataset.last_occurrence == pedestrian_track.last_detection.occurrence
+        assert dataset.classifications == {
+            car_track.classification,
+            pedestrian_track.classification,
+        }
+        assert empty_dataset.first_occurrence is None
+        assert empty_dataset.last_occurrence is None
+        assert empty_dataset.classifications == frozenset()
+
+    @pytest.mark.parametrize(
+        "num_tracks,batches,expected_batches", [(10, 1, 1), (10, 4, 4), (3, 4, 3)]
+    )
+    def test_split(
+        self,
+        empty_dataset: MemoryMappedTrackDataset,
+        num_tracks: int,
+        batches: int,
+        expected_batches: int,
+    ) -> None:
+        tracks = [
+            create_track(str(number), [(1, 1), (2, 2)], 1)
+            for number in range(num_tracks)
+        ]
+        dataset = empty_dataset.add_all(tracks[:2]).add_all(tracks[2:])
+
+        split = dataset.split(batches)
+
+        assert len(split) == expected_batches
+        assert sum(len(batch) for batch in split) == num_tracks
+        assert frozenset().union(*(batch.track_ids for batch in split)) == (
+            dataset.track_ids
+        )
+
+    def test_pickle_split_dataset(self, dataset: MemoryMappedTrackDataset) -> None:
+        first, second = dataset.split(2)
+
+        unpickled = pickle.loads(pickle.dumps(second))
+
+        assert unpickled.track_ids == second.track_ids
+        assert unpickled.get_data().equals(second.get_data())
+
+    def test_filter_by_min_detection_length(
+        self, dataset: MemoryMappedTrackDataset, pedestrian_track: Track
+    ) -> None:
+        assert dataset.filter_by_min_detection_length(3).track_ids == {
+            pedestrian_track.id
+        }
+
+    def test_get_first_segments(
+        self,
+        dataset: MemoryMappedTrackDataset,
+        car_track: Track,
+        pedestrian_track: Track,
+        pandas_track_segment_dataset_builder: TrackSegmentDatasetBuilder,
+    ) -> None:
+        pandas_track_segment_dataset_builder.add_first_segments(
+            [car_track, pedestrian_track]
+        )
+
+        assert dataset.get_first_segments() == (
+            pandas_track_segment_dataset_builder.build()
+        )
+
+    def test_get_last_segments(
+        self,
+        dataset: MemoryMappedTrackDataset,
+        car_track: Track,
+        pedestrian_track: Track,
+        pandas_track_segment_dataset_builder: TrackSegmentDatasetBuilder,
+    ) -> None:
+        pandas_track_segment_dataset_builder.add_last_segments(
+            [car_track, pedestrian_track]
+        )
+
+        assert dataset.get_last_segments() == (
+            pandas_track_segment_dataset_builder.build()
+        )
+
+    def test_cut_with_section(
+        self,
+        cutting_section_test_case: tuple[
+            LineSection, list[Track], list[Track], set[TrackId]
+        ],
+        empty_dataset: MemoryMappedTrackDataset,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+    ) -> None:
+        (
+            cutting_section,
+            input_tracks,
+            expected_tracks,
+            expected_original_track_ids,
+        ) = cutting_section_test_case
+        expected_dataset = PandasTrackDataset.from_list(
+            expected_tracks, track_geometry_factory
+        )
+        dataset = empty_dataset.add_all(input_tracks)
+
+        cut_track_dataset, original_track_ids = dataset.cut_with_section(
+            cutting_section, RelativeOffsetCoordinate(0, 0)
+        )
+
+        assert original_track_ids == expected_original_track_ids
+        assert_track_datasets_equal(cut_track_dataset, expected_dataset)
+
+    def test_intersection_points(
+        self,
+        cutting_section_test_case: tuple[
+            LineSection, list[Track], list[Track], set[TrackId]
+        ],
+        empty_dataset: MemoryMappedTrackDataset,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+    ) -> None:
+        section, input_tracks, _, _ = cutting_section_test_case
+        offset = RelativeOffsetCoordinate(0, 0)
+        expected = PandasTrackDataset.from_list(input_tracks, track_geometry_factory)
+
+        dataset = empty_dataset.add_all(input_tracks)
+
+        assert dataset.intersection_points([section], offset) == (
+            expected.intersection_points([section], offset)
+        )
+        assert dataset.intersecting_tracks([section], offset) == (
+            expected.intersecting_tracks([section], offset)
+        )
+
+    def test_keep_single_batch_loaded(
+        self,
+        cutting_section_test_case: tuple[
+            LineSection, list[Track], list[Track], set[TrackId]
+        ],
+        store: MemoryMappedTrackStore,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+    ) -> None:
+        section, input_tracks, _, _ = cutting_section_test_case
+        offset = RelativeOffsetCoordinate(0, 0)
+        tracks = MemoryMappedTrackDataset(store, track_geometry_factory).add_all(
+            input_tracks
+        )
+        (dataset,) = tracks.split_by_track_ids([[track.id for track in input_tracks]])
+
+        intersection_points = dataset.intersection_points([section], offset)
+        loaded = dataset._loaded
+        unpickled = pickle.loads(pickle.dumps(dataset))
+
+        assert loaded is not None
+        assert dataset.intersection_points([section], offset) == intersection_points
+        assert dataset._loaded is loaded
+        assert unpickled._loaded is None
+        assert unpickled.intersection_points([section], offset) == intersection_points
+
+    def test_do_not_keep_dataset_of_repository_loaded(
+        self,
+        cutting_section_test_case: tuple[
+            LineSection, list[Track], list[Track], set[TrackId]
+        ],
+        store: MemoryMappedTrackStore,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+    ) -> None:
+        section, input_tracks, _, _ = cutting_section_test_case
+        offset = RelativeOffsetCoordinate(0, 0)
+        dataset = MemoryMappedTrackDataset(store, track_geometry_factory).add_all(
+            input_tracks
+        )
+
+        dataset.intersection_points([section], offset)
+        dataset.get_detections_at([input_tracks[0].id], [0], offset)
+
+        assert dataset._loaded is None
+
+    def test_get_max_confidences_for(
+        self,
+        dataset: MemoryMappedTrackDataset,
+        empty_dataset: MemoryMappedTrackDataset,
+        car_track: Track,
+        pedestrian_track: Track,
+    ) -> None:
+        car_id = car_track.id.id
+        pedestrian_id = pedestrian_track.id.id
+
+        result = dataset.get_max_confidences_for([car_id, pedestrian_id])
+
+        assert result == {car_id: 0.8, pedestrian_id: 0.9}
+        with pytest.raises(TrackDoesNotExistError):
+            empty_dataset.get_max_confidences_for([car_id])
+
+    def test_remove_files_of_unused_tracks(
+        self, empty_dataset: MemoryMappedTrackDataset, store: MemoryMappedTrackStore
+    ) -> None:
+        builder = TrackBuilder()
+        builder.append_detection()
+        builder.append_detection()
+        dataset = empty_dataset.add_all([builder.build_track()])
+        assert len(list(store.directory.iterdir())) == 1
+
+        del dataset
+
+        assert list(store.directory.iterdir()) == []
+
+
+class TestFilteredMemoryMappedTrackDataset:
+    def test_filter_by_classes(
+        self, dataset: MemoryMappedTrackDataset, car_track: Track
+    ) -> None:
+        included = FilteredMemoryMappedTrackDataset(
+            dataset, frozenset([car_track.classification]), frozenset()
+        )
+        excluded = FilteredMemoryMappedTrackDataset(
+            dataset, frozenset(), frozenset([car_track.classification])
+        )
+
+        assert included.track_ids == {car_track.id}
+        assert car_track.id not in excluded.track_ids
+        assert len(excluded) == 1
+
+
+class TestMemoryMappedTrackSharing:
+    def test_share_tracks(
+        self,
+        store: MemoryMappedTrackStore,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+        car_track: Track,
+        pedestrian_track: Track,
+    ) -> None:
+        tracks = PandasTrackDataset.from_list(
+            [car_track, pedestrian_track], track_geometry_factory
+        )
+        share_tracks = MemoryMappedTrackSharing(store, track_geometry_factory)
+
+        shared = share_tracks(tracks)
+        unpickled = pickle.loads(pickle.dumps(shared))
+
+        assert isinstance(shared, MemoryMappedTrackDataset)
+        assert_track_datasets_equal(shared, tracks)
+        assert_track_datasets_equal(unpickled, tracks)
+        assert len(list(store.directory.iterdir())) == 1
+
+    def test_reuse_shared_tracks(
+        self,
+        store: MemoryMappedTrackStore,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+        car_track: Track,
+        pedestrian_track: Track,
+    ) -> None:
+        tracks = PandasTrackDataset.from_list([car_track], track_geometry_factory)
+        share_tracks = MemoryMappedTrackSharing(store, track_geometry_factory)
+
+        shared = share_tracks(tracks)
+        assert share_tracks(tracks) is shared
+
+        changed = tracks.add_all([pedestrian_track])
+        shared_changed = share_tracks(changed)
+
+        assert shared_changed is not shared
+        assert shared_changed.track_ids == {car_track.id, pedestrian_track.id}
+
+    def test_keep_memory_mapped_tracks(
+        self,
+        store: MemoryMappedTrackStore,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+        dataset: MemoryMappedTrackDataset,
+    ) -> None:
+        filtered = FilteredMemoryMappedTrackDataset(dataset, frozenset(), frozenset())
+        share_tracks = MemoryMappedTrackSharing(store, track_geometry_factory)
+
+        assert share_tracks(dataset) is dataset
+        assert share_tracks(filtered) is filtered
@@ -0,0 +1,336 @@
+import pickle
+from unittest.mock import Mock
+
+import pytest
+
+from OTAnalytics.domain.geometry import RelativeOffsetCoordinate
+from OTAnalytics.domain.section import LineSection
+from OTAnalytics.domain.track import Track, TrackId
+from OTAnalytics.domain.track_dataset import (
+    TRACK_GEOMETRY_FACTORY,
+    TrackDoesNotExistError,
+)
+from OTAnalytics.plugin_datastore.columnar_tracks import ColumnarTracks, NumpyTrack
+from OTAnalytics.plugin_datastore.numpy_track_store import (
+    FilteredNumpyTrackDataset,
+    NumpyTrackDataset,
+)
+from OTAnalytics.plugin_datastore.track_store import PandasTrackDataset
+from tests.utils.assertions import (
+    assert_equal_detection_properties,
+    assert_equal_track_properties,
+    assert_track_datasets_equal,
+)
+from tests.utils.builders.track_builder import create_track
+from tests.utils.builders.track_dataset_provider import create_mock_geometry_dataset
+from tests.utils.builders.track_segment_builder import TrackSegmentDatasetBuilder
+
+
+def create_tracks(
+    tracks: list[Track], track_geometry_factory: TRACK_GEOMETRY_FACTORY
+) -> ColumnarTracks:
+    return ColumnarTracks.from_dataframe(
+        PandasTrackDataset.from_list(tracks, track_geometry_factory).get_data()
+    )
+
+
+@pytest.fixture
+def empty_dataset(track_geometry_factory: TRACK_GEOMETRY_FACTORY) -> NumpyTrackDataset:
+    return NumpyTrackDataset(track_geometry_factory)
+
+
+@pytest.fixture
+def dataset(
+    empty_dataset: NumpyTrackDataset, car_track: Track, pedestrian_track: Track
+) -> NumpyTrackDataset:
+    return empty_dataset.add_all([car_track, pedestrian_track])
+
+
+class TestNumpyTrackDataset:
+    def test_add_all(
+        self,
+        dataset: NumpyTrackDataset,
+        car_track: Track,
+        pedestrian_track: Track,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+    ) -> None:
+        expected = PandasTrackDataset.from_list(
+            [car_track, pedestrian_track], track_geometry_factory
+        )
+
+        assert len(dataset) == 2
+        assert_track_datasets_equal(dataset, expected)
+        assert dataset.get_data().equals(expected.get_data())
+
+    def test_add_nothing(self, empty_dataset: NumpyTrackDataset) -> None:
+        assert empty_dataset.add_all([]) is empty_dataset
+        assert empty_dataset.empty
+
+    def test_add_many_merges_continued_tracks(
+        self,
+        dataset: NumpyTrackDataset,
+        car_track: Track,
+        car_track_continuing: Track,
+        pedestrian_track: Track,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+    ) -> None:
+        expected = PandasTrackDataset.from_list(
+            [car_track, car_track_continuing, pedestrian_track],
+            track_geometry_factory,
+        )
+
+        merged = dataset.add_many(
+            [
+                PandasTrackDataset.from_list(
+                    [car_track_continuing], track_geometry_factory
+                )
+            ]
+        )
+
+        assert len(merged) == 2
+        assert_track_datasets_equal(merged, expected)
+
+    def test_add_many_updates_geometries(
+        self,
+        car_track: Track,
+        pedestrian_track: Track,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+    ) -> None:
+        offset = RelativeOffsetCoordinate(0, 0)
+        geometry_dataset, updated_geometry_dataset = create_mock_geometry_dataset()
+        dataset = NumpyTrackDataset(
+            track_geometry_factory,
+            create_tracks([car_track], track_geometry_factory),
+            {offset: geometry_dataset},
+        )
+
+        result = dataset.add_all([pedestrian_track])
+
+        geometry_dataset.remove.assert_called_once_with([pedestrian_track.id.id])
+        updated_geometry_dataset.add_all.assert_called_once()
+        assert result._geometry_datasets == {
+            offset: updated_geometry_dataset.add_all.return_value
+        }
+
+    def test_get_for_returns_view(
+        self, dataset: NumpyTrackDataset, car_track: Track
+    ) -> None:
+        actual = dataset.get_for(car_track.id)
+
+        assert isinstance(actual, NumpyTrack)
+        assert_equal_track_properties(actual, car_track)
+        assert dataset.get_for(TrackId("missing")) is None
+
+    def test_get_detection(self, dataset: NumpyTrackDataset, car_track: Track) -> None:
+        actual = dataset.get_for(car_track.id)
+
+        assert actual is not None
+        assert_equal_detection_properties(
+            actual.get_detection(1), car_track.get_detection(1)
+        )
+        assert_equal_detection_properties(
+            actual.last_detection, car_track.last_detection
+        )
+        with pytest.raises(IndexError):
+            actual.get_detection(len(car_track.detections))
+
+    def test_remove(
+        self,
+        dataset: NumpyTrackDataset,
+        car_track: Track,
+        pedestrian_track: Track,
+    ) -> None:
+        assert dataset.remove(car_track.id).track_ids == {pedestrian_track.id}
+        assert dataset.remove(TrackId("missing")) is dataset
+        assert dataset.remove_multiple({car_track.id, pedestrian_track.id}).empty
+        assert dataset.clear().empty
+        assert len(dataset) == 2
+
+    def test_properties(
+        self,
+        dataset: NumpyTrackDataset,
+        empty_dataset: NumpyTrackDataset,
+        car_track: Track,
+        pedestrian_track: Track,
+    ) -> None:
+        assert dataset.track_ids == {car_track.id, pedestrian_track.id}
+        assert dataset.first_occurrence == car_track.first_detection.occurrence
+        assert dataset.last_occurrence == pedestrian_track.last_detection.occurrence
+        assert dataset.classifications == {
+            car_track.classification,
+            pedestrian_track.classification,
+        }
+        assert empty_dataset.first_occurrence is None
+        assert empty_dataset.last_occurrence is None
+        assert empty_dataset.classifications == frozenset()
+
+    @pytest.mark.parametrize(
+        "num_tracks,batches,expected_batches", [(10, 1, 1), (10, 4, 4), (3, 4, 3)]
+    )
+    def test_split(
+        self,
+        empty_dataset: NumpyTrackDataset,
+        num_tracks: int,
+        batches: int,
+        expected_batches: int,
+    ) -> None:
+        tracks = [
+            create_track(str(number), [(1, 1), (2, 2)], 1)
+            for number in range(num_tracks)
+        ]
+        dataset = empty_dataset.add_all(tracks)
+
+        split = dataset.split(batches)
+
+        assert len(split) == expected_batches
+        assert sum(len(batch) for batch in split) == num_tracks
+        assert frozenset().union(*(batch.track_ids for batch in split)) == (
+            dataset.track_ids
+        )
+
+    def test_split_keeps_geometries(
+        self,
+        car_track: Track,
+        pedestrian_track: Track,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+    ) -> None:
+        offset = RelativeOffsetCoordinate(0, 0)
+        first_geometries = Mock()
+        second_geometries = Mock()
+        geometry_dataset, _ = create_mock_geometry_dataset(
+            [first_geometries, second_geometries]
+        )
+        dataset = NumpyTrackDataset(
+            track_geometry_factory,
+            create_tracks([car_track, pedestrian_track], track_geometry_factory),
+            {offset: geometry_dataset},
+        )
+
+        first, second = dataset.split(2)
+
+        assert first._geometry_datasets == {offset: first_geometries}
+        assert second._geometry_datasets == {offset: second_geometries}
+
+    def test_pickle_split_dataset(self, dataset: NumpyTrackDataset) -> None:
+        _, second = dataset.split(2)
+
+        unpickled = pickle.loads(pickle.dumps(second))
+
+        assert unpickled.track_ids == second.track_ids
+        assert unpickled.get_data().equals(second.get_data())
+
+    def test_filter_by_min_detection_length(
+        self, dataset: NumpyTrackDataset, pedestrian_track: Track
+    ) -> None:
+        assert dataset.filter_by_min_detection_length(3).track_ids == {
+            pedestrian_track.id
+        }
+
+    def test_get_first_segments(
+        self,
+        dataset: NumpyTrackDataset,
+        car_track: Track,
+        pedestrian_track: Track,
+        pandas_track_segment_dataset_builder: TrackSegmentDatasetBuilder,
+    ) -> None:
+        pandas_track_segment_dataset_builder.add_first_segments(
+            [car_track, pedestrian_track]
+        )
+
+        assert dataset.get_first_segments() == (
+            pandas_track_segment_dataset_builder.build()
+        )
+
+    def test_get_last_segments(
+        self,
+        dataset: NumpyTrackDataset,
+        car_track: Track,
+        pedestrian_track: Track,
+        pandas_track_segment_dataset_builder: TrackSegmentDatasetBuilder,
+    ) -> None:
+        pandas_track_segment_dataset_builder.add_last_segments(
+            [car_track, pedestrian_track]
+        )
+
+        assert dataset.get_last_segments() == (
+            pandas_track_segment_dataset_builder.build()
+        )
+
+    def test_cut_with_section(
+        self,
+        cutting_section_test_case: tuple[
+            LineSection, list[Track], list[Track], set[TrackId]
+        ],
+        empty_dataset: NumpyTrackDataset,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+    ) -> None:
+        (
+            cutting_section,
+            input_tracks,
+            expected_tracks,
+            expected_original_track_ids,
+        ) = cutting_section_test_case
+        expected_dataset = PandasTrackDataset.from_list(
+            expected_tracks, track_geometry_factory
+        )
+        dataset = empty_dataset.add_all(input_tracks)
+
+        cut_track_dataset, original_track_ids = dataset.cut_with_section(
+            cutting_section, RelativeOffsetCoordinate(0, 0)
+        )
+
+        assert original_track_ids == expected_original_track_ids
+        assert_track_datasets_equal(cut_track_dataset, expected_dataset)
+
+    def test_intersection_points(
+        self,
+        cutting_section_test_case: tuple[
+            LineSection, list[Track], list[Track], set[TrackId]
+        ],
+        empty_dataset: NumpyTrackDataset,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+    ) -> None:
+        section, input_tracks, _, _ = cutting_section_test_case
+        offset = RelativeOffsetCoordinate(0, 0)
+        expected = PandasTrackDataset.from_list(input_tracks, track_geometry_factory)
+
+        dataset = empty_dataset.add_all(input_tracks)
+
+        assert dataset.intersection_points([section], offset) == (
+            expected.intersection_points([section], offset)
+        )
+        assert dataset.intersecting_tracks([section], offset) == (
+            expected.intersecting_tracks([section], offset)
+        )
+
+    def test_get_max_confidences_for(
+        self,
+        dataset: NumpyTrackDataset,
+        empty_dataset: NumpyTrackDataset,
+        car_track: Track,
+        pedestrian_track: Track,
+    ) -> None:
+        car_id = car_track.id.id
+        pedestrian_id = pedestrian_track.id.id
+
+        result = dataset.get_max_confidences_for([car_id, pedestrian_id])
+
+        assert result == {car_id: 0.8, pedestrian_id: 0.9}
+        with pytest.raises(TrackDoesNotExistError):
+            empty_dataset.get_max_confidences_for([car_id])
+
+
+class TestFilteredNumpyTrackDataset:
+    def test_filter_by_classes(
+        self, dataset: NumpyTrackDataset, car_track: Track
+    ) -> None:
+        included = FilteredNumpyTrackDataset(
+            dataset, frozenset([car_track.classification]), frozenset()
+        )
+        excluded = FilteredNumpyTrackDataset(
+            dataset, frozenset(), frozenset([car_track.classification])
+        )
+
+        assert included.track_ids == {car_track.id}
+        assert car_track.id not in excluded.track_ids
+        assert len(excluded) == 1
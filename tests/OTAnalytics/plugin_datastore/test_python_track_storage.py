@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import cast
 from unittest.mock import Mock, call
@@ -32,6 +32,7 @@ from OTAnalytics.domain.track_dataset import (
     TRACK_GEOMETRY_FACTORY,
     TrackDoesNotExistError,
     TrackGeometryDataset,
+    TrackSummary,
 )
 from OTAnalytics.plugin_datastore.python_track_store import (
     ByMaxConfidence,
@@ -40,6 +41,7 @@ from OTAnalytics.plugin_datastore.python_track_store import (
     PythonTrackDataset,
     PythonTrackSegment,
     PythonTrackSegmentDataset,
+    PythonTrackSummaryDataset,
     SimpleCutTrackSegmentBuilder,
     create_segment_for,
 )
@@ -319,6 +321,47 @@ class TestPythonTrackSegmentDataset:
         consumer.assert_not_called()
 
 
+class TestPythonTrackSummaryDataset:
+    def test_get_ids_alive_between_with_mixed_lifetimes(self) -> None:
+        origin = datetime(2020, 1, 1)
+        lifetimes = [(0, 1000), (10, 11), (20, 20), (30, 34), (500, 508), (990, 1000)]
+        summaries = [
+            TrackSummary(
+                TrackId(str(position)),
+                "car",
+                origin + timedelta(seconds=start),
+                origin + timedelta(seconds=end),
+                2,
+                0.5,
+                0,
+                0,
+                1,
+                1,
+            )
+            for position, (start, end) in enumerate(lifetimes)
+        ]
+        dataset = PythonTrackSummaryDataset(
+            {summary.id: summary for summary in summaries}
+        )
+        windows: list[tuple[datetime | None, datetime | None]] = [
+            (None, None),
+            (origin + timedelta(seconds=20), origin + timedelta(seconds=20)),
+            (origin + timedelta(seconds=33), None),
+            (None, origin + timedelta(seconds=10)),
+            (origin + timedelta(seconds=12), origin + timedelta(seconds=499)),
+            (origin + timedelta(seconds=1001), None),
+        ]
+
+        for start, end in windows:
+            expected = [
+                summary.id
+                for summary in summaries
+                if (start is None or summary.end >= start)
+                and (end is None or summary.start <= end)
+            ]
+            assert dataset.get_ids_alive_between(start, end) == expected
+
+
 class TestPythonTrackDataset:
     @staticmethod
     def create_track_dataset(size: int) -> PythonTrackDataset:
@@ -391,6 +434,35 @@ class TestPythonTrackDataset:
             RelativeOffsetCoordinate(0.5, 0.5): updated_geometry_dataset_with_offset,
         }
 
+    def test_add_many_merges_tracks_at_once(
+        self, car_track: Track, car_track_continuing: Track, pedestrian_track: Track
+    ) -> None:
+        geometry_dataset, updated_geometry_dataset = create_mock_geometry_dataset()
+        offset = RelativeOffsetCoordinate(0, 0)
+        dataset = PythonTrackDataset(
+            PygeosTrackGeometryDataset.from_track_dataset,
+            geometry_datasets={offset: cast(TrackGeometryDataset, geometry_dataset)},
+        )
+        first = PythonTrackDataset.from_list(
+            [car_track, pedestrian_track], PygeosTrackGeometryDataset.from_track_dataset
+        )
+        second = PythonTrackDataset.from_list(
+            [car_track_continuing], PygeosTrackGeometryDataset.from_track_dataset
+        )
+
+        merged = dataset.add_many([first, second])
+
+        expected_merged_track = PythonTrack(
+            car_track.id,
+            car_track_continuing.classification,
+            car_track.detections + car_track_continuing.detections,
+        )
+        assert list(merged) == [expected_merged_track, pedestrian_track]
+        assert_track_geometry_dataset_add_all_called_correctly(
+            geometry_dataset.add_all, [expected_merged_track, pedestrian_track]
+        )
+        assert merged._geometry_datasets == {offset: updated_geometry_dataset}
+
     def test_add_nothing(self, car_track: Track) -> None:
         dataset = PythonTrackDataset(PygeosTrackGeometryDataset.from_track_dataset)
         result_dataset = dataset.add_all([car_track]).add_all(
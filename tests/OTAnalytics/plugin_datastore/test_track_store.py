@@ -1,9 +1,11 @@
+import pickle
+from datetime import datetime, timedelta, timezone
 from typing import cast
 from unittest.mock import Mock, call
 
 import numpy
 import pytest
-from pandas import DataFrame, Series
+from pandas import Categorical, DataFrame, Series
 
 from OTAnalytics.domain import track
 from OTAnalytics.domain.geometry import RelativeOffsetCoordinate
@@ -18,16 +20,23 @@ from OTAnalytics.domain.track_dataset import (
 from OTAnalytics.plugin_datastore.python_track_store import (
     PythonTrack,
     PythonTrackDataset,
+    PythonTrackSummaryDataset,
+    create_summary_for,
 )
 from OTAnalytics.plugin_datastore.track_geometry_store.pygeos_store import (
     PygeosTrackGeometryDataset,
 )
 from OTAnalytics.plugin_datastore.track_store import (
+    DetectionColumns,
+    MissingDetectionColumnError,
     PandasDetection,
     PandasTrack,
     PandasTrackDataset,
     PandasTrackSegmentDataset,
+    PandasTrackSummaryDataset,
+    TrackLifetimeIndex,
     _convert_tracks,
+    create_cut_track_ids,
 )
 from tests.utils.assertions import (
     assert_equal_detection_properties,
@@ -40,31 +49,118 @@ from tests.utils.builders.track_dataset_provider import create_mock_geometry_dat
 from tests.utils.builders.track_segment_builder import TrackSegmentDatasetBuilder
 
 
+def create_detection_columns(tracks: list[Track]) -> DetectionColumns:
+    data = _convert_tracks(tracks)
+    data[track.TRACK_CLASSIFICATION] = data[track.CLASSIFICATION]
+    return DetectionColumns(data)
+
+
+class TestDetectionColumns:
+    def test_accept_missing_optional_columns(self) -> None:
+        builder = TrackBuilder()
+        builder.append_detection()
+        data = _classified([builder.build_track()]).drop(
+            columns=[track.VIDEO_NAME, track.INPUT_FILE, track.INTERPOLATED_DETECTION]
+        )
+
+        columns = DetectionColumns(data)
+        detection = PandasDetection(columns, 0, builder.track_id)
+
+        assert detection.x == builder.build_detections()[0].x
+        with pytest.raises(MissingDetectionColumnError):
+            detection.video_name
+        with pytest.raises(MissingDetectionColumnError):
+            detection.input_file
+        with pytest.raises(MissingDetectionColumnError):
+            detection.interpolated_detection
+
+    def test_keep_categorical_columns(self) -> None:
+        first = TrackBuilder()
+        first.add_track_id("1")
+        first.append_detection()
+        first.append_detection()
+        second = TrackBuilder()
+        second.add_track_id("2")
+        second.append_detection()
+        first_track = first.build_track()
+        second_track = second.build_track()
+        categoricals = [
+            track.CLASSIFICATION,
+            track.TRACK_CLASSIFICATION,
+            track.VIDEO_NAME,
+            track.INPUT_FILE,
+        ]
+        data = (
+            _classified([first_track, second_track])
+            .iloc[[0, 2, 1]]
+            .astype({name: "category" for name in categoricals})
+        )
+
+        columns = DetectionColumns(data)
+
+        for name in categoricals:
+            assert isinstance(getattr(columns, name), Categorical)
+        assert_equal_track_properties(columns.track(0), first_track)
+        assert_equal_track_properties(columns.track(1), second_track)
+        detection = columns.track(0).get_detection(1)
+        assert type(detection.classification) is str
+        assert type(detection.video_name) is str
+
+    def test_reject_missing_required_columns(self) -> None:
+        builder = TrackBuilder()
+        builder.append_detection()
+        data = _classified([builder.build_track()]).drop(columns=[track.X])
+
+        with pytest.raises(MissingDetectionColumnError, match=track.X):
+            DetectionColumns(data)
+
+
 class TestPandasDetection:
-    def test_convert_frame_number_to_python_data_type(self) -> None:
-        track_id = "track-id"
-        new_frame_number = 2
+    def test_convert_to_python_data_types(self) -> None:
         builder = TrackBuilder()
-        python_detection = builder.create_detection()
-        detection_values = python_detection.to_dict()
-        detection_values[track.FRAME] = numpy.int64(new_frame_number)
-        data = Series(detection_values)
-        detection = PandasDetection(track_id=track_id, data=data)
+        builder.append_detection()
+        builder.append_detection()
+        columns = create_detection_columns([builder.build_track()])
+
+        detection = PandasDetection(columns, 1, builder.track_id)
 
         assert type(detection.frame) is int
-        assert detection.frame == new_frame_number
+        assert type(detection.x) is float
+        assert type(detection.interpolated_detection) is bool
 
     def test_properties(self) -> None:
         builder = TrackBuilder()
         builder.append_detection()
         python_detection = builder.build_detections()[0]
-        data = Series(
-            python_detection.to_dict(),
-            name=python_detection.occurrence,
-        )
-        pandas_detection = PandasDetection(python_detection.track_id.id, data)
+        columns = create_detection_columns([builder.build_track()])
+
+        pandas_detection = PandasDetection(columns, 0, python_detection.track_id.id)
 
         assert_equal_detection_properties(pandas_detection, python_detection)
+        assert pandas_detection.to_dict() == python_detection.to_dict()
+
+    def test_has_no_instance_dict(self) -> None:
+        builder = TrackBuilder()
+        builder.append_detection()
+        columns = create_detection_columns([builder.build_track()])
+
+        detection = PandasDetection(columns, 0, builder.track_id)
+
+        assert not hasattr(detection, "__dict__")
+
+    def test_equality(self) -> None:
+        builder = TrackBuilder()
+        builder.append_detection()
+        builder.append_detection()
+        tracks = [builder.build_track()]
+        columns = create_detection_columns(tracks)
+        other_columns = create_detection_columns(tracks)
+
+        first = PandasDetection(columns, 0, builder.track_id)
+
+        assert first == PandasDetection(other_columns, 0, builder.track_id)
+        assert first != PandasDetection(columns, 1, builder.track_id)
+        assert hash(first) == hash(PandasDetection(other_columns, 0, builder.track_id))
 
 
 class TestPandasTrack:
@@ -76,13 +172,33 @@ class TestPandasTrack:
         builder.append_detection()
         builder.append_detection()
         python_track = builder.build_track()
-        detections = [detection.to_dict() for detection in python_track.detections]
-        data = DataFrame(detections).set_index([track.OCCURRENCE]).sort_index()
-        data[track.TRACK_CLASSIFICATION] = data[track.CLASSIFICATION]
-        data = data.drop([track.TRACK_ID], axis=1)
-        pandas_track = PandasTrack(python_track.id.id, data)
+        columns = create_detection_columns([python_track])
+
+        pandas_track = PandasTrack(columns, 0)
 
         assert_equal_track_properties(pandas_track, python_track)
+        assert_equal_detection_properties(
+            pandas_track.get_detection(-2), python_track.get_detection(3)
+        )
+
+    def test_unsorted_tracks(self) -> None:
+        first = TrackBuilder()
+        first.add_track_id("1")
+        first.append_detection()
+        first.append_detection()
+        second = TrackBuilder()
+        second.add_track_id("2")
+        second.append_detection()
+        first_track = first.build_track()
+        second_track = second.build_track()
+        data = _convert_tracks([first_track, second_track]).iloc[[0, 2, 1]]
+        data[track.TRACK_CLASSIFICATION] = data[track.CLASSIFICATION]
+
+        columns = DetectionColumns(data)
+
+        assert columns.find("2") == 1
+        assert_equal_track_properties(columns.track(0), first_track)
+        assert_equal_track_properties(columns.track(1), second_track)
 
 
 class TestPandasTrackSegmentDataset:
@@ -110,6 +226,92 @@ class TestPandasTrackSegmentDataset:
         consumer.assert_not_called()
 
 
+class TestPandasTrackSummaryDataset:
+    def test_from_detections(self, car_track: Track, pedestrian_track: Track) -> None:
+        summaries = PandasTrackSummaryDataset.from_detections(
+            _classified([car_track, pedestrian_track])
+        )
+
+        assert len(summaries) == 2
+        assert summaries.as_list() == [
+            create_summary_for(car_track),
+            create_summary_for(pedestrian_track),
+        ]
+        assert summaries.get_for(TrackId("missing")) is None
+
+    def test_add_all_replaces_existing_summaries(
+        self, car_track: Track, car_track_continuing: Track, pedestrian_track: Track
+    ) -> None:
+        summaries = PandasTrackSummaryDataset.from_detections(
+            _classified([car_track, pedestrian_track])
+        )
+        continued = PythonTrackSummaryDataset.from_tracks([car_track_continuing])
+
+        result = summaries.add_all(continued)
+
+        assert len(result) == 2
+        assert result.get_for(car_track.id) == create_summary_for(car_track_continuing)
+        assert result.get_for(pedestrian_track.id) == create_summary_for(
+            pedestrian_track
+        )
+
+    def test_remove_and_filter(self, car_track: Track, pedestrian_track: Track) -> None:
+        summaries = PandasTrackSummaryDataset.from_detections(
+            _classified([car_track, pedestrian_track])
+        )
+
+        assert summaries.remove_multiple({car_track.id}).as_list() == [
+            create_summary_for(pedestrian_track)
+        ]
+        assert summaries.filter_by_min_detection_length(3).as_list() == [
+            create_summary_for(pedestrian_track)
+        ]
+
+    def test_get_max_confidences_for(
+        self, car_track: Track, pedestrian_track: Track
+    ) -> None:
+        summaries = PandasTrackSummaryDataset.from_detections(
+            _classified([car_track, pedestrian_track])
+        )
+
+        assert summaries.get_max_confidences_for([car_track.id.id]) == {"1": 0.8}
+        with pytest.raises(TrackDoesNotExistError):
+            summaries.get_max_confidences_for(["missing"])
+
+
+class TestTrackLifetimeIndex:
+    def test_alive_between_with_mixed_lifetimes(self) -> None:
+        origin = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        lifetimes = [(0, 1000), (10, 11), (20, 20), (30, 34), (500, 508), (990, 1000)]
+        starts = [origin + timedelta(seconds=start) for start, _ in lifetimes]
+        ends = [origin + timedelta(seconds=end) for _, end in lifetimes]
+        track_ids = numpy.array([str(position) for position in range(len(lifetimes))])
+        index = TrackLifetimeIndex(track_ids, Series(starts), Series(ends))
+        windows: list[tuple[datetime | None, datetime | None]] = [
+            (None, None),
+            (origin + timedelta(seconds=20), origin + timedelta(seconds=20)),
+            (origin + timedelta(seconds=33), None),
+            (None, origin + timedelta(seconds=10)),
+            (origin + timedelta(seconds=12), origin + timedelta(seconds=499)),
+            (origin + timedelta(seconds=1001), None),
+        ]
+
+        for start, end in windows:
+            expected = [
+                str(position)
+                for position, (track_start, track_end) in enumerate(zip(starts, ends))
+                if (start is None or track_end >= start)
+                and (end is None or track_start <= end)
+            ]
+            assert index.alive_between(start, end).tolist() == expected
+
+
+def _classified(tracks: list[Track]) -> DataFrame:
+    data = _convert_tracks(tracks)
+    data[track.TRACK_CLASSIFICATION] = data[track.CLASSIFICATION]
+    return data
+
+
 class TestPandasTrackDataset:
     def _create_dataset(self, size: int) -> TrackDataset:
         tracks = []
@@ -215,6 +417,124 @@ class TestPandasTrackDataset:
             assert_equal_track_properties(actual, expected)
         assert merged._geometry_datasets == {}
 
+    def test_add_many(self, track_geometry_factory: TRACK_GEOMETRY_FACTORY) -> None:
+        first_track = self.__build_track("1")
+        second_track = self.__build_track("2")
+        third_track = self.__build_track("3")
+        expected_dataset = PandasTrackDataset.from_list(
+            [first_track, second_track, third_track], track_geometry_factory
+        )
+        dataset = PandasTrackDataset.from_list([first_track], track_geometry_factory)
+
+        merged = dataset.add_many(
+            [
+                PandasTrackDataset.from_list([second_track], track_geometry_factory),
+                PandasTrackDataset.from_list([], track_geometry_factory),
+                PandasTrackDataset.from_list([third_track], track_geometry_factory),
+            ]
+        )
+
+        assert_track_datasets_equal(merged, expected_dataset)
+
+    def test_add_many_reclassifies_tracks_spread_over_datasets(
+        self, track_geometry_factory: TRACK_GEOMETRY_FACTORY
+    ) -> None:
+        first_part = TrackBuilder()
+        first_part.add_track_id("1")
+        first_part.add_detection_class("car")
+        first_part.add_confidence(0.5)
+        first_part.add_second(1)
+        first_part.append_detection()
+        second_part = TrackBuilder()
+        second_part.add_track_id("1")
+        second_part.add_detection_class("bicycle")
+        second_part.add_confidence(0.4)
+        second_part.add_frame(2)
+        second_part.add_second(2)
+        second_part.append_detection()
+        second_part.add_frame(3)
+        second_part.add_second(3)
+        second_part.append_detection()
+        other_track = self.__build_track("2")
+        first = PandasTrackDataset.from_list(
+            [first_part.build_track()], track_geometry_factory
+        )
+        second = PandasTrackDataset.from_list(
+            [second_part.build_track(), other_track], track_geometry_factory
+        )
+
+        merged = PandasTrackDataset(track_geometry_factory).add_many([first, second])
+
+        classifications = (
+            merged.get_data()[track.TRACK_CLASSIFICATION]
+            .groupby(level=track.TRACK_ID)
+            .unique()
+        )
+        assert len(merged.get_data()) == 3 + len(other_track.detections)
+        assert list(classifications["1"]) == ["bicycle"]
+        assert list(classifications["2"]) == [other_track.classification]
+
+    def test_add_many_updates_geometries(
+        self, track_geometry_factory: TRACK_GEOMETRY_FACTORY
+    ) -> None:
+        offset = RelativeOffsetCoordinate(0, 0)
+        dataset = PandasTrackDataset.from_list(
+            [self.__build_track("1")], track_geometry_factory
+        )
+        dataset.calculate_geometries_for([offset])
+
+        merged = dataset.add_many(
+            [
+                PandasTrackDataset.from_list(
+                    [self.__build_track("2")], track_geometry_factory
+                )
+            ]
+        )
+
+        assert merged._geometry_datasets[offset].track_ids == {"1", "2"}
+
+    def test_split_by_track_ids_keeps_geometries(
+        self, track_geometry_factory: TRACK_GEOMETRY_FACTORY
+    ) -> None:
+        offset = RelativeOffsetCoordinate(0, 0)
+        dataset = PandasTrackDataset.from_list(
+            [self.__build_track("1"), self.__build_track("2")], track_geometry_factory
+        )
+        dataset.calculate_geometries_for([offset])
+
+        first, second = dataset.split_by_track_ids([[TrackId("2")], [TrackId("1")]])
+
+        assert first._geometry_datasets[offset].track_ids == {"2"}
+        assert second._geometry_datasets[offset].track_ids == {"1"}
+
+    def test_add_all_keeps_categoricals(
+        self, track_geometry_factory: TRACK_GEOMETRY_FACTORY
+    ) -> None:
+        first = PandasTrackDataset.from_list(
+            [self.__build_track("1")], track_geometry_factory
+        )
+        second = PandasTrackDataset.from_list(
+            [self.__build_track("2")], track_geometry_factory
+        )
+        first_data = first.get_data().astype({track.CLASSIFICATION: "category"})
+        second_data = second.get_data().astype({track.CLASSIFICATION: "category"})
+        second_data[track.CLASSIFICATION] = second_data[
+            track.CLASSIFICATION
+        ].cat.rename_categories(lambda category: f"other_{category}")
+
+        merged = cast(
+            PandasTrackDataset,
+            PandasTrackDataset(track_geometry_factory, first_data).add_all(
+                PandasTrackDataset(track_geometry_factory, second_data)
+            ),
+        )
+
+        classifications = merged.get_data()[track.CLASSIFICATION]
+        assert classifications.dtype == "category"
+        assert set(classifications) == set(first_data[track.CLASSIFICATION]) | set(
+            second_data[track.CLASSIFICATION]
+        )
+
     def test_add_all_merge_tracks(
         self,
         car_track: Track,
@@ -447,6 +767,46 @@ class TestPandasTrackDataset:
             call([pedestrian_track.id.id]),
         ]
 
+    def test_filter_by_classifications_keeps_geometries(
+        self,
+        car_track: Track,
+        pedestrian_track: Track,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+    ) -> None:
+        car_geometries = Mock()
+        geometry_dataset, _ = create_mock_geometry_dataset([car_geometries])
+        offset = RelativeOffsetCoordinate(0, 0)
+        dataset = PandasTrackDataset.from_dataframe(
+            _convert_tracks([car_track, pedestrian_track]),
+            track_geometry_factory,
+            {offset: cast(TrackGeometryDataset, geometry_dataset)},
+        )
+
+        result = dataset.filter_by_classifications([car_track.classification])
+
+        assert_track_datasets_equal(
+            result, PandasTrackDataset.from_list([car_track], track_geometry_factory)
+        )
+        assert result._geometry_datasets == {offset: car_geometries}
+        geometry_dataset.get_for.assert_called_once_with([car_track.id.id])
+
+    def test_filter_by_classifications_is_memoized(
+        self,
+        car_track: Track,
+        pedestrian_track: Track,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+    ) -> None:
+        dataset = PandasTrackDataset.from_list(
+            [car_track, pedestrian_track], track_geometry_factory
+        )
+        all_classes = [car_track.classification, pedestrian_track.classification]
+
+        result = dataset.filter_by_classifications([car_track.classification])
+
+        assert dataset.filter_by_classifications({car_track.classification}) is result
+        assert dataset.filter_by_classifications(all_classes) is dataset
+        assert pickle.loads(pickle.dumps(dataset))._class_views == {}
+
     def test_filter_by_minimum_detection_length(
         self, track_geometry_factory: TRACK_GEOMETRY_FACTORY
     ) -> None:
@@ -461,6 +821,27 @@ class TestPandasTrackDataset:
         for actual_track, expected_track in zip(filtered_dataset, [second_track]):
             assert_equal_track_properties(actual_track, expected_track)
 
+    def test_filter_by_minimum_detection_length_after_add_all(
+        self, track_geometry_factory: TRACK_GEOMETRY_FACTORY
+    ) -> None:
+        first_track = self.__build_track("1", length=10)
+        second_track = self.__build_track("2", length=10)
+        third_track = self.__build_track("3", length=10)
+        short_track = self.__build_track("4", length=5)
+        initial = PandasTrackDataset.from_list(
+            [first_track, third_track], track_geometry_factory
+        )
+        initial.get_summaries()
+        dataset = initial.add_all([second_track, short_track])
+
+        filtered_dataset = dataset.filter_by_min_detection_length(10)
+
+        expected_tracks = [first_track, second_track, third_track]
+        assert filtered_dataset.get_data().index.is_monotonic_increasing
+        assert len(filtered_dataset) == len(expected_tracks)
+        for actual_track, expected_track in zip(filtered_dataset, expected_tracks):
+            assert_equal_track_properties(actual_track, expected_track)
+
     def test_get_first_segments(
         self,
         car_track: Track,
@@ -601,6 +982,63 @@ class TestPandasTrackDataset:
             [car_track.id, pedestrian_track.id]
         )
 
+    def test_structural_metadata_is_computed_once(
+        self,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+        car_track: Track,
+        pedestrian_track: Track,
+    ) -> None:
+        dataset = PandasTrackDataset.from_list(
+            [car_track, pedestrian_track], track_geometry_factory
+        )
+
+        assert len(dataset) == 2
+        structure = dataset._structure
+        index = dataset.get_index()
+
+        assert structure is not None
+        assert index is not None
+        assert list(index) == [car_track.id.id, pedestrian_track.id.id]
+        assert dataset.track_ids == frozenset([car_track.id, pedestrian_track.id])
+        assert dataset.classifications == frozenset(
+            [car_track.classification, pedestrian_track.classification]
+        )
+        assert dataset.first_occurrence == car_track.first_detection.occurrence
+        assert dataset._structure is structure
+        assert dataset.get_index() is index
+
+        updated_dataset = dataset.remove(pedestrian_track.id)
+
+        assert len(updated_dataset) == 1
+        assert updated_dataset.track_ids == frozenset([car_track.id])
+        assert dataset.track_ids == frozenset([car_track.id, pedestrian_track.id])
+
+    def test_summaries_are_updated_with_dataset(
+        self,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+        car_track: Track,
+        car_track_continuing: Track,
+        pedestrian_track: Track,
+    ) -> None:
+        dataset = PandasTrackDataset.from_list([car_track], track_geometry_factory)
+        dataset.get_summaries()
+
+        added = dataset.add_all([car_track_continuing, pedestrian_track])
+        removed = added.remove(car_track.id)
+
+        assert added._summaries is not None
+        assert removed._summaries is not None
+        assert (
+            added.get_summaries()
+            .get_data()
+            .equals(
+                PandasTrackSummaryDataset.from_detections(added.get_data()).get_data()
+            )
+        )
+        assert removed.get_summaries().as_list() == [
+            create_summary_for(pedestrian_track)
+        ]
+
     def test_empty(
         self, track_geometry_factory: TRACK_GEOMETRY_FACTORY, car_track: Track
     ) -> None:
@@ -635,5 +1073,62 @@ class TestPandasTrackDataset:
         dataset = PandasTrackDataset.from_list(
             [single_detection_track], track_geometry_factory
         )
-        result = dataset._create_track_flyweight(single_detection_track.id.id)
+        result = dataset.get_for(single_detection_track.id)
+        assert result is not None
         assert_equal_track_properties(result, single_detection_track)
+
+    def test_detections_array(
+        self,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+        car_track: Track,
+        pedestrian_track: Track,
+    ) -> None:
+        offset = RelativeOffsetCoordinate(0.5, 0.5)
+        filled_dataset = PandasTrackDataset.from_list(
+            [car_track, pedestrian_track], track_geometry_factory
+        )
+
+        result = filled_dataset.detections_array(car_track.id)
+
+        assert result is not None
+        assert result.track_id == car_track.id
+        assert result.classification == car_track.classification
+        assert len(result) == len(car_track.detections)
+        assert list(result.x) == [detection.x for detection in car_track.detections]
+        assert list(result.occurrence) == [
+            detection.occurrence for detection in car_track.detections
+        ]
+        assert result.get_coordinate(1, offset) == (
+            car_track.get_detection(1).get_coordinate(offset)
+        )
+        assert filled_dataset.detections_array(TrackId("missing")) is None
+
+    def test_pickle_without_detection_columns(
+        self, track_geometry_factory: TRACK_GEOMETRY_FACTORY, car_track: Track
+    ) -> None:
+        filled_dataset = PandasTrackDataset.from_list(
+            [car_track], track_geometry_factory
+        )
+        filled_dataset.get_for(car_track.id)
+
+        unpickled = pickle.loads(pickle.dumps(filled_dataset))
+
+        assert unpickled._detection_columns is None
+        assert unpickled.get_data().equals(filled_dataset.get_data())
+
+
+def test_create_cut_track_ids() -> None:
+    actual = create_cut_track_ids(
+        numpy.array(["1", "2", "3"]), numpy.array([3, 4, 1]), [[1], [0, 2, 2], []]
+    )
+
+    assert list(actual) == [
+        "1_0",
+        "1_1",
+        "1_1",
+        "2_1",
+        "2_1",
+        "2_3",
+        "2_3",
+        "3_0",
+    ]
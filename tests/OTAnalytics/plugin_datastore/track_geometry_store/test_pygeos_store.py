@@ -1,3 +1,4 @@
+import pickle
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable
@@ -14,6 +15,7 @@ from OTAnalytics.domain.section import Area, LineSection, Section, SectionId
 from OTAnalytics.domain.track import Track, TrackId
 from OTAnalytics.domain.track_dataset import (
     TRACK_GEOMETRY_FACTORY,
+    AreaTransitions,
     IntersectionPoint,
     TrackDataset,
     TrackGeometryDataset,
@@ -34,6 +36,7 @@ from OTAnalytics.plugin_datastore.track_store import (
 )
 from OTAnalytics.plugin_parser.otvision_parser import OtFlowParser, OttrkParser
 from OTAnalytics.plugin_parser.pandas_parser import PandasDetectionParser
+from tests.utils.assertions import assert_area_transitions_equal
 from tests.utils.builders.track_builder import TrackBuilder
 
 
@@ -587,6 +590,36 @@ class TestPygeosTrackGeometryDataset:
         result = geometry_dataset.intersecting_tracks(sections)
         assert result == {first_track.id, second_track.id}
 
+    def test_intersecting_tracks_after_remove(
+        self, first_track: Track, second_track: Track, first_section: Section
+    ) -> None:
+        track_dataset = create_track_dataset([first_track, second_track])
+        geometry_dataset = PygeosTrackGeometryDataset.from_track_dataset(
+            track_dataset, BASE_GEOMETRY
+        )
+        assert geometry_dataset.intersecting_tracks([first_section]) == {
+            first_track.id,
+            second_track.id,
+        }
+
+        result = geometry_dataset.remove([first_track.id.id])
+
+        assert result.intersecting_tracks([first_section]) == {second_track.id}
+
+    def test_pickle_without_spatial_index(
+        self, first_track: Track, first_section: Section
+    ) -> None:
+        track_dataset = create_track_dataset([first_track])
+        geometry_dataset = PygeosTrackGeometryDataset.from_track_dataset(
+            track_dataset, BASE_GEOMETRY
+        )
+        geometry_dataset.intersecting_tracks([first_section])
+
+        unpickled = pickle.loads(pickle.dumps(geometry_dataset))
+
+        assert unpickled == geometry_dataset
+        assert unpickled.intersecting_tracks([first_section]) == {first_track.id}
+
     def test_as_dict(self, first_track: Track, second_track: Track) -> None:
         tracks = [first_track, second_track]
         track_dataset = create_track_dataset(tracks)
@@ -635,6 +668,22 @@ class TestPygeosTrackGeometryDataset:
         )
         assert result == contained_by_section_test_case.expected_result
 
+    def test_area_transitions(
+        self,
+        contained_by_section_test_case: ContainedBySectionTestCase,
+    ) -> None:
+        track_dataset = create_track_dataset(contained_by_section_test_case.tracks)
+        geometry_dataset = PygeosTrackGeometryDataset.from_track_dataset(
+            track_dataset, BASE_GEOMETRY
+        )
+        result = geometry_dataset.area_transitions(
+            contained_by_section_test_case.sections
+        )
+        assert_area_transitions_equal(
+            result,
+            AreaTransitions.from_masks(contained_by_section_test_case.expected_result),
+        )
+
     def test_get_for_existing(self, first_track: Track, second_track: Track) -> None:
         track_dataset = create_track_dataset([first_track, second_track])
         geometry_dataset = PygeosTrackGeometryDataset.from_track_dataset(
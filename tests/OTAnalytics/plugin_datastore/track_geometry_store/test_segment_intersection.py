@@ -0,0 +1,120 @@
+from typing import Sequence
+
+import numpy
+import pytest
+
+from OTAnalytics.domain.geometry import Coordinate
+from OTAnalytics.domain.section import LineSection, SectionId
+from OTAnalytics.plugin_datastore.track_geometry_store.segment_intersection import (
+    SectionSegments,
+    TrackSegments,
+)
+
+
+def create_section(
+    section_id: str, coordinates: list[tuple[float, float]]
+) -> LineSection:
+    return LineSection(
+        SectionId(section_id),
+        section_id,
+        {},
+        {},
+        [Coordinate(x, y) for x, y in coordinates],
+    )
+
+
+def create_segments(tracks: Sequence[Sequence[tuple[float, float]]]) -> TrackSegments:
+    coordinates = numpy.array(
+        [point for _track in tracks for point in _track], dtype=numpy.float64
+    )
+    sizes = numpy.array([len(_track) for _track in tracks], dtype=numpy.int64)
+    return TrackSegments(coordinates[:, 0], coordinates[:, 1], sizes)
+
+
+def intersections(
+    tracks: Sequence[Sequence[tuple[float, float]]], sections: list[LineSection]
+) -> list[tuple[int, int, int]]:
+    track_positions, section_positions, indices = create_segments(
+        tracks
+    ).intersection_points(sections)
+    return list(
+        zip(track_positions.tolist(), section_positions.tolist(), indices.tolist())
+    )
+
+
+class TestSectionSegments:
+    def test_skip_degenerate_segments(self) -> None:
+        section = create_section("section", [(0, 0), (0, 0), (1, 0), (1, 1)])
+
+        segments = SectionSegments([section])
+
+        assert segments.section.tolist() == [0, 0]
+        assert segments.is_last.tolist() == [False, True]
+        assert segments.x0.tolist() == [0, 1]
+        assert segments.y1.tolist() == [0, 1]
+
+
+class TestTrackSegments:
+    @pytest.mark.parametrize(
+        "track,expected_index",
+        [
+            ([(0, 0), (10, 0), (20, 0)], 2),
+            ([(0, 0), (15, 0), (20, 0)], 2),
+            ([(0, 0), (10, 0), (15, 0)], 3),
+            ([(0, 0), (15, 0), (15, 0), (20, 0)], 3),
+        ],
+    )
+    def test_intersection_points(
+        self, track: list[tuple[float, float]], expected_index: int
+    ) -> None:
+        section = create_section("section", [(15, -1), (15, 1)])
+
+        assert intersections([track], [section]) == [(0, 0, expected_index)]
+
+    def test_intersection_points_of_multiple_tracks_and_sections(self) -> None:
+        tracks = [
+            [(0, 5), (10, 5), (20, 5)],
+            [(0, 0), (10, 0), (20, 0), (10, 0)],
+        ]
+        first = create_section("first", [(15, -1), (15, 1)])
+        second = create_section("second", [(5, -10), (5, 10)])
+
+        assert intersections(tracks, [first, second]) == [
+            (0, 1, 1),
+            (1, 0, 2),
+            (1, 0, 3),
+            (1, 1, 1),
+        ]
+
+    def test_intersection_at_section_vertex(self) -> None:
+        track = [(0, 0), (10, 0)]
+        section = create_section("section", [(5, -5), (5, 0), (5, 5)])
+
+        assert intersections([track], [section]) == [(0, 0, 1)]
+
+    def test_section_touching_track(self) -> None:
+        track = [(0, 0), (10, 0)]
+        section = create_section("section", [(5, 0), (5, 5)])
+
+        assert intersections([track], [section]) == [(0, 0, 1)]
+
+    def test_collinear_overlap(self) -> None:
+        track = [(0, 0), (10, 0), (10, 10)]
+        section = create_section("section", [(5, 0), (15, 0)])
+
+        assert intersections([track], [section]) == [(0, 0, 1), (0, 0, 2)]
+
+    def test_no_intersection(self) -> None:
+        tracks = [[(0, 0), (10, 0)], [(0, 0), (0, 0)]]
+        section = create_section("section", [(20, -1), (20, 1)])
+
+        assert intersections(tracks, [section]) == []
+        assert intersections(tracks, []) == []
+
+    def test_intersecting_tracks(self) -> None:
+        segments = create_segments(
+            [[(0, 5), (10, 5)], [(0, 0), (10, 0)], [(0, -5), (10, -5)]]
+        )
+        section = create_section("section", [(5, -6), (5, 1)])
+
+        assert segments.intersecting_tracks([section]).tolist() == [1, 2]
@@ -0,0 +1,253 @@
+import pickle
+from pathlib import Path
+
+import pytest
+
+from OTAnalytics.application.config import DEFAULT_TRACK_OFFSET
+from OTAnalytics.domain.geometry import Coordinate
+from OTAnalytics.domain.section import Area, LineSection, Section, SectionId
+from OTAnalytics.domain.track import Track
+from OTAnalytics.domain.track_dataset import (
+    AreaTransitions,
+    IntersectionPoint,
+    TrackDataset,
+)
+from OTAnalytics.plugin_datastore.track_geometry_store.pygeos_store import (
+    BASE_GEOMETRY,
+    PygeosTrackGeometryDataset,
+)
+from OTAnalytics.plugin_datastore.track_geometry_store.shapely_store import (
+    ShapelyTrackGeometryDataset,
+)
+from OTAnalytics.plugin_datastore.track_store import PandasByMaxConfidence
+from OTAnalytics.plugin_parser.otvision_parser import OtFlowParser, OttrkParser
+from OTAnalytics.plugin_parser.pandas_parser import PandasDetectionParser
+from tests.utils.assertions import assert_area_transitions_equal
+from tests.utils.builders.track_builder import create_track
+
+TEST_FILE = "Testvideo_Cars-Cyclist_FR20_2020-01-01_00-00-00"
+
+
+def create_area(section_id: str, coordinates: list[tuple[float, float]]) -> Area:
+    return Area(
+        SectionId(section_id),
+        section_id,
+        {},
+        {},
+        [Coordinate(x, y) for x, y in coordinates],
+    )
+
+
+def create_line_section(
+    section_id: str, coordinates: list[tuple[float, float]]
+) -> LineSection:
+    return LineSection(
+        SectionId(section_id),
+        section_id,
+        {},
+        {},
+        [Coordinate(x, y) for x, y in coordinates],
+    )
+
+
+def create_area_around(section: Section, margin: float) -> Area:
+    xs = [coordinate.x for coordinate in section.get_coordinates()]
+    ys = [coordinate.y for coordinate in section.get_coordinates()]
+    min_x, min_y = min(xs) - margin, min(ys) - margin
+    max_x, max_y = max(xs) + margin, max(ys) + margin
+    return create_area(
+        f"area-{section.id.id}",
+        [
+            (min_x, min_y),
+            (max_x, min_y),
+            (max_x, max_y),
+            (min_x, max_y),
+            (min_x, min_y),
+        ],
+    )
+
+
+@pytest.fixture
+def straight_track() -> Track:
+    return create_track("straight", [(0, 0), (10, 0), (20, 0), (30, 0)], 1)
+
+
+@pytest.fixture
+def other_track() -> Track:
+    return create_track("other", [(0, 5), (10, 5), (20, 5)], 1)
+
+
+@pytest.fixture
+def single_detection_track() -> Track:
+    return create_track("single", [(5, 5)], 1)
+
+
+class TestShapelyTrackGeometryDataset:
+    def test_from_track_dataset_disregards_single_detection_tracks(
+        self, straight_track: Track, single_detection_track: Track
+    ) -> None:
+        geometry_dataset = ShapelyTrackGeometryDataset(BASE_GEOMETRY).add_all(
+            [straight_track, single_detection_track]
+        )
+
+        assert geometry_dataset.track_ids == {straight_track.id.id}
+
+    def test_empty(self, straight_track: Track) -> None:
+        empty = ShapelyTrackGeometryDataset(BASE_GEOMETRY)
+
+        assert empty.empty
+        assert not empty.add_all([straight_track]).empty
+
+    def test_add_all_replaces_existing_tracks(
+        self, straight_track: Track, other_track: Track
+    ) -> None:
+        geometry_dataset = ShapelyTrackGeometryDataset(BASE_GEOMETRY).add_all(
+            [straight_track, other_track]
+        )
+        replacement = create_track(straight_track.id.id, [(0, 0), (0, 10)], 1)
+
+        result = geometry_dataset.add_all([replacement])
+
+        assert result == ShapelyTrackGeometryDataset(BASE_GEOMETRY).add_all(
+            [other_track, replacement]
+        )
+
+    def test_remove_and_get_for(
+        self, straight_track: Track, other_track: Track
+    ) -> None:
+        geometry_dataset = ShapelyTrackGeometryDataset(BASE_GEOMETRY).add_all(
+            [straight_track, other_track]
+        )
+        expected = ShapelyTrackGeometryDataset(BASE_GEOMETRY).add_all([other_track])
+
+        assert geometry_dataset.remove([straight_track.id.id]) == expected
+        assert geometry_dataset.get_for([other_track.id.id]) == expected
+        assert geometry_dataset.get_for(["missing"]).empty
+
+    def test_intersection_points(
+        self, straight_track: Track, other_track: Track
+    ) -> None:
+        geometry_dataset = ShapelyTrackGeometryDataset(BASE_GEOMETRY).add_all(
+            [straight_track, other_track]
+        )
+        first_section = create_line_section("first", [(15, -1), (15, 1)])
+        second_section = create_line_section("second", [(25, -10), (25, 10)])
+
+        result = geometry_dataset.intersection_points([first_section, second_section])
+
+        assert result == {
+            straight_track.id: [
+                (first_section.id, IntersectionPoint(2)),
+                (second_section.id, IntersectionPoint(3)),
+            ],
+        }
+        assert geometry_dataset.intersecting_tracks([second_section]) == {
+            straight_track.id
+        }
+
+    def test_contained_by_sections(
+        self, straight_track: Track, other_track: Track
+    ) -> None:
+        geometry_dataset = ShapelyTrackGeometryDataset(BASE_GEOMETRY).add_all(
+            [straight_track, other_track]
+        )
+        area = create_area("area", [(5, -1), (25, -1), (25, 1), (5, 1), (5, -1)])
+
+        result = geometry_dataset.contained_by_sections([area])
+
+        assert result == {
+            straight_track.id: [(area.id, [False, True, True, False])],
+        }
+
+    def test_area_transitions(self, straight_track: Track, other_track: Track) -> None:
+        geometry_dataset = ShapelyTrackGeometryDataset(BASE_GEOMETRY).add_all(
+            [straight_track, other_track]
+        )
+        first = create_area("first", [(5, -1), (25, -1), (25, 1), (5, 1), (5, -1)])
+        second = create_area("second", [(-1, 4), (15, 4), (15, 6), (-1, 6), (-1, 4)])
+
+        result = geometry_dataset.area_transitions([first, second])
+
+        assert_area_transitions_equal(
+            result,
+            AreaTransitions(
+                track_id=["straight", "straight", "other", "other"],
+                section_id=[first.id, first.id, second.id, second.id],
+                index=[1, 3, 0, 2],
+                entered=[True, False, True, False],
+            ),
+        )
+
+    def test_pickle(self, straight_track: Track) -> None:
+        geometry_dataset = ShapelyTrackGeometryDataset(BASE_GEOMETRY).add_all(
+            [straight_track]
+        )
+        section = create_line_section("section", [(15, -1), (15, 1)])
+        geometry_dataset.intersecting_tracks([section])
+
+        unpickled = pickle.loads(pickle.dumps(geometry_dataset))
+
+        assert unpickled == geometry_dataset
+        assert unpickled.intersecting_tracks([section]) == {straight_track.id}
+
+
+class TestCompareWithPygeosTrackGeometryDataset:
+    @pytest.fixture
+    def tracks(self, test_data_dir: Path) -> TrackDataset:
+        parser = OttrkParser(
+            PandasDetectionParser(
+                PandasByMaxConfidence(), ShapelyTrackGeometryDataset.from_track_dataset
+            )
+        )
+        return parser.parse(test_data_dir / f"{TEST_FILE}.ottrk").tracks
+
+    @pytest.fixture
+    def sections(self, test_data_dir: Path) -> list[Section]:
+        sections, _ = OtFlowParser().parse(test_data_dir / f"{TEST_FILE}.otflow")
+        return list(sections)
+
+    def test_results_equal_pygeos(
+        self, tracks: TrackDataset, sections: list[Section]
+    ) -> None:
+        shapely_dataset = ShapelyTrackGeometryDataset.from_track_dataset(
+            tracks, DEFAULT_TRACK_OFFSET
+        )
+        pygeos_dataset = PygeosTrackGeometryDataset.from_track_dataset(
+            tracks, DEFAULT_TRACK_OFFSET
+        )
+        areas: list[Section] = [
+            create_area_around(section, margin=50) for section in sections
+        ]
+
+        intersection_points = shapely_dataset.intersection_points(sections)
+        contained = shapely_dataset.contained_by_sections(areas)
+        expected_contained = pygeos_dataset.contained_by_sections(areas)
+
+        expected_points = pygeos_dataset.intersection_points(sections)
+
+        assert intersection_points
+        assert list(intersection_points) == list(expected_points)
+        assert {
+            track_id: sorted(points, key=lambda point: (point[0].id, point[1].index))
+            for track_id, points in intersection_points.items()
+        } == {
+            track_id: sorted(points, key=lambda point: (point[0].id, point[1].index))
+            for track_id, points in expected_points.items()
+        }
+        assert shapely_dataset.intersecting_tracks(
+            sections
+        ) == pygeos_dataset.intersecting_tracks(sections)
+        assert contained
+        assert_area_transitions_equal(
+            shapely_dataset.area_transitions(areas),
+            pygeos_dataset.area_transitions(areas),
+        )
+        assert_area_transitions_equal(
+            shapely_dataset.area_transitions(areas),
+            AreaTransitions.from_masks(expected_contained),
+        )
+        assert list(contained) == list(expected_contained)
+        assert contained == {
+            track_id: [(section_id, list(mask)) for section_id, mask in masks]
+            for track_id, masks in expected_contained.items()
+        }
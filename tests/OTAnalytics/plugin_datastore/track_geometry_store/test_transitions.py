@@ -0,0 +1,45 @@
+import numpy
+
+from OTAnalytics.plugin_datastore.track_geometry_store.transitions import (
+    find_transitions,
+    order_transitions,
+)
+
+
+def test_find_transitions() -> None:
+    contained = numpy.array(
+        [False, True, True, False] + [True, True] + [] + [True, False, True]
+    )
+    sizes = numpy.array([4, 2, 0, 3])
+
+    track_positions, indices, entered = find_transitions(contained, sizes)
+
+    assert track_positions.tolist() == [0, 0, 1, 3, 3, 3]
+    assert indices.tolist() == [1, 3, 0, 0, 1, 2]
+    assert entered.tolist() == [True, False, True, True, False, True]
+
+
+def test_find_transitions_without_detections() -> None:
+    track_positions, indices, entered = find_transitions(
+        numpy.empty(0, dtype=bool), numpy.empty(0, dtype=numpy.int64)
+    )
+
+    assert len(track_positions) == len(indices) == len(entered) == 0
+
+
+def test_order_transitions() -> None:
+    track_positions = numpy.array([2, 0, 1, 2, 0])
+    section_positions = numpy.array([0, 0, 1, 1, 1])
+    indices = numpy.array([4, 3, 1, 0, 2])
+
+    order = order_transitions(track_positions, section_positions, indices)
+
+    assert track_positions[order].tolist() == [0, 0, 2, 2, 1]
+    assert section_positions[order].tolist() == [0, 1, 0, 1, 1]
+    assert indices[order].tolist() == [3, 2, 4, 0, 1]
+
+
+def test_order_transitions_empty() -> None:
+    empty = numpy.empty(0, dtype=numpy.int64)
+
+    assert len(order_transitions(empty, empty, empty)) == 0
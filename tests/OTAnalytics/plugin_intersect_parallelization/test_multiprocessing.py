@@ -1,9 +1,10 @@
 from typing import Callable, Iterable, cast
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 import pytest
 
-from OTAnalytics.domain.event import Event
+from OTAnalytics.domain.event import Event, EventBatch
+from OTAnalytics.domain.intersect import TaskTiming, concat_events, execute_timed
 from OTAnalytics.domain.section import Section
 from OTAnalytics.domain.track_dataset import TrackDataset
 from OTAnalytics.plugin_intersect_parallelization.multiprocessing import (
@@ -16,25 +17,41 @@ class TestMultiprocessingIntersectParallelization:
     def test_execute(self, mock_pool_init: Mock) -> None:
         event_1 = Mock(spec=Event)
         event_2 = Mock(spec=Event)
+        first_timing = TaskTiming(0, 1, 0.5)
+        second_timing = TaskTiming(1, 2, 0.25)
 
-        mock_pool_instance = mock_pool_init.return_value.__enter__.return_value
-        mock_pool_instance.starmap.return_value = [[event_1], [event_2]]
+        mock_pool_instance = mock_pool_init.return_value
+        mock_pool_instance.starmap.return_value = [
+            ([event_1], first_timing),
+            ([event_2], second_timing),
+        ]
 
         intersect = Mock()
-        tasks = Mock()
+        first_tracks: TrackDataset = Mock(spec=TrackDataset)
+        second_tracks: TrackDataset = Mock(spec=TrackDataset)
+        sections: list[Section] = [Mock()]
+        tasks = [(first_tracks, sections), (second_tracks, sections)]
 
         parallelizer = MultiprocessingIntersectParallelization()
         result = parallelizer.execute(cast(Callable, intersect), tasks)
 
         assert result == [event_1, event_2]
-        mock_pool_instance.starmap.assert_called_once_with(intersect, tasks)
+        assert parallelizer.task_timings == [first_timing, second_timing]
+        mock_pool_instance.starmap.assert_called_once_with(
+            execute_timed,
+            [
+                (intersect, 0, first_tracks, sections),
+                (intersect, 1, second_tracks, sections),
+            ],
+            chunksize=1,
+        )
 
     @patch("OTAnalytics.plugin_intersect_parallelization.multiprocessing.Pool")
     def test_execute_sequentially(self, mock_pool_init: Mock) -> None:
         event_1 = Mock(spec=Event)
         event_2 = Mock(spec=Event)
 
-        mock_pool_instance = mock_pool_init.return_value.__enter__.return_value
+        mock_pool_instance = mock_pool_init.return_value
 
         intersect = Mock()
         intersect.side_effect = [[event_1, event_2]]
@@ -46,18 +63,105 @@ class TestMultiprocessingIntersectParallelization:
         result = parallelizer.execute(cast(Callable, intersect), [task])
 
         assert result == [event_1, event_2]
+        assert [timing.task for timing in parallelizer.task_timings] == [0]
+        mock_pool_init.assert_not_called()
         mock_pool_instance.starmap.assert_not_called()
         intersect.assert_called_once_with(track_dataset, [section])
 
-    def test_flatten_events(self) -> None:
-        intersect = MultiprocessingIntersectParallelization()
+    @patch("OTAnalytics.plugin_intersect_parallelization.multiprocessing.Pool")
+    def test_reuse_pool(self, mock_pool_init: Mock) -> None:
+        mock_pool_instance = mock_pool_init.return_value
+        mock_pool_instance.starmap.return_value = []
+        intersect = Mock()
+
+        parallelizer = MultiprocessingIntersectParallelization(num_processes=2)
+        parallelizer.execute(cast(Callable, intersect), [])
+        parallelizer.execute(cast(Callable, intersect), [])
+
+        mock_pool_init.assert_called_once_with(processes=2)
+        assert mock_pool_instance.starmap.call_count == 2
+        mock_pool_instance.terminate.assert_not_called()
+
+    @patch("OTAnalytics.plugin_intersect_parallelization.multiprocessing.Pool")
+    def test_close(self, mock_pool_init: Mock) -> None:
+        first_pool = Mock()
+        first_pool.starmap.return_value = []
+        second_pool = Mock()
+        second_pool.starmap.return_value = []
+        mock_pool_init.side_effect = [first_pool, second_pool]
+        intersect = Mock()
+
+        parallelizer = MultiprocessingIntersectParallelization(num_processes=2)
+        parallelizer.execute(cast(Callable, intersect), [])
+        parallelizer.close()
+        parallelizer.close()
+        parallelizer.execute(cast(Callable, intersect), [])
+
+        first_pool.terminate.assert_called_once()
+        first_pool.join.assert_called_once()
+        second_pool.terminate.assert_not_called()
+        assert mock_pool_init.call_count == 2
+
+    @patch("OTAnalytics.plugin_intersect_parallelization.multiprocessing.Pool")
+    def test_set_num_processes_restarts_pool(self, mock_pool_init: Mock) -> None:
+        first_pool = Mock()
+        first_pool.starmap.return_value = []
+        second_pool = Mock()
+        second_pool.starmap.return_value = []
+        mock_pool_init.side_effect = [first_pool, second_pool]
+        intersect = Mock()
+
+        parallelizer = MultiprocessingIntersectParallelization(num_processes=2)
+        parallelizer.execute(cast(Callable, intersect), [])
+        parallelizer.set_num_processes(2)
+        first_pool.terminate.assert_not_called()
+        parallelizer.set_num_processes(3)
+        parallelizer.execute(cast(Callable, intersect), [])
+
+        first_pool.terminate.assert_called_once()
+        assert mock_pool_init.call_args_list == [
+            call(processes=2),
+            call(processes=3),
+        ]
+
+    def test_share_tracks(self) -> None:
+        tracks = Mock(spec=TrackDataset)
+        shared_tracks = Mock(spec=TrackDataset)
+        share_tracks = Mock(return_value=shared_tracks)
+
+        parallelizer = MultiprocessingIntersectParallelization(2, share_tracks)
+
+        assert parallelizer.share_tracks(tracks) == shared_tracks
+        share_tracks.assert_called_once_with(tracks)
+
+    def test_share_tracks_sequentially(self) -> None:
+        tracks = Mock(spec=TrackDataset)
+        share_tracks = Mock()
+
+        parallelizer = MultiprocessingIntersectParallelization(1, share_tracks)
+
+        assert parallelizer.share_tracks(tracks) == tracks
+        assert MultiprocessingIntersectParallelization(2).share_tracks(tracks) == tracks
+        share_tracks.assert_not_called()
+
+    def test_concat_events(self) -> None:
         event_1 = Mock(spec=Event)
         event_2 = Mock(spec=Event)
-        events_to_flatten = [[event_1], [event_2]]
+        events_to_concat = [[event_1], [event_2]]
 
-        result = intersect._flatten_events(events_to_flatten)
+        result = concat_events(events_to_concat)
         assert result == [event_1, event_2]
 
+    def test_concat_event_batches(self) -> None:
+        first = Mock(spec=EventBatch)
+        second = Mock(spec=EventBatch)
+
+        with patch.object(EventBatch, "concat") as concat:
+            result = concat_events([first, second])
+
+        assert result == concat.return_value
+        concat.assert_called_once_with([first, second])
+
     def test_set_num_processes(self) -> None:
         intersect = MultiprocessingIntersectParallelization(4)
         assert intersect._num_processes == 4
@@ -26,6 +26,7 @@ class TestSequentialIntersect:
 
         result = sequential_intersect.execute(cast(Callable, mock_intersect), tasks)
         assert result == [event_1, event_2]
+        assert [timing.task for timing in sequential_intersect.task_timings] == [0, 1]
         assert mock_intersect.call_args_list == [
             call(first_track_dataset, sections),
             call(second_track_dataset, sections),
@@ -0,0 +1,89 @@
+import threading
+from typing import Callable, Iterable, cast
+from unittest.mock import Mock, patch
+
+import pytest
+
+from OTAnalytics.domain.event import Event
+from OTAnalytics.domain.section import Section
+from OTAnalytics.domain.track_dataset import TrackDataset
+from OTAnalytics.plugin_intersect_parallelization.threading import (
+    ThreadedIntersectParallelization,
+)
+
+
+class TestThreadedIntersectParallelization:
+    def test_execute(self) -> None:
+        first_event = Mock(spec=Event)
+        second_event = Mock(spec=Event)
+        first_tracks: TrackDataset = Mock(spec=TrackDataset)
+        second_tracks: TrackDataset = Mock(spec=TrackDataset)
+        sections: list[Section] = [Mock()]
+        events: dict[int, list[Event]] = {
+            id(first_tracks): [first_event],
+            id(second_tracks): [second_event],
+        }
+        threads: set[str] = set()
+
+        def intersect(
+            tracks: TrackDataset, _sections: Iterable[Section]
+        ) -> list[Event]:
+            threads.add(threading.current_thread().name)
+            return events[id(tracks)]
+
+        parallelizer = ThreadedIntersectParallelization(num_processes=2)
+        result = parallelizer.execute(
+            intersect, [(first_tracks, sections), (second_tracks, sections)]
+        )
+        parallelizer.close()
+
+        assert result == [first_event, second_event]
+        assert [timing.task for timing in parallelizer.task_timings] == [0, 1]
+        assert threading.current_thread().name not in threads
+
+    def test_execute_sequentially(self) -> None:
+        event = Mock(spec=Event)
+        intersect = Mock(return_value=[event])
+        track_dataset: TrackDataset = Mock(spec=TrackDataset)
+        sections: list[Section] = [Mock()]
+
+        parallelizer = ThreadedIntersectParallelization(num_processes=1)
+        result = parallelizer.execute(
+            cast(Callable, intersect), [(track_dataset, sections)]
+        )
+
+        assert result == [event]
+        assert parallelizer._executor is None
+        intersect.assert_called_once_with(track_dataset, sections)
+
+    def test_share_tracks_without_copy(self) -> None:
+        tracks = Mock(spec=TrackDataset)
+
+        parallelizer = ThreadedIntersectParallelization(num_processes=2)
+
+        assert parallelizer.share_tracks(tracks) is tracks
+
+    @patch("OTAnalytics.plugin_intersect_parallelization.threading.ThreadPoolExecutor")
+    def test_reuse_threads(self, mock_executor_init: Mock) -> None:
+        executor = mock_executor_init.return_value
+        intersect = Mock()
+
+        parallelizer = ThreadedIntersectParallelization(num_processes=2)
+        parallelizer.execute(cast(Callable, intersect), [])
+        parallelizer.execute(cast(Callable, intersect), [])
+        parallelizer.set_num_processes(2)
+        executor.shutdown.assert_not_called()
+        parallelizer.set_num_processes(3)
+        parallelizer.close()
+
+        mock_executor_init.assert_called_once_with(
+            max_workers=2, thread_name_prefix="intersect"
+        )
+        executor.shutdown.assert_called_once()
+
+    @pytest.mark.parametrize("num_processes", [-1, 0])
+    def test_invalid_num_processes(self, num_processes: int) -> None:
+        with pytest.raises(ValueError):
+            ThreadedIntersectParallelization(num_processes)
+        with pytest.raises(ValueError):
+            ThreadedIntersectParallelization(1).set_num_processes(num_processes)
@@ -1,7 +1,12 @@
 import sys
 from unittest.mock import patch
 
-from OTAnalytics.application.config import DEFAULT_TRACK_FILE_TYPE
+from OTAnalytics.application.config import (
+    DEFAULT_TRACK_FILE_TYPE,
+    GEOMETRY_STORE_SHAPELY,
+    INTERSECTION_PARALLELIZATION_THREADS,
+    TRACK_STORE_MEMORY_MAPPED,
+)
 from OTAnalytics.application.parser.cli_parser import CliArguments
 from OTAnalytics.plugin_parser.argparse_cli_parser import ArgparseCliParser
 
@@ -17,6 +22,8 @@ class TestArgparseCliParser:
         csv_format = "csv"
         otevents_format = "otevents"
         config_file = "path/to/config.otconfig"
+        track_cache_dir = "path/to/cache"
+        track_store_dir = "path/to/store"
 
         cli_args: list[str] = [
             "path",
@@ -48,6 +55,19 @@ class TestArgparseCliParser:
             "car",
             "--exclude-classes",
             "pedestrian",
+            "--track-cache",
+            "--track-cache-dir",
+            track_cache_dir,
+            "--clear-track-cache",
+            "--stream-track-files",
+            "--track-store",
+            TRACK_STORE_MEMORY_MAPPED,
+            "--track-store-dir",
+            track_store_dir,
+            "--geometry-store",
+            GEOMETRY_STORE_SHAPELY,
+            "--intersection-parallelization",
+            INTERSECTION_PARALLELIZATION_THREADS,
         ]
         with patch.object(sys, "argv", cli_args):
             parser = ArgparseCliParser()
@@ -69,4 +89,12 @@ class TestArgparseCliParser:
                 log_file=log_file,
                 include_classes=["truck", "car"],
                 exclude_classes=["pedestrian"],
+                track_cache=True,
+                track_cache_dir=track_cache_dir,
+                clear_track_cache=True,
+                stream_track_files=True,
+                track_store=TRACK_STORE_MEMORY_MAPPED,
+                track_store_dir=track_store_dir,
+                geometry_store=GEOMETRY_STORE_SHAPELY,
+                intersection_parallelization=INTERSECTION_PARALLELIZATION_THREADS,
             )
@@ -1,12 +1,25 @@
 import bz2
+import gzip
+import io
 from pathlib import Path
 
 import pytest
 import ujson
 
+from OTAnalytics.plugin_parser import json_parser
 from OTAnalytics.plugin_parser.json_parser import (
+    Compression,
+    JsonStream,
+    JsonStreamError,
+    OrjsonDecoder,
+    UnsupportedCompressionError,
+    compress_bz2,
+    decompress_bz2,
+    detect_compression,
     parse_json,
     parse_json_bz2,
+    parse_json_bz2_entry,
+    read_bytes,
     write_json,
     write_json_bz2,
 )
@@ -57,3 +70,143 @@ def test_parse_bz2_uncompressed_file(example_json: tuple[Path, dict]) -> None:
     example_path, expected_content = example_json
     result_content = parse_json_bz2(example_path)
     assert result_content == expected_content
+
+
+def test_parse_bz2_entry(test_data_tmp_dir: Path) -> None:
+    path = test_data_tmp_dir / "entries.json.bz2"
+    write_json_bz2({"first": [1, 2, 3], "second": {"value": 4}}, path)
+
+    assert parse_json_bz2_entry(path, "second") == {"value": 4}
+    with pytest.raises(JsonStreamError):
+        parse_json_bz2_entry(path, "missing")
+
+
+def test_parse_gzip(test_data_tmp_dir: Path) -> None:
+    content = {"some": "value"}
+    gzip_file = test_data_tmp_dir / "file.json.gz"
+    gzip_file.write_bytes(gzip.compress(ujson.dumps(content).encode()))
+
+    assert parse_json(gzip_file) == content
+    assert parse_json_bz2(gzip_file) == content
+    assert parse_json_bz2_entry(gzip_file, "some") == "value"
+
+
+@pytest.mark.parametrize(
+    "magic,expected",
+    [
+        (b"BZh9", Compression.BZ2),
+        (b"\x1f\x8b\x08\x00", Compression.GZIP),
+        (b"\x28\xb5\x2f\xfd", Compression.ZSTD),
+        (b"\x04\x22\x4d\x18", Compression.LZ4),
+        (b"{}", Compression.NONE),
+    ],
+)
+def test_detect_compression(
+    test_data_tmp_dir: Path, magic: bytes, expected: Compression
+) -> None:
+    file = test_data_tmp_dir / "compressed"
+    file.write_bytes(magic)
+
+    assert detect_compression(file) == expected
+
+
+def test_read_bytes_without_compression_package(
+    test_data_tmp_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def import_module(name: str) -> None:
+        raise ImportError(name)
+
+    file = test_data_tmp_dir / "file.ottrk"
+    file.write_bytes(b"\x28\xb5\x2f\xfd")
+    monkeypatch.setattr(json_parser.importlib, "import_module", import_module)
+
+    with pytest.raises(UnsupportedCompressionError):
+        read_bytes(file)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_compress_and_decompress_multiple_bz2_streams(workers: int) -> None:
+    content = b"".join(str(number).encode() for number in range(10000))
+
+    compressed = compress_bz2(content, workers, stream_size=1000)
+
+    assert compressed.count(b"BZh9") > 1
+    assert bz2.decompress(compressed) == content
+    assert decompress_bz2(compressed, workers) == content
+
+
+def test_decompress_bz2_falls_back_on_invalid_streams() -> None:
+    content = bz2.compress(b"first") + b"BZh91AY&SY" + bz2.compress(b"second")
+
+    assert decompress_bz2(content, workers=2) == bz2.decompress(content)
+
+
+def test_orjson_decoder_falls_back_on_non_standard_json() -> None:
+    decoder = OrjsonDecoder()
+
+    assert decoder.decode(b'{"a": [1, 2.5]}') == {"a": [1, 2.5]}
+    assert decoder.decode(b'{"a": NaN}')["a"] != decoder.decode(b'{"a": NaN}')["a"]
+
+
+class TestJsonStream:
+    @pytest.mark.parametrize("block_size", [1, 3, 1024])
+    def test_iterate_nested_content(self, block_size: int) -> None:
+        content = '{ "a" : 12345, "b": {"c": [1, 2.5, "x"]},\n "d" : [ {"e": true} ] }'
+        stream = JsonStream(io.StringIO(content), block_size)
+
+        actual: dict = {}
+        for key in stream.object_keys():
+            if key == "d":
+                actual[key] = list(stream.array_chunks(chunk_size=1))
+            else:
+                actual[key] = stream.decode_value()
+
+        assert actual == {"a": 12345, "b": {"c": [1, 2.5, "x"]}, "d": [[{"e": True}]]}
+
+    @pytest.mark.parametrize("block_size", [1, 1024])
+    def test_array_chunks(self, block_size: int) -> None:
+        stream = JsonStream(io.StringIO("[1, 2, 3, 4, 5]"), block_size)
+
+        chunks = list(stream.array_chunks(chunk_size=2))
+
+        assert chunks == [[1, 2], [3, 4], [5]]
+
+    @pytest.mark.parametrize("block_size", [1, 2, 3, 4, 5, 6, 7, 8, 1024])
+    def test_numbers_split_across_blocks(self, block_size: int) -> None:
+        content = "[1, 2.5, 3, -4.25e-2, 1E+3, 60]"
+
+        array_stream = JsonStream(io.StringIO(content), block_size)
+        value_stream = JsonStream(io.StringIO(content), block_size)
+
+        assert list(array_stream.array_chunks(chunk_size=10)) == [
+            [1, 2.5, 3, -0.0425, 1000.0, 60]
+        ]
+        assert value_stream.decode_value() == [1, 2.5, 3, -0.0425, 1000.0, 60]
+
+    def test_empty_containers(self) -> None:
+        stream = JsonStream(io.StringIO('{"a": []}'))
+
+        for _ in stream.object_keys():
+            assert list(stream.array_chunks(chunk_size=2)) == []
+
+    def test_incomplete_content(self) -> None:
+        stream = JsonStream(io.StringIO('{"a": {"b": 1'), block_size=2)
+
+        with pytest.raises(JsonStreamError):
+            for _ in stream.object_keys():
+                stream.decode_value()
+
+    def test_skip_value(self) -> None:
+        stream = JsonStream(
+            io.StringIO('{"a": {"b": [1, {"c": 2}]}, "d": [[3], 4], "e": 5}'),
+            block_size=2,
+        )
+
+        actual: dict = {}
+        for key in stream.object_keys():
+            if key == "e":
+                actual[key] = stream.decode_value()
+            else:
+                stream.skip_value()
+
+        assert actual == {"e": 5}
@@ -3,6 +3,8 @@ from pathlib import Path
 from unittest.mock import Mock, call
 
 import pytest
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
 
 from OTAnalytics import version
 from OTAnalytics.application.datastore import VideoParser
@@ -48,6 +50,7 @@ from OTAnalytics.plugin_parser.otvision_parser import (
     VERSION,
     VERSION_1_0,
     VERSION_1_1,
+    VERSION_1_2,
     CachedVideo,
     CachedVideoParser,
     DetectionFixer,
@@ -62,6 +65,7 @@ from OTAnalytics.plugin_parser.otvision_parser import (
     PythonDetectionParser,
     TrackLengthLimit,
     Version,
+    _merge_by_occurrence,
 )
 from tests.utils.assertions import assert_track_datasets_equal
 from tests.utils.builders.track_builder import (
@@ -80,6 +84,7 @@ def track_builder_setup_with_sample_data() -> TrackBuilder:
 def mocked_track_repository() -> Mock:
     repository = Mock(spec=TrackRepository)
     repository.get_for.return_value = None
+    repository.get_all_ids.return_value = frozenset()
     return repository
 
 
@@ -108,6 +113,33 @@ class TestVersion_1_0_To_1_1:
 
         assert fixed == expected_detection
 
+    @pytest.mark.parametrize(
+        "version,expected_x,expected_y",
+        [
+            (VERSION_1_0, [-5.0, 15.0], [-5.0, 5.0]),
+            (VERSION_1_1, [0.0, 20.0], [0.0, 10.0]),
+        ],
+    )
+    def test_fix_columns(
+        self,
+        version: Version,
+        expected_x: list[float],
+        expected_y: list[float],
+    ) -> None:
+        detections = DataFrame(
+            {
+                ottrk_dataformat.X: [0.0, 20.0],
+                ottrk_dataformat.Y: [0.0, 10.0],
+                ottrk_dataformat.W: [10.0, 10.0],
+                ottrk_dataformat.H: [10.0, 10.0],
+            }
+        )
+
+        fixed = Otdet_Version_1_0_to_1_1().fix_columns(detections, version)
+
+        assert fixed[ottrk_dataformat.X].tolist() == expected_x
+        assert fixed[ottrk_dataformat.Y].tolist() == expected_y
+
 
 class TestVersion_1_1_To_1_2:
     def test_fix_occurrence(
@@ -129,6 +161,26 @@ class TestVersion_1_1_To_1_2:
 
         assert fixed == expected_detection
 
+    def test_fix_occurrence_columns(self) -> None:
+        occurrences = [
+            datetime(2020, 1, 1, 0, 0, 0, 50000, tzinfo=timezone.utc),
+            datetime(2023, 6, 30, 23, 59, 59, 999999, tzinfo=timezone.utc),
+        ]
+        detections = DataFrame(
+            {
+                ottrk_dataformat.OCCURRENCE: [
+                    occurrence.strftime(ottrk_dataformat.DATE_FORMAT)
+                    for occurrence in occurrences
+                ]
+            }
+        )
+
+        fixed = Otdet_Version_1_0_To_1_2().fix_columns(detections, VERSION_1_1)
+
+        assert fixed[ottrk_dataformat.OCCURRENCE].tolist() == [
+            occurrence.timestamp() for occurrence in occurrences
+        ]
+
 
 class TestOttrkFormatFixer:
     def test_run_all_fixer(
@@ -170,6 +222,44 @@ class TestOttrkFormatFixer:
         some_metadata_fixer.fix.assert_called_with(metadata, ottrk_version)
         other_metadata_fixer.fix.assert_called_with(metadata, ottrk_version)
 
+    def test_fix_detection_columns(self) -> None:
+        detections = DataFrame({ottrk_dataformat.X: [1.0, 2.0]})
+        some_fixer = Mock(spec=DetectionFixer)
+        other_fixer = Mock(spec=DetectionFixer)
+        some_fixed = DataFrame({ottrk_dataformat.X: [2.0, 3.0]})
+        other_fixed = DataFrame({ottrk_dataformat.X: [3.0, 4.0]})
+        some_fixer.fix_columns.return_value = some_fixed
+        other_fixer.fix_columns.return_value = other_fixed
+        fixer = OttrkFormatFixer([some_fixer, other_fixer], [])
+
+        fixed = fixer.fix_detection_columns(detections, VERSION_1_0)
+
+        assert fixed is other_fixed
+        some_fixer.fix_columns.assert_called_once_with(detections, VERSION_1_0)
+        other_fixer.fix_columns.assert_called_once_with(some_fixed, VERSION_1_0)
+
+    def test_fix_columns_falls_back_to_single_detections(self) -> None:
+        class IncrementX(DetectionFixer):
+            def __init__(self) -> None:
+                super().__init__(VERSION_1_0, VERSION_1_2)
+
+            def fix(self, detection: dict, current_version: Version) -> dict:
+                detection[ottrk_dataformat.X] += 1
+                return detection
+
+        detections = DataFrame(
+            {ottrk_dataformat.X: [1.0, 2.0], ottrk_dataformat.CLASS: ["car", "bus"]}
+        )
+
+        fixed = IncrementX().fix_columns(detections, VERSION_1_0)
+
+        assert_frame_equal(
+            fixed,
+            DataFrame(
+                {ottrk_dataformat.X: [2.0, 3.0], ottrk_dataformat.CLASS: ["car", "bus"]}
+            ),
+        )
+
     def test_no_fixes_in_newest_version(
         self, track_builder_setup_with_sample_data: TrackBuilder
     ) -> None:
@@ -255,6 +345,14 @@ class TestOttrkParser:
         )
         ottrk_file.unlink()
 
+    def test_parse_metadata(self, ottrk_parser: OttrkParser, ottrk_path: Path) -> None:
+        parse_result = ottrk_parser.parse(ottrk_path)
+
+        actual = ottrk_parser.parse_metadata(ottrk_path)
+
+        assert actual.detection_metadata == parse_result.detection_metadata
+        assert actual.video_metadata == parse_result.video_metadata
+
 
 class TestPythonDetectionParser:
     @pytest.fixture
@@ -364,6 +462,9 @@ class TestPythonDetectionParser:
         merged_classification = "car"
         mocked_classificator.calculate.return_value = merged_classification
         mocked_track_repository.get_for.return_value = existing_track
+        mocked_track_repository.get_all_ids.return_value = frozenset(
+            [existing_track.id]
+        )
         all_detections = deserialized_detections + existing_track.detections
         merged_track = PythonTrack(
             existing_track.id, merged_classification, all_detections
@@ -380,6 +481,29 @@ class TestPythonDetectionParser:
         assert_track_datasets_equal(result_sorted_input, expected_sorted)
         mocked_classificator.calculate.assert_called_once_with(all_detections)
 
+    def test_parse_tracks_looks_up_continued_tracks_only(
+        self,
+        track_builder_setup_with_sample_data: TrackBuilder,
+        mocked_track_repository: Mock,
+        mocked_classificator: Mock,
+        parser: PythonDetectionParser,
+    ) -> None:
+        mocked_classificator.calculate.return_value = "car"
+        mocked_track_repository.get_all_ids.return_value = frozenset([TrackId("other")])
+        detections = track_builder_setup_with_sample_data.build_serialized_detections()
+        metadata_video = track_builder_setup_with_sample_data.get_metadata()[
+            ottrk_dataformat.VIDEO
+        ]
+
+        parser.parse_tracks(
+            detections,
+            metadata_video,
+            track_builder_setup_with_sample_data.input_file,
+        )
+
+        mocked_track_repository.get_all_ids.assert_called_once()
+        mocked_track_repository.get_for.assert_not_called()
+
     @pytest.mark.parametrize(
         "track_length_limit",
         [
@@ -414,6 +538,36 @@ class TestPythonDetectionParser:
         assert len(result_sorted_input) == 0
 
 
+def test_merge_by_occurrence() -> None:
+    builder = TrackBuilder()
+    for occurrence_second in range(1, 7):
+        builder.add_second(occurrence_second)
+        builder.append_detection()
+    first, second, third, fourth, fifth, sixth = builder.build_detections()
+
+    assert _merge_by_occurrence([first, second], [third, fourth]) == [
+        first,
+        second,
+        third,
+        fourth,
+    ]
+    assert _merge_by_occurrence([third, fourth], [first, second]) == [
+        first,
+        second,
+        third,
+        fourth,
+    ]
+    assert _merge_by_occurrence([first, fourth, fifth], [second, third, sixth]) == [
+        first,
+        second,
+        third,
+        fourth,
+        fifth,
+        sixth,
+    ]
+    assert _merge_by_occurrence([], [first]) == [first]
+
+
 class TestOtFlowParser:
     def test_parse_sections_and_flows(self, test_data_tmp_dir: Path) -> None:
         first_coordinate = Coordinate(0, 0)
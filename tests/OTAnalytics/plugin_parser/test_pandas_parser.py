@@ -1,7 +1,11 @@
+from datetime import datetime, timezone
 from unittest.mock import Mock
 
 import pytest
+from pandas import CategoricalDtype, Series, testing
 
+from OTAnalytics.domain import track
+from OTAnalytics.domain.track import TrackId
 from OTAnalytics.domain.track_dataset import TRACK_GEOMETRY_FACTORY
 from OTAnalytics.domain.track_repository import TrackRepository
 from OTAnalytics.plugin_datastore.track_geometry_store.pygeos_store import (
@@ -17,7 +21,11 @@ from OTAnalytics.plugin_parser.otvision_parser import (
     DetectionParser,
     TrackLengthLimit,
 )
-from OTAnalytics.plugin_parser.pandas_parser import PandasDetectionParser
+from OTAnalytics.plugin_parser.pandas_parser import (
+    PandasDetectionParser,
+    _create_track_ids,
+    _to_datetime,
+)
 from tests.utils.assertions import assert_equal_track_properties
 from tests.utils.builders.track_builder import track_builder_with_sample_data
 
@@ -97,3 +105,50 @@ class TestPandasDetectionParser:
         ).as_list()
 
         assert len(result_sorted_input) == 0
+
+    def test_parse_tracks_with_categoricals(
+        self,
+        parser: DetectionParser,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+    ) -> None:
+        input_file = "tests/data/tracks.ottrk"
+        track_builder = track_builder_with_sample_data(input_file)
+        detections: list[dict] = track_builder.build_serialized_detections()
+        metadata_video = track_builder.get_metadata()[ottrk_dataformat.VIDEO]
+        categorical_parser = PandasDetectionParser(
+            PandasByMaxConfidence(),
+            track_geometry_factory,
+            track_length_limit=DEFAULT_TRACK_LENGTH_LIMIT,
+            use_categoricals=True,
+        )
+
+        expected = parser.parse_tracks(detections, metadata_video, input_file)
+        actual = categorical_parser.parse_tracks(detections, metadata_video, input_file)
+
+        assert isinstance(expected, PandasTrackDataset)
+        assert isinstance(actual, PandasTrackDataset)
+        actual_data = actual.get_data()
+        for column in [track.CLASSIFICATION, track.VIDEO_NAME, track.INPUT_FILE]:
+            assert isinstance(actual_data[column].dtype, CategoricalDtype)
+        testing.assert_frame_equal(
+            actual_data, expected.get_data(), check_categorical=False, check_dtype=False
+        )
+
+
+def test_create_track_ids_calls_generator_once_per_track() -> None:
+    id_generator = Mock(side_effect=lambda track_id: TrackId(f"file#{track_id}"))
+
+    actual = _create_track_ids(Series([1, 1, 2, 1, 3, 2]), id_generator)
+
+    assert list(actual) == ["file#1", "file#1", "file#2", "file#1", "file#3", "file#2"]
+    assert id_generator.call_count == 3
+
+
+def test_to_datetime_equals_fromtimestamp() -> None:
+    timestamps = [1609459200.0, 1609459200.05, 1609459201.123456789, 1.0000005]
+
+    actual = _to_datetime(Series(timestamps))
+
+    assert list(actual) == [
+        datetime.fromtimestamp(timestamp, timezone.utc) for timestamp in timestamps
+    ]
@@ -0,0 +1,107 @@
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from pandas import testing
+
+from OTAnalytics.application.datastore import TrackParseResult
+from OTAnalytics.plugin_datastore.track_geometry_store.pygeos_store import (
+    PygeosTrackGeometryDataset,
+)
+from OTAnalytics.plugin_datastore.track_store import (
+    PandasByMaxConfidence,
+    PandasTrackDataset,
+)
+from OTAnalytics.plugin_parser.otvision_parser import DEFAULT_TRACK_LENGTH_LIMIT
+from OTAnalytics.plugin_parser.pandas_parser import PandasDetectionParser
+from OTAnalytics.plugin_parser.parallel_track_parser import (
+    CompactPandasTracks,
+    ProcessPoolTrackParser,
+)
+from OTAnalytics.plugin_parser.streaming_parser import StreamingOttrkParser
+
+
+@pytest.fixture
+def ottrk_parser() -> StreamingOttrkParser:
+    return StreamingOttrkParser(
+        PandasDetectionParser(
+            PandasByMaxConfidence(),
+            PygeosTrackGeometryDataset.from_track_dataset,
+            track_length_limit=DEFAULT_TRACK_LENGTH_LIMIT,
+        )
+    )
+
+
+@pytest.fixture
+def ottrk_files(test_data_dir: Path) -> list[Path]:
+    return sorted(test_data_dir.glob("Testvideo_*.ottrk"))
+
+
+def assert_equal_parse_results(
+    actual: TrackParseResult | Exception, expected: TrackParseResult | Exception
+) -> None:
+    assert isinstance(actual, TrackParseResult)
+    assert isinstance(expected, TrackParseResult)
+    assert isinstance(actual.tracks, PandasTrackDataset)
+    assert isinstance(expected.tracks, PandasTrackDataset)
+    testing.assert_frame_equal(actual.tracks.get_data(), expected.tracks.get_data())
+    assert actual.detection_metadata == expected.detection_metadata
+    assert actual.video_metadata == expected.video_metadata
+
+
+class TestProcessPoolTrackParser:
+    def test_parse_all_equals_sequential_parsing(
+        self, ottrk_parser: StreamingOttrkParser, ottrk_files: list[Path]
+    ) -> None:
+        expected = list(ottrk_parser.parse_all(ottrk_files))
+
+        actual = list(ProcessPoolTrackParser(ottrk_parser, 2).parse_all(ottrk_files))
+
+        assert len(actual) == len(ottrk_files)
+        for actual_result, expected_result in zip(actual, expected):
+            assert_equal_parse_results(actual_result, expected_result)
+
+    def test_parse_all_yields_exceptions_in_order(
+        self,
+        ottrk_parser: StreamingOttrkParser,
+        ottrk_files: list[Path],
+        test_data_tmp_dir: Path,
+    ) -> None:
+        missing_file = test_data_tmp_dir / "missing.ottrk"
+
+        actual = list(
+            ProcessPoolTrackParser(ottrk_parser, 2).parse_all(
+                [missing_file, ottrk_files[0]]
+            )
+        )
+
+        assert isinstance(actual[0], FileNotFoundError)
+        assert_equal_parse_results(actual[1], ottrk_parser.parse(ottrk_files[0]))
+
+    def test_parse_all_sequential(self) -> None:
+        file = Path("some.ottrk")
+        other = Mock()
+        parse_result = Mock()
+        other.parse_all.return_value = iter([parse_result])
+
+        actual = list(ProcessPoolTrackParser(other, 4).parse_all([file]))
+
+        assert actual == [parse_result]
+        other.parse_all.assert_called_once_with([file])
+
+    def test_invalid_num_processes(self) -> None:
+        with pytest.raises(ValueError):
+            ProcessPoolTrackParser(Mock(), 0)
+
+
+def test_compact_pandas_tracks_roundtrip(
+    ottrk_parser: StreamingOttrkParser, ottrk_path: Path
+) -> None:
+    tracks = ottrk_parser.parse(ottrk_path).tracks
+    assert isinstance(tracks, PandasTrackDataset)
+
+    compact = CompactPandasTracks.from_dataset(tracks)
+    actual = compact.to_dataset()
+
+    assert compact.categorical_columns
+    testing.assert_frame_equal(actual.get_data(), tracks.get_data())
@@ -0,0 +1,124 @@
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from pandas import DataFrame, testing
+
+from OTAnalytics.domain.track_dataset import TRACK_GEOMETRY_FACTORY
+from OTAnalytics.plugin_datastore.track_geometry_store.pygeos_store import (
+    PygeosTrackGeometryDataset,
+)
+from OTAnalytics.plugin_datastore.track_store import (
+    PandasByMaxConfidence,
+    PandasTrackDataset,
+)
+from OTAnalytics.plugin_parser import ottrk_dataformat
+from OTAnalytics.plugin_parser.json_parser import write_json_bz2
+from OTAnalytics.plugin_parser.otvision_parser import OttrkParser
+from OTAnalytics.plugin_parser.pandas_parser import PandasDetectionParser
+from OTAnalytics.plugin_parser.streaming_parser import (
+    DetectionColumns,
+    OttrkStreamError,
+    StreamingOttrkParser,
+    stream_ottrk,
+)
+from tests.utils.builders.track_builder import track_builder_with_sample_data
+
+
+@pytest.fixture
+def track_geometry_factory() -> TRACK_GEOMETRY_FACTORY:
+    return PygeosTrackGeometryDataset.from_track_dataset
+
+
+@pytest.fixture
+def detection_parser(
+    track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+) -> PandasDetectionParser:
+    return PandasDetectionParser(PandasByMaxConfidence(), track_geometry_factory)
+
+
+class TestDetectionColumns:
+    def test_to_dataframe(self) -> None:
+        columns = DetectionColumns()
+        first_chunk: list[dict] = [{"x": 1.0, "frame": 1}, {"x": 2.0, "frame": 2}]
+        second_chunk: list[dict] = [{"x": 3.0, "frame": 3.5, "other": "a"}]
+
+        columns.append(first_chunk)
+        columns.append(second_chunk)
+
+        testing.assert_frame_equal(
+            columns.to_dataframe(), DataFrame(first_chunk + second_chunk)
+        )
+        assert len(columns) == 3
+
+
+class TestStreamingOttrkParser:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 10000])
+    def test_parse_equals_ottrk_parser(
+        self,
+        detection_parser: PandasDetectionParser,
+        ottrk_path: Path,
+        chunk_size: int,
+    ) -> None:
+        expected = OttrkParser(detection_parser).parse(ottrk_path)
+
+        actual = StreamingOttrkParser(detection_parser, chunk_size=chunk_size).parse(
+            ottrk_path
+        )
+
+        assert isinstance(actual.tracks, PandasTrackDataset)
+        assert isinstance(expected.tracks, PandasTrackDataset)
+        testing.assert_frame_equal(actual.tracks.get_data(), expected.tracks.get_data())
+        assert actual.detection_metadata == expected.detection_metadata
+        assert actual.video_metadata == expected.video_metadata
+
+    @pytest.mark.parametrize("version", ["1.0", "1.1"])
+    def test_parse_legacy_version(
+        self,
+        test_data_tmp_dir: Path,
+        detection_parser: PandasDetectionParser,
+        version: str,
+    ) -> None:
+        ottrk_file = test_data_tmp_dir / "legacy_file.ottrk"
+        track_builder = track_builder_with_sample_data(input_file=str(ottrk_file))
+        track_builder.set_otdet_version(version)
+        track_builder.set_ottrk_version(version)
+        content = track_builder.build_ottrk()
+        for detection in content[ottrk_dataformat.DATA][
+            ottrk_dataformat.DATA_DETECTIONS
+        ]:
+            detection[ottrk_dataformat.OCCURRENCE] = datetime.fromtimestamp(
+                float(detection[ottrk_dataformat.OCCURRENCE]), timezone.utc
+            ).strftime(ottrk_dataformat.DATE_FORMAT)
+        reversed_content = {
+            ottrk_dataformat.DATA: content[ottrk_dataformat.DATA],
+            ottrk_dataformat.METADATA: content[ottrk_dataformat.METADATA],
+        }
+        write_json_bz2(reversed_content, ottrk_file)
+        expected = OttrkParser(detection_parser).parse(ottrk_file)
+
+        actual = StreamingOttrkParser(detection_parser, chunk_size=2).parse(ottrk_file)
+
+        assert isinstance(actual.tracks, PandasTrackDataset)
+        assert isinstance(expected.tracks, PandasTrackDataset)
+        testing.assert_frame_equal(actual.tracks.get_data(), expected.tracks.get_data())
+        ottrk_file.unlink()
+
+    def test_parse_without_metadata(
+        self, test_data_tmp_dir: Path, detection_parser: PandasDetectionParser
+    ) -> None:
+        ottrk_file = test_data_tmp_dir / "no_metadata.ottrk"
+        write_json_bz2({ottrk_dataformat.DATA: {"detections": []}}, ottrk_file)
+
+        with pytest.raises(OttrkStreamError):
+            StreamingOttrkParser(detection_parser).parse(ottrk_file)
+        ottrk_file.unlink()
+
+
+def test_stream_ottrk_yields_metadata_and_chunks(ottrk_path: Path) -> None:
+    events = list(stream_ottrk(ottrk_path, chunk_size=100))
+
+    keys = [key for key, _ in events]
+    assert keys[0] == ottrk_dataformat.METADATA
+    assert set(keys[1:]) == {ottrk_dataformat.DATA_DETECTIONS}
+    assert all(len(chunk) <= 100 for _, chunk in events[1:])
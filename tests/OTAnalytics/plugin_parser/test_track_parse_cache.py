@@ -0,0 +1,184 @@
+import os
+import shutil
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from pandas import testing
+
+from OTAnalytics.application.config import DEFAULT_TRACK_CACHE_SIZE
+from OTAnalytics.application.datastore import TrackParseResult
+from OTAnalytics.plugin_datastore.track_geometry_store.pygeos_store import (
+    PygeosTrackGeometryDataset,
+)
+from OTAnalytics.plugin_datastore.track_store import (
+    PandasByMaxConfidence,
+    PandasTrackDataset,
+)
+from OTAnalytics.plugin_parser.otvision_parser import DEFAULT_TRACK_LENGTH_LIMIT
+from OTAnalytics.plugin_parser.pandas_parser import PandasDetectionParser
+from OTAnalytics.plugin_parser.streaming_parser import StreamingOttrkParser
+from OTAnalytics.plugin_parser.track_parse_cache import (
+    CachedTrackParser,
+    TrackParseCache,
+    create_cache_key,
+)
+
+
+@pytest.fixture
+def ottrk_parser() -> StreamingOttrkParser:
+    return StreamingOttrkParser(
+        PandasDetectionParser(
+            PandasByMaxConfidence(),
+            PygeosTrackGeometryDataset.from_track_dataset,
+            track_length_limit=DEFAULT_TRACK_LENGTH_LIMIT,
+        )
+    )
+
+
+@pytest.fixture
+def ottrk_file(test_data_dir: Path, tmp_path: Path) -> Path:
+    source = test_data_dir / "Testvideo_Cars-Cyclist_FR20_2020-01-01_00-00-00.ottrk"
+    return Path(shutil.copy2(source, tmp_path / source.name))
+
+
+@pytest.fixture
+def other_ottrk_file(test_data_dir: Path, tmp_path: Path) -> Path:
+    source = test_data_dir / "Testvideo_Cars-Truck_FR20_2020-01-01_00-00-00.ottrk"
+    return Path(shutil.copy2(source, tmp_path / source.name))
+
+
+def create_cache(
+    cache_dir: Path, max_size: int = DEFAULT_TRACK_CACHE_SIZE, key: str = ""
+) -> TrackParseCache:
+    return TrackParseCache(
+        cache_dir, PygeosTrackGeometryDataset.from_track_dataset, max_size, key
+    )
+
+
+def assert_equal_parse_results(
+    actual: TrackParseResult | None, expected: TrackParseResult
+) -> None:
+    assert actual is not None
+    assert isinstance(actual.tracks, PandasTrackDataset)
+    assert isinstance(expected.tracks, PandasTrackDataset)
+    testing.assert_frame_equal(actual.tracks.get_data(), expected.tracks.get_data())
+    assert actual.detection_metadata == expected.detection_metadata
+    assert actual.video_metadata == expected.video_metadata
+
+
+class TestTrackParseCache:
+    def test_put_and_get(
+        self, ottrk_parser: StreamingOttrkParser, ottrk_file: Path, tmp_path: Path
+    ) -> None:
+        cache = create_cache(tmp_path / "cache")
+        expected = ottrk_parser.parse(ottrk_file)
+
+        cache.put(ottrk_file, expected)
+        actual = cache.get(ottrk_file)
+
+        assert_equal_parse_results(actual, expected)
+
+    def test_get_missing_entry(self, ottrk_file: Path, tmp_path: Path) -> None:
+        assert create_cache(tmp_path / "cache").get(ottrk_file) is None
+
+    def test_invalidate_changed_file(
+        self, ottrk_parser: StreamingOttrkParser, ottrk_file: Path, tmp_path: Path
+    ) -> None:
+        cache = create_cache(tmp_path / "cache")
+        cache.put(ottrk_file, ottrk_parser.parse(ottrk_file))
+
+        with open(ottrk_file, "ab") as file:
+            file.write(b"changed")
+
+        assert cache.get(ottrk_file) is None
+
+    def test_keep_touched_file_with_same_content(
+        self, ottrk_parser: StreamingOttrkParser, ottrk_file: Path, tmp_path: Path
+    ) -> None:
+        cache = create_cache(tmp_path / "cache")
+        expected = ottrk_parser.parse(ottrk_file)
+        cache.put(ottrk_file, expected)
+
+        stat = ottrk_file.stat()
+        os.utime(ottrk_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert_equal_parse_results(cache.get(ottrk_file), expected)
+        with patch("OTAnalytics.plugin_parser.track_parse_cache._hash") as hash_content:
+            assert_equal_parse_results(cache.get(ottrk_file), expected)
+        hash_content.assert_not_called()
+
+    def test_ignore_entries_with_other_key(
+        self, ottrk_parser: StreamingOttrkParser, ottrk_file: Path, tmp_path: Path
+    ) -> None:
+        create_cache(tmp_path / "cache", key="some").put(
+            ottrk_file, ottrk_parser.parse(ottrk_file)
+        )
+
+        assert create_cache(tmp_path / "cache", key="other").get(ottrk_file) is None
+
+    def test_evict_least_recently_used(
+        self,
+        ottrk_parser: StreamingOttrkParser,
+        ottrk_file: Path,
+        other_ottrk_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        cache_dir = tmp_path / "cache"
+        create_cache(cache_dir).put(ottrk_file, ottrk_parser.parse(ottrk_file))
+        entry_size = sum(file.stat().st_size for file in cache_dir.rglob("*"))
+        cache = create_cache(cache_dir, max_size=int(entry_size * 1.5))
+        first_entry = next(cache_dir.iterdir())
+        os.utime(first_entry / "manifest.json", (0, 0))
+
+        cache.put(other_ottrk_file, ottrk_parser.parse(other_ottrk_file))
+
+        assert cache.get(ottrk_file) is None
+        assert cache.get(other_ottrk_file) is not None
+
+    def test_clear(
+        self, ottrk_parser: StreamingOttrkParser, ottrk_file: Path, tmp_path: Path
+    ) -> None:
+        cache = create_cache(tmp_path / "cache")
+        cache.put(ottrk_file, ottrk_parser.parse(ottrk_file))
+
+        cache.clear()
+
+        assert cache.get(ottrk_file) is None
+        assert list((tmp_path / "cache").iterdir()) == []
+
+    def test_put_uncacheable_tracks(self, ottrk_file: Path, tmp_path: Path) -> None:
+        cache = create_cache(tmp_path / "cache")
+
+        cache.put(ottrk_file, TrackParseResult(Mock(), Mock(), Mock()))
+
+        assert cache.get(ottrk_file) is None
+        assert list((tmp_path / "cache").iterdir()) == []
+
+
+def test_create_cache_key() -> None:
+    key = create_cache_key(track_length_limit=DEFAULT_TRACK_LENGTH_LIMIT)
+
+    assert key == create_cache_key(track_length_limit=DEFAULT_TRACK_LENGTH_LIMIT)
+    assert key != create_cache_key(
+        track_length_limit=DEFAULT_TRACK_LENGTH_LIMIT, use_categoricals=True
+    )
+    with patch("OTAnalytics.plugin_parser.track_parse_cache.PARSER_VERSION", -1):
+        assert key != create_cache_key(track_length_limit=DEFAULT_TRACK_LENGTH_LIMIT)
+
+
+class TestCachedTrackParser:
+    def test_parse_uses_cache(self, ottrk_file: Path) -> None:
+        other = Mock()
+        cache = Mock()
+        parse_result = Mock()
+        cache.get.return_value = None
+        other.parse.return_value = parse_result
+        parser = CachedTrackParser(other, cache)
+
+        assert parser.parse(ottrk_file) == parse_result
+        cache.put.assert_called_once_with(ottrk_file, parse_result)
+
+        cache.get.return_value = parse_result
+        assert parser.parse(ottrk_file) == parse_result
+        other.parse.assert_called_once_with(ottrk_file)
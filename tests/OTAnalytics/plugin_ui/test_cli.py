@@ -2,7 +2,7 @@ from datetime import datetime
 from pathlib import Path
 from shutil import copy2, rmtree
 from typing import Any
-from unittest.mock import Mock, PropertyMock, patch
+from unittest.mock import Mock, PropertyMock, call, patch
 
 import pytest
 
@@ -642,15 +642,44 @@ class TestOTAnalyticsCli:
         logger.exception.assert_called_once_with(exception, exc_info=True)
         mock_run_analysis.assert_called_once()
 
+    def test_register_metadata(self, mock_cli_dependencies: dict[str, Mock]) -> None:
+        first_track_file = Path("path/to/a.ottrk")
+        second_track_file = Path("path/to/b.ottrk")
+        first_metadata = Mock()
+        second_metadata = Mock()
+        track_parser = mock_cli_dependencies[self.TRACK_PARSER]
+        track_parser.parse_metadata.side_effect = [first_metadata, second_metadata]
+        tracks_metadata = mock_cli_dependencies[self.TRACKS_METADATA]
+        videos_metadata = mock_cli_dependencies[self.VIDEOS_METADATA]
+
+        cli = OTAnalyticsCli(Mock(), **mock_cli_dependencies)
+        cli._register_metadata([first_track_file, second_track_file])
+
+        assert track_parser.parse_metadata.call_args_list == [
+            call(first_track_file),
+            call(second_track_file),
+        ]
+        track_parser.parse_all.assert_not_called()
+        assert tracks_metadata.update_detection_classes.call_args_list == [
+            call(first_metadata.detection_metadata.detection_classes),
+            call(second_metadata.detection_metadata.detection_classes),
+        ]
+        assert videos_metadata.update.call_args_list == [
+            call(first_metadata.video_metadata),
+            call(second_metadata.video_metadata),
+        ]
+
     @patch("OTAnalytics.plugin_ui.cli.OTAnalyticsCli._do_export_counts")
     @patch("OTAnalytics.plugin_ui.cli.OTAnalyticsCli._export_events")
     @patch("OTAnalytics.plugin_ui.cli.OTAnalyticsCli._parse_tracks")
+    @patch("OTAnalytics.plugin_ui.cli.OTAnalyticsCli._register_metadata")
     @patch("OTAnalytics.plugin_ui.cli.OTAnalyticsCli._add_sections")
     @patch("OTAnalytics.plugin_ui.cli.OTAnalyticsCli._add_flows")
     def test_run_analysis(
         self,
         mock_add_flows: Mock,
         mock_add_sections: Mock,
+        mock_register_metadata: Mock,
         mock_parse_tracks: Mock,
         mock_export_events: Mock,
         mock_do_export_counts: Mock,
@@ -676,6 +705,9 @@ class TestOTAnalyticsCli:
         mock_cli_dependencies[self.EVENT_REPOSITORY].clear.assert_called_once()
         mock_add_flows.assert_called_once_with(flows)
         mock_add_sections.assert_called_once_with(sections)
+        mock_register_metadata.assert_called_once_with(
+            [first_track_file, second_track_file]
+        )
         mock_parse_tracks.assert_called_once_with([first_track_file, second_track_file])
         mock_cli_dependencies[self.GET_ALL_SECTIONS].assert_called_once()
         mock_cli_dependencies[self.APPLY_CLI_CUTS].apply.assert_called_once_with(
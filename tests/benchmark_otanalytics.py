@@ -1,3 +1,4 @@
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Iterable
@@ -20,6 +21,11 @@ from OTAnalytics.application.analysis.traffic_counting_specification import (
 from OTAnalytics.application.config import (
     CLI_CUTTING_SECTION_MARKER,
     CUTTING_SECTION_MARKER,
+    DEFAULT_INTERSECTION_PARALLELIZATION,
+    INTERSECTION_PARALLELIZATIONS,
+    TRACK_STORE_MEMORY_MAPPED,
+    TRACK_STORE_NUMPY,
+    TRACK_STORE_PANDAS,
 )
 from OTAnalytics.application.datastore import DetectionMetadata, TrackParser
 from OTAnalytics.application.run_configuration import RunConfiguration
@@ -50,6 +56,15 @@ from OTAnalytics.domain.section import (
 from OTAnalytics.domain.track_dataset import TRACK_GEOMETRY_FACTORY, TrackDataset
 from OTAnalytics.domain.track_repository import TrackRepository
 from OTAnalytics.domain.types import EventType
+from OTAnalytics.plugin_datastore.memory_mapped_track_store import (
+    FilteredMemoryMappedTrackDataset,
+    MemoryMappedTrackDataset,
+    MemoryMappedTrackStore,
+)
+from OTAnalytics.plugin_datastore.numpy_track_store import (
+    FilteredNumpyTrackDataset,
+    NumpyTrackDataset,
+)
 from OTAnalytics.plugin_datastore.python_track_store import (
     ByMaxConfidence,
     FilteredPythonTrackDataset,
@@ -77,7 +92,14 @@ from tests.utils.builders.run_configuration import NUM_PROCESSES, create_run_con
 
 PYTHON = "PYTHON"
 PANDAS = "PANDAS"
-CURRENT_DATASET_TYPE = PANDAS
+NUMPY = "NUMPY"
+MEMORY_MAPPED = "MEMORY_MAPPED"
+CURRENT_DATASET_TYPE = os.environ.get("OTANALYTICS_BENCHMARK_DATASET", PANDAS)
+
+TRACK_STORES_BY_DATASET_TYPE = {
+    NUMPY: TRACK_STORE_NUMPY,
+    MEMORY_MAPPED: TRACK_STORE_MEMORY_MAPPED,
+}
 
 EXCLUDE_FILTER = [
     CLASS_PEDESTRIAN,
@@ -111,6 +133,12 @@ class UseCaseProvider:
 
     @property
     def run_config(self) -> RunConfiguration:
+        return self.create_run_config()
+
+    def create_run_config(
+        self,
+        intersection_parallelization: str = DEFAULT_INTERSECTION_PARALLELIZATION,
+    ) -> RunConfiguration:
         return create_run_config(
             flow_parser=self._flow_parser,
             start_cli=True,
@@ -123,6 +151,10 @@ class UseCaseProvider:
             event_formats=["otevents"],
             include_classes=list(self._include_classes),
             exclude_classes=list(self._exclude_classes),
+            track_store=TRACK_STORES_BY_DATASET_TYPE.get(
+                self._dataset_type, TRACK_STORE_PANDAS
+            ),
+            intersection_parallelization=intersection_parallelization,
         )
 
     @property
@@ -139,6 +171,7 @@ class UseCaseProvider:
         self._otflow_file = otflow_file
         self._ottrk_files = ottrk_files
         self._save_dir = save_dir
+        self._dataset_type = dataset_type
         self._include_classes: frozenset[str] = frozenset()
         self._exclude_classes: frozenset[str] = frozenset()
         self._starter = ApplicationStarter()
@@ -163,7 +196,11 @@ class UseCaseProvider:
         get_all_tracks = GetAllTracks(self._track_repository)
         return self._starter._create_tracks_intersecting_sections(get_all_tracks)
 
-    def get_create_events(self) -> CreateEvents:
+    def get_create_events(
+        self,
+        num_processes: int = NUM_PROCESSES,
+        intersection_parallelization: str = DEFAULT_INTERSECTION_PARALLELIZATION,
+    ) -> CreateEvents:
         clear_all_events = ClearAllEvents(self._event_repository)
         get_tracks_without_single_detections = GetTracksWithoutSingleDetections(
             self._track_repository
@@ -176,7 +213,9 @@ class UseCaseProvider:
             get_tracks,
             get_tracks_without_single_detections,
             add_events,
-            num_processes=NUM_PROCESSES,
+            self._starter._create_intersect_parallelizer(
+                self.create_run_config(intersection_parallelization), num_processes
+            ),
         )
         return create_events
 
@@ -218,6 +257,12 @@ class UseCaseProvider:
         elif dataset_type == PANDAS:
             repository = TrackRepository(self.provide_pandas_track_dataset())
             parser = OttrkParser(self.provide_pandas_detection_parser())
+        elif dataset_type == NUMPY:
+            repository = TrackRepository(self.provide_numpy_track_dataset())
+            parser = OttrkParser(self.provide_pandas_detection_parser())
+        elif dataset_type == MEMORY_MAPPED:
+            repository = TrackRepository(self.provide_memory_mapped_track_dataset())
+            parser = OttrkParser(self.provide_pandas_detection_parser())
         else:
             raise ValueError(f"Unknown dataset type {dataset_type}")
         detection_metadata = _fill_track_repository(parser, repository, track_files)
@@ -232,6 +277,23 @@ class UseCaseProvider:
             self._exclude_classes,
         )
 
+    def provide_numpy_track_dataset(self) -> TrackDataset:
+        return FilteredNumpyTrackDataset(
+            NumpyTrackDataset(PygeosTrackGeometryDataset.from_track_dataset),
+            self._include_classes,
+            self._exclude_classes,
+        )
+
+    def provide_memory_mapped_track_dataset(self) -> TrackDataset:
+        return FilteredMemoryMappedTrackDataset(
+            MemoryMappedTrackDataset(
+                MemoryMappedTrackStore(),
+                PygeosTrackGeometryDataset.from_track_dataset,
+            ),
+            self._include_classes,
+            self._exclude_classes,
+        )
+
     def provide_python_track_dataset(self) -> TrackDataset:
         return FilteredPythonTrackDataset(
             PythonTrackDataset(PygeosTrackGeometryDataset.from_track_dataset),
@@ -271,7 +333,7 @@ class UseCaseProvider:
             return OttrkParser(
                 self.provide_python_detection_parser(self._track_repository)
             )
-        elif dataset_type == PANDAS:
+        elif dataset_type in (PANDAS, NUMPY, MEMORY_MAPPED):
             return OttrkParser(self.provide_pandas_detection_parser())
         else:
             raise ValueError(f"Unknown dataset type {dataset_type}")
@@ -479,6 +541,33 @@ class TestBenchmarkCreateEvents:
         )
 
 
+class TestBenchmarkIntersectionParallelization:
+    ROUNDS = 1
+    ITERATIONS = 1
+    WARMUP_ROUNDS = 1
+
+    @pytest.mark.parametrize("num_processes", [1, 2, 4, 8, 16])
+    @pytest.mark.parametrize(
+        "intersection_parallelization", INTERSECTION_PARALLELIZATIONS
+    )
+    def test_15min(
+        self,
+        benchmark: BenchmarkFixture,
+        use_case_provider_15min: UseCaseProvider,
+        intersection_parallelization: str,
+        num_processes: int,
+    ) -> None:
+        use_case = use_case_provider_15min.get_create_events(
+            num_processes, intersection_parallelization
+        )
+        benchmark.pedantic(
+            use_case,
+            rounds=self.ROUNDS,
+            iterations=self.ITERATIONS,
+            warmup_rounds=self.WARMUP_ROUNDS,
+        )
+
+
 class TestBenchmarkExportCounting:
     ROUNDS = 1
     ITERATIONS = 1
@@ -3,7 +3,7 @@ from typing import Iterable
 from unittest.mock import Mock
 
 from OTAnalytics.domain.track import Detection, Track
-from OTAnalytics.domain.track_dataset import TrackDataset
+from OTAnalytics.domain.track_dataset import AreaTransitions, TrackDataset
 
 
 def assert_equal_detection_properties(actual: Detection, expected: Detection) -> None:
@@ -52,6 +52,26 @@ def assert_track_geometry_dataset_add_all_called_correctly(
         assert_equal_track_properties(actual_track, expected_track)
 
 
+def assert_area_transitions_equal(
+    actual: AreaTransitions, expected: AreaTransitions
+) -> None:
+    def as_tuples(
+        transitions: AreaTransitions,
+    ) -> list[tuple[str, str, int, bool]]:
+        return [
+            (str(track_id), section_id.id, int(index), bool(entered))
+            for track_id, section_id, index, entered in zip(
+                transitions.track_id,
+                transitions.section_id,
+                transitions.index,
+                transitions.entered,
+            )
+        ]
+
+    assert len(actual) == len(expected)
+    assert as_tuples(actual) == as_tuples(expected)
+
+
 def assert_track_dataset_has_tracks(dataset: TrackDataset, tracks: list[Track]) -> None:
     assert len(dataset) == len(tracks)
     for expected in tracks:
@@ -1,3 +1,7 @@
+from OTAnalytics.application.config import (
+    DEFAULT_INTERSECTION_PARALLELIZATION,
+    DEFAULT_TRACK_STORE,
+)
 from OTAnalytics.application.parser.cli_parser import CliArguments
 from OTAnalytics.application.parser.flow_parser import FlowParser
 from OTAnalytics.application.run_configuration import RunConfiguration
@@ -23,6 +27,8 @@ def create_run_config(
     log_file: str | None = None,
     include_classes: list[str] | None = None,
     exclude_classes: list[str] | None = None,
+    track_store: str = DEFAULT_TRACK_STORE,
+    intersection_parallelization: str = DEFAULT_INTERSECTION_PARALLELIZATION,
 ) -> RunConfiguration:
     cli_args = CliArguments(
         start_cli=start_cli,
@@ -41,5 +47,7 @@ def create_run_config(
         log_file=log_file,
         include_classes=include_classes,
         exclude_classes=exclude_classes,
+        track_store=track_store,
+        intersection_parallelization=intersection_parallelization,
     )
     return RunConfiguration(flow_parser, cli_args)
@@ -3,11 +3,19 @@ from unittest.mock import Mock
 
 from OTAnalytics.domain.track import Track
 from OTAnalytics.domain.track_dataset import (
-    TRACK_GEOMETRY_FACTORY,
     FilteredTrackDataset,
     TrackDataset,
     TrackGeometryDataset,
 )
+from OTAnalytics.plugin_datastore.memory_mapped_track_store import (
+    FilteredMemoryMappedTrackDataset,
+    MemoryMappedTrackDataset,
+    MemoryMappedTrackStore,
+)
+from OTAnalytics.plugin_datastore.numpy_track_store import (
+    FilteredNumpyTrackDataset,
+    NumpyTrackDataset,
+)
 from OTAnalytics.plugin_datastore.python_track_store import (
     FilteredPythonTrackDataset,
     PythonTrackDataset,
@@ -35,24 +43,38 @@ def create_mock_geometry_dataset(
 
 PYTHON: Literal["PYTHON"] = "PYTHON"
 PANDAS: Literal["PANDAS"] = "PANDAS"
-IMPLEMENTATIONS = [PYTHON, PANDAS]
+NUMPY: Literal["NUMPY"] = "NUMPY"
+MEMORY_MAPPED: Literal["MEMORY_MAPPED"] = "MEMORY_MAPPED"
+IMPLEMENTATIONS = [PYTHON, PANDAS, NUMPY, MEMORY_MAPPED]
 
 
 class TrackDatasetProvider:
-    GEOMETRY_FACTORY: TRACK_GEOMETRY_FACTORY = (
-        PygeosTrackGeometryDataset.from_track_dataset
-    )
-
     def provide(self, dataset_type: str, tracks: list[Track]) -> TrackDataset:
         if dataset_type == PYTHON:
             return self.provide_python(tracks)
         elif dataset_type == PANDAS:
             return self.provide_pandas(tracks)
+        elif dataset_type == NUMPY:
+            return self.provide_numpy(tracks)
+        elif dataset_type == MEMORY_MAPPED:
+            return self.provide_memory_mapped(tracks)
         else:
             raise ValueError(f"Not known TrackDataset type of {dataset_type}!")
 
     def provide_pandas(self, tracks: list[Track]) -> PandasTrackDataset:
-        return PandasTrackDataset.from_list(tracks, self.GEOMETRY_FACTORY)
+        return PandasTrackDataset.from_list(
+            tracks, PygeosTrackGeometryDataset.from_track_dataset
+        )
+
+    def provide_numpy(self, tracks: list[Track]) -> NumpyTrackDataset:
+        return NumpyTrackDataset(PygeosTrackGeometryDataset.from_track_dataset).add_all(
+            tracks
+        )
+
+    def provide_memory_mapped(self, tracks: list[Track]) -> MemoryMappedTrackDataset:
+        return MemoryMappedTrackDataset(
+            MemoryMappedTrackStore(), PygeosTrackGeometryDataset.from_track_dataset
+        ).add_all(tracks)
 
     def provide_python(self, tracks: list[Track]) -> PythonTrackDataset:
         return PythonTrackDataset.from_list(
@@ -74,6 +96,18 @@ class TrackDatasetProvider:
             return self.provide_filtered_pandas(
                 tracks, include_classes, exclude_classes
             )
+        elif dataset_type == NUMPY:
+            return FilteredNumpyTrackDataset(
+                self.provide_numpy(tracks),
+                frozenset(include_classes),
+                frozenset(exclude_classes),
+            )
+        elif dataset_type == MEMORY_MAPPED:
+            return FilteredMemoryMappedTrackDataset(
+                self.provide_memory_mapped(tracks),
+                frozenset(include_classes),
+                frozenset(exclude_classes),
+            )
         else:
             raise ValueError(f"Not known TrackDataset type of {dataset_type}!")
 
@@ -123,5 +157,21 @@ class TrackDatasetProvider:
                 ),
                 mock,
             )
+        elif dataset_type == NUMPY:
+            mock = Mock()
+            return (
+                FilteredNumpyTrackDataset(
+                    mock, frozenset(include_classes), frozenset(exclude_classes)
+                ),
+                mock,
+            )
+        elif dataset_type == MEMORY_MAPPED:
+            mock = Mock()
+            return (
+                FilteredMemoryMappedTrackDataset(
+                    mock, frozenset(include_classes), frozenset(exclude_classes)
+                ),
+                mock,
+            )
         else:
             raise ValueError(f"Not known TrackDataset type of {dataset_type}!")
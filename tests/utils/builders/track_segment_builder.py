@@ -25,7 +25,9 @@ from OTAnalytics.plugin_datastore.track_store import PandasTrackSegmentDataset
 
 PYTHON = "PYTHON"
 PANDAS = "PANDAS"
-IMPLEMENTATIONS = [PYTHON, PANDAS]
+NUMPY = "NUMPY"
+MEMORY_MAPPED = "MEMORY_MAPPED"
+IMPLEMENTATIONS = [PYTHON, PANDAS, NUMPY, MEMORY_MAPPED]
 
 
 class TrackSegmentDatasetBuilder(ABC):
@@ -127,7 +129,7 @@ class TrackSegmentDatasetBuilderProvider:
     def provide(self, implementation: str) -> TrackSegmentDatasetBuilder:
         if implementation == PYTHON:
             return PythonTrackSegmentDatasetBuilder()
-        elif implementation == PANDAS:
+        elif implementation in (PANDAS, NUMPY, MEMORY_MAPPED):
             return PandasTrackSegmentDatasetBuilder()
         else:
             raise ValueError(f"Unsupported implementation: {implementation}")